@@ -0,0 +1,119 @@
+"""
+API Key Auth Benchmark
+======================
+
+Toplam API key sayısına göre key doğrulama (kayıt bulma + hash doğrulama) süresini ölçer.
+In-memory SQLite'ta api_keys tablosu doldurulur, aranan key her zaman en son eklenen key'dir.
+
+Ölçülen durumlar:
+    - lookup: Yeni format key ({prefix}{lookup_id}.{secret}) - index'ten tek satır + HMAC
+    - migrated: HMAC hash'e taşınmış eski key - key_hash unique index'i ile tek satır
+    - legacy: Taşınmamış eski key - aktif eski key'lerin tamamı bcrypt ile taranır
+
+NOT: Seed süresini kısaltmak için bcrypt hash'leri varsayılan olarak 4 round ile üretilir;
+production'daki 12 round ile legacy süresi yaklaşık 2^8 kat daha uzundur (--bcrypt-rounds 12).
+
+Kullanım (proje kök dizininden):
+    python benchmarks/api_key_auth.py --keys 10 100 1000 --repeat 20
+"""
+import argparse
+import os
+import secrets
+import statistics
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("ENCRYPTION_KEY", secrets.token_hex(32))
+
+_project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_project_root))
+sys.path.insert(0, str(_project_root / "src"))
+
+
+def _seed(session, mode: str, key_count: int, bcrypt_rounds: int) -> str:
+    """key_count adet key ekler, son eklenen key'in tam değerini döner"""
+    from miniflow.models import ApiKey
+    from miniflow.services import ApiKeyService
+    from miniflow.utils.helpers.encryption_helper import hash_api_key, hash_password
+
+    full_api_key = None
+    for i in range(key_count):
+        if mode == "lookup":
+            lookup_id = secrets.token_hex(ApiKeyService.LOOKUP_ID_LENGTH // 2)
+            full_api_key = f"sk_live_{lookup_id}{ApiKeyService.KEY_SEPARATOR}{secrets.token_urlsafe(32)}"
+            key_hash = hash_api_key(full_api_key)
+        else:
+            lookup_id = None
+            full_api_key = f"sk_live_{secrets.token_urlsafe(32)}"
+            key_hash = hash_api_key(full_api_key) if mode == "migrated" else hash_password(full_api_key, rounds=bcrypt_rounds)
+
+        session.add(ApiKey(
+            workspace_id="WSP-BENCH", owner_id="USR-BENCH", name=f"key_{i}",
+            key_prefix="sk_live_", key_lookup_id=lookup_id, key_hash=key_hash
+        ))
+    session.commit()
+    return full_api_key
+
+
+def run_benchmark(mode: str, key_count: int, repeat: int, bcrypt_rounds: int) -> dict:
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+    from miniflow.models import ApiKey
+    from miniflow.services import ApiKeyService
+
+    engine = create_engine("sqlite://")
+    ApiKey.__table__.create(engine)
+
+    # Legacy durumunda her tekrar aynı taramayı ölçsün diye HMAC'e taşıma yapılmaz
+    migrate = ApiKeyService.__dict__["_migrate_legacy_api_key"]
+    ApiKeyService._migrate_legacy_api_key = classmethod(lambda cls, **kwargs: None)
+
+    timings = []
+    try:
+        with Session(engine) as session:
+            full_api_key = _seed(session, mode, key_count, bcrypt_rounds)
+            for _ in range(repeat):
+                started = time.perf_counter()
+                api_key = ApiKeyService._find_api_key(session, full_api_key)
+                timings.append(time.perf_counter() - started)
+                if api_key is None:
+                    raise RuntimeError(f"Key not found ({mode}, {key_count} keys)")
+    finally:
+        ApiKeyService._migrate_legacy_api_key = migrate
+        engine.dispose()
+
+    return {
+        "mode": mode,
+        "keys": key_count,
+        "median_ms": round(statistics.median(timings) * 1000, 3),
+        "max_ms": round(max(timings) * 1000, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MiniFlow API key authentication latency benchmark (in-memory SQLite)")
+    parser.add_argument("--keys", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--modes", nargs="+", default=["lookup", "migrated", "legacy"],
+                        choices=["lookup", "migrated", "legacy"])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--bcrypt-rounds", type=int, default=4)
+    args = parser.parse_args()
+
+    results = [
+        run_benchmark(mode, key_count, args.repeat, args.bcrypt_rounds)
+        for mode in args.modes for key_count in args.keys
+    ]
+
+    print("\n" + "=" * 50)
+    print("API KEY AUTH LATENCY".center(50))
+    print("=" * 50)
+    print(f"{'mode':<10} {'keys':>8} {'median_ms':>12} {'max_ms':>12}")
+    for result in results:
+        print(f"{result['mode']:<10} {result['keys']:>8} {result['median_ms']:>12} {result['max_ms']:>12}")
+    print("=" * 50 + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Engine Throughput Benchmark
+===========================
+
+No-op script'lerle EngineManager'ın saniyede kaç task dağıtıp tamamladığını ölçer.
+Sadece EngineManager'ın public API'sini (put_item / get_execution_results) kullanır,
+bu yüzden farklı commit'ler üzerinde aynen çalıştırılıp karşılaştırılabilir.
+
+Kullanım (proje kök dizininden):
+    python benchmarks/engine_throughput.py --tasks 500
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+_project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_project_root))
+sys.path.insert(0, str(_project_root / "src"))
+
+NOOP_SCRIPT = '''
+def module():
+    class Noop:
+        def run(self, params):
+            return {}
+    return Noop()
+'''
+
+
+def _feed(engine, items):
+    for item in items:
+        while not engine.put_item(item):
+            time.sleep(0.01)
+
+
+def run_benchmark(tasks: int, iob_task_limit: int, queue_limit: int, timeout: float) -> dict:
+    from miniflow.engine.manager import EngineManager
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        script_path = os.path.join(tmp_dir, "noop_script.py")
+        with open(script_path, "w") as f:
+            f.write(NOOP_SCRIPT)
+
+        engine = EngineManager(queue_limit=queue_limit, iob_task_limit=iob_task_limit)
+        if not engine.start():
+            raise RuntimeError("Engine could not be started")
+
+        # Worker process'lerin ayağa kalkması ölçüme dahil edilmez
+        time.sleep(1.0)
+
+        items = [{
+            "script_path": script_path,
+            "params": {},
+            "execution_id": "BENCH",
+            "node_id": f"NOD-{i}",
+            "max_retries": 3,
+            "timeout_seconds": 30,
+            "process_type": "iob",
+        } for i in range(tasks)]
+
+        started = time.perf_counter()
+        feeder = threading.Thread(target=_feed, args=(engine, items), daemon=True)
+        feeder.start()
+
+        completed = 0
+        failed = 0
+        while completed < tasks and time.perf_counter() - started < timeout:
+            for result in engine.get_execution_results(max_items=100, timeout=0.05):
+                completed += 1
+                if result.get("status") != "SUCCESS":
+                    failed += 1
+        elapsed = time.perf_counter() - started
+
+        engine.shutdown()
+
+    return {
+        "tasks": tasks,
+        "completed": completed,
+        "failed": failed,
+        "elapsed_seconds": round(elapsed, 3),
+        "tasks_per_second": round(completed / elapsed, 2) if elapsed else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MiniFlow engine throughput benchmark (no-op scripts)")
+    parser.add_argument("--tasks", type=int, default=200)
+    parser.add_argument("--iob-task-limit", type=int, default=20)
+    parser.add_argument("--queue-limit", type=int, default=20)
+    parser.add_argument("--timeout", type=float, default=600.0)
+    args = parser.parse_args()
+
+    result = run_benchmark(args.tasks, args.iob_task_limit, args.queue_limit, args.timeout)
+
+    print("\n" + "=" * 50)
+    print("ENGINE THROUGHPUT".center(50))
+    print("=" * 50)
+    for key, value in result.items():
+        print(f"{key:<20}: {value}")
+    print("=" * 50 + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Execution Start Benchmark
+=========================
+
+Workflow'daki node sayısına göre execution başlatma süresini ölçer.
+ExecutionManagementService.start_execution_by_workflow'u in-memory SQLite üzerinde çağırır
+(execution + tüm ExecutionInput satırları), her tekrar sonunda transaction geri alınır.
+Sadece servisin public API'sini kullanır, bu yüzden farklı commit'ler üzerinde aynen
+çalıştırılıp karşılaştırılabilir.
+
+Kullanım (proje kök dizininden):
+    python benchmarks/execution_start.py --nodes 10 100 500 2000 --repeat 5
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+_project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_project_root))
+sys.path.insert(0, str(_project_root / "src"))
+
+
+def _seed_workflow(session, node_count: int) -> None:
+    """WFL-BENCH: node_count node'luk zincir (her node bir öncekine bağlı), hepsi aynı script'i kullanır"""
+    from miniflow.models import Workflow, Node, Edge, Script
+
+    session.add(Workflow(id="WFL-BENCH", workspace_id="WSP-BENCH", name="bench"))
+    session.add(Script(id="SCR-BENCH", name="bench", category="bench", file_path="/scripts/bench.py"))
+    for i in range(node_count):
+        session.add(Node(
+            id=f"NOD-{i:016X}", workflow_id="WFL-BENCH", name=f"node_{i}", script_id="SCR-BENCH",
+            input_params={"message": {"value": f"${{node:NOD-{max(i - 1, 0):016X}.message}}", "type": "string"}}
+        ))
+        if i:
+            session.add(Edge(
+                id=f"EDG-{i:016X}", workflow_id="WFL-BENCH",
+                from_node_id=f"NOD-{i - 1:016X}", to_node_id=f"NOD-{i:016X}"
+            ))
+    session.commit()
+
+
+def run_benchmark(node_count: int, repeat: int) -> dict:
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+    from miniflow.models import Workflow, Node, Edge, Script, Execution, ExecutionInput
+    from miniflow.services._9_execution_services.execution_managment_service import ExecutionManagementService
+
+    engine = create_engine("sqlite://")
+    for model in (Workflow, Node, Edge, Script, Execution, ExecutionInput):
+        model.__table__.create(engine)
+
+    # @log_function_call ve @with_transaction atlanır, servis benchmark session'ında çalışır
+    start_execution = ExecutionManagementService.start_execution_by_workflow.__wrapped__.__wrapped__
+    timings = []
+    with Session(engine) as session:
+        _seed_workflow(session, node_count)
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = start_execution(
+                ExecutionManagementService, session, workspace_id="WSP-BENCH", workflow_id="WFL-BENCH"
+            )
+            session.flush()
+            timings.append(time.perf_counter() - started)
+            session.rollback()
+
+            if result["execution_inputs_count"] != node_count:
+                raise RuntimeError(f"Expected {node_count} inputs, got {result['execution_inputs_count']}")
+    engine.dispose()
+
+    median = statistics.median(timings)
+    return {
+        "nodes": node_count,
+        "median_ms": round(median * 1000, 2),
+        "min_ms": round(min(timings) * 1000, 2),
+        "per_node_us": round(median / node_count * 1_000_000, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MiniFlow execution start latency benchmark (in-memory SQLite)")
+    parser.add_argument("--nodes", type=int, nargs="+", default=[10, 100, 500, 2000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = [run_benchmark(node_count, args.repeat) for node_count in args.nodes]
+
+    print("\n" + "=" * 50)
+    print("EXECUTION START LATENCY".center(50))
+    print("=" * 50)
+    print(f"{'nodes':>8} {'median_ms':>12} {'min_ms':>12} {'per_node_us':>14}")
+    for result in results:
+        print(f"{result['nodes']:>8} {result['median_ms']:>12} {result['min_ms']:>12} {result['per_node_us']:>14}")
+    print("=" * 50 + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Request Session Benchmark
+=========================
+
+Kimliği doğrulanmış, workspace kapsamlı bir isteğin veritabanı maliyetini ölçer:
+    1. LoginService.validate_access_token (authenticate_user)
+    2. WorkspaceMemberService.validate_workspace_access (require_workspace_access)
+    3. Route'un servis çağrısı: get_workflow (GET) veya update_workflow (PATCH)
+
+Her istek iki şekilde çalıştırılır:
+    - separate: Her servis kendi session'ını açar (request scope yok)
+    - request: Tüm adımlar request_session_scope içinde tek session'ı paylaşır (use_request_session)
+
+İstek başına SQL statement, connection checkout ve commit sayısı ile süre raporlanır.
+Veritabanı yolunu ölçmek için AccessTokenCache ve WorkspaceAccessCache kapatılır
+(cache hit durumunda adım 1 ve 2 zaten SQL çalıştırmaz).
+
+Kullanım (proje kök dizininden):
+    python benchmarks/request_session.py --requests 200
+"""
+import argparse
+import os
+import secrets
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("JWT_SECRET_KEY", secrets.token_hex(32))
+
+_project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_project_root))
+sys.path.insert(0, str(_project_root / "src"))
+
+
+class _Counters:
+    def __init__(self):
+        self.statements = 0
+        self.checkouts = 0
+        self.commits = 0
+
+
+def _instrument(sa_engine, counters: _Counters) -> None:
+    from sqlalchemy import event
+
+    @event.listens_for(sa_engine, "before_cursor_execute")
+    def _statement(conn, cursor, statement, *args):
+        if statement not in ("BEGIN", "COMMIT", "ROLLBACK") and not statement.startswith(("SAVEPOINT", "RELEASE")):
+            counters.statements += 1
+
+    @event.listens_for(sa_engine, "commit")
+    def _commit(conn):
+        counters.commits += 1
+
+    @event.listens_for(sa_engine.pool, "checkout")
+    def _checkout(dbapi_connection, connection_record, connection_proxy):
+        counters.checkouts += 1
+
+
+def _seed(session) -> str:
+    from miniflow.models import User, AuthSession, Workspace, WorkspaceMember, Workflow
+
+    jti = secrets.token_urlsafe(32)
+    session.add(User(id="USR-BENCH", username="bench", email="bench@example.com", is_verified=True))
+    session.add(AuthSession(
+        user_id="USR-BENCH", access_token_jti=jti,
+        access_token_expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+        refresh_token_jti=secrets.token_urlsafe(32),
+        refresh_token_expires_at=datetime.now(timezone.utc) + timedelta(days=1),
+    ))
+    session.add(Workspace(
+        id="WSP-BENCH", name="bench", slug="bench", owner_id="USR-BENCH", plan_id="PLN-BENCH",
+        member_limit=10, workflow_limit=10, custom_script_limit=10, max_file_size_mb_per_workspace=10,
+        storage_limit_mb=100, api_key_limit=10, monthly_execution_limit=100, monthly_concurrent_executions=10,
+    ))
+    session.add(WorkspaceMember(workspace_id="WSP-BENCH", user_id="USR-BENCH", role_id="ROL-BENCH", role_name="owner"))
+    session.add(Workflow(id="WFL-BENCH", workspace_id="WSP-BENCH", name="bench"))
+    session.commit()
+    return jti
+
+
+def _request(access_token: str, method: str, scoped: bool) -> None:
+    from miniflow.database import request_session_scope
+    from miniflow.services import LoginService, WorkspaceMemberService, WorkflowManagementService
+
+    with request_session_scope() if scoped else nullcontext():
+        result = LoginService.validate_access_token(access_token=access_token)
+        if not result["valid"]:
+            raise RuntimeError(f"Token rejected: {result}")
+        WorkspaceMemberService.validate_workspace_access(workspace_id="WSP-BENCH", user_id=result["user_id"])
+        if method == "GET":
+            WorkflowManagementService.get_workflow(workflow_id="WFL-BENCH")
+        else:
+            WorkflowManagementService.update_workflow(workflow_id="WFL-BENCH", description=secrets.token_hex(8))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MiniFlow per-request DB cost with and without request_session_scope (SQLite)")
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    from miniflow.database import get_database_manager, get_sqlite_config
+    from miniflow.utils import ConfigurationHandler
+    from miniflow.utils.helpers.access_token_cache import AccessTokenCache
+    from miniflow.utils.helpers.workspace_access_cache import WorkspaceAccessCache
+    from miniflow.utils.helpers.jwt_helper import create_access_token
+
+    ConfigurationHandler.ensure_loaded()
+    for cache in (AccessTokenCache, WorkspaceAccessCache):
+        cache._initialized = True
+        cache.enabled = False
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = get_database_manager()
+        manager.initialize(get_sqlite_config(os.path.join(tmp, "bench")), auto_start=True, create_tables=True)
+        counters = _Counters()
+        _instrument(manager.engine._engine, counters)
+
+        with manager.engine.session_context() as session:
+            jti = _seed(session)
+        access_token, _ = create_access_token(user_id="USR-BENCH", access_token_jti=jti)
+
+        rows = []
+        for method in ("GET", "PATCH"):
+            for mode in ("separate", "request"):
+                timings = []
+                counters.statements = counters.checkouts = counters.commits = 0
+                for _ in range(args.requests):
+                    started = time.perf_counter()
+                    _request(access_token, method, scoped=(mode == "request"))
+                    timings.append(time.perf_counter() - started)
+                rows.append({
+                    "request": method,
+                    "mode": mode,
+                    "statements": counters.statements / args.requests,
+                    "checkouts": counters.checkouts / args.requests,
+                    "commits": counters.commits / args.requests,
+                    "median_ms": round(statistics.median(timings) * 1000, 3),
+                })
+        manager.stop()
+
+    print("\n" + "=" * 72)
+    print("PER-REQUEST DATABASE COST".center(72))
+    print("=" * 72)
+    print(f"{'request':<8} {'mode':<10} {'statements':>12} {'checkouts':>10} {'commits':>8} {'median_ms':>12}")
+    for row in rows:
+        print(f"{row['request']:<8} {row['mode']:<10} {row['statements']:>12.1f} {row['checkouts']:>10.1f} "
+              f"{row['commits']:>8.1f} {row['median_ms']:>12}")
+    print("=" * 72 + "\n")
+
+
+if __name__ == "__main__":
+    main()
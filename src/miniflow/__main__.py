@@ -9,7 +9,10 @@ Terminal üzerinden sunucuyu yönetmek için iki mod:
 # STANDARD LIBRARY IMPORTS
 # ============================================================================
 import os
+import signal
+import socket
 import sys
+import threading
 import time
 import traceback
 import warnings
@@ -90,11 +93,13 @@ if len(sys.argv) > 1 and sys.argv[1].lower() in ("help", "--help", "-h"):
     print("\n  quickstart  Interactive .env setup wizard")
     print("  setup      Initial setup (database, seed data, tests)")
     print("  run        Start application (default)")
+    print("  engine     Start the shared engine daemon (ENGINE engine_mode = standalone)")
     print("  help       Show this help message")
     print("\nExamples:")
     print("  miniflow quickstart  # Create .env file interactively")
     print("  miniflow setup       # Initialize database")
     print("  miniflow run         # Start application")
+    print("  miniflow engine      # Start one engine per host for all API workers")
     print("  miniflow             # defaults to 'run'")
     print("\nNote: If 'miniflow' command not found, use:")
     print("  python -m src.miniflow <command>\n")
@@ -331,14 +336,29 @@ class MiniFlow:
                 self._worker_shutdown(worker_pid, state)
 
     def _worker_startup(self, pid: int) -> dict:
-        """Worker servisleri başlat"""
-        state = {}
+        """
+        Worker servisleri başlat.
+        Standalone modda engine ve handler'lar ayrı engine process'inde çalışır; API worker yalnızca veritabanına bağlanır.
+        """
         services = [
             ("Database", self._start_database),
-            ("Engine", self._start_engine),
-            ("Output Handler", self._start_output_handler),
-            ("Input Handler", self._start_input_handler),
+            ("API Key Usage", self._start_api_key_usage_handler),
+            ("Access Token Cache", self._start_access_token_cache),
+            ("Workspace Access Cache", self._start_workspace_access_cache),
         ]
+        if self.is_standalone_engine:
+            services.append(("Engine Client", self._start_engine_client))
+        else:
+            services.extend([
+                ("Engine", self._start_engine),
+                ("Output Handler", self._start_output_handler),
+                ("Input Handler", self._start_input_handler),
+            ])
+        return self._start_services(pid, services)
+
+    def _start_services(self, pid: int, services: list) -> dict:
+        """Servisleri sırayla başlatır, hata olursa başlatılanları kapatır"""
+        state = {}
 
         try:
             for i, (name, starter) in enumerate(services, 1):
@@ -368,7 +388,8 @@ class MiniFlow:
         print(f"\n[WORKER-{pid}] {prefix}Stopping services...")
 
         # Ters sırada kapat
-        shutdown_order = ['input_handler', 'output_handler', 'engine', 'database', 'scheduler']
+        shutdown_order = ['engine_server', 'engine_client', 'input_handler', 'output_handler', 'engine',
+                          'access_token_cache', 'workspace_access_cache', 'api_key_usage', 'database', 'scheduler']
 
         for i, service_key in enumerate(shutdown_order, 1):
             if service := state.get(service_key):
@@ -383,6 +404,46 @@ class MiniFlow:
 
         print(f"[WORKER-{pid}] {prefix}[SUCCESS] Shutdown complete\n")
 
+    # ========================================================================
+    # ENGINE MODE
+    # ========================================================================
+
+    def engine(self):
+        """
+        Host başına tek engine daemon'ı: worker process havuzu, input/output handler'lar ve
+        API worker'larının bağlandığı Unix socket sunucusu bu process'te çalışır.
+        """
+        self._print_header("MINIFLOW ENGINE MODE")
+
+        if not self._is_database_ready():
+            self._print_error("DATABASE NOT READY",
+                            "Please run setup first: python -m src.miniflow setup")
+            sys.exit(1)
+
+        if not hasattr(socket, "AF_UNIX"):
+            self._print_error("ENGINE MODE NOT SUPPORTED", "Standalone engine requires Unix domain sockets")
+            sys.exit(1)
+
+        pid = os.getpid()
+        state = self._start_services(pid, [
+            ("Database", self._start_database),
+            ("Engine", self._start_engine),
+            ("Output Handler", self._start_output_handler),
+            ("Input Handler", self._start_input_handler),
+            ("Engine Server", self._start_engine_server),
+        ])
+        self.is_running = True
+
+        stop_event = threading.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, lambda signum, frame: stop_event.set())
+
+        try:
+            stop_event.wait()
+        finally:
+            self.is_running = False
+            self._worker_shutdown(pid, state)
+
     def _start_server(self, app):
         """Uvicorn sunucu başlat"""
         import uvicorn
@@ -415,12 +476,41 @@ class MiniFlow:
     def _start_engine(self, state: dict):
         """Engine başlat"""
         from miniflow.engine.manager.engine_manager import EngineManager
-        engine = EngineManager()
+        section = "ENGINE"
+        engine = EngineManager(
+            cancel_grace_seconds=ConfigurationHandler.get_float(section, "engine_cancel_grace_seconds", fallback=5.0),
+            resource_sample_interval=ConfigurationHandler.get_float(section, "engine_resource_sample_interval", fallback=0.1),
+            iob_min_processes=ConfigurationHandler.get_int(section, "engine_iob_min_processes", fallback=1),
+            iob_max_processes=ConfigurationHandler.get_int(section, "engine_iob_max_processes", fallback=0) or None,
+            scale_up_queue_wait=ConfigurationHandler.get_float(section, "engine_scale_up_queue_wait", fallback=0.5),
+            scale_up_backlog=ConfigurationHandler.get_int(section, "engine_scale_up_backlog", fallback=10),
+            idle_retire_seconds=ConfigurationHandler.get_float(section, "engine_idle_retire_seconds", fallback=60.0),
+            cb_task_limit=ConfigurationHandler.get_int(section, "engine_cb_task_limit", fallback=1),
+            cb_processes=ConfigurationHandler.get_int(section, "engine_cb_processes", fallback=0) or None,
+            cb_cpu_affinity=ConfigurationHandler.get_bool(section, "engine_cb_cpu_affinity", fallback=False),
+        )
         if not engine.started:
             engine.start()
         state['engine_manager'] = engine
         return engine
 
+    def _start_engine_server(self, state: dict):
+        """Standalone engine'in Unix socket sunucusunu başlat"""
+        from miniflow.engine.manager.engine_server import EngineServer
+        server = EngineServer(state['engine_manager'], self._engine_socket_path)
+        success, message = server.start()
+        if not success:
+            raise InternalError("engine_server", message)
+        return server
+
+    def _start_engine_client(self, state: dict):
+        """API worker'dan standalone engine'e bağlantı (engine henüz ayakta değilse de worker başlar)"""
+        from miniflow.engine.manager.engine_server import EngineClient
+        client = EngineClient(self._engine_socket_path)
+        if not client.ping():
+            print(f"[WARNING] Engine daemon is not reachable at {self._engine_socket_path}; start it with 'miniflow engine'")
+        return client
+
     def _start_output_handler(self, state: dict):
         """Output Handler başlat"""
         from miniflow.handlers.execution_output_handler import ExecutionOutputHandler
@@ -433,6 +523,24 @@ class MiniFlow:
         ExecutionInputHandler.start(state['engine_manager'])
         return ExecutionInputHandler
 
+    def _start_api_key_usage_handler(self, state: dict):
+        """API key kullanım sayaçlarının write-behind flush'ını başlat"""
+        from miniflow.handlers.api_key_usage_handler import ApiKeyUsageHandler
+        ApiKeyUsageHandler.start()
+        return ApiKeyUsageHandler
+
+    def _start_access_token_cache(self, state: dict):
+        """Access token cache'inin diğer worker'lardan gelen invalidation dinleyicisini başlat (redis backend)"""
+        from miniflow.utils.helpers.access_token_cache import AccessTokenCache
+        AccessTokenCache.start()
+        return AccessTokenCache
+
+    def _start_workspace_access_cache(self, state: dict):
+        """Workspace access cache'inin diğer worker'lardan gelen invalidation dinleyicisini başlat (redis backend)"""
+        from miniflow.utils.helpers.workspace_access_cache import WorkspaceAccessCache
+        WorkspaceAccessCache.start()
+        return WorkspaceAccessCache
+
     def _start_scheduler(self, pid: int, state: dict):
         """
         Scheduler başlat (opsiyonel)
@@ -457,6 +565,8 @@ class MiniFlow:
             service.shutdown()
         elif hasattr(service, 'stop'):
             service.stop()
+        elif hasattr(service, 'close'):
+            service.close()
 
     # ========================================================================
     # MIDDLEWARE & ROUTES
@@ -510,7 +620,8 @@ class MiniFlow:
             return {
                 "status": "healthy",
                 "environment": self._app_env,
-                "database_type": self._db_type
+                "database_type": self._db_type,
+                "engine": self._engine_health()
             }
 
         # API routers
@@ -549,6 +660,17 @@ class MiniFlow:
 
         return configs[self._db_type]()
 
+    def _engine_health(self) -> str:
+        """Embedded modda engine worker içindedir; standalone modda daemon'a ping atılır"""
+        if not self.is_standalone_engine:
+            return "embedded"
+        from miniflow.engine.manager.engine_server import EngineClient
+        client = EngineClient(self._engine_socket_path, timeout=1.0)
+        try:
+            return "up" if client.ping() else "down"
+        finally:
+            client.close()
+
     def _test_db_connection(self) -> bool:
         """Veritabanı bağlantı testi"""
         if not self._db_manager or not self._db_manager.is_initialized:
@@ -597,6 +719,14 @@ class MiniFlow:
     def _config(self):
         return ConfigurationHandler
 
+    @property
+    def is_standalone_engine(self) -> bool:
+        return self._config.get("ENGINE", "engine_mode", "embedded").lower() == "standalone"
+
+    @property
+    def _engine_socket_path(self) -> str:
+        return self._config.get("ENGINE", "engine_socket_path", "/tmp/miniflow-engine.sock")
+
     @property
     def is_development(self) -> bool:
         return 'dev' in self._app_env
@@ -641,6 +771,7 @@ class MiniFlow:
             print(f"Documentation     : http://{host}:{port}/docs")
         print(f"Reload            : {'[ACTIVE]' if reload else '[DISABLED]'}")
         print(f"Workers           : {workers}")
+        print(f"Engine            : {'STANDALONE (' + self._engine_socket_path + ')' if self.is_standalone_engine else 'EMBEDDED'}")
         print("-" * 70 + "\n")
 
     def _handle_initialization_error(self, e):
@@ -705,6 +836,8 @@ def main():
             miniflow.setup()
         elif command == "run":
             miniflow.run()
+        elif command == "engine":
+            miniflow.engine()
         else:
             print(f"\nUnknown command: {command}")
             print("Use 'miniflow help' for available commands\n")
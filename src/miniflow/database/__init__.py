@@ -9,6 +9,9 @@ from .engine import (
     with_readonly_session,
     with_retry_session,
     inject_session,
+    request_session_scope,
+    get_request_session,
+    run_after_commit,
 )
 
 # Config
@@ -40,6 +43,9 @@ __all__ = [
     "with_readonly_session",
     "with_retry_session",
     "inject_session",
+    "request_session_scope",
+    "get_request_session",
+    "run_after_commit",
     
     # Config
     "EngineConfig",
@@ -54,6 +54,11 @@ Decorator'lar:
     - with_retry_session: Deadlock/timeout için retry desteği
     - inject_session: Keyword argument olarak session inject
 
+Request Scope:
+    - request_session_scope: Bir istek boyunca with_transaction / with_readonly_session
+      servislerinin paylaştığı tek session (tek commit)
+    - run_after_commit: Hook'u en dıştaki transaction'ın commit'ine bağlar (SAVEPOINT release'ine değil)
+
 Örnekler ve Dokümantasyon:
     - Her sınıf ve fonksiyon detaylı docstring içerir
     - examples/ klasöründe kullanım örnekleri
@@ -87,6 +92,7 @@ from .decorators import (
     with_retry_session,
     inject_session,
 )
+from .request_session import request_session_scope, get_request_session, run_after_commit
 
 
 __all__ = [
@@ -99,5 +105,8 @@ __all__ = [
     'with_readonly_session',
     'with_retry_session',
     'inject_session',
+    'request_session_scope',
+    'get_request_session',
+    'run_after_commit',
 ]
 
@@ -6,6 +6,7 @@ from sqlalchemy.exc import SQLAlchemyError, OperationalError, DBAPIError
 
 from miniflow.core.exceptions import DatabaseQueryError
 from .manager import DatabaseManager, get_database_manager
+from .request_session import get_request_session
 
 
 T = TypeVar('T')
@@ -87,6 +88,19 @@ def _inject_session_parameter(func: Callable, session: Session, args: tuple, kwa
         return func(*args_list, **kwargs)
 
 
+def _reusable_request_session(
+    manager: Optional[DatabaseManager],
+    isolation_level: Optional[str] = None
+) -> Optional[Session]:
+    """
+    Aktif request_session_scope varsa ve decorator varsayılan ayarlarla kullanılmışsa
+    (global manager, isolation level yok) paylaşılan session'ı döner, yoksa None.
+    """
+    if manager is not None or isolation_level is not None:
+        return None
+    return get_request_session()
+
+
 def with_session(
     auto_commit: bool = True,
     auto_flush: bool = True,
@@ -387,6 +401,12 @@ def with_transaction(
             
             @wraps(original_func)
             def wrapper(*args, **kwargs) -> T:
+                request_session = _reusable_request_session(manager, isolation_level)
+                if request_session is not None:
+                    # Request scope'u: commit scope sonunda, hata olursa sadece bu çağrı geri alınır
+                    with request_session.begin_nested():
+                        return _inject_session_parameter(original_func, request_session, args, kwargs)
+                
                 mgr = manager or get_database_manager()
                 
                 with mgr.engine.session_context(
@@ -411,6 +431,12 @@ def with_transaction(
             
             @wraps(original_func)
             def wrapper(*args, **kwargs) -> T:
+                request_session = _reusable_request_session(manager, isolation_level)
+                if request_session is not None:
+                    # Request scope'u: commit scope sonunda, hata olursa sadece bu çağrı geri alınır
+                    with request_session.begin_nested():
+                        return _inject_session_parameter(original_func, request_session, args, kwargs)
+                
                 mgr = manager or get_database_manager()
                 
                 with mgr.engine.session_context(
@@ -433,6 +459,12 @@ def with_transaction(
             # Normal fonksiyon
             @wraps(func)
             def wrapper(*args, **kwargs) -> T:
+                request_session = _reusable_request_session(manager, isolation_level)
+                if request_session is not None:
+                    # Request scope'u: commit scope sonunda, hata olursa sadece bu çağrı geri alınır
+                    with request_session.begin_nested():
+                        return _inject_session_parameter(func, request_session, args, kwargs)
+                
                 mgr = manager or get_database_manager()
                 
                 with mgr.engine.session_context(
@@ -569,6 +601,10 @@ def with_readonly_session(
             
             @wraps(original_func)
             def wrapper(*args, **kwargs) -> T:
+                request_session = _reusable_request_session(manager)
+                if request_session is not None:
+                    return _inject_session_parameter(original_func, request_session, args, kwargs)
+                
                 mgr = manager or get_database_manager()
                 
                 with mgr.engine.session_context(
@@ -585,6 +621,10 @@ def with_readonly_session(
             
             @wraps(original_func)
             def wrapper(*args, **kwargs) -> T:
+                request_session = _reusable_request_session(manager)
+                if request_session is not None:
+                    return _inject_session_parameter(original_func, request_session, args, kwargs)
+                
                 mgr = manager or get_database_manager()
                 
                 with mgr.engine.session_context(
@@ -599,6 +639,10 @@ def with_readonly_session(
         else:
             @wraps(func)
             def wrapper(*args, **kwargs) -> T:
+                request_session = _reusable_request_session(manager)
+                if request_session is not None:
+                    return _inject_session_parameter(func, request_session, args, kwargs)
+                
                 mgr = manager or get_database_manager()
                 
                 with mgr.engine.session_context(
@@ -6,10 +6,10 @@ from contextlib import contextmanager
 from typing import Optional, Callable, TypeVar, Tuple, Type, Set
 
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy import create_engine, Engine, text
+from sqlalchemy import create_engine, event, Engine, text
 from sqlalchemy.exc import SQLAlchemyError, OperationalError, DBAPIError
 
-from ..config import DatabaseConfig
+from ..config import DatabaseConfig, DatabaseType
 from miniflow.core.exceptions import (
     DatabaseError, DatabaseConnectionError, DatabaseQueryError,
     DatabaseConfigurationError, DatabaseSessionError, DatabaseEngineError,
@@ -395,6 +395,8 @@ class DatabaseEngine:
                 engine_kwargs.pop('pool_pre_ping', None)
 
             self._engine = create_engine(self._connection_string, **engine_kwargs)
+            if self.config.db_type == DatabaseType.SQLITE:
+                self._install_sqlite_transaction_handling(self._engine)
             logger.info("Database engine created successfully")
 
         except Exception as e:
@@ -402,6 +404,23 @@ class DatabaseEngine:
             self._log_error("build_engine", error)
             raise error
         
+    @staticmethod
+    def _install_sqlite_transaction_handling(engine: Engine) -> None:
+        """pysqlite'ın kendi transaction yönetimini kapatıp BEGIN'i SQLAlchemy'ye bırakır.
+
+        pysqlite ilk DML'den önce BEGIN gönderir, SAVEPOINT'ten önce göndermez; bu durumda
+        RELEASE SAVEPOINT değişikliği kalıcı olarak commit eder ve request_session_scope'un
+        (ve begin_nested() kullanan her kodun) dış rollback'i hiçbir şeyi geri almaz.
+        Transaction her zaman açık BEGIN ile başlatılınca SAVEPOINT'ler dış transaction'ın içinde kalır.
+        """
+        @event.listens_for(engine, "connect")
+        def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine, "begin")
+        def _begin(connection):
+            connection.exec_driver_sql("BEGIN")
+
     def _build_session_factory(self) -> None:
         """Veritabanı oturumları oluşturmak için session factory oluştur."""
         try:
@@ -0,0 +1,110 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, SessionTransaction
+
+from .manager import DatabaseManager, get_database_manager
+
+
+_request_session: ContextVar[Optional[Session]] = ContextVar("miniflow_request_session", default=None)
+
+_AFTER_COMMIT_KEY = "miniflow_after_commit"
+
+
+def get_request_session() -> Optional[Session]:
+    """Aktif request_session_scope'un session'ını, scope yoksa None döner."""
+    return _request_session.get()
+
+
+@contextmanager
+def request_session_scope(manager: Optional[DatabaseManager] = None) -> Iterator[Session]:
+    """Bir HTTP isteği (unit of work) boyunca paylaşılan session.
+
+    Scope açıkken @with_transaction ve @with_readonly_session (manager=None) ile dekore edilmiş
+    servisler yeni session açmak yerine bu session'ı kullanır:
+        - with_readonly_session: Fonksiyon doğrudan paylaşılan session ile çağrılır
+        - with_transaction: Fonksiyon bir SAVEPOINT içinde çalışır; hata fırlatırsa sadece
+          kendi değişiklikleri geri alınır (scope dışındaki davranışla aynı)
+
+    Scope sonunda tek commit yapılır, hata ile çıkılırsa tüm değişiklikler rollback edilir.
+    run_after_commit() ile kaydedilen hook'lar (ör. cache invalidation) bu commit'te çalışır.
+    Scope iç içe açılırsa mevcut session kullanılır.
+
+    Examples:
+        >>> with request_session_scope():
+        ...     LoginService.validate_access_token(access_token=token)
+        ...     WorkflowManagementService.create_workflow(...)
+        ...     # Tek connection checkout, tek commit
+
+    Note:
+        - Session ilk sorguda connection alır ve scope kapanana kadar tutar; uzun süren
+          veritabanı dışı işler (dosya, script çalıştırma, e-posta) yapan isteklerde kullanılmamalı
+        - isolation_level veya özel manager verilen decorator'lar ve with_retry_session
+          her zaman kendi session'larını açar
+        - ContextVar kullanır: Thread'ler scope'u devralmaz, asyncio task'ları kopyasını alır
+    """
+    current = _request_session.get()
+    if current is not None:
+        yield current
+        return
+
+    mgr = manager or get_database_manager()
+    with mgr.engine.session_context(auto_commit=True, auto_flush=True) as session:
+        token = _request_session.set(session)
+        try:
+            yield session
+        finally:
+            _request_session.reset(token)
+
+
+def run_after_commit(session: Session, callback: Callable[[], None]) -> None:
+    """Session'ın en dıştaki transaction'ı commit edildiğinde callback'i bir kez çağırır.
+
+    Session'ın after_commit event'i SAVEPOINT release edildiğinde de tetiklenir; request scope'unda
+    her with_transaction çağrısı bir SAVEPOINT içinde çalıştığı için hook'lar burada kuyruğa alınır:
+        - SAVEPOINT release: Hook'lar bekler, dış transaction'a kalır
+        - SAVEPOINT rollback: O SAVEPOINT (ve içindekiler) sırasında kaydedilen hook'lar düşer
+        - Dış transaction commit: Bekleyen tüm hook'lar kayıt sırasıyla çalışır
+        - Dış transaction rollback: Bekleyen tüm hook'lar düşer
+
+    Examples:
+        >>> run_after_commit(session, lambda: AccessTokenCache.invalidate(jti=jti))
+    """
+    hooks: Optional[List[Tuple[Optional[SessionTransaction], Callable[[], None]]]] = session.info.get(_AFTER_COMMIT_KEY)
+    if hooks is None:
+        hooks = session.info[_AFTER_COMMIT_KEY] = []
+        event.listen(session, "after_commit", _run_after_commit_hooks)
+        event.listen(session, "after_soft_rollback", _drop_after_commit_hooks)
+    hooks.append((session.get_nested_transaction() or session.get_transaction(), callback))
+
+
+def _run_after_commit_hooks(session: Session) -> None:
+    if session.in_nested_transaction():
+        return
+    hooks = session.info.get(_AFTER_COMMIT_KEY)
+    if not hooks:
+        return
+    callbacks = [callback for _, callback in hooks]
+    hooks.clear()
+    for callback in callbacks:
+        callback()
+
+
+def _drop_after_commit_hooks(session: Session, previous_transaction: SessionTransaction) -> None:
+    hooks = session.info.get(_AFTER_COMMIT_KEY)
+    if not hooks:
+        return
+    if not previous_transaction.nested:
+        hooks.clear()
+        return
+
+    def _registered_inside(transaction: Optional[SessionTransaction]) -> bool:
+        while transaction is not None:
+            if transaction is previous_transaction:
+                return True
+            transaction = transaction.parent
+        return False
+
+    hooks[:] = [hook for hook in hooks if not _registered_inside(hook[0])]
@@ -1,28 +1,57 @@
-from threading import Event
+from datetime import datetime, timezone
+from threading import Event, Condition
 from multiprocessing import cpu_count
 from .type_controller import TypeController
 
 
 class ProcessController:
-    def __init__(self, output_queue, input_queue, logger, iob_task_limit: int, cb_task_limit: int, os: bool):
+    def __init__(self, output_queue, input_queue, logger, iob_task_limit: int, cb_task_limit: int, os: bool,
+                 cancel_grace_seconds: float = 5.0, resource_sample_interval: float = 0.1,
+                 iob_min_processes: int = None, iob_max_processes: int = None,
+                 scale_up_queue_wait: float = 0.5, scale_up_backlog: int = 10, idle_retire_seconds: float = 60.0,
+                 cb_processes: int = None, cb_cpu_affinity: bool = False):
         self.output_queue = output_queue
         self.input_queue = input_queue
-        self.max_process_count = cpu_count() - 1
+        # Tek çekirdekli host'larda da en az bir IO-Bound process kalsın
+        self.max_process_count = max(cpu_count() - 1, 2)
+        # CPU-Bound lane çekirdek sayısına göre boyutlanır: process başına cb_task_limit (varsayılan 1) task
+        self.cb_processes = max(cb_processes or cpu_count() - 1, 1)
+        # IO-Bound lane min..max arasında autoscale edilir; verilmezse sabit max_process_count - 1
+        self.iob_max_processes = max(iob_max_processes or self.max_process_count - 1, 1)
+        self.iob_min_processes = min(max(iob_min_processes or self.iob_max_processes, 1), self.iob_max_processes)
+        # QueueController bağlandığında lane bazlı bekleyen item sayısını verir
+        self.backlog_provider = None
         self.started = False
         self.shutdown_event = Event()
+        # Type controller'lar slot boşaldığında bu condition'ı notify eder
+        self.slot_condition = Condition()
         self.os = os
         self.cb_task_limit = cb_task_limit
         self.iob_task_limit = iob_task_limit
         self.logger = logger
         
         self.logger.info(f"[PROCESS CONTROLLER] Initializing with max_process_count={self.max_process_count}")
-        self.logger.info(f"[PROCESS CONTROLLER] CPU-Bound: 1 process, task_limit={cb_task_limit}")
-        self.logger.info(f"[PROCESS CONTROLLER] IO-Bound: {self.max_process_count - 1} processes, task_limit={iob_task_limit}")
+        self.logger.info(f"[PROCESS CONTROLLER] CPU-Bound: {self.cb_processes} processes, task_limit={cb_task_limit}, "
+                         f"cpu_affinity={cb_cpu_affinity}")
+        self.logger.info(f"[PROCESS CONTROLLER] IO-Bound: {self.iob_min_processes}-{self.iob_max_processes} processes, task_limit={iob_task_limit}")
         
-        self.cb_controller = TypeController(output_queue=self.output_queue, process_count=1, task_limit=cb_task_limit,
-                                            os=self.os, controller_type="CPU-Bound")
-        self.iob_controller = TypeController(output_queue=self.output_queue, process_count=self.max_process_count - 1,
-                                             task_limit=iob_task_limit, os=self.os, controller_type="IO-Bound")
+        self.cb_controller = TypeController(output_queue=self.output_queue, process_count=self.cb_processes,
+                                            task_limit=cb_task_limit, os=self.os, controller_type="CPU-Bound",
+                                            slot_condition=self.slot_condition,
+                                            cancel_grace_seconds=cancel_grace_seconds,
+                                            recycle_stuck_processes=True,
+                                            resource_sample_interval=resource_sample_interval,
+                                            cpu_affinity=cb_cpu_affinity)
+        self.iob_controller = TypeController(output_queue=self.output_queue, process_count=self.iob_min_processes,
+                                             task_limit=iob_task_limit, os=self.os, controller_type="IO-Bound",
+                                             slot_condition=self.slot_condition,
+                                             cancel_grace_seconds=cancel_grace_seconds,
+                                             resource_sample_interval=resource_sample_interval,
+                                             max_process_count=self.iob_max_processes,
+                                             scale_up_queue_wait=scale_up_queue_wait,
+                                             scale_up_backlog=scale_up_backlog,
+                                             idle_retire_seconds=idle_retire_seconds,
+                                             backlog_provider=lambda: self.get_backlog("iob"))
         
         self.logger.info("[PROCESS CONTROLLER] Type controllers initialized")
 
@@ -49,35 +78,50 @@ class ProcessController:
     def get_iob_ps_info(self):
         return self.iob_controller.get_ps_info()
 
+    def get_backlog(self, process_type):
+        """Lane'e dağıtılmayı bekleyen item sayısı (autoscaler girdisi)"""
+        if self.backlog_provider is None:
+            return 0
+        return self.backlog_provider(process_type)
+
+    def _get_type_controller(self, process_type):
+        if process_type == "cb":
+            return self.cb_controller
+        elif process_type == "iob":
+            return self.iob_controller
+        return None
+
+    def has_free_slot(self, process_type):
+        controller = self._get_type_controller(process_type)
+        if controller is None:
+            # Bilinmeyen process_type create_thread içinde FAILED olarak raporlanır
+            return True
+        return controller.has_free_slot()
+
+    def wait_for_slot(self, timeout: float):
+        """Herhangi bir type controller'da slot boşalana kadar (veya timeout'a kadar) bekler."""
+        with self.slot_condition:
+            return self.slot_condition.wait(timeout=timeout)
+
+    def is_late_result(self, item):
+        """Timeout olarak raporlanmış task'tan sonradan gelen worker sonucu mu?"""
+        if item.get("reported_by_engine"):
+            return False
+        task_id = item.get("task_id")
+        return self.cb_controller.is_late_result(task_id) or self.iob_controller.is_late_result(task_id)
+
     def create_thread(self, item):
         if not self._check_retry(item):
             process_type = item.get("process_type")
             self.logger.info(f"[PROCESS CONTROLLER] Item process_type: {process_type}")
-            
+
             if process_type == "cb":
                 self.logger.info("[PROCESS CONTROLLER] Using CPU-Bound controller")
-                success, message = self.cb_controller.create_thread(item)
-
-                if success:
-                    self.logger.info("[PROCESS CONTROLLER] CPU-Bound task created successfully")
-                    return True
-                else:
-                    self.logger.error(message)
-                    self.logger.warning("[PROCESS CONTROLLER] CPU-Bound controller busy, requeueing")
-                    self.input_queue.put(item)
-                    return False
+                return self._dispatch(self.cb_controller, item, "CPU-Bound")
 
             elif process_type == "iob":
                 self.logger.info("[PROCESS CONTROLLER] Using IO-Bound controller")
-                success, message = self.iob_controller.create_thread(item)
-                if success:
-                    self.logger.info("[PROCESS CONTROLLER] IO-Bound task created successfully")
-                    return True
-                else:
-                    self.logger.error(message)
-                    self.logger.warning("[PROCESS CONTROLLER] IO-Bound controller busy, requeueing")
-                    self.input_queue.put(item)
-                    return False
+                return self._dispatch(self.iob_controller, item, "IO-Bound")
 
             else:
                 self.logger.error(f"[PROCESS CONTROLLER] Unknown process_type: {process_type}, failing task")
@@ -93,14 +137,56 @@ class ProcessController:
             self.output_queue.put(item)
             return False
 
-    def _check_retry(self, item):
-        if item.get("retry") is not None:
+    def _dispatch(self, controller, item, label):
+        try:
+            success, message = controller.create_thread(item)
+        except Exception as e:
+            # Komut worker'a iletilemedi: gerçek bir deneme, retry hakkından düşer
+            self.logger.error(f"[PROCESS CONTROLLER] {label} dispatch failed: {e}, requeueing")
             item["retry"] += 1
-            return item.get("retry") > item.get("max_retries")
+            self.requeue(item, label)
+            return False
 
-        else:
+        if success:
+            self.logger.info(f"[PROCESS CONTROLLER] {label} task created successfully")
+            return True
+
+        # Tüm worker'lar dolu: item hiç çalışmadığı için retry hakkı harcanmaz
+        self.logger.debug(message)
+        self.logger.warning(f"[PROCESS CONTROLLER] {label} controller busy, requeueing")
+        self.requeue(item, label)
+        return False
+
+    def requeue(self, item, label):
+        """
+        Item'ı input queue'ya geri koyar. BaseQueue.put dolu kuyrukta item'ı düşürdüğü için put_with_retry
+        kullanılır; yine de kabul edilmezse item sessizce kaybolmaz, output queue'ya FAILED olarak raporlanır.
+        """
+        if self.input_queue.put_with_retry(item):
+            return True
+
+        self.logger.error(f"[PROCESS CONTROLLER] {label} requeue rejected, input queue full: "
+                          f"execution_id={item.get('execution_id')}, node_id={item.get('node_id')}")
+        failed = dict(item)
+        failed["ended_at"] = datetime.now(timezone.utc).isoformat()
+        failed["status"] = "FAILED"
+        failed["timed_out"] = False
+        # Worker'dan gelen geç sonuçtan ayırt etmek için
+        failed["reported_by_engine"] = True
+        failed["error_message"] = "Engine input queue full, task could not be requeued"
+        failed["error_details"] = {
+            "exception_type": "QueueFull",
+            "message": f"Input queue rejected the requeued task ({label})"
+        }
+        self.output_queue.put_with_retry(failed)
+        return False
+
+    def _check_retry(self, item):
+        """Retry hakkı bitmiş mi? Sayaç yalnızca başarısız dispatch denemelerinde artırılır."""
+        if item.get("retry") is None:
             item["retry"] = 0
             return False
+        return item.get("retry") > item.get("max_retries", 3)
 
     def shutdown(self):
         """Graceful shutdown"""
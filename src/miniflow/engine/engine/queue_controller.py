@@ -1,21 +1,35 @@
+from collections import Counter, deque
 from threading import Event, Lock, Thread
-import time
+from miniflow.core.logger import get_logger
+
+# Logger instance
+logger = get_logger(__name__)
 
 
 class QueueController:
-    def __init__(self, input_queue, process_controller):
+    def __init__(self, input_queue, process_controller, batch_size: int = 50, slot_wait_timeout: float = 0.5):
         self.input_queue = input_queue
         self.process_controller = process_controller
+        # Shutdown'da dağıtılamayan batch kuyruğa geri konur; kuyruk kapasitesini aşan batch sığmaz
+        capacity = getattr(input_queue, "maxsize", None)
+        if capacity and capacity > 0 and batch_size > capacity:
+            logger.warning(f"[QUEUE CONTROLLER] batch_size={batch_size} exceeds input queue capacity, "
+                           f"clamping to {capacity}")
+            batch_size = capacity
+        self.batch_size = batch_size
+        self.slot_wait_timeout = slot_wait_timeout
         self.started = False
         self.shutdown_event = Event()
         self.process_lock = Lock()
+        # Slot bekleyen item'ların lane bazlı sayısı
+        self.pending_counts = Counter()
 
     def start(self):
         if self.started:
             return False, "[QUEUE CONTROLLER] QueueController already started"
 
-        watcher_thread = Thread(target=self.watch_input_queue, daemon=True)
-        watcher_thread.start()
+        self.watcher_thread = Thread(target=self.watch_input_queue, daemon=True)
+        self.watcher_thread.start()
 
         self.started = True
         return True, "[QUEUE CONTROLLER] QueueController started successfully"
@@ -23,22 +37,66 @@ class QueueController:
     def watch_input_queue(self):
         while not self.shutdown_event.is_set():
             try:
-                item = self.input_queue.get_with_timeout(timeout=1.0)
-                if item is not None:
-                    with self.process_lock:
-                        print(f"[QUEUE CONTROLLER] Processing item: execution_id={item.get('execution_id')}, process_type={item.get('process_type')}")
-                        print(f"[QUEUE CONTROLLER] Item details: {item}")
-                        
-                        if self.process_controller.create_thread(item):
-                            print("[QUEUE CONTROLLER] Task Created Successfully")
-                        else:
-                            print("[QUEUE CONTROLLER] Task Creation Failed")
-                            print(f"[QUEUE CONTROLLER] Failed item: execution_id={item.get('execution_id')}, process_type={item.get('process_type')}")
-
-                        time.sleep(1)
+                items = self.input_queue.get_batch(max_items=self.batch_size, timeout=1.0)
+                if items:
+                    self._dispatch_batch(items)
 
             except Exception as e:
-                print(f"[QUEUE CONTROLLER] Input watcher error: {e}")
+                if self.shutdown_event.is_set():
+                    break
+                logger.error(f"[QUEUE CONTROLLER] Input watcher error: {e}")
+
+    def _dispatch_batch(self, items):
+        """
+        Batch'teki item'ları boş slotu olan lane'lere dağıtır.
+        Lane'i dolu olan item'lar sıranın sonuna alınır; tüm lane'ler doluysa
+        type controller'lardan "slot boşaldı" bildirimi beklenir.
+        """
+        pending = deque(items)
+        blocked = 0
+        self.pending_counts = Counter(item.get("process_type") for item in items)
+
+        while pending and not self.shutdown_event.is_set():
+            item = pending.popleft()
+
+            if self.process_controller.has_free_slot(item.get("process_type")):
+                blocked = 0
+                self.pending_counts[item.get("process_type")] -= 1
+                self._dispatch(item)
+                continue
+
+            pending.append(item)
+            blocked += 1
+            if blocked >= len(pending):
+                self.process_controller.wait_for_slot(timeout=self.slot_wait_timeout)
+                blocked = 0
+
+        # Shutdown sırasında dağıtılamayan item'ları kaybetmemek için kuyruğa geri koy;
+        # kuyruk kabul etmezse ProcessController item'ı FAILED olarak raporlar
+        for item in pending:
+            self.process_controller.requeue(item, "Shutdown")
+        self.pending_counts = Counter()
+
+    def get_backlog(self, process_type):
+        """
+        Lane'e dağıtılmayı bekleyen item sayısı: dispatcher'da slot bekleyenler ile input queue'da
+        henüz alınmamış item'lar (lane'i bilinmediğinden her lane için sayılır).
+        """
+        return self.pending_counts.get(process_type, 0) + self.input_queue.size()
+
+    def _dispatch(self, item):
+        with self.process_lock:
+            logger.debug(f"[QUEUE CONTROLLER] Processing item: execution_id={item.get('execution_id')}, "
+                         f"process_type={item.get('process_type')}")
+
+            if self.process_controller.create_thread(item):
+                logger.debug("[QUEUE CONTROLLER] Task Created Successfully")
+            else:
+                logger.warning(f"[QUEUE CONTROLLER] Task Creation Failed: execution_id={item.get('execution_id')}, "
+                               f"process_type={item.get('process_type')}")
 
     def shutdown(self):
-        self.shutdown_event.set()
\ No newline at end of file
+        self.shutdown_event.set()
+        # wait_for_slot içinde bekleyen watcher'ı uyandır
+        with self.process_controller.slot_condition:
+            self.process_controller.slot_condition.notify_all()
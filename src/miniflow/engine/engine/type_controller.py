@@ -1,21 +1,72 @@
-import json, psutil, time
-from multiprocessing import Pipe
+import json, psutil, time, uuid
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from multiprocessing import Pipe, Value
+from multiprocessing.connection import wait
 from ..process import BaseProcess
-from threading import Thread, Lock, Event
+from threading import Thread, Lock, Event, Condition
+from miniflow.core.logger import get_logger
+
+# Logger instance
+logger = get_logger(__name__)
+
+# Geç gelen sonuçları ayıklamak için hatırlanan timeout'lu task sayısı
+TIMED_OUT_HISTORY_LIMIT = 10000
+
+# Status listener'ın deadline yokken en uzun bekleme süresi (saniye)
+STATUS_WAIT_TIMEOUT = 1.0
+
+# Autoscaler p95 hesabında kullanılan kuyruk bekleme örnekleri
+QUEUE_WAIT_SAMPLE_LIMIT = 500
+QUEUE_WAIT_WINDOW_SECONDS = 30.0
 
 
 class TypeController:
-    def __init__(self, output_queue, os: bool, process_count: int, task_limit: int, controller_type: str):
+    def __init__(self, output_queue, os: bool, process_count: int, task_limit: int, controller_type: str,
+                 slot_condition: Condition = None, cancel_grace_seconds: float = 5.0,
+                 recycle_stuck_processes: bool = False, resource_sample_interval: float = 0.1,
+                 max_process_count: int = None, scale_up_queue_wait: float = 0.5, scale_up_backlog: int = 10,
+                 idle_retire_seconds: float = 60.0, autoscale_interval: float = 1.0,
+                 backlog_provider: callable = None, cpu_affinity: bool = False):
         self.output_queue = output_queue
         self.priority = -19 if os else psutil.HIGH_PRIORITY_CLASS  # self._unix_process_classes() if os else self._nt_process_classes()
+        # process_count başlangıç ve alt sınırdır; max_process_count'a kadar autoscaler büyütür
         self.process_count = process_count
+        self.max_process_count = max(max_process_count or process_count, process_count)
         self.task_limit = task_limit
         self.controller_type = controller_type
+        # Slot boşaldığında QueueController'ı uyandırmak için (ProcessController ile paylaşılır)
+        self.slot_condition = slot_condition or Condition()
+        # Cancel sonrası thread'in durması için tanınan süre
+        self.cancel_grace_seconds = cancel_grace_seconds
+        # Cancel'a rağmen duramayan task'ların process'i yeniden başlatılsın mı (CPU-Bound lane)
+        self.recycle_stuck_processes = recycle_stuck_processes
+        self.resource_sample_interval = resource_sample_interval
+        # Autoscaler eşikleri: p95 kuyruk bekleme süresi veya lane'i bekleyen item sayısı aşılınca büyü,
+        # idle_retire_seconds boyunca boş kalan process'i kapat
+        self.scale_up_queue_wait = scale_up_queue_wait
+        self.scale_up_backlog = scale_up_backlog
+        self.idle_retire_seconds = idle_retire_seconds
+        self.autoscale_interval = autoscale_interval
+        self.backlog_provider = backlog_provider
+        # Her process tek bir çekirdeğe sabitlenir (CPU-Bound lane'de cache/scheduler sıçramalarını önler)
+        self.cpu_affinity = cpu_affinity
         self._set_options()
 
     def _set_options(self):
         self.active_processes = []
+        # task_id -> {process, item, dispatched_at, deadline}
+        self.running_tasks = {}
+        # task_id -> {process, grace_deadline}; worker task'ın bittiğini bildirene kadar tutulur
+        self.cancelling_tasks = {}
+        self.timed_out_tasks = OrderedDict()
+        # (dispatch zamanı, kuyrukta bekleme süresi)
+        self.queue_waits = deque(maxlen=QUEUE_WAIT_SAMPLE_LIMIT)
+        self.process_seq = 0
+        self.status_thread = None
         self.scaler_thread = None
+        # Yeni process eklenince status listener'ı güncel pipe listesiyle uyandırmak için
+        self._listener_wakeup_reader, self._listener_wakeup_writer = Pipe(duplex=False)
         self.started = False
         self.shutdown_event = Event()
         self.process_lock = Lock()
@@ -31,111 +82,465 @@ class TypeController:
             return False, message
 
         self._start_thread_counter()
+        self._start_autoscaler()
         return True, f"[TYPE CONTROLLER {self.controller_type}] Successfully started {self.process_count} processes"
 
+    def _spawn_process(self, name, core: int = None):
+        cmd_parent_conn, cmd_child_conn = Pipe()
+        health_parent_conn, health_child_conn = Pipe()
+        # Process ile paylaşılan dolu slot sayacı
+        slots = Value('i', 0)
+        process = BaseProcess(cmd_child_conn, health_child_conn, self.output_queue,
+                              resource_sample_interval=self.resource_sample_interval,
+                              task_limit=self.task_limit, slot_counter=slots)
+        process.start()
+        # Child uçları kapatılır ki process ölünce engine tarafı EOF alsın
+        cmd_child_conn.close()
+        health_child_conn.close()
+        # Priority ayarı kritik değil - sadece warning log'la
+        success, message = self._set_process_priority(process.process.pid, self.priority)
+        if not success:
+            # Priority hatası durumunda sadece warning log'la, process başlatıldı
+            print(f"[WARNING] {message}")
+        if core is not None:
+            success, message = self._set_cpu_affinity(process.process.pid, core)
+            if not success:
+                logger.warning(message)
+        return {
+            'name': name,
+            'pid': process.process.pid,
+            'process': process,
+            'cmd_pipe': cmd_parent_conn,
+            'health_pipe': health_parent_conn,
+            'slots': slots,
+            'module_cache': {},
+            'core': core
+        }
+
     def _start_processes(self, count):
         for i in range(count):
             try:
-                cmd_parent_conn, cmd_child_conn = Pipe()
-                health_parent_conn, health_child_conn = Pipe()
-                process = BaseProcess(cmd_child_conn, health_child_conn, self.output_queue)
-                process.start()
-                # Priority ayarı kritik değil - sadece warning log'la
-                success, message = self._set_process_priority(process.process.pid, self.priority)
-                if not success:
-                    # Priority hatası durumunda sadece warning log'la, process başlatıldı
-                    print(f"[WARNING] {message}")
-                self.active_processes.append({
-                    'name': f'{self.controller_type}-{i}',
-                    'pid': process.process.pid,
-                    'process': process,
-                    'cmd_pipe': cmd_parent_conn,
-                    'health_pipe': health_parent_conn,
-                    'thread_count': 0
-                })
+                self.new_process()
             except Exception as e:
                 return False, f"[TYPE CONTROLLER {self.controller_type}] FAILED to start process {i}: {str(e)}"
 
         return True, f"[TYPE CONTROLLER {self.controller_type}] Successfully started {len(self.active_processes)} processes"
 
     def new_process(self):
-        self._start_processes(1)
+        """Yeni bir worker process başlatıp dispatch'e açar"""
+        with self.process_lock:
+            name = f'{self.controller_type}-{self.process_seq}'
+            core = self._pick_core(self.process_seq) if self.cpu_affinity else None
+            self.process_seq += 1
+
+        # Process başlatma lock dışında; dispatch beklemez
+        proc_dict = self._spawn_process(name, core)
+        proc_dict['idle_since'] = time.monotonic()
+
+        with self.process_lock:
+            self.active_processes.append(proc_dict)
+
+        self._wake_status_listener()
+        self._notify_slot_freed()
+        return proc_dict
+
+    def _retire_process(self, proc_dict):
+        """
+        Boştaki process'i dispatch'ten çıkarıp kapatır.
+        Slot ayırma process_lock altında yapıldığından, kontrol ve çıkarma aynı lock altında atomiktir.
+        """
+        with self.process_lock:
+            if proc_dict not in self.active_processes or proc_dict['slots'].value > 0:
+                return False
+            self.active_processes.remove(proc_dict)
+
+        logger.info(f"[TYPE CONTROLLER {self.controller_type}] Retiring idle process: "
+                    f"name={proc_dict['name']}, pid={proc_dict['pid']}")
+        try:
+            proc_dict['cmd_pipe'].send({"command": "shutdown"})
+            proc_dict['process'].shutdown()
+        except Exception as e:
+            logger.error(f"[TYPE CONTROLLER {self.controller_type}] Error retiring process {proc_dict['pid']}: {e}")
+
+        self._wake_status_listener()
+        return True
+
+    def record_queue_wait(self, item):
+        """Dispatch anında item'ın input queue'da beklediği süreyi kaydeder"""
+        enqueued_at = item.get("enqueued_at")
+        if enqueued_at is None:
+            return
+        self.queue_waits.append((time.monotonic(), max(time.time() - enqueued_at, 0.0)))
+
+    def queue_wait_p95(self):
+        """Son QUEUE_WAIT_WINDOW_SECONDS içindeki dispatch'lerin p95 kuyruk bekleme süresi"""
+        cutoff = time.monotonic() - QUEUE_WAIT_WINDOW_SECONDS
+        waits = sorted(wait_seconds for dispatched_at, wait_seconds in list(self.queue_waits) if dispatched_at >= cutoff)
+        if not waits:
+            return 0.0
+        return waits[min(int(len(waits) * 0.95), len(waits) - 1)]
+
+    def _backlog(self):
+        if self.backlog_provider is None:
+            return 0
+        try:
+            return self.backlog_provider()
+        except Exception:
+            return 0
+
+    def _autoscale_step(self):
+        """
+        Tek autoscale kararı. Her adımda en fazla bir process eklenir veya kapatılır.
+        Returns: "scale_up", "retire" veya None
+        """
+        now = time.monotonic()
+        processes = list(self.active_processes)
+
+        for proc_dict in processes:
+            if proc_dict['slots'].value > 0:
+                proc_dict['idle_since'] = None
+            elif proc_dict.get('idle_since') is None:
+                proc_dict['idle_since'] = now
+
+        backlog = self._backlog()
+        queue_wait_p95 = self.queue_wait_p95()
+        saturated = not self.has_free_slot()
+        if saturated and len(processes) < self.max_process_count and (
+                backlog >= self.scale_up_backlog or queue_wait_p95 >= self.scale_up_queue_wait):
+            logger.info(f"[TYPE CONTROLLER {self.controller_type}] Scaling up: processes={len(processes)}, "
+                        f"backlog={backlog}, p95_queue_wait={queue_wait_p95:.3f}s")
+            self.queue_waits.clear()
+            self.new_process()
+            return "scale_up"
+
+        if len(processes) > self.process_count and backlog == 0:
+            idle = [p for p in processes
+                    if p.get('idle_since') is not None and now - p['idle_since'] >= self.idle_retire_seconds]
+            # En son eklenen process önce kapatılır
+            for proc_dict in reversed(idle):
+                if self._retire_process(proc_dict):
+                    return "retire"
+
+        return None
+
+    def _autoscale_loop(self):
+        while not self.shutdown_event.wait(self.autoscale_interval):
+            try:
+                self._autoscale_step()
+            except Exception as e:
+                logger.error(f"[TYPE CONTROLLER {self.controller_type}] Autoscaler error: {e}")
+
+    def _start_autoscaler(self):
+        if self.max_process_count <= self.process_count:
+            return
+        self.scaler_thread = Thread(target=self._autoscale_loop, daemon=True)
+        self.scaler_thread.start()
 
     def get_ps_info(self):
         ps_info_list = []
 
         for process in self.active_processes:
-            ps_info_list.append({'name': process['name'], 'pid': process['pid'], 'thread_count': process['thread_count']})
+            ps_info_list.append({'name': process['name'], 'pid': process['pid'], 'thread_count': process['slots'].value,
+                                 'module_cache': process.get('module_cache', {}), 'core': process.get('core')})
 
         return ps_info_list
 
+    def _reserve_slot(self, process):
+        """Process'in paylaşılan sayacından atomik olarak bir slot ayırır"""
+        slots = process['slots']
+        with slots.get_lock():
+            if slots.value >= self.task_limit:
+                return False
+            slots.value += 1
+            return True
+
+    def _release_slot(self, process):
+        slots = process['slots']
+        with slots.get_lock():
+            slots.value = max(slots.value - 1, 0)
+
     def _get_next_process(self):
-        
+        """
+        En az dolu process'ten slot ayırır. Sayaçları process'ler task bitince kendileri
+        azalttığından seçim güncel doluluğa göre yapılır; seçilen process'te slot ayrılmış olur.
+        """
         if not self.active_processes:
             return None, f"[TYPE CONTROLLER {self.controller_type}] No active processes available"
 
-        available_processes = [p for p in self.active_processes if p['thread_count'] < self.task_limit]
-
-        selected_process = min(
-            (p for p in self.active_processes if p['thread_count'] < self.task_limit),
-            key=lambda p: p['thread_count'],
-            default=None
+        candidates = sorted(
+            (p for p in self.active_processes if p['slots'].value < self.task_limit),
+            key=lambda p: p['slots'].value
         )
 
-        if selected_process:
-            message = f"[TYPE CONTROLLER {self.controller_type}] Selected process: pid={selected_process['pid']}, thread_count={selected_process['thread_count']}"
-        else:
-            message = f"[TYPE CONTROLLER {self.controller_type}] No process available under task limit"
+        for selected_process in candidates:
+            if self._reserve_slot(selected_process):
+                message = f"[TYPE CONTROLLER {self.controller_type}] Selected process: pid={selected_process['pid']}, thread_count={selected_process['slots'].value}"
+                return selected_process, message
+
+        return None, f"[TYPE CONTROLLER {self.controller_type}] No process available under task limit"
+
+    def has_free_slot(self):
+        return any(p['slots'].value < self.task_limit for p in list(self.active_processes))
 
-        return selected_process, message
+    def _notify_slot_freed(self):
+        with self.slot_condition:
+            self.slot_condition.notify_all()
 
     def create_thread(self, item: json):
-        process, message = self._get_next_process()
+        with self.process_lock:
+            process, message = self._get_next_process()
+
+            if process is None:
+                return False, f"[TYPE CONTROLLER {self.controller_type}] No available process found"
 
-        if process is None:
-            return False, f"[TYPE CONTROLLER {self.controller_type}] No available process found"
+            # Slot'u worker task bitince (veya cancel edilince) kendisi bırakır
+            self._register_task(process, item)
+            self.record_queue_wait(item)
 
         command_data = {
             "command": "start_thread",
             "data": "src.miniflow.engine.process.modules.python_runner.python_runner",
             "args": (item,),
-            "kwargs": {}
+            "kwargs": {},
+            "task_id": item["task_id"]
         }
-        process.get("cmd_pipe").send(command_data)
+        try:
+            process.get("cmd_pipe").send(command_data)
+        except Exception:
+            # Komut worker'a ulaşmadı, ayrılan slot ve kayıt geri alınır
+            with self.process_lock:
+                self.running_tasks.pop(item["task_id"], None)
+            self._release_slot(process)
+            raise
         return True, f"[TYPE CONTROLLER {self.controller_type}] Command sent to process {process['pid']}"
 
+    def _register_task(self, process, item):
+        """Task'ı deadline takibine al (process_lock altında çağrılır)"""
+        item["task_id"] = uuid.uuid4().hex
+        timeout_seconds = item.get("timeout_seconds")
+        now = time.monotonic()
+        self.running_tasks[item["task_id"]] = {
+            'process': process,
+            'item': item,
+            'dispatched_at': datetime.now(timezone.utc).isoformat(),
+            'deadline': now + timeout_seconds if timeout_seconds and timeout_seconds > 0 else None
+        }
+
+    def is_late_result(self, task_id):
+        """
+        Timeout olarak raporlanmış bir task'ın sonradan gelen sonucunu tespit eder.
+        Her task için en fazla bir geç sonuç olabileceğinden kayıt tüketilir.
+        """
+        if task_id is None:
+            return False
+        with self.process_lock:
+            return self.timed_out_tasks.pop(task_id, None) is not None
+
+    def _mark_timed_out(self, task_id):
+        self.timed_out_tasks[task_id] = True
+        while len(self.timed_out_tasks) > TIMED_OUT_HISTORY_LIMIT:
+            self.timed_out_tasks.popitem(last=False)
+
+    def _report_task_failure(self, task, error_message, error_details, timed_out=True):
+        """Timeout/recycle edilen task için output queue'ya FAILED sonucu koy"""
+        item = dict(task['item'])
+        item.setdefault("started_at", task['dispatched_at'])
+        item["ended_at"] = datetime.now(timezone.utc).isoformat()
+        item["status"] = "FAILED"
+        item["timed_out"] = timed_out
+        # Worker'dan gelen geç sonuçtan ayırt etmek için
+        item["reported_by_engine"] = True
+        item["error_message"] = error_message
+        item["error_details"] = error_details
+        self.output_queue.put(item)
+
+    def _check_deadlines(self):
+        """Deadline'ı geçen task'ları timeout olarak raporlar, slotlarını boşaltır ve cancel gönderir"""
+        now = time.monotonic()
+        expired = []
+
+        with self.process_lock:
+            for task_id, task in list(self.running_tasks.items()):
+                if task['deadline'] is not None and task['deadline'] <= now:
+                    del self.running_tasks[task_id]
+                    self._mark_timed_out(task_id)
+                    process = task['process']
+                    # Slot'u worker cancel komutunu işleyince bırakır
+                    self.cancelling_tasks[task_id] = {
+                        'process': process,
+                        'grace_deadline': now + self.cancel_grace_seconds
+                    }
+                    expired.append((task_id, task))
+
+        if not expired:
+            return
+
+        for task_id, task in expired:
+            timeout_seconds = task['item'].get("timeout_seconds")
+            logger.warning(f"[TYPE CONTROLLER {self.controller_type}] Task timed out: task_id={task_id}, "
+                           f"execution_id={task['item'].get('execution_id')}, node_id={task['item'].get('node_id')}, "
+                           f"timeout_seconds={timeout_seconds}")
+            self._report_task_failure(task, f"Timeout: node exceeded {timeout_seconds} seconds", {
+                "exception_type": "TimeoutError",
+                "message": f"Node execution exceeded timeout_seconds={timeout_seconds}",
+                "timeout_seconds": timeout_seconds
+            })
+            try:
+                task['process']['cmd_pipe'].send({"command": "cancel_task", "task_id": task_id})
+            except Exception as e:
+                logger.error(f"[TYPE CONTROLLER {self.controller_type}] Cancel command failed: task_id={task_id}: {e}")
+
+    def _check_cancelled_tasks(self):
+        """
+        Cancel gönderilen task'ların durduğunu doğrular. Grace süresi içinde duramayan
+        task CPU-Bound lane'de ise (GIL'i bırakmayan kod) process yeniden başlatılır.
+        """
+        now = time.monotonic()
+        stuck_processes = []
+
+        with self.process_lock:
+            for task_id, task in list(self.cancelling_tasks.items()):
+                if now < task['grace_deadline']:
+                    continue
+                del self.cancelling_tasks[task_id]
+                process = task['process']
+                if self.recycle_stuck_processes:
+                    if process not in stuck_processes:
+                        stuck_processes.append(process)
+                else:
+                    logger.warning(f"[TYPE CONTROLLER {self.controller_type}] Cancelled task still running "
+                                   f"after {self.cancel_grace_seconds}s: task_id={task_id}, pid={process['pid']}")
+
+        for process in stuck_processes:
+            self._recycle_process(process)
+
+    def _recycle_process(self, proc_dict, reason: str = "Worker process was restarted because a timed out task "
+                                                          "could not be cancelled"):
+        """Takılı kalan veya ölen process'i öldürüp aynı isimle yenisini başlatır"""
+        logger.warning(f"[TYPE CONTROLLER {self.controller_type}] Recycling process: "
+                       f"name={proc_dict['name']}, pid={proc_dict['pid']}")
+
+        with self.process_lock:
+            if proc_dict not in self.active_processes:
+                # Başka bir yol (recycle / retire) process'i zaten dispatch'ten çıkardı
+                return
+            self.active_processes.remove(proc_dict)
+            lost_tasks = [(task_id, task) for task_id, task in self.running_tasks.items()
+                          if task['process'] is proc_dict]
+            for task_id, _ in lost_tasks:
+                del self.running_tasks[task_id]
+                self._mark_timed_out(task_id)
+            for task_id in [tid for tid, t in self.cancelling_tasks.items() if t['process'] is proc_dict]:
+                del self.cancelling_tasks[task_id]
+
+        # Kill / join ve yeni process başlatma lock dışında; dispatch ve status listener beklemez
+        old_process = proc_dict['process']
+        try:
+            old_process.process.kill()
+            old_process.process.join(timeout=5)
+        except Exception as e:
+            logger.error(f"[TYPE CONTROLLER {self.controller_type}] Error killing process {proc_dict['pid']}: {e}")
+
+        try:
+            # Yeni dict: status listener'ın eski pipe'tan aldığı EOF yeni process'i tekrar recycle etmez
+            new_proc = self._spawn_process(proc_dict['name'], proc_dict.get('core'))
+            new_proc['idle_since'] = time.monotonic()
+            with self.process_lock:
+                self.active_processes.append(new_proc)
+        except Exception as e:
+            logger.error(f"[TYPE CONTROLLER {self.controller_type}] FAILED to respawn process "
+                         f"{proc_dict['name']}: {e}")
+
+        self._wake_status_listener()
+
+        for task_id, task in lost_tasks:
+            self._report_task_failure(task, "Worker process recycled", {
+                "exception_type": "WorkerRecycled",
+                "message": reason
+            }, timed_out=False)
+
+        self._notify_slot_freed()
+
     def shutdown(self):
         self.shutdown_event.set()
 
-        for p in self.active_processes:
+        for p in list(self.active_processes):
             try:
                 p['cmd_pipe'].send({"command": "shutdown"})
                 p['process'].shutdown()
             except Exception as e:
                 return False, f"[TYPE CONTROLLER {self.controller_type}] Error shutting down process: {e}"
 
-    def _get_process_thread_counts(self):
+    def _apply_status(self, proc_dict, status):
+        """
+        Worker'ın task bittiğinde veya cancel edildiğinde gönderdiği status mesajını işler.
+        Slot sayacını worker mesajdan önce azalttığından bekleyen dispatcher uyandırılır.
+        """
         with self.process_lock:
-            for proc_dict in self.active_processes:
-                try:
-                    proc_dict['health_pipe'].send({"command": "get_thread_count"})
-                    if proc_dict['health_pipe'].poll(0.05):
-                        resp = proc_dict['health_pipe'].recv()
-                        proc_dict['thread_count'] = resp.get("thread_count", 0)
-                    else:
-                        proc_dict['thread_count'] = 0
-                except Exception as e:
-                    print(f"Error getting thread count: {e}")
-                    proc_dict['thread_count'] = 0
-
-    def _thread_count_updater(self):
+            for task_id in status.get("finished_tasks", []):
+                self.running_tasks.pop(task_id, None)
+                # Cancel edilen thread durdu
+                self.cancelling_tasks.pop(task_id, None)
+            proc_dict['module_cache'] = status.get("module_cache", proc_dict.get('module_cache', {}))
+
+        self._notify_slot_freed()
+
+    def _next_timer_timeout(self):
+        """Listener'ın en yakın deadline/grace süresine kadar bekleyeceği süre"""
+        with self.process_lock:
+            deadlines = [t['deadline'] for t in self.running_tasks.values() if t['deadline'] is not None]
+            deadlines.extend(t['grace_deadline'] for t in self.cancelling_tasks.values())
+
+        if not deadlines:
+            return STATUS_WAIT_TIMEOUT
+        return min(max(min(deadlines) - time.monotonic(), 0), STATUS_WAIT_TIMEOUT)
+
+    def _status_listener(self):
+        """
+        Tüm worker'ların health pipe'larını tek blocking wait ile dinler.
+        Worker'lar durumu değişince mesaj atar; boştayken periyodik sorgu yapılmaz.
+        """
         while not self.shutdown_event.is_set():
-            self._get_process_thread_counts()
-            time.sleep(0.2)
+            connections = {p['health_pipe']: p for p in list(self.active_processes)}
+
+            try:
+                ready = wait(list(connections) + [self._listener_wakeup_reader], timeout=self._next_timer_timeout())
+            except OSError:
+                # Recycle/retire sırasında kapanan pipe, bir sonraki turda güncel liste ile beklenir
+                ready = []
+
+            for conn in ready:
+                if conn is self._listener_wakeup_reader:
+                    while conn.poll():
+                        conn.recv_bytes()
+                    continue
+
+                proc_dict = connections[conn]
+                try:
+                    while conn.poll():
+                        self._apply_status(proc_dict, conn.recv())
+                except (EOFError, OSError):
+                    if self.shutdown_event.is_set():
+                        return
+                    if proc_dict not in self.active_processes:
+                        # Autoscaler tarafından kapatılan process
+                        continue
+                    logger.error(f"[TYPE CONTROLLER {self.controller_type}] Process exited unexpectedly: "
+                                 f"name={proc_dict['name']}, pid={proc_dict['pid']}")
+                    self._recycle_process(proc_dict, reason="Worker process exited unexpectedly")
+
+            self._check_deadlines()
+            self._check_cancelled_tasks()
+
+    def _wake_status_listener(self):
+        try:
+            self._listener_wakeup_writer.send_bytes(b"\0")
+        except Exception:
+            pass
 
     def _start_thread_counter(self):
-        self.scaler_thread = Thread(target=self._thread_count_updater, daemon=True)
-        self.scaler_thread.start()
+        self.status_thread = Thread(target=self._status_listener, daemon=True)
+        self.status_thread.start()
 
     def _set_process_priority(self, pid: int, priority):
         try:
@@ -147,6 +552,25 @@ class TypeController:
         except Exception as e:
             return False, f"[TYPE CONTROLLER {self.controller_type}] Priority setting error for PID {pid}: {e}"
 
+    @staticmethod
+    def _pick_core(seq: int):
+        """Engine process'inin kullanabildiği çekirdekler arasından sıradaki çekirdek"""
+        try:
+            cores = psutil.Process().cpu_affinity()
+        except (AttributeError, psutil.Error, OSError):
+            # macOS'ta cpu_affinity yok
+            cores = list(range(psutil.cpu_count() or 1))
+        return cores[seq % len(cores)]
+
+    def _set_cpu_affinity(self, pid: int, core: int):
+        try:
+            psutil.Process(pid).cpu_affinity([core])
+            return True, f"[TYPE CONTROLLER {self.controller_type}] PID {pid} pinned to core {core}"
+        except AttributeError:
+            return False, f"[TYPE CONTROLLER {self.controller_type}] CPU affinity is not supported on this platform"
+        except Exception as e:
+            return False, f"[TYPE CONTROLLER {self.controller_type}] CPU affinity error for PID {pid}: {e}"
+
     def _nt_process_classes(self):
         """Windows process priority classes"""
         return [psutil.IDLE_PRIORITY_CLASS, psutil.BELOW_NORMAL_PRIORITY_CLASS,
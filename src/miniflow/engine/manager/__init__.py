@@ -1 +1,2 @@
 from .engine_manager import EngineManager
+from .engine_server import EngineServer, EngineClient
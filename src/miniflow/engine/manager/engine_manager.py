@@ -19,7 +19,11 @@ if sys.platform == 'darwin':
         pass
 
 class EngineManager:
-    def __init__(self, queue_limit: int = 20, iob_task_limit: int = 20, cb_task_limit: int = 1):
+    def __init__(self, queue_limit: int = 20, iob_task_limit: int = 20, cb_task_limit: int = 1,
+                 dispatch_batch_size: int = 50, cancel_grace_seconds: float = 5.0,
+                 resource_sample_interval: float = 0.1, iob_min_processes: int = None,
+                 iob_max_processes: int = None, scale_up_queue_wait: float = 0.5, scale_up_backlog: int = 10,
+                 idle_retire_seconds: float = 60.0, cb_processes: int = None, cb_cpu_affinity: bool = False):
         self.logger = get_logger("execution_engine")
         self.logger.info("[ENGINE MANAGER] Constructor starting...")
         self.input_queue = BaseQueue(maxsize=queue_limit)
@@ -32,6 +36,16 @@ class EngineManager:
 
         self.iob_task_limit = iob_task_limit
         self.cb_task_limit = cb_task_limit
+        self.dispatch_batch_size = dispatch_batch_size
+        self.cancel_grace_seconds = cancel_grace_seconds
+        self.resource_sample_interval = resource_sample_interval
+        self.iob_min_processes = iob_min_processes
+        self.iob_max_processes = iob_max_processes
+        self.scale_up_queue_wait = scale_up_queue_wait
+        self.scale_up_backlog = scale_up_backlog
+        self.idle_retire_seconds = idle_retire_seconds
+        self.cb_processes = cb_processes
+        self.cb_cpu_affinity = cb_cpu_affinity
         self.logger.info(f"[ENGINE MANAGER] Execution Engine initialized with IO_Task_Limit={iob_task_limit}s, CPU_Task_Limit={cb_task_limit}")
 
         self.logger.info("[ENGINE MANAGER] Starting Execution Engine")
@@ -65,7 +79,16 @@ class EngineManager:
                 self.process_controller = ProcessController(output_queue=self.output_queue, input_queue=self.input_queue,
                                                             logger=self.logger,
                                                             os=is_unix,
-                                                            iob_task_limit=self.iob_task_limit, cb_task_limit=self.cb_task_limit)
+                                                            iob_task_limit=self.iob_task_limit, cb_task_limit=self.cb_task_limit,
+                                                            cancel_grace_seconds=self.cancel_grace_seconds,
+                                                            resource_sample_interval=self.resource_sample_interval,
+                                                            iob_min_processes=self.iob_min_processes,
+                                                            iob_max_processes=self.iob_max_processes,
+                                                            scale_up_queue_wait=self.scale_up_queue_wait,
+                                                            scale_up_backlog=self.scale_up_backlog,
+                                                            idle_retire_seconds=self.idle_retire_seconds,
+                                                            cb_processes=self.cb_processes,
+                                                            cb_cpu_affinity=self.cb_cpu_affinity)
                 self.logger.info("[ENGINE MANAGER] ProcessController created, starting...")
                 success, message = self.process_controller.start()
                 if not success:
@@ -75,7 +98,10 @@ class EngineManager:
                 self.logger.info(message)
 
                 self.logger.info("[ENGINE MANAGER] Creating QueueController...")
-                self.queue_controller = QueueController(self.input_queue, self.process_controller)
+                self.queue_controller = QueueController(self.input_queue, self.process_controller,
+                                                        batch_size=self.dispatch_batch_size)
+                # Autoscaler lane backlog'unu dispatcher'dan okur
+                self.process_controller.backlog_provider = self.queue_controller.get_backlog
                 self.logger.info("[ENGINE MANAGER] QueueController created, starting...")
                 success, message = self.queue_controller.start()
                 if not success:
@@ -100,6 +126,8 @@ class EngineManager:
     def put_item(self, item: json):
         if not self.started:
             return False
+        # Autoscaler kuyruk bekleme süresini bu zamandan ölçer
+        item.setdefault("enqueued_at", time.time())
         return self.input_queue.put(item)
 
     def put_items_bulk(self, items: list):
@@ -124,6 +152,10 @@ class EngineManager:
         if not items:
             return True
 
+        enqueued_at = time.time()
+        for item in items:
+            item.setdefault("enqueued_at", enqueued_at)
+
         # Use optimized batch put method
         result = self.input_queue.put_batch(items)
         self.logger.info(f"[ENGINE MANAGER] Batch put result: {result}")
@@ -149,24 +181,23 @@ class EngineManager:
         Amaç: Output queue'dan birden fazla item'ı bulk olarak alır
         Döner: Item listesi
         
-        Performance optimized version for batch result processing
+        İlk result için en fazla timeout kadar bekler (result gelince hemen döner),
+        sonra kuyrukta hazır olanları beklemeden max_items'a kadar toplar.
         """
         if not self.started:
             self.logger.warning("[ENGINE MANAGER] Engine not started, returning empty results")
             return []
 
         items = []
-        for i in range(max_items):
-            try:
-                item = self.output_queue.get_with_timeout(timeout=timeout)
-                if item is None:
-                    break
-                items.append(item)
-                self.logger.debug(f"[ENGINE MANAGER] Retrieved result {i+1}: execution_id={item.get('execution_id')}, "
-                                f"status={item.get('status')}")
-            except Exception as e:
-                self.logger.debug(f"[ENGINE MANAGER] Exception getting item {i+1}: {str(e)}")
-                break
+        for item in self.output_queue.get_batch(max_items=max_items, timeout=timeout):
+            if self.process_controller.is_late_result(item):
+                # Timeout olarak zaten raporlandı
+                self.logger.warning(f"[ENGINE MANAGER] Dropping late result of timed out task: "
+                                    f"execution_id={item.get('execution_id')}, node_id={item.get('node_id')}")
+                continue
+            items.append(item)
+            self.logger.debug(f"[ENGINE MANAGER] Retrieved result {len(items)}: execution_id={item.get('execution_id')}, "
+                            f"status={item.get('status')}")
 
         if items:
             self.logger.info(f"[ENGINE MANAGER] Retrieved {len(items)} execution results from output queue")
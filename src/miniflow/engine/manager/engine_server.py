@@ -0,0 +1,178 @@
+import os
+from threading import Thread, Event, Lock
+from multiprocessing.connection import Listener, Client
+from miniflow.core.logger import get_logger
+from miniflow.utils.helpers.secret_cache import SecretCache
+
+# Logger instance
+logger = get_logger(__name__)
+
+
+class EngineServer:
+    """
+    Host başına tek engine process'inin (standalone mod) yerel IPC sunucusu.
+
+    Worker process havuzu ve input/output handler'lar yalnızca engine process'inde çalışır;
+    API worker'ları (uvicorn) veritabanı ile konuşur, engine'e ihtiyaç duyduklarında
+    EngineClient ile Unix socket üzerinden bağlanır.
+
+    İstek: {"command": "ping" | "put_items" | "stats", ...}
+    Yanıt: (success, payload)
+    """
+
+    def __init__(self, engine_manager, socket_path: str):
+        self.engine_manager = engine_manager
+        self.socket_path = socket_path
+        self.listener = None
+        self.accept_thread = None
+        self.started = False
+        self.shutdown_event = Event()
+
+    def start(self):
+        if self.started:
+            return False, "[ENGINE SERVER] EngineServer already started"
+
+        if os.path.exists(self.socket_path):
+            if EngineClient(self.socket_path, timeout=1.0).ping():
+                return False, f"[ENGINE SERVER] Another engine is already listening on {self.socket_path}"
+            # Önceki process'ten kalan socket dosyası
+            os.unlink(self.socket_path)
+
+        self.listener = Listener(self.socket_path, family="AF_UNIX")
+        # Yalnızca aynı kullanıcı bağlanabilsin
+        os.chmod(self.socket_path, 0o600)
+
+        self.accept_thread = Thread(target=self._accept_loop, daemon=True)
+        self.accept_thread.start()
+
+        self.started = True
+        return True, f"[ENGINE SERVER] Listening on {self.socket_path}"
+
+    def _accept_loop(self):
+        while not self.shutdown_event.is_set():
+            try:
+                conn = self.listener.accept()
+            except OSError:
+                if self.shutdown_event.is_set():
+                    break
+                continue
+            Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn):
+        try:
+            while not self.shutdown_event.is_set():
+                request = conn.recv()
+                conn.send(self._handle(request))
+        except (EOFError, OSError):
+            pass
+        finally:
+            conn.close()
+
+    def _handle(self, request):
+        command = request.get("command") if isinstance(request, dict) else None
+        try:
+            if command == "ping":
+                return True, "pong"
+            elif command == "put_items":
+                return self.engine_manager.put_items_bulk(request.get("items") or []), None
+            elif command == "stats":
+                return True, self._stats()
+            return False, f"Unknown command: {command}"
+        except Exception as e:
+            logger.error(f"[ENGINE SERVER] Command {command} failed: {e}")
+            return False, str(e)
+
+    def _stats(self):
+        process_controller = self.engine_manager.process_controller
+        return {
+            "pid": os.getpid(),
+            "started": self.engine_manager.started,
+            "input_queue_size": self.engine_manager.input_queue.size(),
+            "cb_processes": process_controller.get_cb_ps_info() if process_controller else [],
+            "iob_processes": process_controller.get_iob_ps_info() if process_controller else [],
+            "secret_cache": SecretCache.stats(),
+        }
+
+    def shutdown(self):
+        if not self.started:
+            return
+        self.shutdown_event.set()
+        try:
+            # accept() içinde bloklanan thread'i uyandır
+            Client(self.socket_path, family="AF_UNIX").close()
+        except OSError:
+            pass
+        self.listener.close()
+        self.started = False
+
+
+class EngineClient:
+    """
+    Standalone engine'e Unix socket üzerinden bağlanan istemci.
+    EngineManager ile aynı put_item/put_items_bulk arayüzünü sunar; ping/stats isteği engine'e ulaşmadan
+    bağlantı koparsa bir kez yeniden bağlanır, put_items hiçbir durumda tekrar gönderilmez.
+    """
+
+    def __init__(self, socket_path: str, timeout: float = 5.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self.conn = None
+        self._lock = Lock()
+
+    def _connect(self):
+        if self.conn is None:
+            self.conn = Client(self.socket_path, family="AF_UNIX")
+        return self.conn
+
+    def _request(self, request, retry: bool = True):
+        """
+        İsteği gönderir ve yanıtı döner.
+        Yalnızca bağlantı veya gönderim başarısız olursa (istek engine'e ulaşmadıysa) bir kez yeniden bağlanıp dener.
+        İstek gönderildikten sonraki hatalar (TimeoutError dahil) tekrar denenmez: engine isteği işlemiş olabilir.
+        """
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    conn = self._connect()
+                    conn.send(request)
+                except (OSError, EOFError):
+                    self.close()
+                    if attempt or not retry:
+                        raise
+                    continue
+
+                try:
+                    if not conn.poll(self.timeout):
+                        raise TimeoutError(f"Engine did not respond within {self.timeout}s")
+                    return conn.recv()
+                except (OSError, EOFError):
+                    # Geç gelen yanıt sonraki isteğin yanıtı sanılmasın
+                    self.close()
+                    raise
+
+    def ping(self):
+        try:
+            success, _ = self._request({"command": "ping"})
+            return success
+        except (OSError, EOFError):
+            return False
+
+    def put_item(self, item: dict):
+        return self.put_items_bulk([item])
+
+    def put_items_bulk(self, items: list):
+        # Tekrar gönderilen item'lar engine'de iki kez çalışır
+        success, _ = self._request({"command": "put_items", "items": items}, retry=False)
+        return success
+
+    def get_stats(self):
+        success, stats = self._request({"command": "stats"})
+        return stats if success else None
+
+    def close(self):
+        if self.conn is not None:
+            try:
+                self.conn.close()
+            except OSError:
+                pass
+            self.conn = None
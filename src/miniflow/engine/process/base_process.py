@@ -1,8 +1,10 @@
-from multiprocessing import Process
+from multiprocessing import Process, Pipe
+from multiprocessing.connection import wait
 from .base_thread import BaseThread
+from .task_pool import TaskPool
+from .resource_monitor import ResourceMonitor
 from ..queue_module import BaseQueue
 import threading
-import time
 import importlib
 import os
 from miniflow.core.logger import get_logger
@@ -10,23 +12,112 @@ from miniflow.core.logger import get_logger
 # Logger instance
 logger = get_logger(__name__)
 
+# Shutdown kontrolü için event loop'un en uzun bekleme süresi (saniye)
+EVENT_LOOP_TIMEOUT = 1.0
+
 
 class BaseProcess:
-    def __init__(self, cmd_pipe, health_pipe, output_queue: BaseQueue):
+    def __init__(self, cmd_pipe, health_pipe, output_queue: BaseQueue, resource_sample_interval: float = 0.1,
+                 task_limit: int = 20, slot_counter=None):
         """
         pipe: Bu process'e özel child_conn
         output_queue: Sonuçları QueueWatcher'a göndermek için paylaşılan kuyruk
+        resource_sample_interval: Task bellek örnekleme aralığı (saniye), 0 ölçümü kapatır
+        task_limit: Process içindeki task thread havuzunun boyutu
+        slot_counter: TypeController ile paylaşılan dolu slot sayacı (multiprocessing.Value);
+                      controller dispatch'te artırır, process task bitince azaltır
         """
         self.cmd_pipe = cmd_pipe
         self.health_pipe = health_pipe
         self.output_queue = output_queue
+        self.resource_sample_interval = resource_sample_interval
+        self.task_limit = task_limit
+        self.slot_counter = slot_counter
         # Lock'ları process içinde oluşturacağız - pickle issue
         self.process = Process(target=self.run_process, args=(self.cmd_pipe, self.health_pipe, self.output_queue))
 
-    def _cleanup_dead_threads(self):
-        """Bitmiş thread'leri listeden çıkar"""
-        if hasattr(self, 'threads'):
-            self.threads = [t for t in self.threads if t.thread.is_alive()]
+    @staticmethod
+    def _task_key(thread: BaseThread):
+        return thread.task_id if thread.task_id is not None else id(thread)
+
+    def _on_thread_finish(self, thread: BaseThread):
+        """Biten task'ı kayıttan çıkar ve bir sonraki health cevabında engine'e bildir"""
+        self.pool.task_finished()
+        with self.lock:
+            key = self._task_key(thread)
+            self.tasks.pop(key, None)
+            if key in self.cancelled_tasks:
+                # Slot cancel anında bırakıldı
+                self.cancelled_tasks.discard(key)
+            else:
+                self._release_slot()
+            if thread.task_id is not None:
+                self.finished_tasks.append(thread.task_id)
+            signal = self._mark_status_dirty()
+
+        if signal:
+            self._wakeup_writer.send_bytes(b"\0")
+
+    def _release_slot(self):
+        if self.slot_counter is None:
+            return
+        with self.slot_counter.get_lock():
+            self.slot_counter.value = max(self.slot_counter.value - 1, 0)
+
+    def _mark_status_dirty(self):
+        """
+        Art arda gelen değişiklikler tek bir status mesajında toplanır (self.lock altında çağrılır).
+        Returns: Event loop'un uyandırılması gerekiyorsa True
+        """
+        signal = not self._status_dirty
+        self._status_dirty = True
+        return signal
+
+    def _health_snapshot(self):
+        """
+        Engine'e gönderilen status mesajı; task bittiğinde kendiliğinden gönderilir.
+        İptal edilmiş ama henüz durmamış task'lar slot tüketmez.
+        """
+        with self.lock:
+            finished_tasks, self.finished_tasks = self.finished_tasks, []
+            cancelled_running = len(self.cancelled_tasks)
+            self._status_dirty = False
+
+        return {
+            "thread_count": max(self.pool.in_flight - cancelled_running, 0),
+            "finished_tasks": finished_tasks,
+            "module_cache": self._module_cache_stats()
+        }
+
+    def _module_cache_stats(self):
+        """Yüklenen runner modüllerinin script cache sayaçlarını toplar"""
+        stats = {}
+        for module in list(getattr(self, 'runner_modules', {}).values()):
+            get_stats = getattr(module, "get_module_cache_stats", None)
+            if get_stats is None:
+                continue
+            for key, value in get_stats().items():
+                stats[key] = stats.get(key, 0) + value
+        return stats
+
+    def cancel_task(self, task_id):
+        """Deadline'ı aşan task'ın thread'ine cooperative cancel gönder"""
+        with self.lock:
+            thread = self.tasks.get(task_id)
+            if thread is None or task_id in self.cancelled_tasks:
+                return False
+            self.cancelled_tasks.add(task_id)
+            # Durmasını beklemeden slot bırakılır; task bitince tekrar azaltılmaz
+            self._release_slot()
+            signal = self._mark_status_dirty()
+
+        if signal:
+            self._wakeup_writer.send_bytes(b"\0")
+
+        if not self.pool.cancel(thread):
+            logger.warning(f"Cancel could not be delivered: task_id={task_id}")
+            return False
+        return True
 
     def start(self):
         try:
@@ -45,79 +136,103 @@ class BaseProcess:
         """
         try:
             logger.info(f"Process {os.getpid()} started successfully")
-            # Process içinde lock ve thread listesi oluştur
-            self.threads = []
+            # Process içinde lock, task kaydı ve thread havuzu oluştur
+            self.tasks = {}
+            self.runner_modules = {}
+            self.finished_tasks = []
+            self.cancelled_tasks = set()
             self.lock = threading.Lock()
             self.shutdown_event = threading.Event()
+            self.monitor = ResourceMonitor(sample_interval=self.resource_sample_interval)
+            self.monitor.start()
+            self.pool = TaskPool(size=self.task_limit)
+            self.pool.start()
+            # Pool thread'leri task bitince event loop'u bu pipe ile uyandırır
+            self._wakeup_reader, self._wakeup_writer = Pipe(duplex=False)
+            self._status_dirty = False
         except Exception as e:
             logger.error(f"Error in run_process initialization: {e}", exc_info=True)
             return
 
-        def health_check():
-            while not self.shutdown_event.is_set():
-                try:
-                    self._cleanup_dead_threads()
-                    if health_pipe.poll():
-                        health_data = health_pipe.recv()
-
-                        if health_data["command"] == "shutdown":
-                            self.shutdown_event.set()
-                            break
-
-                        elif health_data["command"] == "get_thread_count":
-                            health_pipe.send({"thread_count": len(self.threads)})
-
-                except Exception as e:
-                    output_queue.put({"error": f"Thread controller error: {e}"})
-
-                time.sleep(0.1)
-        
-        def thread_controller():
-            while not self.shutdown_event.is_set():
-                try:
-                    if cmd_pipe.poll():
-                        command_data = cmd_pipe.recv()
-
-                        if command_data["command"] == "start_thread":
-                            dotted_path = command_data["data"]
-                            target_func = self.import_from_path(dotted_path)
-                            args = command_data.get("args", ())
-                            kwargs = command_data.get("kwargs", {})
-
-                            self.start_thread(target_func, args, kwargs)
-                            
-                        elif command_data["command"] == "shutdown":
-                            self.shutdown_event.set()
-                            break
-                            
-                except Exception as e:
-                    output_queue.put({"error": f"Thread controller error: {e}"})
-
-                time.sleep(0.1)
-
-        controller = threading.Thread(target=thread_controller, daemon=True)
-        controller.start()
-
-        comm = threading.Thread(target=health_check, daemon=True)
-        comm.start()
-
-        # Graceful shutdown için controller thread'ini bekle
+        try:
+            self._event_loop(cmd_pipe, health_pipe, output_queue)
+        finally:
+            self.pool.shutdown()
+            self.monitor.stop()
+
+    def _event_loop(self, cmd_pipe, health_pipe, output_queue):
+        """
+        Komut, health ve task-bitti sinyallerini tek bir blocking wait ile işler.
+        Boştayken process uyanmaz; komutlar geldiği anda işlenir.
+        """
+        connections = [cmd_pipe, health_pipe, self._wakeup_reader]
+
         while not self.shutdown_event.is_set():
-            time.sleep(1)
+            try:
+                for conn in wait(connections, timeout=EVENT_LOOP_TIMEOUT):
+                    if conn is self._wakeup_reader:
+                        while conn.poll():
+                            conn.recv_bytes()
+                        health_pipe.send(self._health_snapshot())
+
+                    elif conn is cmd_pipe:
+                        while not self.shutdown_event.is_set() and cmd_pipe.poll():
+                            self._handle_command(cmd_pipe.recv())
+
+                    else:
+                        while not self.shutdown_event.is_set() and health_pipe.poll():
+                            health_data = health_pipe.recv()
+
+                            if health_data["command"] == "shutdown":
+                                self.shutdown_event.set()
+
+                            elif health_data["command"] == "get_thread_count":
+                                health_pipe.send(self._health_snapshot())
+
+            except (EOFError, OSError):
+                # Engine tarafı pipe'ı kapattı
+                self.shutdown_event.set()
+
+            except Exception as e:
+                output_queue.put({"error": f"Thread controller error: {e}"})
+
+    def _handle_command(self, command_data):
+        if command_data["command"] == "start_thread":
+            dotted_path = command_data["data"]
+            try:
+                target_func = self.import_from_path(dotted_path)
+            except Exception:
+                # Controller'ın ayırdığı slot task hiç başlamadan geri verilir
+                self._release_slot()
+                raise
+            args = command_data.get("args", ())
+            kwargs = command_data.get("kwargs", {})
+
+            self.start_thread(target_func, args, kwargs, task_id=command_data.get("task_id"))
+
+        elif command_data["command"] == "cancel_task":
+            self.cancel_task(command_data.get("task_id"))
+
+        elif command_data["command"] == "shutdown":
+            self.shutdown_event.set()
 
-    def start_thread(self, target, args, kwargs):
+    def start_thread(self, target, args, kwargs, task_id: str = None):
         """
-        Yeni thread başlat ve yönet.
+        Task'ı process'in thread havuzuna gönder.
         """
-        thread = BaseThread(target=target, args=args, output_queue=self.output_queue)
-        thread.start()
-        
-        if hasattr(self, 'lock'):
-            with self.lock:
-                self.threads.append(thread)
-                # Periyodik temizlik
-                if len(self.threads) > 3:  # Threshold
-                    self._cleanup_dead_threads()
+        thread = BaseThread(target=target, args=args, output_queue=self.output_queue,
+                            task_id=task_id, on_finish=self._on_thread_finish,
+                            monitor=getattr(self, 'monitor', None))
+
+        if not hasattr(self, 'pool'):
+            # Process dışında (havuz yokken) task kendi thread'inde çalışır
+            thread.on_finish = None
+            thread.start()
+            return
+
+        with self.lock:
+            self.tasks[self._task_key(thread)] = thread
+        self.pool.submit(thread)
 
     def shutdown(self):
         """Graceful shutdown"""
@@ -133,4 +248,6 @@ class BaseProcess:
         """
         module_path, func_name = dotted_path.rsplit(".", 1)
         module = importlib.import_module(module_path)
+        if hasattr(self, 'runner_modules'):
+            self.runner_modules[module_path] = module
         return getattr(module, func_name)
\ No newline at end of file
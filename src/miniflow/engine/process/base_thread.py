@@ -1,11 +1,116 @@
-from threading import Thread
+import ctypes
+from threading import Thread, Lock, get_ident
 from ..queue_module import BaseQueue
+from .resource_monitor import ResourceMonitor, MeteredOutputQueue
+
+
+class TaskCancelled(BaseException):
+    """
+    Deadline'ı aşan task thread'ine asenkron olarak fırlatılır.
+    BaseException'dan türer ki script runner'ların `except Exception` blokları yakalamasın.
+    """
+
+
+def _set_async_exc(thread_ident, exc_type):
+    return ctypes.pythonapi.PyThreadState_SetAsyncExc(
+        ctypes.c_ulong(thread_ident), ctypes.py_object(exc_type) if exc_type is not None else None
+    )
 
 
 class BaseThread:
-    def __init__(self, target: callable, args: tuple, output_queue: BaseQueue):
+    """
+    Tek bir task'ın çalışma birimi.
+    run() çağıran thread içinde çalışır: worker process'te TaskPool thread'leri, tek başına
+    kullanımda start() ile açılan ayrı thread tarafından çağrılır.
+    """
+
+    QUEUED, RUNNING, DONE = "QUEUED", "RUNNING", "DONE"
+
+    def __init__(self, target: callable, args: tuple, output_queue: BaseQueue, task_id: str = None, on_finish: callable = None,
+                 monitor: ResourceMonitor = None):
         self.output_queue = output_queue
-        self.thread = Thread(target=target, args=args + (self.output_queue,))
+        self.task_id = task_id
+        self.on_finish = on_finish
+        self.monitor = monitor
+        self.target = target
+        if monitor is not None:
+            # Ölçümler sonuç kuyruğa konarken item'a eklenir
+            task_queue = MeteredOutputQueue(self.output_queue, on_put=lambda: monitor.end_task(self))
+        else:
+            task_queue = self.output_queue
+        self.args = args + (task_queue,)
+        self.thread = None
+        self.ident = None
+        self.state = self.QUEUED
+        self.cancelled_while_running = False
+        # State geçişleri ve cancel aynı lock altında; cancel yalnızca RUNNING task'a ve bir kez gider
+        self._state_lock = Lock()
+
+    def run(self):
+        try:
+            with self._state_lock:
+                if self.state != self.QUEUED:
+                    return
+                self.state = self.RUNNING
+                self.ident = get_ident()
+
+            try:
+                if self.monitor is not None:
+                    self.monitor.begin_task(self)
+                self.target(*self.args)
+            finally:
+                self._mark_done()
+        except TaskCancelled:
+            # Timeout engine tarafından raporlandı, geç sonuç üretilmez
+            pass
+
+        if self.state != self.DONE:
+            # Cancel finally bloğuna girerken geldiyse
+            self._mark_done()
+
+        if self.monitor is not None:
+            self.monitor.discard_task(self)
+        if self.on_finish:
+            self.on_finish(self)
+
+    def _mark_done(self):
+        """
+        Thread havuzda yeniden kullanıldığı için, task bittikten sonra hâlâ bekleyen bir cancel
+        sonraki task'a sıçramamalı: DONE işaretlendikten sonra bekleyen async exception temizlenir.
+        """
+        with self._state_lock:
+            self.state = self.DONE
+        _set_async_exc(self.ident, None)
 
     def start(self):
-        self.thread.start()
\ No newline at end of file
+        """Task'ı kendine ait yeni bir thread'de çalıştırır"""
+        self.thread = Thread(target=self.run)
+        self.thread.start()
+
+    def is_alive(self):
+        return self.state != self.DONE
+
+    def cancel(self):
+        """
+        Cooperative cancel: task'ı çalıştıran thread'e TaskCancelled fırlatır.
+        Exception bir sonraki bytecode'da işlenir; bloklayan C çağrıları (sleep, socket, C extension)
+        dönene kadar thread durmaz. Henüz başlamamış task hiç çalıştırılmaz.
+        """
+        with self._state_lock:
+            if self.state == self.QUEUED:
+                self.state = self.DONE
+            elif self.state == self.RUNNING and not self.cancelled_while_running:
+                result = _set_async_exc(self.ident, TaskCancelled)
+                if result > 1:
+                    # Birden fazla thread state etkilendiyse geri al
+                    _set_async_exc(self.ident, None)
+                    return False
+                self.cancelled_while_running = result == 1
+                return self.cancelled_while_running
+            else:
+                return False
+
+        # Kuyrukta beklerken cancel edildi, run() hiç çalışmayacak
+        if self.on_finish:
+            self.on_finish(self)
+        return True
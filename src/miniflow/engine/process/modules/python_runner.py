@@ -1,9 +1,76 @@
 import importlib.util
 import json
+import os
+import threading
 import traceback
+from collections import OrderedDict
 from datetime import datetime, timezone
 from queue import Queue
 
+# Process başına yüklenmiş script modülleri için LRU cache boyutu
+MODULE_CACHE_SIZE = 128
+
+# script_path -> (file_signature, module)
+_module_cache = OrderedDict()
+_module_cache_lock = threading.Lock()
+_module_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def _file_signature(script_path: str):
+    """
+    Dosya değiştiğinde (yeniden yazma, silip yeniden oluşturma, atomic replace) değişen imza.
+    Script güncellemeleri bu sayede ek bir bildirim gerekmeden cache'i geçersiz kılar.
+    """
+    stat = os.stat(script_path)
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def _load_module(script_path: str):
+    module_name = script_path.split("/")[-1].replace(".py", "")
+
+    spec = importlib.util.spec_from_file_location(module_name, script_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Could not load spec for module at {script_path}")
+
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def get_module(script_path: str):
+    """
+    Script modülünü process içi LRU cache'ten döndürür, yoksa veya dosya değiştiyse yeniden yükler.
+    Modül seviyesindeki state aynı process'teki task'lar arasında paylaşılır; her task için
+    module() yeniden çağrıldığından run() nesnesi task'a özeldir.
+    """
+    signature = _file_signature(script_path)
+
+    with _module_cache_lock:
+        cached = _module_cache.get(script_path)
+        if cached is not None and cached[0] == signature:
+            _module_cache.move_to_end(script_path)
+            _module_cache_stats["hits"] += 1
+            return cached[1]
+        _module_cache_stats["misses"] += 1
+
+    # Import lock dışında yapılır; aynı script'in eşzamanlı ilk yüklemeleri birbirini beklemez
+    module = _load_module(script_path)
+
+    with _module_cache_lock:
+        _module_cache[script_path] = (signature, module)
+        _module_cache.move_to_end(script_path)
+        while len(_module_cache) > MODULE_CACHE_SIZE:
+            _module_cache.popitem(last=False)
+            _module_cache_stats["evictions"] += 1
+
+    return module
+
+
+def get_module_cache_stats():
+    """Worker health cevabında engine'e raporlanır"""
+    with _module_cache_lock:
+        return {**_module_cache_stats, "size": len(_module_cache)}
+
 
 def python_runner(item: json, output_queue: Queue):
     execution_id = item.get("execution_id", "UNKNOWN")
@@ -19,14 +86,7 @@ def python_runner(item: json, output_queue: Queue):
         if not script_path:
             raise ValueError("script_path is missing")
 
-        module_name = script_path.split("/")[-1].replace(".py", "")
-
-        spec = importlib.util.spec_from_file_location(module_name, script_path)
-        if spec is None or spec.loader is None:
-            raise ImportError(f"Could not load spec for module at {script_path}")
-
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        module = get_module(script_path)
 
         if not hasattr(module, "module"):
             raise AttributeError("The module must contain a 'module()' function")
@@ -0,0 +1,136 @@
+import os
+import time
+import psutil
+from threading import Thread, Lock, Event
+from miniflow.core.logger import get_logger
+
+# Logger instance
+logger = get_logger(__name__)
+
+BYTES_PER_MB = 1024 * 1024
+
+
+class ResourceMonitor:
+    """
+    Worker process içinde task bazlı kaynak kullanımını ölçer.
+
+    - CPU: time.thread_time() ile task thread'inin kendi CPU süresi (platform destekliyorsa)
+    - Bellek: process RSS'i sample_interval aralıklarla örneklenir, task süresince görülen
+      en yüksek RSS'in başlangıca göre farkı raporlanır. RSS process geneli olduğundan aynı
+      process'te eşzamanlı çalışan task'ların artışları birbirine karışabilir.
+    """
+
+    def __init__(self, sample_interval: float = 0.1):
+        self.sample_interval = sample_interval
+        self.enabled = sample_interval is not None and sample_interval > 0
+        self._process = None
+        self._tasks = {}
+        self._lock = Lock()
+        self._stop_event = Event()
+        self._sampler = None
+
+    def start(self):
+        """Process içinde çağrılır (fork sonrası pid doğru olsun)"""
+        if not self.enabled:
+            return
+        try:
+            self._process = psutil.Process(os.getpid())
+        except Exception as e:
+            logger.warning(f"Resource monitor disabled, psutil unavailable: {e}")
+            self.enabled = False
+            return
+
+        self._sampler = Thread(target=self._sample_loop, daemon=True)
+        self._sampler.start()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def _rss(self):
+        try:
+            return self._process.memory_info().rss
+        except Exception:
+            return None
+
+    def _sample_loop(self):
+        while not self._stop_event.wait(self.sample_interval):
+            # Çalışan task yoksa örnekleme yapılmaz
+            if not self._tasks:
+                continue
+            rss = self._rss()
+            if rss is None:
+                continue
+            with self._lock:
+                for task in self._tasks.values():
+                    if task['rss_peak'] is None or rss > task['rss_peak']:
+                        task['rss_peak'] = rss
+
+    def begin_task(self, key):
+        """Task thread'i içinde, task başlamadan önce çağrılır"""
+        if not self.enabled:
+            return
+        rss = self._rss()
+        with self._lock:
+            self._tasks[key] = {
+                'rss_start': rss,
+                'rss_peak': rss,
+                'cpu_start': time.thread_time(),
+                'wall_start': time.perf_counter()
+            }
+
+    def end_task(self, key):
+        """
+        Task thread'i içinde, sonuç gönderilmeden önce çağrılır.
+
+        Returns:
+            dict: memory_mb, cpu_percent, cpu_time_seconds (ölçüm yoksa boş dict)
+        """
+        if not self.enabled:
+            return {}
+        cpu_end = time.thread_time()
+        wall_end = time.perf_counter()
+        rss = self._rss()
+
+        with self._lock:
+            task = self._tasks.pop(key, None)
+        if task is None:
+            return {}
+
+        metrics = {}
+        cpu_time = cpu_end - task['cpu_start']
+        wall_time = wall_end - task['wall_start']
+        metrics['cpu_time_seconds'] = round(cpu_time, 6)
+        if wall_time > 0:
+            metrics['cpu_percent'] = round(cpu_time / wall_time * 100, 2)
+
+        if task['rss_start'] is not None:
+            peak = max(p for p in (task['rss_peak'], rss) if p is not None)
+            metrics['memory_mb'] = round(max(peak - task['rss_start'], 0) / BYTES_PER_MB, 3)
+
+        return metrics
+
+    def discard_task(self, key):
+        """Sonuç üretmeden biten (cancel edilen) task'ın kaydını sil"""
+        with self._lock:
+            self._tasks.pop(key, None)
+
+
+class MeteredOutputQueue:
+    """
+    Task'a verilen output queue sarmalayıcısı.
+    Sonuç kuyruğa konmadan hemen önce ölçümleri item'a ekler.
+    """
+
+    def __init__(self, output_queue, on_put: callable):
+        self.output_queue = output_queue
+        self.on_put = on_put
+
+    def put(self, item):
+        if isinstance(item, dict):
+            for key, value in self.on_put().items():
+                if item.get(key) is None:
+                    item[key] = value
+        return self.output_queue.put(item)
+
+    def __getattr__(self, name):
+        return getattr(self.output_queue, name)
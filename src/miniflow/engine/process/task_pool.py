@@ -0,0 +1,93 @@
+import queue
+from threading import Thread, Lock
+from .base_thread import BaseThread, TaskCancelled
+from miniflow.core.logger import get_logger
+
+# Logger instance
+logger = get_logger(__name__)
+
+
+class TaskPool:
+    """
+    Worker process başına sabit boyutlu, yeniden kullanılan task thread havuzu.
+
+    - size: Aynı anda çalışan task sayısı (type controller'ın task_limit'i)
+    - in_flight: Kuyrukta bekleyen + çalışan task sayısı, submit/finish ile lock altında güncellenir
+    - Çalışırken cancel edilen task'ın thread'i yerine hemen yeni bir thread açılır; kapasite
+      düşmez, cancel edilen thread task'ı bitince havuzdan çıkar.
+    """
+
+    def __init__(self, size: int):
+        self.size = max(size, 1)
+        self._queue = queue.SimpleQueue()
+        self._lock = Lock()
+        self._in_flight = 0
+        self._workers = 0
+        self._shutdown = False
+
+    def start(self):
+        for _ in range(self.size):
+            self._start_worker()
+
+    def _start_worker(self):
+        with self._lock:
+            self._workers += 1
+        Thread(target=self._worker_loop, daemon=True).start()
+
+    @property
+    def in_flight(self):
+        with self._lock:
+            return self._in_flight
+
+    @property
+    def worker_count(self):
+        with self._lock:
+            return self._workers
+
+    def submit(self, task: BaseThread):
+        with self._lock:
+            if self._shutdown:
+                return False
+            self._in_flight += 1
+        self._queue.put(task)
+        return True
+
+    def task_finished(self):
+        """Task bittiğinde (veya başlamadan cancel edildiğinde) çağrılır"""
+        with self._lock:
+            self._in_flight -= 1
+
+    def cancel(self, task: BaseThread):
+        """Task'ı cancel eder; çalışan bir thread'e cancel gittiyse yerine yeni thread açar"""
+        if not task.cancel():
+            return False
+        if task.cancelled_while_running:
+            self._start_worker()
+        return True
+
+    def _worker_loop(self):
+        while True:
+            task = self._queue.get()
+            if task is None:
+                break
+
+            try:
+                task.run()
+            except TaskCancelled:
+                # run() dışına taşan geç cancel
+                pass
+            except Exception as e:
+                logger.error(f"Task pool worker error: {e}", exc_info=True)
+
+            if task.cancelled_while_running:
+                # Yerine cancel anında yeni thread açıldı
+                with self._lock:
+                    self._workers -= 1
+                return
+
+    def shutdown(self):
+        with self._lock:
+            self._shutdown = True
+            workers = self._workers
+        for _ in range(workers):
+            self._queue.put(None)
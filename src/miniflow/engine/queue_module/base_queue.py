@@ -11,6 +11,7 @@ logger = get_logger(__name__)
 class BaseQueue:
     def __init__(self, maxsize=1000):  # Increased from 100 to 1000
         self.q = multiprocessing.Queue(maxsize=maxsize)
+        self.maxsize = maxsize
         self.dropped_items = 0  # Track dropped items for monitoring
 
     def put(self, item: json):
@@ -92,6 +93,31 @@ class BaseQueue:
             logger.error(f"Get with timeout failed: {e}", exc_info=True)
             return None
 
+    def get_batch(self, max_items=50, timeout=1.0):
+        """
+        Batch get: ilk item için timeout kadar bekler, sonra kuyrukta hazır
+        olanları beklemeden max_items'a kadar toplar.
+
+        Returns:
+            list: Alınan item'lar (kuyruk boşsa boş liste)
+        """
+        items = []
+        first = self.get_with_timeout(timeout=timeout)
+        if first is None:
+            return items
+        items.append(first)
+
+        while len(items) < max_items:
+            try:
+                items.append(self.q.get_nowait())
+            except queue.Empty:
+                break
+            except Exception as e:
+                logger.error(f"Get batch failed: {e}", exc_info=True)
+                break
+
+        return items
+
     def get(self):
         """Legacy get method - kept for compatibility"""
         try:
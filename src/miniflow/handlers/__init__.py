@@ -1,8 +1,10 @@
 from .execution_input_handler import ExecutionInputHandler
 from .execution_output_handler import ExecutionOutputHandler
+from .api_key_usage_handler import ApiKeyUsageHandler
 
 __all__ = [
     "ExecutionInputHandler",
     "ExecutionOutputHandler",
+    "ApiKeyUsageHandler",
 ]
 
@@ -0,0 +1,163 @@
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+
+from ..utils import ConfigurationHandler
+from ..services import ApiKeyService
+from ..core.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class ApiKeyUsageHandler:
+    """
+    API key kullanım sayaçları için write-behind handler: auth yolu sadece bellekteki sayacı artırır,
+    sayaçlar periyodik olarak key başına birleştirilip tek UPDATE ile yazılır.
+
+    Lifecycle:
+    1. start() -> Flush thread'ini başlatır
+    2. record() -> authenticate_api_key her başarılı doğrulamada çağırır (veritabanına dokunmaz)
+    3. _flush_loop() -> flush_interval saniyede bir (veya bekleyen key sayısı max_pending_keys'e ulaşınca) flush()
+       - flush() -> Bekleyen sayaçları alır, ApiKeyService.apply_usage() ile tek transaction'da yazar
+         (yazılamazsa sayaçlar bir sonraki flush için geri eklenir)
+    4. stop() -> Thread'i durdurur, kalan sayaçları yazar
+
+    NOT: Process beklenmedik şekilde kapanırsa son flush_interval içindeki kullanım sayaçları kaybolur.
+    """
+
+    _initialized = False
+    _running = False
+    _lock = threading.Lock()
+    _pending: Dict[str, Tuple[int, datetime]] = {}
+    _shutdown_event: Optional[threading.Event] = None
+    _flush_requested: Optional[threading.Event] = None
+    _flush_thread: Optional[threading.Thread] = None
+
+    flush_interval: float = 10.0
+    max_pending_keys: int = 10000
+
+    @classmethod
+    def _load_config(cls):
+        """Config dosyasından ayarları yükler."""
+        if cls._initialized:
+            return
+
+        try:
+            ConfigurationHandler.ensure_loaded()
+            section = "API_KEY"
+
+            cls.flush_interval = ConfigurationHandler.get_float(section, "usage_flush_interval_seconds", fallback=10.0)
+            cls.max_pending_keys = ConfigurationHandler.get_int(section, "usage_max_pending_keys", fallback=10000)
+
+            cls._initialized = True
+            logger.info(f"ApiKeyUsageHandler config loaded: flush_interval={cls.flush_interval}, max_pending_keys={cls.max_pending_keys}")
+
+        except Exception as e:
+            logger.error(f"Failed to load ApiKeyUsageHandler config: {e}")
+            raise
+
+    @classmethod
+    def start(cls):
+        """Handler'ı başlatır ve flush thread'ini başlatır."""
+        if cls._running:
+            logger.warning("ApiKeyUsageHandler is already running")
+            return True
+
+        cls._load_config()
+        cls._shutdown_event = threading.Event()
+        cls._flush_requested = threading.Event()
+        cls._running = True
+
+        cls._flush_thread = threading.Thread(
+            target=cls._flush_loop,
+            name="ApiKeyUsageHandlerThread",
+            daemon=True
+        )
+        cls._flush_thread.start()
+
+        logger.info("ApiKeyUsageHandler started successfully")
+        return True
+
+    @classmethod
+    def stop(cls):
+        """Flush thread'ini durdurur ve bekleyen sayaçları yazar."""
+        if not cls._running:
+            return True
+
+        logger.info("Stopping ApiKeyUsageHandler...")
+        cls._running = False
+        cls._shutdown_event.set()
+        cls._flush_requested.set()
+
+        if cls._flush_thread and cls._flush_thread.is_alive():
+            cls._flush_thread.join(timeout=10)
+        cls._flush_thread = None
+
+        cls.flush()
+        logger.info("ApiKeyUsageHandler stopped successfully")
+        return True
+
+    @classmethod
+    def record(cls, api_key_id: str, used_at: Optional[datetime] = None):
+        """Bir kullanımı bellekte sayar; aynı key'in kullanımları tek satırda birleştirilir."""
+        used_at = used_at or datetime.now(timezone.utc)
+
+        with cls._lock:
+            count, last_used_at = cls._pending.get(api_key_id, (0, used_at))
+            cls._pending[api_key_id] = (count + 1, max(last_used_at, used_at))
+            pending_keys = len(cls._pending)
+
+        if pending_keys >= cls.max_pending_keys:
+            if cls._running:
+                cls._flush_requested.set()
+            else:
+                # Flush thread'i yok (ör. CLI, test): bellek sınırsız büyümesin diye hemen yazılır
+                cls.flush()
+
+    @classmethod
+    def flush(cls) -> int:
+        """
+        Bekleyen sayaçları tek UPDATE ile yazar.
+
+        Returns:
+            int: Güncellenen API key sayısı
+        """
+        with cls._lock:
+            usage, cls._pending = cls._pending, {}
+
+        if not usage:
+            return 0
+
+        try:
+            return ApiKeyService.apply_usage(usage=usage)
+        except Exception as e:
+            logger.error(f"Failed to flush usage of {len(usage)} API keys, retrying on next flush: {e}")
+            cls._merge_back(usage)
+            return 0
+
+    @classmethod
+    def _merge_back(cls, usage: Dict[str, Tuple[int, datetime]]):
+        """Yazılamayan sayaçları flush sırasında gelen yeni kullanımlarla birleştirir."""
+        with cls._lock:
+            for api_key_id, (count, used_at) in usage.items():
+                pending_count, pending_used_at = cls._pending.get(api_key_id, (0, used_at))
+                cls._pending[api_key_id] = (pending_count + count, max(pending_used_at, used_at))
+
+    @classmethod
+    def _flush_loop(cls):
+        """flush_interval saniyede bir veya flush istendiğinde bekleyen sayaçları yazar."""
+        logger.info("ApiKeyUsageHandler flush loop started")
+
+        while not cls._shutdown_event.is_set():
+            cls._flush_requested.wait(cls.flush_interval)
+            cls._flush_requested.clear()
+            if cls._shutdown_event.is_set():
+                break
+
+            try:
+                cls.flush()
+            except Exception as e:
+                logger.error(f"Error in ApiKeyUsageHandler flush loop: {e}")
+
+        logger.info("ApiKeyUsageHandler flush loop stopped")
@@ -3,7 +3,7 @@ import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 from typing import Dict, Any, List, Optional
 
-from ..utils import ConfigurationHandler
+from ..utils import ConfigurationHandler, ReadyInputNotifier
 from ..services import SchedulerForInputHandler
 from ..core.logger import get_logger, log_function_call
 
@@ -18,12 +18,18 @@ class ExecutionInputHandler:
     Lifecycle:
     1. start() -> Handler'ı başlatır (main loop thread'i başlar)
     2. _main_loop() -> Sürekli çalışan ana döngü
-       - get_ready_execution_inputs() -> Hazır input'ları getirir
+       - claim_ready_execution_inputs() -> Hazır input'ları atomik olarak claim eder (diğer poller'lar atlar)
        - _process_tasks() -> Task'ları işler
-       - _create_contexts_batch() -> Context'leri oluşturur (paralel)
+       - _create_contexts_batch() -> Context'leri toplu oluşturur (chunk başına tek session)
        - _prepare_payloads() -> Engine payload'larını hazırlar
        - _submit_to_engine() -> Engine'e gönderir
+       - _release_claims() -> Gönderilemeyen input'ların claim'ini bırakır
+       - Boşta: ReadyInputNotifier.wait() -> Yeni input hazır olduğunda anında uyanır,
+         bildirim gelmezse adaptive polling aralığı sonunda tekrar kontrol eder (fallback)
     3. stop() -> Handler'ı durdurur
+    
+    dispatch_contexts() -> Output handler'ın DAG continuation yolunda claim edip context'ini oluşturduğu
+                           input'ları aynı payload/submit/silme adımlarıyla engine'e gönderir
     """
     
     _initialized = False
@@ -44,6 +50,7 @@ class ExecutionInputHandler:
     retry_delay: float = 1.0
     adaptive_polling: bool = True
     parallel_context: bool = True
+    claim_lease_seconds: float = 120.0
 
     @classmethod
     def _load_config(cls):
@@ -65,6 +72,7 @@ class ExecutionInputHandler:
             cls.retry_delay = ConfigurationHandler.get_float(section, "input_handler_retry_delay", fallback=1.0)
             cls.adaptive_polling = ConfigurationHandler.get_bool(section, "input_handler_adaptive_polling", fallback=True)
             cls.parallel_context = ConfigurationHandler.get_bool(section, "input_handler_parallel_context", fallback=True)
+            cls.claim_lease_seconds = ConfigurationHandler.get_float(section, "input_handler_claim_lease_seconds", fallback=120.0)
             
             cls._initialized = True
             logger.info(f"ExecutionInputHandler config loaded: batch_size={cls.batch_size}, worker_threads={cls.worker_threads}")
@@ -97,6 +105,7 @@ class ExecutionInputHandler:
             
             cls._current_polling_interval = cls.min_polling_interval
             cls._running = True
+            ReadyInputNotifier.start()
             
             cls._main_thread = threading.Thread(
                 target=cls._main_loop,
@@ -122,6 +131,8 @@ class ExecutionInputHandler:
         try:
             logger.info("Stopping ExecutionInputHandler...")
             cls._shutdown_event.set()
+            # Bildirim bekleyen main loop'u uyandırır
+            ReadyInputNotifier.stop()
             
             if cls._worker_pool:
                 cls._worker_pool.shutdown(wait=True)
@@ -149,19 +160,23 @@ class ExecutionInputHandler:
         
         while cls._running and not cls._shutdown_event.is_set():
             try:
-                result = SchedulerForInputHandler.get_ready_execution_inputs(batch_size=cls.batch_size)
+                result = SchedulerForInputHandler.claim_ready_execution_inputs(
+                    batch_size=cls.batch_size,
+                    lease_seconds=cls.claim_lease_seconds
+                )
                 task_ids = result.get("ids", [])
                 count = result.get("count", 0)
                 
                 if not task_ids:
                     cls._adjust_polling_interval(idle=True)
-                    time.sleep(cls._current_polling_interval)
+                    if ReadyInputNotifier.wait(cls._current_polling_interval):
+                        cls._current_polling_interval = cls.min_polling_interval
                     continue
                 
                 logger.debug(f"Found {count} ready execution inputs")
                 cls._adjust_polling_interval(idle=False)
                 
-                cls._process_tasks(task_ids)
+                cls._process_tasks(task_ids, result.get("claim_token"))
                 
             except Exception as e:
                 logger.error(f"Error in ExecutionInputHandler main loop: {e}")
@@ -170,11 +185,15 @@ class ExecutionInputHandler:
         logger.info("ExecutionInputHandler main loop stopped")
 
     @classmethod
-    def _process_tasks(cls, task_ids: List[str]):
-        """Task'ları işler: context oluşturur, payload hazırlar ve engine'e gönderir."""
+    def _process_tasks(cls, task_ids: List[str], claim_token: Optional[str] = None):
+        """
+        Task'ları işler: context oluşturur, payload hazırlar ve engine'e gönderir.
+        Engine'e ulaşmayan input'ların claim'i bırakılır, bir sonraki poll'da tekrar denenir.
+        """
         if not task_ids:
             return
         
+        submitted_ids: List[str] = []
         try:
             contexts = cls._create_contexts_batch(task_ids)
             
@@ -194,7 +213,13 @@ class ExecutionInputHandler:
             
             try:
                 cls._submit_to_engine(payloads)
+                submitted_ids = execution_input_ids
                 cls._remove_execution_inputs(execution_input_ids)
+            except TimeoutError as e:
+                # Engine input'ları almış olabilir: claim bırakılmaz, lease dolmadan tekrar gönderilmez
+                submitted_ids = execution_input_ids
+                logger.error(f"Engine did not confirm submission, keeping claims until lease expires: {e}")
+                raise
             except Exception as e:
                 logger.error(f"Failed to submit payloads to engine, not removing execution inputs: {e}")
                 raise
@@ -204,53 +229,96 @@ class ExecutionInputHandler:
         except Exception as e:
             logger.error(f"Error processing tasks: {e}")
             raise
+        finally:
+            # Engine'e gönderilen input'lar silinemese bile claim'de kalır, lease dolmadan tekrar çalıştırılmaz
+            cls._release_claims([task_id for task_id in task_ids if task_id not in submitted_ids], claim_token)
+
+    @classmethod
+    def dispatch_contexts(cls, contexts: Dict[str, Dict[str, Any]], claim_token: str) -> int:
+        """
+        Başka bir yolda (output handler DAG continuation) claim edilmiş input'ların context'lerini engine'e gönderir.
+        Gönderilemeyen input'ların claim'i bırakılır ve main loop uyandırılır, normal yoldan tekrar denenir.
+        
+        Returns:
+            int: Engine'e gönderilen input sayısı
+        """
+        submitted_ids: List[str] = []
+        try:
+            payloads, execution_input_ids = cls._prepare_payloads(contexts)
+            try:
+                cls._submit_to_engine(payloads)
+            except TimeoutError:
+                # Engine input'ları almış olabilir: claim bırakılmaz, lease dolmadan tekrar gönderilmez
+                submitted_ids = execution_input_ids
+                raise
+            submitted_ids = execution_input_ids
+            cls._remove_execution_inputs(execution_input_ids)
+            logger.info(f"Dispatched {len(submitted_ids)} continuation tasks")
+        except Exception as e:
+            logger.error(f"Failed to dispatch {len(contexts)} continuation tasks: {e}")
+        finally:
+            unsubmitted_ids = [execution_input_id for execution_input_id in contexts if execution_input_id not in submitted_ids]
+            if unsubmitted_ids:
+                cls._release_claims(unsubmitted_ids, claim_token)
+                ReadyInputNotifier.wake()
+        return len(submitted_ids)
+
+    @classmethod
+    def _release_claims(cls, execution_input_ids: List[str], claim_token: Optional[str]):
+        """Engine'e gönderilemeyen input'ların claim'ini bırakır."""
+        if not execution_input_ids or not claim_token:
+            return
+        
+        try:
+            released = SchedulerForInputHandler.release_execution_input_claims(
+                execution_input_ids=execution_input_ids,
+                claim_token=claim_token
+            )
+            logger.debug(f"Released {released} execution input claims")
+        except Exception as e:
+            # Claim lease dolunca kendiliğinden düşer
+            logger.warning(f"Failed to release execution input claims: {e}")
 
     @classmethod
     def _create_contexts_batch(cls, task_ids: List[str]) -> Dict[str, Dict[str, Any]]:
-        """Paralel olarak execution context'leri oluşturur."""
+        """
+        Execution context'leri toplu olarak oluşturur.
+        Her chunk tek session'da, referans tipi başına tek sorgu ile çözülür; parallel_context açıksa
+        batch worker_threads kadar chunk'a bölünüp paralel işlenir.
+        """
         contexts = {}
         
-        if cls.parallel_context and cls._worker_pool:
-            future_to_id = {
-                cls._worker_pool.submit(cls._create_single_context, task_id): task_id
-                for task_id in task_ids
+        if cls.parallel_context and cls._worker_pool and len(task_ids) > 1:
+            chunk_size = -(-len(task_ids) // cls.worker_threads)
+            chunks = [task_ids[i:i + chunk_size] for i in range(0, len(task_ids), chunk_size)]
+            future_to_chunk = {
+                cls._worker_pool.submit(cls._create_context_chunk, chunk): chunk
+                for chunk in chunks
             }
             
             try:
-                for future in as_completed(future_to_id.keys(), timeout=cls.context_timeout):
-                    task_id = future_to_id[future]
-                    try:
-                        context = future.result(timeout=1.0)
-                        if context:
-                            contexts[task_id] = context
-                    except Exception as e:
-                        logger.error(f"Failed to create context for {task_id}: {e}")
+                for future in as_completed(future_to_chunk.keys(), timeout=cls.context_timeout):
+                    contexts.update(future.result(timeout=1.0))
             except FuturesTimeoutError:
-                for future in future_to_id.keys():
+                for future in future_to_chunk.keys():
                     if not future.done():
                         future.cancel()
                 logger.warning(f"Timeout creating contexts. Created: {len(contexts)}/{len(task_ids)}")
         else:
-            for task_id in task_ids:
-                try:
-                    context = cls._create_single_context(task_id)
-                    if context:
-                        contexts[task_id] = context
-                except Exception as e:
-                    logger.error(f"Failed to create context for {task_id}: {e}")
+            contexts = cls._create_context_chunk(task_ids)
         
         return contexts
 
     @classmethod
-    def _create_single_context(cls, execution_input_id: str) -> Optional[Dict[str, Any]]:
-        """Tek bir execution context oluşturur."""
+    def _create_context_chunk(cls, execution_input_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Bir grup execution input için context'leri tek session'da oluşturur."""
         try:
-            context = SchedulerForInputHandler.create_execution_context(execution_input_id=execution_input_id)
-            logger.debug(f"Created context for execution_input_id: {execution_input_id}")
-            return context
+            contexts = SchedulerForInputHandler.create_execution_contexts(execution_input_ids=execution_input_ids)
+            logger.debug(f"Created {len(contexts)}/{len(execution_input_ids)} contexts")
+            return contexts
         except Exception as e:
-            logger.error(f"Failed to create context for execution_input_id {execution_input_id}: {e}")
-            return None
+            logger.error(f"Failed to create contexts for {len(execution_input_ids)} execution inputs: {e}")
+            return {}
 
     @classmethod
     def _prepare_payloads(cls, contexts: Dict[str, Dict[str, Any]]) -> tuple[List[Dict[str, Any]], List[str]]:
@@ -269,7 +337,7 @@ class ExecutionInputHandler:
                     'node_id': context.get('node_id'),
                     'max_retries': context.get('max_retries', 3),
                     'timeout_seconds': context.get('timeout_seconds', 300),
-                    'process_type': 'iob'
+                    'process_type': context.get('process_type') or 'iob'
                 }
                 
                 if not payload['script_path']:
@@ -310,6 +378,9 @@ class ExecutionInputHandler:
                     else:
                         raise Exception(f"Failed to submit payloads to engine after {cls.max_retries} attempts")
                         
+            except TimeoutError:
+                # İstek engine'e ulaştı ama yanıt gelmedi; tekrar göndermek node'ları iki kez çalıştırabilir
+                raise
             except Exception as e:
                 if attempt < cls.max_retries - 1:
                     delay = cls.retry_delay * (attempt + 1)
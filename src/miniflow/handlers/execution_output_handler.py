@@ -5,6 +5,8 @@ from typing import Dict, Any, List, Optional
 
 from ..utils import ConfigurationHandler
 from ..services import SchedulerForOutputHandler
+from ..services._0_internal_services import ExecutionClassifier, ExecutionGraph, ExecutionOutputCache
+from .execution_input_handler import ExecutionInputHandler
 from ..core.logger import get_logger, log_function_call
 
 
@@ -18,10 +20,15 @@ class ExecutionOutputHandler:
     Lifecycle:
     1. start() -> Handler'ı başlatır (main loop thread'i başlar)
     2. _main_loop() -> Sürekli çalışan ana döngü
-       - get_execution_results() -> Engine'den result'ları getirir
+       - get_execution_results() -> Result gelene kadar engine output queue'sunda bekler, gelenleri toplu getirir
        - _process_results() -> Result'ları işler
-       - _process_results_batch() -> Result'ları batch olarak işler (paralel)
-       - process_execution_result() -> Her result'ı scheduler'a gönderir
+       - _process_results_batch() -> Result'ları batch olarak işler
+         - group_commit: process_execution_results() -> Batch'i tek transaction'da işler
+           (batch transaction'ı başarısız olursa result'lar tek tek işlenir)
+         - dag_continuation: process_and_continue_execution_results() -> Group commit'e ek olarak hazır hale gelen
+           sonraki node'lar aynı transaction'da claim edilir, commit'ten sonra
+           ExecutionInputHandler.dispatch_contexts() ile doğrudan engine'e gönderilir
+         - _process_results_individually() -> process_execution_result() ile her result'ı ayrı işler (paralel)
     3. stop() -> Handler'ı durdurur
     """
     
@@ -42,6 +49,8 @@ class ExecutionOutputHandler:
     retry_delay: float = 1.0
     adaptive_polling: bool = True
     parallel_processing: bool = True
+    group_commit: bool = True
+    dag_continuation: bool = True
 
     @classmethod
     def _load_config(cls):
@@ -62,6 +71,13 @@ class ExecutionOutputHandler:
             cls.retry_delay = ConfigurationHandler.get_float(section, "output_handler_retry_delay", fallback=1.0)
             cls.adaptive_polling = ConfigurationHandler.get_bool(section, "output_handler_adaptive_polling", fallback=True)
             cls.parallel_processing = ConfigurationHandler.get_bool(section, "output_handler_parallel_processing", fallback=True)
+            cls.group_commit = ConfigurationHandler.get_bool(section, "output_handler_group_commit", fallback=True)
+            cls.dag_continuation = ConfigurationHandler.get_bool(section, "output_handler_dag_continuation", fallback=True)
+
+            # Sonuç işleme yolundaki process içi cache'lerin ayarları burada bir kez yüklenir
+            ExecutionGraph.load_config()
+            ExecutionOutputCache.load_config()
+            ExecutionClassifier.load_config()
             
             cls._initialized = True
             logger.info(f"ExecutionOutputHandler config loaded: batch_size={cls.batch_size}, worker_threads={cls.worker_threads}")
@@ -146,11 +162,14 @@ class ExecutionOutputHandler:
         
         while cls._running and not cls._shutdown_event.is_set():
             try:
-                results = cls._engine_manager.get_execution_results(max_items=cls.batch_size, timeout=0.1)
+                # Result gelene kadar queue üzerinde bekler, gelince hemen döner
+                results = cls._engine_manager.get_execution_results(
+                    max_items=cls.batch_size,
+                    timeout=cls._current_polling_interval
+                )
                 
                 if not results:
                     cls._adjust_polling_interval(idle=True)
-                    time.sleep(cls._current_polling_interval)
                     continue
                 
                 logger.debug(f"Found {len(results)} execution results from engine")
@@ -180,10 +199,51 @@ class ExecutionOutputHandler:
 
     @classmethod
     def _process_results_batch(cls, results: List[Dict[str, Any]]):
-        """Paralel olarak execution result'ları işler."""
+        """Execution result'ları group commit ile, kapalıysa veya başarısız olursa tek tek işler."""
         if not results:
             return
         
+        if cls.group_commit:
+            try:
+                if cls.dag_continuation and ExecutionInputHandler._running:
+                    cls._process_results_with_continuation(results)
+                else:
+                    cls._process_results_group_commit(results)
+                return
+            except Exception as e:
+                # Transaction geri alındı, hatalı result'ı izole etmek için tek tek işlenir
+                logger.error(f"Group commit failed for {len(results)} results, processing individually: {e}")
+        
+        cls._process_results_individually(results)
+
+    @classmethod
+    def _process_results_group_commit(cls, results: List[Dict[str, Any]]):
+        """Batch'i tek transaction'da işler, result bazlı hataları loglar."""
+        outcomes = SchedulerForOutputHandler.process_execution_results(results=results)
+        cls._log_outcome_errors(results, outcomes)
+
+    @classmethod
+    def _process_results_with_continuation(cls, results: List[Dict[str, Any]]):
+        """Batch'i tek transaction'da işler, hazır hale gelen sonraki node'ları input handler'ı beklemeden engine'e gönderir."""
+        processed = SchedulerForOutputHandler.process_and_continue_execution_results(
+            results=results,
+            lease_seconds=ExecutionInputHandler.claim_lease_seconds
+        )
+        cls._log_outcome_errors(results, processed["outcomes"])
+        
+        if processed["contexts"]:
+            # Commit edildi: output'lar ve claim'ler kalıcı, engine'e gönderilemeyenler input handler'a bırakılır
+            ExecutionInputHandler.dispatch_contexts(processed["contexts"], processed["claim_token"])
+
+    @staticmethod
+    def _log_outcome_errors(results: List[Dict[str, Any]], outcomes: List[Dict[str, Any]]):
+        for result, outcome in zip(results, outcomes):
+            if outcome.get("error"):
+                logger.error(f"Failed to process result for execution_id={result.get('execution_id')}, node_id={result.get('node_id')}: {outcome['error']}")
+
+    @classmethod
+    def _process_results_individually(cls, results: List[Dict[str, Any]]):
+        """Paralel olarak execution result'ları tek tek işler (her result ayrı transaction)."""
         if cls.parallel_processing and cls._worker_pool:
             future_to_result = {
                 cls._worker_pool.submit(cls._process_single_result, result): result
@@ -21,6 +21,7 @@ Temel Alanlar:
     - user_id: API key sahibi (kim oluşturdu)
     - name: API key adı (user+workspace bazında benzersiz)
     - key_prefix: Görünen prefix (sk_live_, sk_test_)
+    - key_lookup_id: Key içinde açıkça taşınan, gizli olmayan arama ID'si (index'li)
     - key_hash: Tam key hash (güvenli saklama)
     - permissions: API key izinleri (JSON)
 
@@ -43,9 +44,15 @@ Durum:
 Veri Bütünlüğü:
     - UniqueConstraint: (workspace_id, name) benzersiz olmalı
     - Unique: key_hash benzersiz olmalı (global)
+    - Unique: key_lookup_id benzersiz olmalı (global)
+
+Key Formatı:
+    - {key_prefix}{key_lookup_id}.{secret} (örn: sk_live_3f9a1c2b7d4e.Xy...)
+    - Doğrulama: key_lookup_id ile tek satır okunur, key_hash (HMAC-SHA256) sabit zamanlı karşılaştırılır
+    - Eski key'ler (lookup ID'siz, bcrypt hash'li) ilk başarılı kullanımda HMAC hash'e taşınır
 
 Güvenlik En İyi Uygulamaları:
-    - key_hash bcrypt veya argon2 ile hashlenmiş saklanmalı
+    - key_hash HMAC-SHA256 ile hashlenmiş saklanır (key yüksek entropili rastgele değer, yavaş hash gerekmez)
     - Tam key sadece oluşturma anında gösterilir, sonra erişilemez
     - key_prefix görüntülemek için kullanılır (sk_live_****...)
     - Son kullanma tarihi ayarlanmalı (maksimum 1 yıl önerilir)
@@ -82,6 +89,7 @@ class ApiKey(BaseModel):
     
     # Key bilgileri - Güvenlik
     key_prefix = Column(String(20), nullable=False)  # örn: "sk_live_", "sk_test_"
+    key_lookup_id = Column(String(32), nullable=True, unique=True, index=True)  # Eski key'lerde NULL
     key_hash = Column(String(255), nullable=False, unique=True)  # Tam key hashlenmiş
     
     # İzinler - Detaylı izinler ile JSON
@@ -23,11 +23,15 @@ Temel Alanlar:
 Zamanlama Parametreleri:
     - dependency_count: Kaç bağımlılık var (execution sırasını belirler)
     - priority: Öncelik seviyesi (yüksek önce çalışır)
-    - wait_factor: Bekleme faktörü
+    - wait_factor: Kuyrukta bekleme süresi (saniye) - created_at'ten hesaplanır, kolon değildir
+    - claimed_by / claimed_until: Input handler claim'i (token ve lease bitişi) - süresi dolan claim tekrar seçilebilir
+    - process_type: Engine lane'i ("cb" CPU-Bound, "iob" IO-Bound) - script'te beyan edilen sınıf; beyan yoksa "auto"
+      (lane context oluşturulurken ölçülen CPU kullanımından belirlenir)
 
 Node Execution Verisi:
     - node_name: Node adı (anlık görüntü - node silinirse kaybolmaz)
     - node_params: Node parametreleri (JSON) - Kaynak referansları içerir
+    - reference_plan: Oluşturulma anında parse edilmiş referans planı (JSON) - input handler string parse etmez
     - script_name: Script adı (anlık görüntü)
     - script_path: Script yolu (anlık görüntü)
     - script_content: Script içeriği (anlık görüntü - execution sırasında değişmemeli)
@@ -74,7 +78,8 @@ Input Data Format:
 """
 
 from sqlalchemy.orm import relationship
-from sqlalchemy import Column, String, Integer, Text, ForeignKey, JSON, CheckConstraint, Index
+from datetime import datetime, timezone
+from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey, JSON, CheckConstraint, Index, desc
 
 from ..base_model import BaseModel
 
@@ -96,8 +101,9 @@ class ExecutionInput(BaseModel):
         # Kaldırıldı: next_retry_at ile Index (next_retry_at kolonu kaldırıldı)
         Index('idx_execution_input_ready', 'dependency_count'),  # get_ready_with_retry_check
         Index('idx_execution_input_cleanup', 'retry_count', 'resource_retry_count', 'created_at'),  # cleanup_failed_tasks
-        # Composite index for _get_ready_inputs: filters by dependency_count=0 and orders by priority DESC, created_at ASC
-        Index('idx_execution_input_ready_sorted', 'dependency_count', 'priority', 'created_at'),  # _get_ready_inputs optimization
+        # _get_ready_execution_input_ids: dependency_count=0 filtresi ve priority DESC, created_at ASC sıralaması
+        # index'ten okunur, LIMIT ile sıralama adımı olmadan ilk batch döner
+        Index('idx_execution_input_ready_sorted', 'dependency_count', desc('priority'), 'created_at'),
     )
 
     # İlişkiler - Ana execution, workflow, workspace ve node
@@ -109,20 +115,26 @@ class ExecutionInput(BaseModel):
     # Zamanlama parametreleri - Execution sırası ve öncelik
     dependency_count = Column(Integer, default=0, nullable=False)
     priority = Column(Integer, default=0, nullable=False)
-    wait_factor = Column(Integer, default=0, nullable=False)
     
     # Execution yapılandırması - Oluşturulma zamanında Node'dan kopyalanır
     max_retries = Column(Integer, default=3, nullable=False)
     timeout_seconds = Column(Integer, default=300, nullable=False)
+    process_type = Column(String(10), default="iob", nullable=False)  # Script'in execution sınıfı (cb / iob / auto)
     
     # Retry yönetimi - Kaynak izleme entegrasyonu
     retry_count = Column(Integer, default=0, nullable=False, index=True)
     resource_retry_count = Column(Integer, default=0, nullable=False)
     last_rejection_reason = Column(Text, nullable=True)
 
+    # Claim - Birden fazla input handler aynı input'u almasın diye atomik olarak işaretlenir
+    claimed_by = Column(String(64), nullable=True)
+    claimed_until = Column(DateTime, nullable=True)
+
     # Node execution verisi - Execution zamanında anlık görüntü
     node_name = Column(String(100), nullable=False)
     params = Column(JSON, default=lambda: {}, nullable=False)
+    # [[param_name, type, id_or_value, path_parts, expected_type], ...] - SchedulerForInputHandler.compile_reference_plan
+    reference_plan = Column(JSON, nullable=True)
     
     # Script bilgileri - Execution zamanında anlık görüntü
     script_name = Column(String(100), nullable=False)
@@ -134,3 +146,12 @@ class ExecutionInput(BaseModel):
     workspace = relationship("Workspace", back_populates="execution_inputs")
     node = relationship("Node", back_populates="execution_inputs")
 
+    @property
+    def wait_factor(self) -> int:
+        """Input'un oluşturulmasından bu yana geçen süre (saniye); aynı priority içinde eski input önce seçilir"""
+        if self.created_at is None:
+            return 0
+        created_at = self.created_at.replace(tzinfo=None)
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return max(int((now - created_at).total_seconds()), 0)
+
@@ -36,6 +36,7 @@ Node İlerleme Takibi:
 Execution Verisi:
     - trigger_data: Trigger'dan gelen giriş verisi (JSON)
     - results: Final execution sonuçları (JSON)
+    - dag_snapshot: Başlangıç anındaki workflow grafiği (JSON) - execution sırasında yapılan workflow değişikliklerinden etkilenmez
     - error_message: Hata mesajı (eğer varsa)
     - error_details: Detaylı hata bilgisi (JSON)
 
@@ -69,7 +70,7 @@ Veri Bütünlüğü:
 """
 
 from datetime import datetime, timezone
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy import Column, String, Integer, Float, DateTime, Boolean, Text, ForeignKey, JSON, Enum, CheckConstraint, Index
 
 from ..base_model import BaseModel
@@ -104,6 +105,8 @@ class Execution(BaseModel):
     # Execution verisi - Giriş ve çıkış
     trigger_data = Column(JSON, default=lambda: {}, nullable=False)  # Trigger'dan gelen input
     results = Column(JSON, default=lambda: {}, nullable=False)  # Final sonuçlar
+    # {"successors": {node_id: [to_node_id, ...]}} - ExecutionGraph.build_snapshot, yalnızca cache miss'te okunur
+    dag_snapshot = deferred(Column(JSON, nullable=True))
 
     # Retry ve kurtarma
     retry_count = Column(Integer, default=0, nullable=False)
@@ -1,11 +1,11 @@
-from typing import List, Optional
-from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy.sql import select, func
+from sqlalchemy.sql import select, update, func, case
 
 from ..base_repository import BaseRepository
 from miniflow.models import ApiKey
-from miniflow.utils.helpers.encryption_helper import verify_password
+from miniflow.utils.helpers.encryption_helper import is_bcrypt_hash, verify_password
 
 
 class ApiKeyRepository(BaseRepository[ApiKey]):
@@ -45,7 +45,20 @@ class ApiKeyRepository(BaseRepository[ApiKey]):
         return session.execute(query).scalar_one_or_none()
 
     @BaseRepository._handle_db_exceptions
-    def _get_by_api_key(
+    def _get_by_lookup_id(
+        self,
+        session: Session,
+        *,
+        lookup_id: str,
+        include_deleted: bool = False
+    ) -> Optional[ApiKey]:
+        """Get API key by its non-secret lookup id (indexed)"""
+        query = select(ApiKey).where(ApiKey.key_lookup_id == lookup_id)
+        query = self._apply_soft_delete_filter(query, include_deleted)
+        return session.execute(query).scalar_one_or_none()
+
+    @BaseRepository._handle_db_exceptions
+    def _get_legacy_by_api_key(
         self,
         session: Session,
         *,
@@ -53,19 +66,38 @@ class ApiKeyRepository(BaseRepository[ApiKey]):
         include_deleted: bool = False
     ) -> Optional[ApiKey]:
         """
-        Get API key by full API key string.
-        This method checks all possible key hashes by trying to verify the key.
+        Get a legacy (bcrypt-hashed, no lookup id) API key by full API key string.
+        Only active keys that have not been migrated yet are checked, one bcrypt verification each.
         """
-        query = select(ApiKey).where(ApiKey.is_active == True)
+        query = select(ApiKey).where(
+            ApiKey.is_active == True,
+            ApiKey.key_lookup_id == None,
+            ApiKey.key_hash.like("$2%")
+        )
         query = self._apply_soft_delete_filter(query, include_deleted)
         api_keys = session.execute(query).scalars().all()
         
         for api_key in api_keys:
-            if verify_password(full_api_key, api_key.key_hash):
+            if is_bcrypt_hash(api_key.key_hash) and verify_password(full_api_key, api_key.key_hash):
                 return api_key
         
         return None
 
+    @BaseRepository._handle_db_exceptions
+    def _count_legacy(
+        self,
+        session: Session,
+        include_deleted: bool = False
+    ) -> int:
+        """Count active API keys that still have a bcrypt hash (not migrated to HMAC yet)"""
+        query = select(func.count(ApiKey.id)).where(
+            ApiKey.is_active == True,
+            ApiKey.key_lookup_id == None,
+            ApiKey.key_hash.like("$2%")
+        )
+        query = self._apply_soft_delete_filter(query, include_deleted)
+        return session.execute(query).scalar() or 0
+
     @BaseRepository._handle_db_exceptions
     def _get_all_by_workspace_id(
         self,
@@ -91,16 +123,37 @@ class ApiKeyRepository(BaseRepository[ApiKey]):
         return session.execute(query).scalar() or 0
 
     @BaseRepository._handle_db_exceptions
-    def _update_last_used(
+    def _apply_usage(
         self,
         session: Session,
-        api_key_id: str
-    ) -> None:
-        """Update last used timestamp and increment usage count"""
-        api_key = self._get_by_id(session, record_id=api_key_id)
-        if api_key:
-            api_key.last_used_at = datetime.now(timezone.utc)
-            api_key.usage_count += 1
+        *,
+        usage: Dict[str, Tuple[int, datetime]],
+    ) -> int:
+        """
+        Add usage counts and set last used timestamps of multiple API keys in a single query.
+        
+        Args:
+            session: Database session
+            usage: {api_key_id: (count, last_used_at)} mapping
+            
+        Returns:
+            Number of rows updated
+        """
+        if not usage:
+            return 0
+        
+        counts = {api_key_id: count for api_key_id, (count, _) in usage.items()}
+        last_used = {api_key_id: used_at for api_key_id, (_, used_at) in usage.items()}
+        stmt = (
+            update(ApiKey)
+            .where(ApiKey.id.in_(list(usage)))
+            .values(
+                usage_count=ApiKey.usage_count + case(counts, value=ApiKey.id, else_=0),
+                last_used_at=case(last_used, value=ApiKey.id, else_=ApiKey.last_used_at),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return session.execute(stmt).rowcount
 
     @BaseRepository._handle_db_exceptions
     def _deactivate(
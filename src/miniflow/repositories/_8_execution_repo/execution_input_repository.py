@@ -1,7 +1,7 @@
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, select, update, delete, func
-from datetime import datetime, timezone
+from sqlalchemy import and_, or_, select, insert, update, delete, func, case
+from datetime import datetime, timezone, timedelta
 
 from ..base_repository import BaseRepository
 from miniflow.models import ExecutionInput
@@ -36,6 +36,38 @@ class ExecutionInputRepository(BaseRepository[ExecutionInput]):
         )
         session.execute(stmt)
 
+    @BaseRepository._handle_db_exceptions
+    def _get_by_execution_ids(
+        self,
+        session: Session,
+        *,
+        execution_ids: List[str],
+        include_deleted: bool = False,
+    ) -> List[ExecutionInput]:
+        """Batch get execution inputs of multiple executions in a single query"""
+        if not execution_ids:
+            return []
+
+        query = select(ExecutionInput).where(ExecutionInput.execution_id.in_(execution_ids))
+        query = self._apply_soft_delete_filter(query, include_deleted)
+        return list(session.execute(query).scalars().all())
+
+    @BaseRepository._handle_db_exceptions
+    def _delete_by_execution_ids(
+        self,
+        session: Session,
+        *,
+        execution_ids: List[str],
+    ) -> int:
+        """Hard delete all execution inputs of multiple executions"""
+        if not execution_ids:
+            return 0
+
+        stmt = delete(ExecutionInput).where(
+            ExecutionInput.execution_id.in_(execution_ids)
+        )
+        return session.execute(stmt).rowcount
+
     @BaseRepository._handle_db_exceptions
     def _delete_by_ids(
         self,
@@ -53,39 +85,162 @@ class ExecutionInputRepository(BaseRepository[ExecutionInput]):
         result = session.execute(stmt)
         return result.rowcount
 
-    def _get_ready_execution_inputs(
+    @BaseRepository._handle_db_exceptions
+    def _bulk_insert(
         self,
         session: Session,
-    ) -> List[ExecutionInput]:
-        query = select(ExecutionInput).where(
+        *,
+        records: List[Dict[str, Any]],
+    ) -> List[str]:
+        """
+        Create multiple execution inputs with a single multi-row INSERT.
+        IDs are generated up front and no ORM objects are built, so the cost does not grow
+        with one flush per node. Missing columns get their model defaults.
+        """
+        if not records:
+            return []
+
+        rows = [{**record, "id": record.get("id") or ExecutionInput._generate_id()} for record in records]
+        session.execute(insert(ExecutionInput), rows)
+        return [row["id"] for row in rows]
+
+    def _ready_execution_inputs_query(self, limit: int, now: datetime):
+        """
+        Çalışmaya hazır ve claim'i olmayan (veya lease'i dolmuş) input'ların ilk `limit` tanesi.
+        Önce priority, aynı priority içinde en eski created_at (aging) gelir; sıralama
+        idx_execution_input_ready_sorted index'i ile yapılır, backlog boyutundan bağımsızdır.
+        """
+        return select(ExecutionInput.id).where(
             and_(
                 ExecutionInput.dependency_count == 0,
                 ExecutionInput.retry_count < ExecutionInput.max_retries,
-                ExecutionInput.is_deleted == False
+                ExecutionInput.is_deleted == False,
+                or_(ExecutionInput.claimed_until == None, ExecutionInput.claimed_until < now)
             )
         ).order_by(
             ExecutionInput.priority.desc(),
-            ExecutionInput.wait_factor.desc()
+            ExecutionInput.created_at.asc()
+        ).limit(limit)
+
+    def _get_ready_execution_input_ids(
+        self,
+        session: Session,
+        *,
+        limit: int,
+    ) -> List[str]:
+        query = self._ready_execution_inputs_query(limit, datetime.now(timezone.utc))
+        return list(session.execute(query).scalars().all())
+
+    @BaseRepository._handle_db_exceptions
+    def _claim_ready_execution_inputs(
+        self,
+        session: Session,
+        *,
+        limit: int,
+        claim_token: str,
+        lease_seconds: float,
+    ) -> List[str]:
+        """
+        Hazır input'ları tek adımda claim eder; aynı anda çalışan poller'lar aynı input'u alamaz.
+
+        - PostgreSQL/MySQL: SELECT ... FOR UPDATE SKIP LOCKED ile satırlar kilitlenir, diğer poller
+          kilitli satırları atlayıp sonrakileri alır; claim aynı transaction içinde yazılır.
+        - SQLite: Tek bir UPDATE ... WHERE id IN (SELECT ... LIMIT n) ile claim token yazılır
+          (SQLite yazıcıları serileştirir), ardından token ile claim edilen ID'ler okunur.
+
+        Claim lease_seconds sonra düşer; input'u claim edip çöken process'in satırları tekrar seçilir.
+        """
+        now = datetime.now(timezone.utc)
+        claimed_until = now + timedelta(seconds=lease_seconds)
+        query = self._ready_execution_inputs_query(limit, now)
+
+        if session.get_bind().dialect.name in ("postgresql", "mysql", "mariadb"):
+            ids = list(session.execute(query.with_for_update(skip_locked=True)).scalars().all())
+            if not ids:
+                return []
+            session.execute(
+                update(ExecutionInput)
+                .where(ExecutionInput.id.in_(ids))
+                .values(claimed_by=claim_token, claimed_until=claimed_until)
+                .execution_options(synchronize_session=False)
+            )
+            return ids
+
+        session.execute(
+            update(ExecutionInput)
+            .where(ExecutionInput.id.in_(query.scalar_subquery()))
+            .values(claimed_by=claim_token, claimed_until=claimed_until)
+            .execution_options(synchronize_session=False)
+        )
+        claimed = session.execute(
+            select(ExecutionInput.id)
+            .where(ExecutionInput.claimed_by == claim_token)
+            .order_by(ExecutionInput.priority.desc(), ExecutionInput.created_at.asc())
+        )
+        return list(claimed.scalars().all())
+
+    @BaseRepository._handle_db_exceptions
+    def _claim_ready_by_node_ids(
+        self,
+        session: Session,
+        *,
+        execution_ids: List[str],
+        node_ids: List[str],
+        claim_token: str,
+        lease_seconds: float,
+    ) -> List[ExecutionInput]:
+        """
+        Verilen execution'ların, verilen node'larına ait hazır (dependency_count = 0) ve claim'siz input'larını
+        tek UPDATE ile claim eder ve claim edilen input'ları döndürür.
+        Output handler'ın DAG continuation yolu, dependency'si yeni azaltılan node'lar için kullanır.
+        """
+        if not execution_ids or not node_ids:
+            return []
+
+        now = datetime.now(timezone.utc)
+        session.execute(
+            update(ExecutionInput)
+            .where(
+                ExecutionInput.execution_id.in_(execution_ids),
+                ExecutionInput.node_id.in_(node_ids),
+                ExecutionInput.dependency_count == 0,
+                ExecutionInput.retry_count < ExecutionInput.max_retries,
+                ExecutionInput.is_deleted == False,
+                or_(ExecutionInput.claimed_until == None, ExecutionInput.claimed_until < now)
+            )
+            .values(claimed_by=claim_token, claimed_until=now + timedelta(seconds=lease_seconds))
+            .execution_options(synchronize_session=False)
+        )
+        query = (
+            select(ExecutionInput)
+            .where(ExecutionInput.claimed_by == claim_token)
+            .order_by(ExecutionInput.priority.desc(), ExecutionInput.created_at.asc())
+            .execution_options(populate_existing=True)
         )
-        
         return list(session.execute(query).scalars().all())
-    
-    def _increment_wait_factor_by_ids(
+
+    @BaseRepository._handle_db_exceptions
+    def _release_claims(
         self,
         session: Session,
         *,
         execution_input_ids: List[str],
+        claim_token: str,
     ) -> int:
+        """Token'a ait claim'leri bırakır (input'lar bir sonraki poll'da tekrar seçilebilir)"""
+        if not execution_input_ids:
+            return 0
 
         stmt = (
             update(ExecutionInput)
-            .where(ExecutionInput.id.in_(execution_input_ids))
-            .where(ExecutionInput.is_deleted == False)
-            .values(wait_factor=ExecutionInput.wait_factor + 1)
+            .where(
+                ExecutionInput.id.in_(execution_input_ids),
+                ExecutionInput.claimed_by == claim_token
+            )
+            .values(claimed_by=None, claimed_until=None)
+            .execution_options(synchronize_session=False)
         )
-        
-        result = session.execute(stmt)
-        return result.rowcount
+        return session.execute(stmt).rowcount
 
     @BaseRepository._handle_db_exceptions
     def _get_by_execution_and_node(
@@ -172,4 +327,47 @@ class ExecutionInputRepository(BaseRepository[ExecutionInput]):
         )
         
         result = session.execute(stmt)
-        return result.rowcount
\ No newline at end of file
+        return result.rowcount
+
+    @BaseRepository._handle_db_exceptions
+    def _decrement_dependency_counts(
+        self,
+        session: Session,
+        *,
+        execution_id: str,
+        node_counts: Dict[str, int],
+    ) -> int:
+        """
+        Decrement dependency_count of multiple inputs by per-node amounts in a single query.
+        Used when several completed nodes of the same execution point to the same target node.
+        Never goes below 0.
+        
+        Args:
+            session: Database session
+            execution_id: Execution ID
+            node_counts: {node_id: amount} mapping
+            
+        Returns:
+            Number of rows updated
+        """
+        if not node_counts:
+            return 0
+        
+        amount = case(node_counts, value=ExecutionInput.node_id, else_=0)
+        stmt = (
+            update(ExecutionInput)
+            .where(
+                ExecutionInput.execution_id == execution_id,
+                ExecutionInput.node_id.in_(list(node_counts)),
+                ExecutionInput.is_deleted == False,
+                ExecutionInput.dependency_count > 0
+            )
+            .values(dependency_count=case(
+                (ExecutionInput.dependency_count > amount, ExecutionInput.dependency_count - amount),
+                else_=0
+            ))
+            .execution_options(synchronize_session=False)
+        )
+        
+        result = session.execute(stmt)
+        return result.rowcount
@@ -1,4 +1,4 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timezone
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, desc, select, update, delete, func
@@ -41,6 +41,86 @@ class ExecutionOutputRepository(BaseRepository[ExecutionOutput]):
         query = self._apply_soft_delete_filter(query, include_deleted)
         return session.execute(query).scalar_one_or_none()
 
+    @BaseRepository._handle_db_exceptions
+    def _get_by_execution_and_node_pairs(
+        self,
+        session: Session,
+        *,
+        pairs: List[Tuple[str, str]],
+        include_deleted: bool = False,
+    ) -> List[ExecutionOutput]:
+        """
+        Batch get execution outputs for (execution_id, node_id) pairs in a single query.
+        Filters with IN on both columns and keeps only the requested pairs.
+        """
+        if not pairs:
+            return []
+
+        execution_ids = {execution_id for execution_id, _ in pairs}
+        node_ids = {node_id for _, node_id in pairs}
+        query = select(ExecutionOutput).where(
+            ExecutionOutput.execution_id.in_(execution_ids),
+            ExecutionOutput.node_id.in_(node_ids)
+        )
+        query = self._apply_soft_delete_filter(query, include_deleted)
+
+        wanted = set(pairs)
+        return [
+            output for output in session.execute(query).scalars().all()
+            if (output.execution_id, output.node_id) in wanted
+        ]
+
+    @BaseRepository._handle_db_exceptions
+    def _get_by_execution_ids(
+        self,
+        session: Session,
+        *,
+        execution_ids: List[str],
+        include_deleted: bool = False,
+    ) -> List[ExecutionOutput]:
+        """Batch get execution outputs of multiple executions in a single query."""
+        if not execution_ids:
+            return []
+
+        query = select(ExecutionOutput).where(ExecutionOutput.execution_id.in_(execution_ids))
+        query = self._apply_soft_delete_filter(query, include_deleted)
+        return list(session.execute(query).scalars().all())
+
+    @BaseRepository._handle_db_exceptions
+    def _bulk_create(
+        self,
+        session: Session,
+        *,
+        records: List[Dict[str, Any]],
+    ) -> List[ExecutionOutput]:
+        """
+        Create multiple execution outputs with a single flush.
+        IDs are generated in the model constructor, so the INSERTs are batched.
+        """
+        if not records:
+            return []
+
+        outputs = [ExecutionOutput(**record) for record in records]
+        session.add_all(outputs)
+        session.flush()
+        return outputs
+
+    @BaseRepository._handle_db_exceptions
+    def _delete_by_execution_ids(
+        self,
+        session: Session,
+        *,
+        execution_ids: List[str],
+    ) -> int:
+        """Hard delete all execution outputs of multiple executions"""
+        if not execution_ids:
+            return 0
+
+        stmt = delete(ExecutionOutput).where(
+            ExecutionOutput.execution_id.in_(execution_ids)
+        )
+        return session.execute(stmt).rowcount
+
     @BaseRepository._handle_db_exceptions
     def _delete_by_execution_id(
         self,
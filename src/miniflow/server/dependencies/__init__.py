@@ -35,6 +35,7 @@ from .auth import (
     authenticate_admin,
     authenticate_api_key,
 )
+from .request_session import use_request_session
 from .access import (
     require_workspace_access,
     require_workspace_access_allow_suspended,
@@ -77,6 +78,8 @@ __all__ = [
     "authenticate_admin",
     "authenticate_api_key",
     "extract_workspace_id",
+    # Request Session
+    "use_request_session",
     # Access
     "require_workspace_access",
     "require_workspace_access_allow_suspended",
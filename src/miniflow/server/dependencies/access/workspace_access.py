@@ -26,23 +26,17 @@ async def require_workspace_access(
     request: Request,
     workspace_id: str = Depends(extract_workspace_id),
     current_user: AuthenticatedUser = Depends(authenticate_user),
-    workspace_service = Depends(get_workspace_service),
     member_service = Depends(get_workspace_member_service),
 ) -> str:
     try:
-        # 1. Validate workspace exists and not suspended
-        workspace_service.validate_workspace(
+        # 1. Validate workspace exists and not suspended, user is a member (cached)
+        member_service.validate_workspace_access(
             workspace_id=workspace_id,
+            user_id=current_user["user_id"],
             check_suspended=True,
         )
         
-        # 2. Validate user is a member
-        member_service.validate_workspace_member(
-            workspace_id=workspace_id, 
-            user_id=current_user["user_id"]
-        )
-        
-        # 3. Set request state
+        # 2. Set request state
         request.state.workspace_id = workspace_id
         
         return workspace_id
@@ -61,23 +55,17 @@ async def require_workspace_access_allow_suspended(
     request: Request,
     workspace_id: str = Depends(extract_workspace_id),
     current_user: AuthenticatedUser = Depends(authenticate_user),
-    workspace_service = Depends(get_workspace_service),
     member_service = Depends(get_workspace_member_service),
 ) -> str:
     try:
-        # 1. Validate workspace exists (allow suspended)
-        workspace_service.validate_workspace(
-            workspace_id=workspace_id,
-            check_suspended=False,
-        )
-        
-        # 2. Validate user is a member
-        member_service.validate_workspace_member(
+        # 1. Validate workspace exists (allow suspended), user is a member (cached)
+        member_service.validate_workspace_access(
             workspace_id=workspace_id,
             user_id=current_user["user_id"],
+            check_suspended=False,
         )
         
-        # 3. Set request state
+        # 2. Set request state
         request.state.workspace_id = workspace_id
         
         return workspace_id
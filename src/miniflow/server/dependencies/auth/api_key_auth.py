@@ -3,6 +3,7 @@ import ipaddress
 from fastapi import Depends, HTTPException, Request, Header, status
 
 from miniflow.services import ApiKeyService
+from miniflow.handlers import ApiKeyUsageHandler
 from ..service_providers import get_api_key_service
 from .rate_limiters import WorkspaceRateLimiter
 from miniflow.core.exceptions import (
@@ -138,6 +139,9 @@ async def authenticate_api_key(
                 headers={"Retry-After": "60"},
             )
     
+    # Usage stats (write-behind, no DB write on the auth path)
+    ApiKeyUsageHandler.record(api_key_id)
+    
     # Set request state
     request.state.workspace_id = workspace_id
     request.state.api_key_id = api_key_id
@@ -0,0 +1,20 @@
+from fastapi import Request
+
+from miniflow.database import request_session_scope
+
+
+async def use_request_session(request: Request):
+    """
+    İstek boyunca paylaşılan veritabanı session'ı (unit of work).
+
+    Router'a dependencies=[Depends(use_request_session, scope="function")] ile eklenir. Auth / access
+    dependency'leri ve route'un çağırdığı servisler bu session'ı kullanır; endpoint döndükten sonra
+    tek commit yapılır, hata varsa tüm istek rollback edilir. scope="function" commit'in yanıt
+    gönderilmeden önce yapılmasını sağlar (commit hatası istemciye hata olarak döner).
+
+    Session ilk sorgudan istek sonuna kadar bir connection tutar; dosya yükleme, script çalıştırma
+    gibi uzun veritabanı dışı işler yapan router'larda kullanılmaz.
+    """
+    with request_session_scope() as session:
+        request.state.session = session
+        yield session
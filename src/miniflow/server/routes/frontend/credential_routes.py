@@ -7,6 +7,7 @@ from miniflow.server.dependencies import (
     get_credential_service,
     authenticate_user,
     require_workspace_access,
+    use_request_session,
 )
 from miniflow.server.dependencies.auth import AuthenticatedUser
 from miniflow.server.schemas.base_schemas import create_success_response
@@ -23,7 +24,7 @@ from .schemas.credential_schemas import (
     DeleteCredentialResponse,
 )
 
-router = APIRouter(prefix="/workspaces", tags=["Credentials"])
+router = APIRouter(prefix="/workspaces", tags=["Credentials"], dependencies=[Depends(use_request_session, scope="function")])
 
 
 # ============================================================================
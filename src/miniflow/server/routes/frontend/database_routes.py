@@ -6,6 +6,7 @@ from miniflow.server.dependencies import (
     get_database_service,
     authenticate_user,
     require_workspace_access,
+    use_request_session,
 )
 from miniflow.server.dependencies.auth import AuthenticatedUser
 from miniflow.server.schemas.base_schemas import create_success_response
@@ -23,7 +24,7 @@ from .schemas.database_schemas import (
     DeleteDatabaseResponse,
 )
 
-router = APIRouter(prefix="/workspaces", tags=["Databases"])
+router = APIRouter(prefix="/workspaces", tags=["Databases"], dependencies=[Depends(use_request_session, scope="function")])
 
 
 # ============================================================================
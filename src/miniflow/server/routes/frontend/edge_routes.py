@@ -6,6 +6,7 @@ from miniflow.server.dependencies import (
     get_edge_service,
     authenticate_user,
     require_workspace_access,
+    use_request_session,
 )
 from miniflow.server.dependencies.auth import AuthenticatedUser
 from miniflow.server.schemas.base_schemas import create_success_response
@@ -20,7 +21,7 @@ from .schemas.edge_schemas import (
     DeleteEdgeResponse,
 )
 
-router = APIRouter(prefix="/workspaces", tags=["Edges"])
+router = APIRouter(prefix="/workspaces", tags=["Edges"], dependencies=[Depends(use_request_session, scope="function")])
 
 
 # ============================================================================
@@ -7,6 +7,7 @@ from miniflow.server.dependencies import (
     get_execution_service,
     authenticate_user,
     require_workspace_access,
+    use_request_session,
 )
 from miniflow.server.dependencies.auth import AuthenticatedUser
 from miniflow.server.schemas.base_schemas import create_success_response
@@ -20,7 +21,7 @@ from .schemas.execution_management_schemas import (
     ExecutionStatsResponse,
 )
 
-router = APIRouter(prefix="/workspaces", tags=["Executions"])
+router = APIRouter(prefix="/workspaces", tags=["Executions"], dependencies=[Depends(use_request_session, scope="function")])
 
 
 # ============================================================================
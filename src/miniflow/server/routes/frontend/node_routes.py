@@ -6,6 +6,7 @@ from miniflow.server.dependencies import (
     get_node_service,
     authenticate_user,
     require_workspace_access,
+    use_request_session,
 )
 from miniflow.server.dependencies.auth import AuthenticatedUser
 from miniflow.server.schemas.base_schemas import create_success_response
@@ -22,7 +23,7 @@ from .schemas.node_schemas import (
     DeleteNodeResponse,
 )
 
-router = APIRouter(prefix="/workspaces", tags=["Nodes"])
+router = APIRouter(prefix="/workspaces", tags=["Nodes"], dependencies=[Depends(use_request_session, scope="function")])
 
 
 # ============================================================================
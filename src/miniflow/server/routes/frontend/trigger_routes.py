@@ -7,6 +7,7 @@ from miniflow.server.dependencies import (
     get_trigger_service,
     authenticate_user,
     require_workspace_access,
+    use_request_session,
 )
 from miniflow.server.dependencies.auth import AuthenticatedUser
 from miniflow.server.schemas.base_schemas import create_success_response
@@ -24,7 +25,7 @@ from .schemas.trigger_schemas import (
     TriggerLimitsResponse,
 )
 
-router = APIRouter(prefix="/workspaces", tags=["Triggers"])
+router = APIRouter(prefix="/workspaces", tags=["Triggers"], dependencies=[Depends(use_request_session, scope="function")])
 
 
 # ============================================================================
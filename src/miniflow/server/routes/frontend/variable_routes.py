@@ -6,6 +6,7 @@ from miniflow.server.dependencies import (
     get_variable_service,
     authenticate_user,
     require_workspace_access,
+    use_request_session,
 )
 from miniflow.server.dependencies.auth import AuthenticatedUser
 from miniflow.server.schemas.base_schemas import create_success_response
@@ -18,7 +19,7 @@ from .schemas.variable_schemas import (
     DeleteVariableResponse,
 )
 
-router = APIRouter(prefix="/workspaces", tags=["Variables"])
+router = APIRouter(prefix="/workspaces", tags=["Variables"], dependencies=[Depends(use_request_session, scope="function")])
 
 
 # ============================================================================
@@ -7,6 +7,7 @@ from miniflow.server.dependencies import (
     get_workflow_service,
     authenticate_user,
     require_workspace_access,
+    use_request_session,
 )
 from miniflow.server.dependencies.auth import AuthenticatedUser
 from miniflow.server.schemas.base_schemas import create_success_response
@@ -26,7 +27,7 @@ from .schemas.workflow_management_schemas import (
     WorkflowGraphResponse,
 )
 
-router = APIRouter(prefix="/workspaces", tags=["Workflows"])
+router = APIRouter(prefix="/workspaces", tags=["Workflows"], dependencies=[Depends(use_request_session, scope="function")])
 
 
 # ============================================================================
@@ -7,6 +7,7 @@ from miniflow.server.dependencies import (
     authenticate_user,
     require_workspace_access,
     require_workspace_owner,
+    use_request_session,
 )
 from miniflow.server.dependencies.auth import AuthenticatedUser
 from miniflow.server.schemas.base_schemas import create_success_response
@@ -21,7 +22,7 @@ from .schemas.workspace_invitation_schemas import (
     ResendInvitationResponse,
 )
 
-router = APIRouter(prefix="/workspaces", tags=["Workspace Invitations"])
+router = APIRouter(prefix="/workspaces", tags=["Workspace Invitations"], dependencies=[Depends(use_request_session, scope="function")])
 
 
 # ============================================================================
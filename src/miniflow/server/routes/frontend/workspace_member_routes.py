@@ -7,6 +7,7 @@ from miniflow.server.dependencies import (
     authenticate_user,
     require_workspace_access,
     require_workspace_owner,
+    use_request_session,
 )
 from miniflow.server.dependencies.auth import AuthenticatedUser
 from miniflow.server.schemas.base_schemas import create_success_response
@@ -22,7 +23,7 @@ from .schemas.workspace_member_schemas import (
     ClearCustomPermissionsResponse,
 )
 
-router = APIRouter(prefix="/workspaces", tags=["Workspace Members"])
+router = APIRouter(prefix="/workspaces", tags=["Workspace Members"], dependencies=[Depends(use_request_session, scope="function")])
 
 
 # ============================================================================
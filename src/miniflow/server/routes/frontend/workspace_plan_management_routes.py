@@ -7,6 +7,7 @@ from miniflow.server.dependencies import (
     authenticate_user,
     require_workspace_access,
     require_workspace_owner,
+    use_request_session,
 )
 from miniflow.server.dependencies.auth import AuthenticatedUser
 from miniflow.server.schemas.base_schemas import create_success_response
@@ -32,7 +33,7 @@ from .schemas.workspace_plan_management_schemas import (
     CheckLimitResponse,
 )
 
-router = APIRouter(prefix="/workspaces", tags=["Workspace Plans"])
+router = APIRouter(prefix="/workspaces", tags=["Workspace Plans"], dependencies=[Depends(use_request_session, scope="function")])
 
 
 # ============================================================================
@@ -1,6 +1,10 @@
 from .scheduler_service import (
     TypeConverter,
     RefrenceResolver,
+    ExecutionClassifier,
+    DagSnapshot,
+    ExecutionGraph,
+    ExecutionOutputCache,
     SchedulerForInputHandler,
     SchedulerForOutputHandler,
 )
@@ -8,6 +12,10 @@ from .scheduler_service import (
 __all__ = [
     "TypeConverter",
     "RefrenceResolver",
+    "ExecutionClassifier",
+    "DagSnapshot",
+    "ExecutionGraph",
+    "ExecutionOutputCache",
     "SchedulerForInputHandler",
     "SchedulerForOutputHandler",
 ]
@@ -1,14 +1,20 @@
 import json
 import re
+import threading
+import uuid
+from collections import OrderedDict, Counter
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
 
-from miniflow.database import RepositoryRegistry, with_transaction, with_readonly_session
+from miniflow.database import RepositoryRegistry, with_transaction, with_readonly_session, run_after_commit
 from miniflow.models.enums import ExecutionStatus
 from miniflow.core.exceptions import ResourceNotFoundError, InvalidInputError
 from miniflow.core.logger import get_logger
 from miniflow.utils.helpers.encryption_helper import decrypt_data
+from miniflow.utils.helpers.secret_cache import SecretCache
 from miniflow.utils.handlers.configuration_handler import ConfigurationHandler
+from miniflow.utils.handlers.ready_input_notifier import ReadyInputNotifier
 from miniflow.utils.helpers.file_helper import get_workspace_file_path
 
 
@@ -194,11 +200,15 @@ class TypeConverter:
                 )
 
 class RefrenceResolver:
+    _type_groups: Optional[Dict[str, List[str]]] = None
+
     @classmethod
     def _get_type_groups(cls):
-        """TYPE_GROUPS'u configuration'dan dinamik olarak yükler."""
+        """TYPE_GROUPS'u configuration'dan ilk kullanımda yükler, sonraki dönüşümlerde tekrar okumaz."""
+        if cls._type_groups is not None:
+            return cls._type_groups
         ConfigurationHandler.ensure_loaded()
-        return {
+        cls._type_groups = {
             "string": ConfigurationHandler.get_list("SCHEDULER_SERVICE", "accepted_string_values", fallback=["string", "text", "str"]),
             "integer": ConfigurationHandler.get_list("SCHEDULER_SERVICE", "accepted_integer_values", fallback=["number", "integer", "int"]),
             "float": ConfigurationHandler.get_list("SCHEDULER_SERVICE", "accepted_float_values", fallback=["float"]),
@@ -206,6 +216,7 @@ class RefrenceResolver:
             "array": ConfigurationHandler.get_list("SCHEDULER_SERVICE", "accepted_array_values", fallback=["array", "list"]),
             "object": ConfigurationHandler.get_list("SCHEDULER_SERVICE", "accepted_object_values", fallback=["object", "dict", "json"]),
         }
+        return cls._type_groups
 
     @staticmethod
     def _resolve_nested_reference(value_path: str) -> list:
@@ -240,6 +251,17 @@ class RefrenceResolver:
                 final_parts.extend(keys)
         final_parts = [p for p in final_parts if p]
         return final_parts
+
+    @classmethod
+    def _path_parts(cls, reference_info: Dict[str, Any]) -> list:
+        """
+        Referansın path parçalarını döndürür. reference_plan'dan gelen referanslarda parçalar
+        oluşturulma anında ayrılmıştır ("path_parts"), diğerlerinde value_path burada parse edilir.
+        """
+        if "path_parts" in reference_info:
+            return reference_info["path_parts"] or []
+        path = reference_info.get("value_path")
+        return cls._resolve_nested_reference(path) if path else []
         
     @staticmethod
     def _get_value_from_context(path_parts: list, context: Any):
@@ -374,6 +396,231 @@ class RefrenceResolver:
         expected_type = reference_info.get("expected_type", "string")
         return cls._convert_to_type(param_name, value, expected_type)
     
+    @classmethod
+    def _build_trigger_data(cls, execution, reference_info: Dict[str, Any]):
+        """
+        Önceden getirilmiş Execution kaydından referans değerini üretir ve tip dönüşümü yapar.
+
+        Args:
+            execution: Execution kaydı veya bulunamadıysa None.
+            reference_info (Dict[str, Any]): Referans bilgileri, resolve_parameters'dan gelir.
+        """
+        execution_id = reference_info["execution_id"]
+        param_name = reference_info.get("param_name")
+        expected_type = reference_info.get("expected_type", "string")
+
+        if not execution:
+            raise ResourceNotFoundError(
+                resource_name="Execution", resource_id=execution_id)
+        
+        trigger_data = execution.trigger_data or {}
+        path_parts = cls._path_parts(reference_info)
+        value = cls._get_value_from_context(path_parts, trigger_data)
+        
+        return cls._convert_to_type(param_name, value, expected_type)
+
+    @classmethod
+    def _build_executed_node_data(cls, node_data, reference_info: Dict[str, Any]):
+        """
+        Önceden getirilmiş node çıktısından referans değerini üretir ve tip dönüşümü yapar.
+
+        Args:
+            node_data: ExecutionOutput.result_data (veya ExecutionOutputCache'teki kopyası), bulunamadıysa None.
+            reference_info (Dict[str, Any]): Referans bilgileri, resolve_parameters'dan gelir.
+        """
+        id = reference_info.get("id") or reference_info.get("id_or_value")
+        param_name = reference_info.get("param_name")
+        expected_type = reference_info.get("expected_type", "string")
+
+        if not id:
+            raise InvalidInputError(
+                field_name=param_name,
+                message=f"Node reference requires 'id' or 'id_or_value' field"
+            )
+
+        if node_data is None:
+            raise ResourceNotFoundError(
+                resource_name="ExecutionOutput", resource_id=id)
+        
+        path_parts = cls._path_parts(reference_info)
+        value = cls._get_value_from_context(path_parts, node_data)
+        
+        return cls._convert_to_type(param_name, value, expected_type)
+
+    @classmethod
+    def _build_variable_data(cls, variable, reference_info: Dict[str, Any]):
+        """
+        Önceden getirilmiş Variable kaydından referans değerini üretir ve tip dönüşümü yapar.
+
+        Args:
+            variable: Variable kaydı veya bulunamadıysa None.
+            reference_info (Dict[str, Any]): Referans bilgileri, resolve_parameters'dan gelir.
+        """
+        id = reference_info.get("id") or reference_info.get("id_or_value")
+        workspace_id = reference_info["workspace_id"]
+        param_name = reference_info.get("param_name")
+        expected_type = reference_info.get("expected_type", "string")
+
+        if not id:
+            raise InvalidInputError(
+                field_name=param_name,
+                message=f"Variable reference requires 'id' or 'id_or_value' field"
+            )
+
+        if not variable:
+            raise ResourceNotFoundError(
+                resource_name="Variable", resource_id=id)
+        
+        if variable.workspace_id != workspace_id:
+            raise InvalidInputError(field_name=param_name, message=f"Variable '{id}' does not belong to workspace '{workspace_id}'")
+        
+        if variable.is_secret:
+            value = SecretCache.get_or_load("variable", variable.id, variable.updated_at, lambda: decrypt_data(variable.value))
+        else:
+            value = variable.value
+
+        return cls._convert_to_type(param_name, value, expected_type)
+
+    @classmethod
+    def _build_database_data(cls, database, reference_info: Dict[str, Any]):
+        """
+        Önceden getirilmiş Database kaydından referans değerini üretir ve tip dönüşümü yapar.
+
+        Args:
+            database: Database kaydı veya bulunamadıysa None.
+            reference_info (Dict[str, Any]): Referans bilgileri, resolve_parameters'dan gelir.
+        """
+        id = reference_info.get("id") or reference_info.get("id_or_value")
+        workspace_id = reference_info["workspace_id"]
+        param_name = reference_info.get("param_name")
+        expected_type = reference_info.get("expected_type", "string")
+
+        if not id:
+            raise InvalidInputError(
+                field_name=param_name,
+                message=f"Database reference requires 'id' or 'id_or_value' field"
+            )
+
+        if not database:
+            raise ResourceNotFoundError(
+                resource_name="Database", resource_id=id)
+
+        if database.workspace_id != workspace_id:
+            raise InvalidInputError(field_name=param_name, message=f"Database '{id}' does not belong to workspace '{workspace_id}'")
+        
+        password = getattr(database, "password", None)
+        if password:
+            try:
+                password = decrypt_data(password)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to decrypt password for database '{id}' (workspace: {workspace_id}): {str(e)}. "
+                    f"Continuing with encrypted password."
+                )
+        
+        database_data = {
+            "host": getattr(database, "host", None),
+            "port": getattr(database, "port", None),
+            "username": getattr(database, "username", None),
+            "password": password,
+            "database_name": getattr(database, "database_name", None),
+            "connection_string": database.connection_string,
+            "ssl_enabled": database.ssl_enabled,
+            "additional_params": database.additional_params
+        }
+
+        path_parts = cls._path_parts(reference_info)
+        value = cls._get_value_from_context(path_parts, database_data)
+        
+        return cls._convert_to_type(param_name, value, expected_type)
+
+    @classmethod
+    def _build_file_data(cls, file_obj, reference_info: Dict[str, Any]):
+        """
+        Önceden getirilmiş File kaydından referans değerini üretir ve tip dönüşümü yapar.
+
+        Args:
+            file_obj: File kaydı veya bulunamadıysa None.
+            reference_info (Dict[str, Any]): Referans bilgileri, resolve_parameters'dan gelir.
+        """
+        id = reference_info.get("id") or reference_info.get("id_or_value")
+        path_parts = cls._path_parts(reference_info)
+        workspace_id = reference_info["workspace_id"]
+        param_name = reference_info.get("param_name")
+        expected_type = reference_info.get("expected_type", "string")
+
+        if not id:
+            raise InvalidInputError(
+                field_name=param_name,
+                message=f"File reference requires 'id' or 'id_or_value' field"
+            )
+
+        if not file_obj:
+            raise ResourceNotFoundError(
+                resource_name="File", resource_id=id)
+        
+        if file_obj.workspace_id != workspace_id:
+            raise InvalidInputError(field_name=param_name, message=f"File '{id}' does not belong to workspace '{workspace_id}'")
+        
+        if path_parts == ["content"]:
+            try:
+                logger.debug(f"Reading file content: file_id={id}, file_path={file_obj.file_path}")
+                with open(file_obj.file_path, 'r', encoding='utf-8') as f:
+                    value = f.read()
+                logger.debug(f"File content read successfully: file_id={id}, size={len(value)} bytes")
+            except Exception as e:
+                logger.error(f"Failed to read file content: file_id={id}, file_path={file_obj.file_path}, error={str(e)}")
+                raise InvalidInputError(field_name=param_name ,message=f"Failed to read file content: {str(e)}")
+        else:
+            file_data = {
+                "name": file_obj.name,
+                "original_filename": file_obj.original_filename,
+                "file_size": file_obj.file_size,
+                "mime_type": file_obj.mime_type,
+                "file_extension": file_obj.file_extension,
+                "description": file_obj.description,
+                "tags": file_obj.tags,
+                "file_metadata": file_obj.file_metadata
+            }
+
+            value = cls._get_value_from_context(path_parts, file_data)
+        
+        return cls._convert_to_type(param_name, value, expected_type)
+
+    @classmethod
+    def _build_credential_data(cls, credential, reference_info: Dict[str, Any]):
+        """
+        Önceden getirilmiş Credential kaydından referans değerini üretir ve tip dönüşümü yapar.
+
+        Args:
+            credential: Credential kaydı veya bulunamadıysa None.
+            reference_info (Dict[str, Any]): Referans bilgileri, resolve_parameters'dan gelir.
+        """
+        id = reference_info.get("id") or reference_info.get("id_or_value")
+        workspace_id = reference_info["workspace_id"]
+        param_name = reference_info.get("param_name")
+        expected_type = reference_info.get("expected_type", "string")
+
+        if not id:
+            raise InvalidInputError(
+                field_name=param_name,
+                message=f"Credential reference requires 'id' or 'id_or_value' field"
+            )
+
+        if not credential:
+            raise ResourceNotFoundError(
+                resource_name="Credential", resource_id=id)
+        
+        if credential.workspace_id != workspace_id:
+            raise InvalidInputError(field_name=param_name, message=f"Credential '{id}' does not belong to workspace '{workspace_id}'")
+        
+        credential_data = SecretCache.get_or_load(
+            "credential", credential.id, credential.updated_at, lambda: decrypt_data(credential.credential_data))
+        path_parts = cls._path_parts(reference_info)
+        value = cls._get_value_from_context(path_parts, credential_data)
+
+        return cls._convert_to_type(param_name, value, expected_type)
+
     @classmethod
     @with_transaction(manager=None)
     def get_trigger_data(cls, session, reference_info: Dict[str, Any]):
@@ -402,22 +649,11 @@ class RefrenceResolver:
         Çıktı:
             Execution.trigger_data'dan çıkarılan ve dönüştürülmüş değer
         """
-        path = reference_info.get("value_path")
         execution_id = reference_info["execution_id"]
-        param_name = reference_info.get("param_name")
-        expected_type = reference_info.get("expected_type", "string")
 
         execution = _execution_repo._get_by_id(session, record_id=execution_id, include_deleted=False)
-        if not execution:
-            raise ResourceNotFoundError(
-                resource_name="Execution", resource_id=execution_id)
-        
-        trigger_data = execution.trigger_data or {}
-        path_parts = cls._resolve_nested_reference(path) if path else []
-        value = cls._get_value_from_context(path_parts, trigger_data)
-        
-        return cls._convert_to_type(param_name, value, expected_type)
-    
+        return cls._build_trigger_data(execution, reference_info)
+
     @classmethod
     @with_transaction(manager=None)
     def get_executed_node_data(cls, session, reference_info: Dict[str, Any]):
@@ -449,27 +685,11 @@ class RefrenceResolver:
             ExecutionOutput.result_data'dan çıkarılan ve dönüştürülmüş değer
         """
         id = reference_info.get("id") or reference_info.get("id_or_value")
-        path = reference_info.get("value_path")
         execution_id = reference_info["execution_id"]
-        param_name = reference_info.get("param_name")
-        expected_type = reference_info.get("expected_type", "string")
-
-        if not id:
-            raise InvalidInputError(
-                field_name=param_name,
-                message=f"Node reference requires 'id' or 'id_or_value' field"
-            )
 
         execution_output = _execution_output_repo._get_by_execution_and_node(session, execution_id=execution_id, node_id=id, include_deleted=False)
-        if not execution_output:
-            raise ResourceNotFoundError(
-                resource_name="ExecutionOutput", resource_id=id)
-        
-        node_data = execution_output.result_data or {}
-        path_parts = cls._resolve_nested_reference(path) if path else []
-        value = cls._get_value_from_context(path_parts, node_data)
-        
-        return cls._convert_to_type(param_name, value, expected_type)
+        node_data = (execution_output.result_data or {}) if execution_output else None
+        return cls._build_executed_node_data(node_data, reference_info)
 
     @classmethod
     @with_transaction(manager=None)
@@ -500,30 +720,9 @@ class RefrenceResolver:
             Variable.value'dan alınan (şifreli ise çözülmüş) ve dönüştürülmüş değer
         """
         id = reference_info.get("id") or reference_info.get("id_or_value")
-        workspace_id = reference_info["workspace_id"]
-        param_name = reference_info.get("param_name")
-        expected_type = reference_info.get("expected_type", "string")
-
-        if not id:
-            raise InvalidInputError(
-                field_name=param_name,
-                message=f"Variable reference requires 'id' or 'id_or_value' field"
-            )
 
         variable = _variable_repo._get_by_id(session, record_id=id, include_deleted=False)
-        if not variable:
-            raise ResourceNotFoundError(
-                resource_name="Variable", resource_id=id)
-        
-        if variable.workspace_id != workspace_id:
-            raise InvalidInputError(field_name=param_name, message=f"Variable '{id}' does not belong to workspace '{workspace_id}'")
-        
-        if variable.is_secret:
-            value = decrypt_data(variable.value)
-        else:
-            value = variable.value
-
-        return cls._convert_to_type(param_name, value, expected_type)
+        return cls._build_variable_data(variable, reference_info)
 
     @classmethod
     @with_transaction(manager=None)
@@ -558,50 +757,9 @@ class RefrenceResolver:
             Database bağlantı bilgisinden çıkarılan (password çözülmüş) ve dönüştürülmüş değer
         """
         id = reference_info.get("id") or reference_info.get("id_or_value")
-        path = reference_info.get("value_path")
-        workspace_id = reference_info["workspace_id"]
-        param_name = reference_info.get("param_name")
-        expected_type = reference_info.get("expected_type", "string")
-
-        if not id:
-            raise InvalidInputError(
-                field_name=param_name,
-                message=f"Database reference requires 'id' or 'id_or_value' field"
-            )
 
         database = _database_repo._get_by_id(session, record_id=id, include_deleted=False)
-        if not database:
-            raise ResourceNotFoundError(
-                resource_name="Database", resource_id=id)
-
-        if database.workspace_id != workspace_id:
-            raise InvalidInputError(field_name=param_name, message=f"Database '{id}' does not belong to workspace '{workspace_id}'")
-        
-        password = getattr(database, "password", None)
-        if password:
-            try:
-                password = decrypt_data(password)
-            except Exception as e:
-                logger.warning(
-                    f"Failed to decrypt password for database '{id}' (workspace: {workspace_id}): {str(e)}. "
-                    f"Continuing with encrypted password."
-                )
-        
-        database_data = {
-            "host": getattr(database, "host", None),
-            "port": getattr(database, "port", None),
-            "username": getattr(database, "username", None),
-            "password": password,
-            "database_name": getattr(database, "database_name", None),
-            "connection_string": database.connection_string,
-            "ssl_enabled": database.ssl_enabled,
-            "additional_params": database.additional_params
-        }
-
-        path_parts = cls._resolve_nested_reference(path) if path else []
-        value = cls._get_value_from_context(path_parts, database_data)
-        
-        return cls._convert_to_type(param_name, value, expected_type)
+        return cls._build_database_data(database, reference_info)
 
     @classmethod
     @with_transaction(manager=None)
@@ -639,50 +797,9 @@ class RefrenceResolver:
             - Diğer durumlarda: Dosya metadata'sından çıkarılan ve dönüştürülmüş değer
         """
         id = reference_info.get("id") or reference_info.get("id_or_value")
-        path = reference_info.get("value_path")
-        workspace_id = reference_info["workspace_id"]
-        param_name = reference_info.get("param_name")
-        expected_type = reference_info.get("expected_type", "string")
-
-        if not id:
-            raise InvalidInputError(
-                field_name=param_name,
-                message=f"File reference requires 'id' or 'id_or_value' field"
-            )
 
         file_obj = _file_repo._get_by_id(session, record_id=id, include_deleted=False)
-        if not file_obj:
-            raise ResourceNotFoundError(
-                resource_name="File", resource_id=id)
-        
-        if file_obj.workspace_id != workspace_id:
-            raise InvalidInputError(field_name=param_name, message=f"File '{id}' does not belong to workspace '{workspace_id}'")
-        
-        if path and path == "content":
-            try:
-                logger.debug(f"Reading file content: file_id={id}, file_path={file_obj.file_path}")
-                with open(file_obj.file_path, 'r', encoding='utf-8') as f:
-                    value = f.read()
-                logger.debug(f"File content read successfully: file_id={id}, size={len(value)} bytes")
-            except Exception as e:
-                logger.error(f"Failed to read file content: file_id={id}, file_path={file_obj.file_path}, error={str(e)}")
-                raise InvalidInputError(field_name=param_name ,message=f"Failed to read file content: {str(e)}")
-        else:
-            file_data = {
-                "name": file_obj.name,
-                "original_filename": file_obj.original_filename,
-                "file_size": file_obj.file_size,
-                "mime_type": file_obj.mime_type,
-                "file_extension": file_obj.file_extension,
-                "description": file_obj.description,
-                "tags": file_obj.tags,
-                "file_metadata": file_obj.file_metadata
-            }
-
-            path_parts = cls._resolve_nested_reference(path) if path else []
-            value = cls._get_value_from_context(path_parts, file_data)
-        
-        return cls._convert_to_type(param_name, value, expected_type)
+        return cls._build_file_data(file_obj, reference_info)
 
     @classmethod
     @with_transaction(manager=None)
@@ -716,30 +833,474 @@ class RefrenceResolver:
             Credential.credential_data'dan çıkarılan (şifre çözülmüş) ve dönüştürülmüş değer
         """
         id = reference_info.get("id") or reference_info.get("id_or_value")
-        path = reference_info.get("value_path")
-        workspace_id = reference_info["workspace_id"]
-        param_name = reference_info.get("param_name")
-        expected_type = reference_info.get("expected_type", "string")
 
-        if not id:
-            raise InvalidInputError(
-                field_name=param_name,
-                message=f"Credential reference requires 'id' or 'id_or_value' field"
-            )
+        credential = _credential_repo._get_by_id(session, record_id=id, include_deleted=False)
+        return cls._build_credential_data(credential, reference_info)
+
+    @classmethod
+    def prefetch_records(
+        cls,
+        session,
+        groups_list: List[Dict[str, List[Dict[str, Any]]]]
+    ) -> Dict[str, Dict[Any, Any]]:
+        """
+        Bir batch'teki tüm referansların kayıtlarını referans tipi başına tek IN sorgusu ile getirir.
+        Tekil get_* metodlarında her referans kendi session'ını açıp _get_by_id çalıştırır (O(referans));
+        burada batch başına O(referans tipi) sorgu atılır. Node çıktıları önce ExecutionOutputCache'ten okunur,
+        yalnızca cache'te olmayanlar için sorgu atılır.
+        
+        Args:
+            session: Database session, create_execution_contexts'tan gelir.
+            groups_list (List[Dict[str, List[Dict[str, Any]]]]): Her execution input için resolve_parameters çıktısı.
+        
+        Returns:
+            Dict[str, Dict[Any, Any]]: Referans tipine göre kayıtlar.
+        
+        Girdi:
+            groups_list: [
+                {"trigger": [...], "node": [{"id": "NOD-123", "execution_id": "EXE-1", ...}], "value": [...]},
+                {"credential": [{"id": "CRD-456", ...}], ...}
+            ]
+        
+        Çıktı:
+            {
+                "trigger": {"EXE-1": Execution},
+                "node": {("EXE-1", "NOD-123"): {...}},  # ExecutionOutput.result_data
+                "value": {"ENV-...": Variable},
+                "credential": {"CRD-456": Credential},
+                "database": {...},
+                "file": {...}
+            }
+        """
+        execution_ids = set()
+        node_pairs = set()
+        record_ids = {kind: set() for kind in cls._batch_repositories()}
+
+        for groups in groups_list:
+            for ref_info in groups.get("trigger", []):
+                execution_ids.add(ref_info["execution_id"])
+            for ref_info in groups.get("node", []):
+                node_id = ref_info.get("id") or ref_info.get("id_or_value")
+                if node_id:
+                    node_pairs.add((ref_info["execution_id"], node_id))
+            for kind in record_ids:
+                for ref_info in groups.get(kind, []):
+                    record_id = ref_info.get("id") or ref_info.get("id_or_value")
+                    if record_id:
+                        record_ids[kind].add(record_id)
+
+        node_data = ExecutionOutputCache.get_many(node_pairs, session)
+        missing_pairs = [pair for pair in node_pairs if pair not in node_data]
+        if missing_pairs:
+            for output in _execution_output_repo._get_by_execution_and_node_pairs(session, pairs=missing_pairs, include_deleted=False):
+                node_data[(output.execution_id, output.node_id)] = output.result_data or {}
+
+        records = {
+            "trigger": {
+                execution.id: execution
+                for execution in _execution_repo._get_by_ids(session, record_ids=list(execution_ids), include_deleted=False)
+            },
+            "node": node_data
+        }
+        for kind, repository in cls._batch_repositories().items():
+            records[kind] = {
+                record.id: record
+                for record in repository._get_by_ids(session, record_ids=list(record_ids[kind]), include_deleted=False)
+            }
+        return records
+
+    @staticmethod
+    def _batch_repositories():
+        """ID ile referans edilen kaynak tipleri ve repository'leri."""
+        return {
+            "value": _variable_repo,
+            "credential": _credential_repo,
+            "database": _database_repo,
+            "file": _file_repo
+        }
+
+    @classmethod
+    def resolve_batch(
+        cls,
+        groups: Dict[str, List[Dict[str, Any]]],
+        records: Dict[str, Dict[Any, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Gruplanmış referansları prefetch_records ile önceden getirilmiş kayıtlardan çözer, veritabanına gitmez.
+        Bulunamayan kayıt, workspace uyuşmazlığı ve tip dönüşümü kuralları tekil get_* metodları ile aynıdır.
+        
+        Args:
+            groups (Dict[str, List[Dict[str, Any]]]): resolve_parameters çıktısı.
+            records (Dict[str, Dict[Any, Any]]): prefetch_records çıktısı.
+        
+        Returns:
+            Dict[str, Any]: Çözülmüş parametreler dict'i. Key: param_name, Value: çözülmüş ve dönüştürülmüş değer.
+        """
+        resolved_params = {}
+
+        for ref_info in groups.get("static", []):
+            resolved_params[ref_info["param_name"]] = cls.get_static_data(ref_info)
+
+        for ref_info in groups.get("trigger", []):
+            execution = records["trigger"].get(ref_info["execution_id"])
+            resolved_params[ref_info["param_name"]] = cls._build_trigger_data(execution, ref_info)
+
+        for ref_info in groups.get("node", []):
+            node_id = ref_info.get("id") or ref_info.get("id_or_value")
+            node_data = records["node"].get((ref_info["execution_id"], node_id))
+            resolved_params[ref_info["param_name"]] = cls._build_executed_node_data(node_data, ref_info)
+
+        builders = {
+            "value": cls._build_variable_data,
+            "credential": cls._build_credential_data,
+            "database": cls._build_database_data,
+            "file": cls._build_file_data
+        }
+        for kind, builder in builders.items():
+            for ref_info in groups.get(kind, []):
+                record_id = ref_info.get("id") or ref_info.get("id_or_value")
+                resolved_params[ref_info["param_name"]] = builder(records[kind].get(record_id), ref_info)
+
+        return resolved_params
+
+
+class ExecutionClassifier:
+    """
+    Node'un engine'de hangi lane'de çalışacağını belirler: "cb" (CPU-Bound) veya "iob" (IO-Bound).
+
+    Öncelik sırası:
+    1. Script metadata'sında beyan edilen sınıf: script_metadata = {"execution_class": "cpu" | "io"}
+    2. Önceki çalışmalardan öğrenilen sınıf: script başına cpu_percent'in üssel hareketli ortalaması
+    3. Varsayılan: "iob"
+
+    Karar iki adımda verilir:
+    - classify(): Execution başlatılırken (API process'i) beyan edilen sınıfı, beyan yoksa "auto" döner;
+      ExecutionInput.process_type'a yazılır
+    - resolve(): Context oluşturulurken (input handler / DAG continuation) "auto"yu öğrenilen sınıfa çevirir.
+      Bu adım record_usage()'ı çağıran output handler ile aynı process'te çalışır, ölçümler API worker'larına taşınmaz.
+
+    Öğrenilen değerler process içi bellekte tutulur; restart sonrası ilk çalışmalar IO-Bound lane'de başlar.
+    """
+
+    CPU_BOUND = "cb"
+    IO_BOUND = "iob"
+    AUTO = "auto"
+    DECLARED_CLASSES = {
+        "cpu": CPU_BOUND, "cb": CPU_BOUND, "cpu_bound": CPU_BOUND,
+        "io": IO_BOUND, "iob": IO_BOUND, "io_bound": IO_BOUND,
+    }
+
+    cpu_bound_threshold: float = 70.0
+    min_cpu_seconds: float = 0.05
+    min_samples: int = 3
+    smoothing: float = 0.3
+    max_tracked_scripts: int = 1024
+
+    _lock = threading.Lock()
+    # script_path -> {"cpu_percent": ewma, "samples": n}
+    _usage: "OrderedDict[str, Dict[str, float]]" = OrderedDict()
+
+    @classmethod
+    def load_config(cls):
+        """
+        Eşik ve yumuşatma ayarlarını config'ten okur.
+        Output handler başlarken bir kez çağrılır; sıcak yolda config okunmaz, çağrılmazsa sınıf varsayılanları kullanılır.
+        """
+        ConfigurationHandler.ensure_loaded()
+        section = "SCHEDULER_SERVICE"
+        cls.cpu_bound_threshold = ConfigurationHandler.get_float(section, "execution_class_cpu_threshold", fallback=70.0)
+        cls.min_cpu_seconds = ConfigurationHandler.get_float(section, "execution_class_min_cpu_seconds", fallback=0.05)
+        cls.min_samples = ConfigurationHandler.get_int(section, "execution_class_min_samples", fallback=3)
+        cls.smoothing = ConfigurationHandler.get_float(section, "execution_class_smoothing", fallback=0.3)
+
+    @classmethod
+    def classify(cls, script) -> str:
+        """
+        Script (Script veya CustomScript) için beyan edilen execution sınıfını döndürür.
+
+        Args:
+            script: Script objesi, (global script'lerde) script_metadata alanı okunur.
+
+        Returns:
+            str: "cb", "iob" veya beyan yoksa "auto" (lane context oluşturulurken resolve() ile belirlenir)
+        """
+        metadata = getattr(script, "script_metadata", None) or {}
+        declared = metadata.get("execution_class") if isinstance(metadata, dict) else None
+        if isinstance(declared, str) and declared.lower() in cls.DECLARED_CLASSES:
+            return cls.DECLARED_CLASSES[declared.lower()]
+        return cls.AUTO
+
+    @classmethod
+    def resolve(cls, process_type: Optional[str], script_path: Optional[str]) -> str:
+        """
+        ExecutionInput.process_type'tan engine lane'ini belirler.
+        Beyan edilmiş sınıf ("cb" / "iob") olduğu gibi kalır; "auto" öğrenilen sınıfa, ölçüm yoksa "iob"ye çevrilir.
+        """
+        if process_type in (cls.CPU_BOUND, cls.IO_BOUND):
+            return process_type
+        return (cls.learned_class(script_path) if script_path else None) or cls.IO_BOUND
+
+    @classmethod
+    def learned_class(cls, script_path: str) -> Optional[str]:
+        """Yeterli ölçüm varsa öğrenilen sınıf, yoksa None"""
+        with cls._lock:
+            usage = cls._usage.get(script_path)
+            if not usage or usage["samples"] < cls.min_samples:
+                return None
+            cpu_percent = usage["cpu_percent"]
+        return cls.CPU_BOUND if cpu_percent >= cls.cpu_bound_threshold else cls.IO_BOUND
+
+    @classmethod
+    def record_usage(cls, result: Dict[str, Any]):
+        """
+        Başarılı node sonucundaki CPU ölçümünü script'in geçmişine ekler.
+        Çok kısa süren task'ların yüksek cpu_percent'i GIL baskısı yaratmadığından 0 sayılır.
+        """
+        script_path = result.get("script_path")
+        cpu_percent = result.get("cpu_percent")
+        if not script_path or cpu_percent is None:
+            return
+
+        if (result.get("cpu_time_seconds") or 0.0) < cls.min_cpu_seconds:
+            cpu_percent = 0.0
+
+        with cls._lock:
+            usage = cls._usage.pop(script_path, None)
+            if usage is None:
+                usage = {"cpu_percent": float(cpu_percent), "samples": 1}
+            else:
+                usage["cpu_percent"] += cls.smoothing * (cpu_percent - usage["cpu_percent"])
+                usage["samples"] += 1
+            cls._usage[script_path] = usage
+            while len(cls._usage) > cls.max_tracked_scripts:
+                cls._usage.popitem(last=False)
+
+
+class DagSnapshot:
+    """
+    Execution başlangıcındaki workflow grafiğinin değişmez görüntüsü.
+
+    successors, in_degree ve terminal_nodes oluşturulurken bir kez hesaplanır; execution sırasında
+    workflow'a eklenen/silinen edge'ler bu görüntüyü değiştirmez.
+    """
+
+    __slots__ = ("_successors", "_in_degree", "_terminal_nodes")
+
+    def __init__(self, successors: Dict[str, List[str]]):
+        frozen = {node_id: tuple(targets) for node_id, targets in successors.items()}
+        in_degree = dict.fromkeys(frozen, 0)
+        for targets in frozen.values():
+            for to_node_id in targets:
+                in_degree[to_node_id] = in_degree.get(to_node_id, 0) + 1
+
+        object.__setattr__(self, "_successors", MappingProxyType(frozen))
+        object.__setattr__(self, "_in_degree", MappingProxyType(in_degree))
+        object.__setattr__(self, "_terminal_nodes", frozenset(
+            node_id for node_id, targets in frozen.items() if not targets
+        ))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("DagSnapshot is immutable")
+
+    def successors(self, node_id: str) -> tuple:
+        """Node'dan çıkan edge'lerin hedef node ID'leri (edge başına bir kayıt)"""
+        return self._successors.get(node_id, ())
+
+    def in_degree(self, node_id: str) -> int:
+        """Node'a gelen edge sayısı"""
+        return self._in_degree.get(node_id, 0)
+
+    @property
+    def terminal_nodes(self) -> frozenset:
+        """Outgoing edge'i olmayan node'lar"""
+        return self._terminal_nodes
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Execution.dag_snapshot kolonunda saklanan JSON formatı"""
+        return {"successors": {node_id: list(targets) for node_id, targets in self._successors.items()}}
+
+
+class ExecutionGraph:
+    """
+    Execution başına DAG snapshot'ları için process içi LRU cache.
+
+    - Snapshot start_execution_by_* sırasında build_snapshot() ile oluşturulur ve Execution.dag_snapshot'ta saklanır
+    - Output handler successor'ları get_snapshot() ile bellekten okur, node başına edge sorgusu yapılmaz
+    - Cache miss'te snapshot Execution.dag_snapshot'tan yüklenir; bu kolon boşsa (eski execution'lar)
+      workflow'un güncel edge'lerinden bir kez oluşturulur
+    - Execution sonlandığında evict() ile cache'ten çıkarılır
+    """
+
+    max_entries: int = 1024
+
+    _lock = threading.Lock()
+    _snapshots: "OrderedDict[str, DagSnapshot]" = OrderedDict()
+
+    @classmethod
+    def load_config(cls):
+        """max_entries'i config'ten okur (ExecutionOutputHandler.start sırasında bir kez)."""
+        ConfigurationHandler.ensure_loaded()
+        cls.max_entries = ConfigurationHandler.get_int("SCHEDULER_SERVICE", "dag_snapshot_cache_max_entries", fallback=1024)
+
+    @staticmethod
+    def build_snapshot(node_ids: List[str], edges: List) -> DagSnapshot:
+        """
+        Node ID'leri ve edge'lerden snapshot oluşturur.
+
+        Args:
+            node_ids (List[str]): Workflow'un node ID'leri.
+            edges (List): Workflow'un edge'leri (from_node_id, to_node_id).
+
+        Returns:
+            DagSnapshot: Değişmez graf görüntüsü
+        """
+        successors: Dict[str, List[str]] = {node_id: [] for node_id in node_ids}
+        for edge in edges:
+            successors.setdefault(edge.from_node_id, []).append(edge.to_node_id)
+        return DagSnapshot(successors)
+
+    @classmethod
+    def get_snapshot(cls, session, execution) -> DagSnapshot:
+        """
+        Execution'ın snapshot'ını döndürür; cache'te yoksa yükler ve cache'e ekler.
+
+        Args:
+            session: Database session (cache miss'te kullanılır).
+            execution: Execution objesi.
+
+        Returns:
+            DagSnapshot: Execution'ın graf görüntüsü
+        """
+        with cls._lock:
+            snapshot = cls._snapshots.get(execution.id)
+            if snapshot is not None:
+                cls._snapshots.move_to_end(execution.id)
+                return snapshot
+
+        snapshot = cls._load_snapshot(session, execution)
+
+        with cls._lock:
+            cls._snapshots[execution.id] = snapshot
+            while len(cls._snapshots) > cls.max_entries:
+                cls._snapshots.popitem(last=False)
+        return snapshot
+
+    @classmethod
+    def _load_snapshot(cls, session, execution) -> DagSnapshot:
+        stored = execution.dag_snapshot
+        if stored:
+            return DagSnapshot(stored.get("successors", {}))
+
+        logger.warning(f"Execution has no DAG snapshot, building from current edges: execution_id={execution.id}")
+        edges = _edge_repo._get_all_by_workflow_id(session, workflow_id=execution.workflow_id)
+        return cls.build_snapshot([], edges)
+
+    @classmethod
+    def evict(cls, execution_id: str):
+        """Sonlanan execution'ın snapshot'ını cache'ten çıkarır."""
+        with cls._lock:
+            cls._snapshots.pop(execution_id, None)
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._snapshots.clear()
+
+
+class ExecutionOutputCache:
+    """
+    Çalışan execution'ların son node çıktıları (result_data) için process içi LRU cache.
+
+    Output handler başarılı result'ları işlerken çıktıyı buraya da yazar; sonraki node'ların
+    ${node:...} referansları ExecutionOutput tablosu okunmadan bellekten çözülür. Cache'te olmayan
+    çıktılar (restart, başka process) veritabanından okunur. Execution sonlandığında evict() ile çıkarılır.
+    Output handler yazma ve çıkarmayı transaction commit edildikten sonra yapar (put_after_commit /
+    evict_after_commit); rollback edilen çıktılar cache'e girmez. Commit'e kadar çıktı yalnızca kendi
+    transaction'ında görünür (get_many(pairs, session)), DAG continuation aynı transaction'da bellekten çözer.
+    """
+
+    max_executions: int = 256
+
+    # session.info anahtarı: (execution_id, node_id) -> (transaction, result_data), commit edilmemiş çıktılar
+    _PENDING_KEY = "miniflow_pending_outputs"
+
+    _lock = threading.Lock()
+    # execution_id -> {node_id: result_data}
+    _outputs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    @classmethod
+    def load_config(cls):
+        """max_executions'ı config'ten okur (ExecutionOutputHandler.start sırasında bir kez)."""
+        ConfigurationHandler.ensure_loaded()
+        cls.max_executions = ConfigurationHandler.get_int("SCHEDULER_SERVICE", "output_cache_max_executions", fallback=256)
+
+    @classmethod
+    def put(cls, execution_id: str, node_id: str, result_data: Dict[str, Any]):
+        """Node çıktısını cache'e yazar."""
+        if cls.max_executions <= 0:
+            return
+        with cls._lock:
+            outputs = cls._outputs.pop(execution_id, None) or {}
+            outputs[node_id] = result_data
+            cls._outputs[execution_id] = outputs
+            while len(cls._outputs) > cls.max_executions:
+                cls._outputs.popitem(last=False)
+
+    @classmethod
+    def put_after_commit(cls, session, execution_id: str, node_id: str, result_data: Dict[str, Any]):
+        """
+        Session'ın en dıştaki transaction'ı commit edildiğinde put() çağırır (run_after_commit).
+        Commit'e kadar çıktı yalnızca bu transaction'da get_many(pairs, session) ile görünür.
+        """
+        transaction = session.get_nested_transaction() or session.get_transaction()
+        pending = session.info.setdefault(cls._PENDING_KEY, {})
+        pending[(execution_id, node_id)] = (transaction, result_data)
+
+        def _commit():
+            pending.pop((execution_id, node_id), None)
+            cls.put(execution_id, node_id, result_data)
+
+        run_after_commit(session, _commit)
+
+    @classmethod
+    def get_many(cls, pairs, session=None) -> Dict[tuple, Dict[str, Any]]:
+        """
+        (execution_id, node_id) çiftlerinden cache'te olanların çıktılarını döndürür.
+        session verilirse o session'ın hâlâ açık transaction'ında put_after_commit ile yazılan çıktılar da döner;
+        rollback edilen (veya SAVEPOINT'i kapanan) transaction'ların çıktıları kullanılmaz.
+        """
+        found = {}
+        pending = session.info.get(cls._PENDING_KEY) if session is not None else None
+        if pending:
+            for pair in pairs:
+                entry = pending.get(pair)
+                if entry is not None and entry[0] is not None and entry[0].is_active:
+                    found[pair] = entry[1]
+        with cls._lock:
+            for execution_id, node_id in pairs:
+                outputs = cls._outputs.get(execution_id)
+                if outputs is not None and node_id in outputs:
+                    found.setdefault((execution_id, node_id), outputs[node_id])
+        return found
+
+    @classmethod
+    def evict(cls, execution_id: str):
+        """Sonlanan execution'ın çıktılarını cache'ten çıkarır."""
+        with cls._lock:
+            cls._outputs.pop(execution_id, None)
 
-        credential = _credential_repo._get_by_id(session, record_id=id, include_deleted=False)
-        if not credential:
-            raise ResourceNotFoundError(
-                resource_name="Credential", resource_id=id)
-        
-        if credential.workspace_id != workspace_id:
-            raise InvalidInputError(field_name=param_name, message=f"Credential '{id}' does not belong to workspace '{workspace_id}'")
-        
-        credential_data = decrypt_data(credential.credential_data)
-        path_parts = cls._resolve_nested_reference(path) if path else []
-        value = cls._get_value_from_context(path_parts, credential_data)
+    @classmethod
+    def evict_after_commit(cls, session, execution_id: str):
+        """
+        Session'ın en dıştaki transaction'ı commit edildiğinde evict() çağırır. Hook'lar kayıt sırasıyla
+        çalıştığı için aynı transaction'da daha önce kaydedilen put'lar sonlanan execution'ı cache'e geri eklemez.
+        """
+        run_after_commit(session, lambda: cls.evict(execution_id))
 
-        return cls._convert_to_type(param_name, value, expected_type)
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._outputs.clear()
 
 
 class SchedulerForInputHandler:
@@ -747,59 +1308,92 @@ class SchedulerForInputHandler:
     Input Handler için scheduler metodları.
     
     Lifecycle:
-    1. get_ready_execution_inputs() -> İşlenmeye hazır input'ları getirir
-    2. create_execution_context() -> Her input için execution context oluşturur
-       - resolve_parameters() -> Parametreleri referans tipine göre gruplar
-       - resolve_refrences() -> Tüm referansları çözer
+    1. claim_ready_execution_inputs() -> İşlenmeye hazır input'ları atomik olarak claim eder
+    2. create_execution_contexts() -> Batch'teki tüm input'lar için context'leri tek session'da oluşturur
+       - _reference_groups() -> Referans gruplarını reference_plan'dan oluşturur (plan yoksa resolve_parameters ile parse eder)
+       - RefrenceResolver.prefetch_records() -> Referans tipi başına tek IN sorgusu
+       - RefrenceResolver.resolve_batch() -> Referansları getirilen kayıtlardan çözer
     3. remove_processed_execution_inputs() -> İşlenen input'ları siler
+    4. release_execution_input_claims() -> Engine'e gönderilemeyen input'ların claim'ini bırakır
     """
 
     @classmethod
     @with_transaction(manager=None)
-    def get_ready_execution_inputs(
+    def claim_ready_execution_inputs(
         cls,
         session,
         *,
-        batch_size: int = 20
+        batch_size: int = 20,
+        lease_seconds: float = 120.0
     ) -> Dict[str, Any]:
         """
-        İşlenmeye hazır execution input'ları getirir ve kalanların wait_factor'ını artırır.
+        İşlenmeye hazır execution input'lardan en öncelikli batch_size tanesini atomik olarak claim eder.
+        Seçim SQL tarafında LIMIT ile yapılır; aynı priority içinde en uzun bekleyen (en eski created_at) önce gelir.
+        Aynı anda poll eden handler'lar (uvicorn worker'ları veya farklı host'lar) aynı input'u alamaz;
+        claim lease_seconds içinde silinmez veya bırakılmazsa input tekrar seçilebilir hale gelir.
         
         Args:
             session: Database session, @with_transaction decorator'ından gelir.
             batch_size (int, optional): Kaç input seçileceği, default 20. Scheduler'dan gelir.
+            lease_seconds (float, optional): Claim'in geçerlilik süresi (saniye), default 120.
         
         Returns:
             Dict[str, Any]: {
-                "count": 15,  # Seçilen input sayısı
-                "ids": ["EXI-123", "EXI-456", ...]  # Seçilen input ID'leri
+                "count": 15,  # Claim edilen input sayısı
+                "ids": ["EXI-123", "EXI-456", ...],  # Claim edilen input ID'leri
+                "claim_token": "9f1c..."  # release_execution_input_claims için
             }
         
         Girdi:
             batch_size: 20  # Kaç input seçilecek
+            lease_seconds: 120  # Claim süresi
         
         Çıktı:
             {
-                "count": 15,  # Seçilen input sayısı
-                "ids": ["EXI-123", "EXI-456", ...]  # Seçilen input ID'leri
+                "count": 15,
+                "ids": ["EXI-123", "EXI-456", ...],
+                "claim_token": "9f1c..."
             }
         """
-        all_ready_inputs = _execution_input_repo._get_ready_execution_inputs(session)
-
-        selected_inputs = all_ready_inputs[:batch_size]
-        remaining_inputs = all_ready_inputs[batch_size:]
-        
-        if remaining_inputs:
-            remaining_ids = [inp.id for inp in remaining_inputs]
-            _execution_input_repo._increment_wait_factor_by_ids(
-                session,
-                execution_input_ids=remaining_ids
-            )
+        claim_token = uuid.uuid4().hex
+        ids = _execution_input_repo._claim_ready_execution_inputs(
+            session,
+            limit=batch_size,
+            claim_token=claim_token,
+            lease_seconds=lease_seconds
+        )
         
         return {
-            "count": len(selected_inputs),
-            "ids": [inp.id for inp in selected_inputs]
+            "count": len(ids),
+            "ids": ids,
+            "claim_token": claim_token
         }
+
+    @classmethod
+    @with_transaction(manager=None)
+    def release_execution_input_claims(
+        cls,
+        session,
+        *,
+        execution_input_ids: List[str],
+        claim_token: str
+    ) -> int:
+        """
+        Engine'e gönderilemeyen input'ların claim'ini bırakır; lease dolmasını beklemeden tekrar seçilirler.
+        
+        Args:
+            session: Database session, @with_transaction decorator'ından gelir.
+            execution_input_ids (List[str]): Claim'i bırakılacak input ID'leri.
+            claim_token (str): claim_ready_execution_inputs'tan dönen token.
+        
+        Returns:
+            int: Claim'i bırakılan input sayısı
+        """
+        return _execution_input_repo._release_claims(
+            session,
+            execution_input_ids=execution_input_ids,
+            claim_token=claim_token
+        )
     
     @staticmethod
     def _is_reference(value: str) -> bool:
@@ -872,7 +1466,7 @@ class SchedulerForInputHandler:
 
         valid_types = ["static", "trigger", "node", "value", "credential", "database", "file"]
         if ref_type not in valid_types:
-            raise InvalidInputError(message=f"Invalid reference type '{ref_type}'. Valid types: {', '.join(valid_types)}")
+            raise InvalidInputError(field_name=param_name, message=f"Invalid reference type '{ref_type}'. Valid types: {', '.join(valid_types)}")
         
         id_or_value = None
         value_path = None
@@ -892,7 +1486,7 @@ class SchedulerForInputHandler:
                 id_or_value = identifier_path
                 value_path = None
         else:
-            raise InvalidInputError(message=f"Invalid reference type '{ref_type}'. Valid types: {', '.join(valid_types)}")
+            raise InvalidInputError(field_name=param_name, message=f"Invalid reference type '{ref_type}'. Valid types: {', '.join(valid_types)}")
         
         result = {
             "type": ref_type,
@@ -981,6 +1575,112 @@ class SchedulerForInputHandler:
 
         return groups
 
+    @classmethod
+    def compile_reference_plan(cls, params: Dict[str, Any]) -> Optional[List[List[Any]]]:
+        """
+        Node parametrelerinden referans planını bir kez çıkarır; ExecutionInput.reference_plan'a yazılır.
+        Input handler her context'te _is_reference, _parse_refrence ve path parse işlemlerini tekrar yapmaz,
+        plan'daki kayıtları getirip değerleri dönüştürür.
+        
+        Args:
+            params (Dict[str, Any]): Parametreler dict'i, ExecutionInput.params ile aynı format.
+        
+        Returns:
+            Optional[List[List[Any]]]: [param_name, type, id_or_value, path_parts, expected_type] listesi.
+                                       Parse edilemeyen referans varsa None; input context oluştururken
+                                       params'tan parse edilir ve hata orada raporlanır.
+        
+        Girdi:
+            params: {
+                "timeout": {"value": "${node:NOD-123.result.items[0]}", "type": "integer"},
+                "static_val": {"value": "test", "type": "string"}
+            }
+        
+        Çıktı:
+            [
+                ["timeout", "node", "NOD-123", ["result", "items", "[0]"], "integer"],
+                ["static_val", "static", "test", None, "string"]
+            ]
+        """
+        plan = []
+        for param_name, param_data in (params or {}).items():
+            param_value = param_data.get('value')
+            expected_type = param_data.get('type')
+
+            if not cls._is_reference(param_value):
+                plan.append([param_name, "static", param_value, None, expected_type])
+                continue
+
+            try:
+                reference_info = cls._parse_refrence(param_value, param_name, expected_type)
+            except InvalidInputError as e:
+                logger.warning(f"Reference plan not compiled for parameter '{param_name}': {e}")
+                return None
+
+            ref_type = reference_info["type"]
+            if ref_type == "static":
+                plan.append([param_name, ref_type, reference_info["id_or_value"], None, expected_type])
+            else:
+                path = reference_info.get("value_path")
+                path_parts = RefrenceResolver._resolve_nested_reference(path) if path else []
+                plan.append([param_name, ref_type, reference_info.get("id"), path_parts, expected_type])
+        return plan
+
+    @staticmethod
+    def _groups_from_plan(
+        reference_plan: List[List[Any]],
+        workspace_id: str,
+        execution_id: str,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        compile_reference_plan çıktısını resolve_parameters ile aynı grup formatına çevirir (string parse etmeden).
+        """
+        groups = {
+            "static": [],
+            "trigger": [],
+            "node": [],
+            "value": [],
+            "credential": [],
+            "database": [],
+            "file": []
+        }
+
+        for param_name, ref_type, id_or_value, path_parts, expected_type in reference_plan:
+            if ref_type == "static":
+                groups["static"].append({
+                    "type": "static",
+                    "id_or_value": id_or_value,
+                    "param_name": param_name,
+                    "expected_type": expected_type
+                })
+            else:
+                groups[ref_type].append({
+                    "type": ref_type,
+                    "id": id_or_value,
+                    "path_parts": path_parts,
+                    "param_name": param_name,
+                    "expected_type": expected_type,
+                    "workspace_id": workspace_id,
+                    "execution_id": execution_id
+                })
+
+        return groups
+
+    @classmethod
+    def _reference_groups(cls, execution_input) -> Dict[str, List[Dict[str, Any]]]:
+        """Input'un referans gruplarını reference_plan'dan, plan yoksa params'tan oluşturur."""
+        if execution_input.reference_plan is not None:
+            return cls._groups_from_plan(
+                execution_input.reference_plan,
+                execution_input.workspace_id,
+                execution_input.execution_id
+            )
+        return cls.resolve_parameters(
+            execution_input.workspace_id,
+            execution_input.execution_id,
+            execution_input.params or {}
+        )
+
     @classmethod
     def resolve_refrences(
         cls,
@@ -988,7 +1688,8 @@ class SchedulerForInputHandler:
         session
     ) -> Dict[str, Any]:
         """
-        Gruplanmış referansları çözer ve resolved parametreler döndürür.
+        Gruplanmış referansları verilen session'da çözer ve resolved parametreler döndürür.
+        Kayıtlar referans tipi başına tek sorgu ile getirilir (RefrenceResolver.prefetch_records).
         
         Args:
             groups (Dict[str, List[Dict[str, Any]]]): Referans tipine göre gruplanmış referans bilgileri,
@@ -1013,37 +1714,8 @@ class SchedulerForInputHandler:
                 ...
             }
         """
-        resolved_params = {}
-
-        for ref_info in groups.get("static", []):
-            value = RefrenceResolver.get_static_data(ref_info)
-            resolved_params[ref_info["param_name"]] = value
-
-        for ref_info in groups.get("trigger", []):
-            value = RefrenceResolver.get_trigger_data(ref_info)
-            resolved_params[ref_info["param_name"]] = value
-
-        for ref_info in groups.get("node", []):
-            value = RefrenceResolver.get_executed_node_data(ref_info)
-            resolved_params[ref_info["param_name"]] = value
-
-        for ref_info in groups.get("value", []):
-            value = RefrenceResolver.get_variable_data(ref_info)
-            resolved_params[ref_info["param_name"]] = value
-
-        for ref_info in groups.get("credential", []):
-            value = RefrenceResolver.get_credential_data(ref_info)
-            resolved_params[ref_info["param_name"]] = value
-
-        for ref_info in groups.get("database", []):
-            value = RefrenceResolver.get_database_data(ref_info)
-            resolved_params[ref_info["param_name"]] = value
-
-        for ref_info in groups.get("file", []):
-            value = RefrenceResolver.get_file_data(ref_info)
-            resolved_params[ref_info["param_name"]] = value
-
-        return resolved_params
+        records = RefrenceResolver.prefetch_records(session, [groups])
+        return RefrenceResolver.resolve_batch(groups, records)
 
     @classmethod
     @with_transaction(manager=None)
@@ -1057,7 +1729,7 @@ class SchedulerForInputHandler:
         
         Args:
             session: Database session, @with_transaction decorator'ından gelir.
-            execution_input_id (str): ExecutionInput ID, get_ready_execution_inputs'dan gelen ID'lerden biri.
+            execution_input_id (str): ExecutionInput ID, claim_ready_execution_inputs'dan gelen ID'lerden biri.
         
         Returns:
             Dict[str, Any]: Execution context dict'i. Engine'e gönderilecek format.
@@ -1069,6 +1741,7 @@ class SchedulerForInputHandler:
                 - params (Dict[str, Any]): Çözülmüş parametreler
                 - max_retries (int): Maksimum retry sayısı
                 - timeout_seconds (int): Timeout süresi (saniye)
+                - process_type (str): Engine lane'i ("cb" veya "iob")
         
         Girdi:
             execution_input_id: "EXI-..."  # ExecutionInput ID
@@ -1086,7 +1759,8 @@ class SchedulerForInputHandler:
                     ...
                 },
                 "max_retries": 3,
-                "timeout_seconds": 300
+                "timeout_seconds": 300,
+                "process_type": "iob"
             }
         """
         logger.info(f"Creating execution context for execution_input_id: {execution_input_id}")
@@ -1098,36 +1772,114 @@ class SchedulerForInputHandler:
                 resource_name="ExecutionInput", resource_id=execution_input_id)
         
         execution_id = execution_input.execution_id
-        workspace_id = execution_input.workspace_id
-        workflow_id = execution_input.workflow_id
         node_id = execution_input.node_id
         params = execution_input.params or {}
 
         logger.debug(f"Resolving parameters for execution_id: {execution_id}, node_id: {node_id}, params_count: {len(params)}")
-        groups = cls.resolve_parameters(workspace_id, execution_id, params)
+        groups = cls._reference_groups(execution_input)
 
         logger.debug(f"Resolving references: {sum(len(v) for v in groups.values())} total references")
         resolved_params = cls.resolve_refrences(groups, session)
         
-        for param_name, param_data in params.items():
+        context = cls._build_context(execution_input, resolved_params)
+        
+        logger.info(f"Execution context created successfully for execution_id: {execution_id}, node_id: {node_id}, resolved_params_count: {len(resolved_params)}")
+        return context
+
+    @classmethod
+    @with_readonly_session(manager=None)
+    def create_execution_contexts(
+        cls,
+        session,
+        execution_input_ids: List[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Bir batch execution input için context'leri tek read session'da oluşturur.
+        Tüm input'ların referansları toplanır ve her referans tipi (trigger, node, variable, credential,
+        database, file) tek IN sorgusu ile getirilir; input başına O(referans) yerine batch başına
+        O(referans tipi) sorgu atılır.
+        
+        Referansı çözülemeyen input (bulunamayan kayıt, başka workspace'e ait kaynak, tip dönüşüm hatası)
+        loglanır ve sonuçta yer almaz; batch'in geri kalanı etkilenmez.
+        
+        Args:
+            session: Database session, @with_readonly_session decorator'ından gelir.
+            execution_input_ids (List[str]): claim_ready_execution_inputs'dan gelen ID'ler.
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: ExecutionInput ID -> execution context (create_execution_context ile aynı format)
+        
+        Girdi:
+            execution_input_ids: ["EXI-123", "EXI-456", ...]
+        
+        Çıktı:
+            {
+                "EXI-123": {"execution_id": "EXE-...", "node_id": "NOD-...", "params": {...}, ...},
+                "EXI-456": {...}
+            }
+        """
+        if not execution_input_ids:
+            return {}
+        
+        execution_inputs = _execution_input_repo._get_by_ids(session, record_ids=execution_input_ids, include_deleted=False)
+        missing = set(execution_input_ids) - {execution_input.id for execution_input in execution_inputs}
+        if missing:
+            logger.error(f"ExecutionInputs not found: {sorted(missing)}")
+        
+        contexts = cls._build_contexts(session, execution_inputs)
+        
+        logger.info(f"Execution contexts created: {len(contexts)}/{len(execution_input_ids)}")
+        return contexts
+
+    @classmethod
+    def _build_contexts(cls, session, execution_inputs: List) -> Dict[str, Dict[str, Any]]:
+        """
+        Verilen input'ların referanslarını toplu çözer ve context'lerini oluşturur.
+        create_execution_contexts ve output handler'ın DAG continuation yolu tarafından kullanılır.
+        """
+        groups_by_input = {}
+        for execution_input in execution_inputs:
+            try:
+                groups_by_input[execution_input.id] = cls._reference_groups(execution_input)
+            except Exception as e:
+                logger.error(f"Failed to parse parameters for execution_input_id {execution_input.id}: {e}")
+        
+        records = RefrenceResolver.prefetch_records(session, list(groups_by_input.values()))
+        
+        contexts = {}
+        for execution_input in execution_inputs:
+            groups = groups_by_input.get(execution_input.id)
+            if groups is None:
+                continue
+            try:
+                resolved_params = RefrenceResolver.resolve_batch(groups, records)
+            except Exception as e:
+                logger.error(f"Failed to resolve references for execution_input_id {execution_input.id}: {e}")
+                continue
+            contexts[execution_input.id] = cls._build_context(execution_input, resolved_params)
+        
+        return contexts
+
+    @classmethod
+    def _build_context(cls, execution_input, resolved_params: Dict[str, Any]) -> Dict[str, Any]:
+        """ExecutionInput ve çözülmüş parametrelerden engine'e gönderilecek context'i oluşturur."""
+        for param_name, param_data in (execution_input.params or {}).items():
             if param_name not in resolved_params:
                 value = param_data.get("value")
                 if not (isinstance(value, str) and cls._is_reference(value)):
                     resolved_params[param_name] = value
         
-        context = {
-            "execution_id": execution_id,
-            "workspace_id": workspace_id,
-            "workflow_id": workflow_id,
-            "node_id": node_id,
+        return {
+            "execution_id": execution_input.execution_id,
+            "workspace_id": execution_input.workspace_id,
+            "workflow_id": execution_input.workflow_id,
+            "node_id": execution_input.node_id,
             "script_path": execution_input.script_path,
             "params": resolved_params,
             "max_retries": execution_input.max_retries,
-            "timeout_seconds": execution_input.timeout_seconds
+            "timeout_seconds": execution_input.timeout_seconds,
+            "process_type": ExecutionClassifier.resolve(execution_input.process_type, execution_input.script_path)
         }
-        
-        logger.info(f"Execution context created successfully for execution_id: {execution_id}, node_id: {node_id}, resolved_params_count: {len(resolved_params)}")
-        return context
 
     @classmethod
     @with_transaction(manager=None)
@@ -1142,7 +1894,7 @@ class SchedulerForInputHandler:
         Args:
             session: Database session, @with_transaction decorator'ından gelir.
             execution_input_ids (List[str]): Silinecek ExecutionInput ID'leri listesi,
-                                           get_ready_execution_inputs'dan gelen ID'lerden oluşur.
+                                           claim_ready_execution_inputs'dan gelen ID'lerden oluşur.
         
         Returns:
             int: Silinen kayıt sayısı
@@ -1178,6 +1930,11 @@ class SchedulerForOutputHandler:
              -> _update_execution_with_results() -> Execution'ı COMPLETED olarak güncelle
            - Son düğüm değilse:
              -> _decrement_next_nodes_dependencies() -> Sonraki düğümlerin dependency_count'unu azalt
+    2. process_execution_results() -> Output handler batch'ini tek transaction'da işler (group commit)
+       -> Output'lar toplu eklenir, dependency azaltmaları execution başına gruplanır,
+          biten execution'lar birlikte sonlandırılır
+    3. process_and_continue_execution_results() -> 2. ile aynı, ek olarak hazır hale gelen sonraki node'ları
+       claim eder ve context'lerini oluşturur; output handler bunları doğrudan engine'e gönderir (DAG continuation)
     """
     
     @classmethod
@@ -1258,6 +2015,7 @@ class SchedulerForOutputHandler:
             return cls._handle_failed_node(session, result, execution)
         elif status == "SUCCESS":
             logger.debug(f"Node execution succeeded: execution_id={execution_id}, node_id={node_id}")
+            ExecutionClassifier.record_usage(result)
             return cls._handle_successful_node(session, result, execution)
         else:
             raise InvalidInputError(
@@ -1265,6 +2023,243 @@ class SchedulerForOutputHandler:
                 message=f"Invalid status '{status}'. Expected 'SUCCESS' or 'FAILED'"
             )
     
+    @classmethod
+    @with_transaction(manager=None)
+    def process_execution_results(
+        cls,
+        session,
+        results: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Engine'den gelen result batch'ini tek transaction'da işler (group commit).
+        
+        process_execution_result ile aynı kuralları uygular, ancak:
+        - Execution'lar batch başına tek sorgu ile getirilir, successor'lar DAG snapshot'tan okunur
+        - SUCCESS output'ları tek flush ile toplu eklenir
+        - Dependency azaltmaları execution başına tek UPDATE ile yapılır
+          (aynı hedefe giden birden fazla tamamlanan node doğru sayıda azaltılır)
+        - Biten execution'ların input/output'ları birlikte toplanır ve silinir
+        
+        Hatalı result (eksik alan, geçersiz status, bulunamayan execution) batch'in geri kalanını etkilemez,
+        sonuç listesinde "error" ile döner. Aynı batch'te execution'ı sonlandıran result'tan sonra gelen
+        result'lar atlanır.
+        
+        Args:
+            session: Database session, @with_transaction decorator'ından gelir.
+            results (List[Dict[str, Any]]): process_execution_result ile aynı formatta result'lar.
+        
+        Returns:
+            List[Dict[str, Any]]: Result sırasıyla işlem sonuçları (process_execution_result formatında),
+                hatalı result'lar için {"execution_id": "...", "node_id": "...", "error": "..."}
+        """
+        outcomes, _ = cls._apply_results(session, results, notify=True)
+        return outcomes
+    
+    @classmethod
+    @with_transaction(manager=None)
+    def process_and_continue_execution_results(
+        cls,
+        session,
+        results: List[Dict[str, Any]],
+        lease_seconds: float
+    ) -> Dict[str, Any]:
+        """
+        Result batch'ini process_execution_results gibi işler ve hazır hale gelen sonraki node'ları
+        aynı transaction'da claim edip context'lerini oluşturur (DAG continuation).
+        
+        Input handler'ın uyanması, ayrı claim ve context transaction'ları beklenmez; output handler
+        commit'ten hemen sonra context'leri engine'e gönderir. ${node:...} referansları bu batch'te ve
+        önceki batch'lerde işlenen çıktılardan (ExecutionOutputCache) bellekten çözülür.
+        Claim input handler ile aynı mekanizmadır; engine'e gönderilemeyen input'ların claim'i bırakılır.
+        
+        Args:
+            session: Database session, @with_transaction decorator'ından gelir.
+            results (List[Dict[str, Any]]): process_execution_result ile aynı formatta result'lar.
+            lease_seconds (float): Claim süresi, input handler'ın claim_lease_seconds değeri.
+        
+        Returns:
+            Dict[str, Any]: {
+                "outcomes": [...],  # process_execution_results çıktısı
+                "contexts": {"EXI-...": {...}},  # create_execution_contexts formatında
+                "claim_token": "..."
+            }
+        """
+        outcomes, decremented = cls._apply_results(session, results, notify=False)
+        
+        claim_token = uuid.uuid4().hex
+        ready_inputs = _execution_input_repo._claim_ready_by_node_ids(
+            session,
+            execution_ids=list(decremented),
+            node_ids=list({node_id for node_ids in decremented.values() for node_id in node_ids}),
+            claim_token=claim_token,
+            lease_seconds=lease_seconds
+        )
+        contexts = SchedulerForInputHandler._build_contexts(session, ready_inputs)
+        
+        unresolved_ids = [execution_input.id for execution_input in ready_inputs if execution_input.id not in contexts]
+        if unresolved_ids:
+            # Input handler'a bırakılır, hata orada tekrar raporlanır
+            _execution_input_repo._release_claims(session, execution_input_ids=unresolved_ids, claim_token=claim_token)
+            ReadyInputNotifier.notify_after_commit(session)
+        
+        return {
+            "outcomes": outcomes,
+            "contexts": contexts,
+            "claim_token": claim_token
+        }
+    
+    @classmethod
+    def _apply_results(
+        cls,
+        session,
+        results: List[Dict[str, Any]],
+        notify: bool
+    ) -> tuple:
+        """
+        process_execution_results ve process_and_continue_execution_results'ın ortak gövdesi.
+        
+        Returns:
+            tuple: (outcomes, {execution_id: [dependency'si azaltılan node_id, ...]})
+        """
+        outcomes: List[Optional[Dict[str, Any]]] = [None] * len(results)
+        
+        valid_indexes = []
+        for index, result in enumerate(results):
+            error = cls._get_result_error(result)
+            if error:
+                outcomes[index] = cls._error_outcome(result, error)
+            else:
+                valid_indexes.append(index)
+        
+        execution_ids = list({results[index]["execution_id"] for index in valid_indexes})
+        executions = {
+            execution.id: execution
+            for execution in _execution_repo._get_by_ids(session, record_ids=execution_ids, include_deleted=False)
+        }
+        
+        finalized: Dict[str, tuple] = {}  # execution_id -> (ExecutionStatus, failed_node_id)
+        decrements: Dict[str, Counter] = {}
+        output_records: List[Dict[str, Any]] = []
+        output_indexes: List[int] = []
+        usage_results: List[Dict[str, Any]] = []
+        
+        for index in valid_indexes:
+            result = results[index]
+            execution_id = result["execution_id"]
+            node_id = result["node_id"]
+            execution = executions.get(execution_id)
+            
+            if execution is None:
+                logger.error(f"Execution not found: {execution_id}")
+                outcomes[index] = cls._error_outcome(result, f"Execution not found: {execution_id}")
+                continue
+            
+            if execution_id in finalized:
+                logger.warning(f"Skipping result of finalized execution: execution_id={execution_id}, node_id={node_id}")
+                outcomes[index] = cls._error_outcome(result, "Execution already finalized in this batch")
+                continue
+            
+            if result["status"] == "FAILED":
+                logger.warning(f"Node execution failed: execution_id={execution_id}, node_id={node_id}")
+                status = ExecutionStatus.TIMEOUT if result.get("timed_out") else ExecutionStatus.FAILED
+                finalized[execution_id] = (status, node_id)
+                outcomes[index] = {"execution_id": execution_id, "status": status.value, "processed": True}
+                continue
+            
+            usage_results.append(result)
+            output_records.append(cls._execution_output_values(result, execution))
+            output_indexes.append(index)
+            
+            successor_node_ids = ExecutionGraph.get_snapshot(session, execution).successors(node_id)
+            if cls._is_last_node(successor_node_ids):
+                finalized[execution_id] = (ExecutionStatus.COMPLETED, None)
+                outcomes[index] = {"execution_id": execution_id, "is_last_node": True, "execution_completed": True}
+            else:
+                ExecutionOutputCache.put_after_commit(session, execution_id, node_id, output_records[-1]["result_data"] or {})
+                decrements.setdefault(execution_id, Counter()).update(successor_node_ids)
+                outcomes[index] = {"execution_id": execution_id, "is_last_node": False,
+                                   "updated_dependencies": len(successor_node_ids)}
+        
+        outputs = _execution_output_repo._bulk_create(session, records=output_records)
+        for index, output in zip(output_indexes, outputs):
+            outcomes[index]["execution_output_id"] = output.id
+        
+        updated_count = 0
+        decremented: Dict[str, List[str]] = {}
+        for execution_id, node_counts in decrements.items():
+            if finalized.get(execution_id, (None,))[0] in (ExecutionStatus.FAILED, ExecutionStatus.TIMEOUT):
+                # Input'lar sonlandırmada silinecek
+                continue
+            updated_count += _execution_input_repo._decrement_dependency_counts(
+                session, execution_id=execution_id, node_counts=dict(node_counts)
+            )
+            decremented[execution_id] = list(node_counts)
+        if updated_count and notify:
+            ReadyInputNotifier.notify_after_commit(session)
+        
+        if finalized:
+            cls._finalize_executions(session, executions, finalized)
+        
+        for result in usage_results:
+            ExecutionClassifier.record_usage(result)
+        
+        return outcomes, decremented
+    
+    @staticmethod
+    def _get_result_error(result: Dict[str, Any]) -> Optional[str]:
+        """Result payload'ındaki zorunlu alanları kontrol eder, hata varsa mesajını döndürür."""
+        if not result.get("execution_id"):
+            return "execution_id is required in result payload"
+        if not result.get("status"):
+            return "status is required in result payload"
+        if result["status"] not in ("SUCCESS", "FAILED"):
+            return f"Invalid status '{result['status']}'. Expected 'SUCCESS' or 'FAILED'"
+        if not result.get("node_id"):
+            return "node_id is required in result payload"
+        return None
+    
+    @staticmethod
+    def _error_outcome(result: Dict[str, Any], error: str) -> Dict[str, Any]:
+        return {"execution_id": result.get("execution_id"), "node_id": result.get("node_id"), "error": error}
+    
+    @classmethod
+    def _finalize_executions(
+        cls,
+        session,
+        executions: Dict[str, Any],
+        finalized: Dict[str, tuple]
+    ):
+        """
+        Batch'te biten execution'ların input/output'larını tek sorguda toplar, siler ve execution'ları günceller.
+        
+        Args:
+            session: Database session, process_execution_results'dan gelir (transaction içinde).
+            executions (Dict[str, Any]): execution_id -> Execution objesi.
+            finalized (Dict[str, tuple]): execution_id -> (ExecutionStatus, failed_node_id).
+        """
+        execution_ids = list(finalized)
+        failed_ids = [
+            execution_id for execution_id, (status, _) in finalized.items()
+            if status != ExecutionStatus.COMPLETED
+        ]
+        
+        # Önce iptal edilen input'lar, sonra gerçek çıktılar: aynı batch'te tamamlanan bir node'un
+        # input satırı henüz silinmemiş olabilir, bu durumda node'un çıktısı geçerlidir
+        merged_results: Dict[str, Dict[str, Any]] = {execution_id: {} for execution_id in execution_ids}
+        for input_obj in _execution_input_repo._get_by_execution_ids(session, execution_ids=failed_ids):
+            if input_obj.node_id:
+                failed_node_id = finalized[input_obj.execution_id][1]
+                merged_results[input_obj.execution_id][input_obj.node_id] = cls._cancelled_input_result(failed_node_id)
+        for output in _execution_output_repo._get_by_execution_ids(session, execution_ids=execution_ids):
+            if output.node_id:
+                merged_results[output.execution_id][output.node_id] = cls._output_result(output)
+        
+        _execution_input_repo._delete_by_execution_ids(session, execution_ids=failed_ids)
+        _execution_output_repo._delete_by_execution_ids(session, execution_ids=execution_ids)
+        
+        for execution_id, (status, _) in finalized.items():
+            cls._update_execution_with_results(session, executions[execution_id], status, merged_results[execution_id])
+    
     @classmethod
     def _handle_failed_node(
         cls,
@@ -1305,14 +2300,16 @@ class SchedulerForOutputHandler:
         
         outputs_dict = cls._collect_and_delete_execution_outputs(session, execution_id)
         
-        merged_results = {**outputs_dict, **cancelled_dict}
+        merged_results = {**cancelled_dict, **outputs_dict}
+        # Engine deadline'ı aşan node'ları timed_out ile işaretler
+        status = ExecutionStatus.TIMEOUT if result.get("timed_out") else ExecutionStatus.FAILED
         cls._update_execution_with_results(
-            session, execution, ExecutionStatus.FAILED, merged_results
+            session, execution, status, merged_results
         )
         
         return {
             "execution_id": execution_id,
-            "status": "FAILED",
+            "status": status.value,
             "processed": True
         }
     
@@ -1345,7 +2342,6 @@ class SchedulerForOutputHandler:
         """
         execution_id = execution.id
         node_id = result.get("node_id")
-        workflow_id = execution.workflow_id
         
         if not node_id:
             raise InvalidInputError(
@@ -1355,11 +2351,9 @@ class SchedulerForOutputHandler:
         
         execution_output_id = cls._create_execution_output_record(session, result, execution)
         
-        outgoing_edges = _edge_repo._get_by_from_node_id(
-            session, workflow_id=workflow_id, from_node_id=node_id, include_deleted=False
-        )
+        successor_node_ids = ExecutionGraph.get_snapshot(session, execution).successors(node_id)
         
-        is_last = cls._is_last_node(outgoing_edges)
+        is_last = cls._is_last_node(successor_node_ids)
         
         if is_last:
             outputs_dict = cls._collect_and_delete_execution_outputs(session, execution_id)
@@ -1374,8 +2368,9 @@ class SchedulerForOutputHandler:
                 "execution_completed": True
             }
         else:
+            ExecutionOutputCache.put_after_commit(session, execution_id, node_id, result.get("result_data") or {})
             updated_count = cls._decrement_next_nodes_dependencies(
-                session, execution_id, node_id, outgoing_edges
+                session, execution_id, node_id, successor_node_ids
             )
             
             return {
@@ -1425,20 +2420,25 @@ class SchedulerForOutputHandler:
         cancelled_dict = {}
         for input_obj in inputs:
             if input_obj.node_id:
-                cancelled_dict[input_obj.node_id] = {
-                    'status': ExecutionStatus.CANCELLED.value,
-                    'result_data': None,
-                    'memory_mb': None,
-                    'cpu_percent': None,
-                    'duration_seconds': None,
-                    'error_message': f'Cancelled because of failed node: {failed_node_id}',
-                    'error_details': {'failed_node_id': failed_node_id}
-                }
+                cancelled_dict[input_obj.node_id] = cls._cancelled_input_result(failed_node_id)
         
         _execution_input_repo._delete_by_execution_id(session, execution_id=execution_id)
         
         return cancelled_dict
     
+    @staticmethod
+    def _cancelled_input_result(failed_node_id: str) -> Dict[str, Any]:
+        """Başarısız node nedeniyle çalıştırılmayan input'un execution.results kaydı."""
+        return {
+            'status': ExecutionStatus.CANCELLED.value,
+            'result_data': None,
+            'memory_mb': None,
+            'cpu_percent': None,
+            'duration_seconds': None,
+            'error_message': f'Cancelled because of failed node: {failed_node_id}',
+            'error_details': {'failed_node_id': failed_node_id}
+        }
+    
     @classmethod
     def _collect_and_delete_execution_outputs(
         cls,
@@ -1478,42 +2478,47 @@ class SchedulerForOutputHandler:
         outputs_dict = {}
         for output in outputs:
             if output.node_id:
-                outputs_dict[output.node_id] = {
-                    'status': output.status,
-                    'result_data': output.result_data or {},
-                    'memory_mb': output.memory_mb,
-                    'cpu_percent': output.cpu_percent,
-                    'duration_seconds': output.duration,
-                    'error_message': output.error_message,
-                    'error_details': output.error_details or {}
-                }
+                outputs_dict[output.node_id] = cls._output_result(output)
         
         _execution_output_repo._delete_by_execution_id(session, execution_id=execution_id)
         
         return outputs_dict
     
+    @staticmethod
+    def _output_result(output) -> Dict[str, Any]:
+        """ExecutionOutput kaydının execution.results kaydı."""
+        return {
+            'status': output.status,
+            'result_data': output.result_data or {},
+            'memory_mb': output.memory_mb,
+            'cpu_percent': output.cpu_percent,
+            'duration_seconds': output.duration,
+            'error_message': output.error_message,
+            'error_details': output.error_details or {}
+        }
+    
     @classmethod
     def _is_last_node(
         cls,
-        outgoing_edges: List
+        successor_node_ids: List[str]
     ) -> bool:
         """
         Node'un son düğüm olup olmadığını kontrol eder (outgoing edge yoksa son düğümdür).
         
         Args:
-            outgoing_edges (List): Bu node'dan çıkan edge'ler listesi,
-                                 _edge_repo._get_by_from_node_id'dan gelir.
+            successor_node_ids (List[str]): Bu node'dan çıkan edge'lerin hedef node ID'leri,
+                                 ExecutionGraph.get_snapshot(...).successors(node_id)'dan gelir.
         
         Returns:
-            bool: True (son düğümse, outgoing_edges boş) veya False (değilse)
+            bool: True (son düğümse, successor_node_ids boş) veya False (değilse)
         
         Girdi:
-            outgoing_edges: [Edge(...), Edge(...)]  # Bu node'dan çıkan edge'ler
+            successor_node_ids: ("NOD-...", "NOD-...")  # Bu node'un sonraki düğümleri
         
         Çıktı:
             True (son düğümse) veya False (değilse)
         """
-        return len(outgoing_edges) == 0
+        return len(successor_node_ids) == 0
     
     @classmethod
     def _create_execution_output_record(
@@ -1540,7 +2545,6 @@ class SchedulerForOutputHandler:
         Çıktı:
             "EXOUT-..." (oluşturulan ExecutionOutput ID'si)
         """
-        status = result.get("status", "SUCCESS")
         node_id = result.get("node_id")
         
         if not node_id:
@@ -1549,6 +2553,26 @@ class SchedulerForOutputHandler:
                 message="node_id is required in result payload"
             )
         
+        execution_output = _execution_output_repo._create(
+            session,
+            **cls._execution_output_values(result, execution)
+        )
+        
+        # Extract the ID while session is still active to avoid DetachedInstanceError
+        session.flush()  # Ensure the object is persisted and has an ID
+        output_id = execution_output.id
+        
+        return output_id
+    
+    @staticmethod
+    def _execution_output_values(
+        result: Dict[str, Any],
+        execution
+    ) -> Dict[str, Any]:
+        """
+        Engine result'ından ExecutionOutput kolon değerlerini oluşturur.
+        _create_execution_output_record ve process_execution_results tarafından kullanılır.
+        """
         started_at = result.get("started_at")
         if started_at:
             if isinstance(started_at, str):
@@ -1565,28 +2589,21 @@ class SchedulerForOutputHandler:
         else:
             ended_at = datetime.now(timezone.utc)
         
-        execution_output = _execution_output_repo._create(
-            session,
-            execution_id=execution.id,
-            workflow_id=execution.workflow_id,
-            workspace_id=execution.workspace_id,
-            node_id=node_id,
-            status=status,
-            result_data=result.get("result_data", {}),
-            started_at=started_at,
-            ended_at=ended_at,
-            memory_mb=result.get("memory_mb"),
-            cpu_percent=result.get("cpu_percent"),
-            error_message=result.get("error_message"),
-            error_details=result.get("error_details", {}),
-            retry_count=result.get("retry_count", 0)
-        )
-        
-        # Extract the ID while session is still active to avoid DetachedInstanceError
-        session.flush()  # Ensure the object is persisted and has an ID
-        output_id = execution_output.id
-        
-        return output_id
+        return {
+            "execution_id": execution.id,
+            "workflow_id": execution.workflow_id,
+            "workspace_id": execution.workspace_id,
+            "node_id": result.get("node_id"),
+            "status": result.get("status", "SUCCESS"),
+            "result_data": result.get("result_data", {}),
+            "started_at": started_at,
+            "ended_at": ended_at,
+            "memory_mb": result.get("memory_mb"),
+            "cpu_percent": result.get("cpu_percent"),
+            "error_message": result.get("error_message"),
+            "error_details": result.get("error_details", {}),
+            "retry_count": result.get("retry_count", 0)
+        }
     
     @classmethod
     def _decrement_next_nodes_dependencies(
@@ -1594,7 +2611,7 @@ class SchedulerForOutputHandler:
         session,
         execution_id: str,
         completed_node_id: str,
-        outgoing_edges: List
+        successor_node_ids: List[str]
     ) -> int:
         """
         Tamamlanan node'un sonraki düğümlerinin dependency_count değerlerini batch olarak azaltır.
@@ -1603,8 +2620,8 @@ class SchedulerForOutputHandler:
             session: Database session, _handle_successful_node'dan gelir (transaction içinde).
             execution_id (str): Execution ID, _handle_successful_node'dan gelir.
             completed_node_id (str): Tamamlanan node ID, result["node_id"]'den gelir.
-            outgoing_edges (List): Bu node'dan çıkan edge'ler listesi,
-                                 _edge_repo._get_by_from_node_id'dan gelir.
+            successor_node_ids (List[str]): Bu node'dan çıkan edge'lerin hedef node ID'leri,
+                                 ExecutionGraph.get_snapshot(...).successors(node_id)'dan gelir.
         
         Returns:
             int: Güncellenen dependency sayısı (batch update sonucu)
@@ -1612,15 +2629,15 @@ class SchedulerForOutputHandler:
         Girdi:
             execution_id: "EXE-..."
             completed_node_id: "NOD-..."  # Tamamlanan node ID
-            outgoing_edges: [Edge(...), Edge(...)]  # Bu node'dan çıkan edge'ler
+            successor_node_ids: ("NOD-...", "NOD-...")  # Bu node'un sonraki düğümleri
         
         Çıktı:
             2  # Güncellenen dependency sayısı
         """
-        if not outgoing_edges:
+        if not successor_node_ids:
             return 0
         
-        target_node_ids = [edge.to_node_id for edge in outgoing_edges]
+        target_node_ids = list(successor_node_ids)
         
         updated_count = _execution_input_repo._decrement_dependency_count_by_node_ids(
             session,
@@ -1628,6 +2645,10 @@ class SchedulerForOutputHandler:
             node_ids=target_node_ids
         )
         
+        if updated_count:
+            # Hazır hale gelen input'lar için input handler polling'i beklemeden uyanır
+            ReadyInputNotifier.notify_after_commit(session)
+        
         return updated_count
     
     @classmethod
@@ -1669,6 +2690,9 @@ class SchedulerForOutputHandler:
         execution.results = results
         
         session.add(execution)
+        # Sonlanan execution'ın grafiğine ve çıktılarına artık ihtiyaç yok
+        ExecutionGraph.evict(execution.id)
+        ExecutionOutputCache.evict_after_commit(session, execution.id)
         
         return execution
 
@@ -1,5 +1,5 @@
 import secrets
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 from datetime import datetime, timezone, timedelta
 
 from miniflow.database import RepositoryRegistry, with_transaction, with_readonly_session
@@ -10,6 +10,7 @@ from miniflow.core.exceptions import (
 )
 from miniflow.core.logger import get_logger, log_function_call
 from miniflow.utils.helpers.encryption_helper import verify_password
+from miniflow.utils.helpers.access_token_cache import AccessTokenCache
 from miniflow.utils.helpers.jwt_helper import (
     create_access_token, 
     create_refresh_token, 
@@ -194,6 +195,7 @@ class LoginService:
                     )
                     # Tüm aktif session'ları iptal et
                     cls._auth_session_repo._revoke_sessions(session, user_id=user.id)
+                    AccessTokenCache.invalidate_after_commit(session, user_id=user.id)
                     
                     # Kilitleme kaydı oluştur (kademeli kilitleme için sayılır)
                     cls._login_history_repo._create(
@@ -223,6 +225,8 @@ class LoginService:
                         locked_reason=f"Temporary lock: Too many failed attempts (lockout #{recent_lockouts + 1})",
                         locked_until=datetime.now(timezone.utc) + timedelta(minutes=lockout_duration)
                     )
+                    # Kilitli kullanıcının token'ları cache'ten geçerli dönmesin
+                    AccessTokenCache.invalidate_after_commit(session, user_id=user.id)
                     
                     # Kilitleme kaydı oluştur (kademeli kilitleme için sayılır)
                     cls._login_history_repo._create(
@@ -263,7 +267,9 @@ class LoginService:
         # Maksimum aktif session kontrolü
         active_sessions = cls._auth_session_repo._get_all_active_user_sessions(session, user_id=user.id)
         if len(active_sessions) >= cls._max_active_sessions:
-            cls._auth_session_repo._revoke_oldest_session(session, user_id=user.id)
+            oldest_session = cls._auth_session_repo._revoke_oldest_session(session, user_id=user.id)
+            if oldest_session:
+                AccessTokenCache.invalidate_after_commit(session, jti=oldest_session.access_token_jti)
         
         # Session oluştur
         cls._auth_session_repo._create(
@@ -369,6 +375,7 @@ class LoginService:
             session_id=auth_session.id, 
             user_id=payload['user_id']
         )
+        AccessTokenCache.invalidate_after_commit(session, jti=access_token_jti)
         
         logger.info(f"Logout successful: session_id={auth_session.id}, user_id={auth_session.user_id}")
         
@@ -395,6 +402,7 @@ class LoginService:
             {"success": True, "sessions_revoked": int}
         """
         num_revoked = cls._auth_session_repo._revoke_sessions(session, user_id=user_id)
+        AccessTokenCache.invalidate_after_commit(session, user_id=user_id)
         
         return {
             "success": True,
@@ -403,16 +411,17 @@ class LoginService:
 
     # ==================================================================================== TOKEN ==
     @classmethod
-    @with_readonly_session(manager=None)
     def validate_access_token(
         cls,
-        session,
         *,
         access_token: str
     ) -> Dict[str, Any]:
         """
         Access token'ı doğrular.
         
+        İmza doğrulandıktan sonra jti AccessTokenCache'te varsa veritabanına gidilmez;
+        yoksa session ve kullanıcı kontrol edilir, geçerli sonuç cache'lenir.
+        
         Args:
             access_token: Access token
             
@@ -425,16 +434,42 @@ class LoginService:
             return {"valid": False, "error": str(e)}
         
         access_token_jti = payload['jti']
+        user_id = AccessTokenCache.get(access_token_jti)
+        if user_id:
+            return {
+                "valid": True,
+                "user_id": user_id
+            }
+        
+        result, expires_at = cls._validate_access_token_session(access_token_jti=access_token_jti)
+        if result["valid"]:
+            AccessTokenCache.put(access_token_jti, result["user_id"], expires_at)
+        return result
+
+    @classmethod
+    @with_readonly_session(manager=None)
+    def _validate_access_token_session(
+        cls,
+        session,
+        *,
+        access_token_jti: str
+    ) -> Tuple[Dict[str, Any], Optional[datetime]]:
+        """
+        Access token'ın session'ını ve kullanıcısını veritabanından kontrol eder.
+        
+        Returns:
+            (validate_access_token sonucu, access token'ın bitiş zamanı)
+        """
         auth_session = cls._auth_session_repo._get_by_access_token_jti(
             session, 
             access_token_jti=access_token_jti
         )
         
         if not auth_session:
-            return {"valid": False, "error": "Session not found"}
+            return {"valid": False, "error": "Session not found"}, None
         
         if auth_session.is_revoked:
-            return {"valid": False, "error": "Session revoked"}
+            return {"valid": False, "error": "Session revoked"}, None
         
         # Token expiry kontrolü
         expires_at = auth_session.access_token_expires_at
@@ -442,23 +477,23 @@ class LoginService:
             expires_at = expires_at.replace(tzinfo=timezone.utc)
         
         if expires_at < datetime.now(timezone.utc):
-            return {"valid": False, "error": "Token expired"}
+            return {"valid": False, "error": "Token expired"}, None
         
         # Kullanıcı kontrolü
         user = cls._user_repo._get_by_id(session, record_id=auth_session.user_id)
         if not user:
-            return {"valid": False, "error": "User not found"}
+            return {"valid": False, "error": "User not found"}, None
         
         if not user.is_verified:
-            return {"valid": False, "error": "Email not verified"}
+            return {"valid": False, "error": "Email not verified"}, None
         
         if user.is_locked:
-            return {"valid": False, "error": "Account locked"}
+            return {"valid": False, "error": "Account locked"}, None
         
         return {
             "valid": True,
             "user_id": auth_session.user_id
-        }
+        }, expires_at
 
     @classmethod
     @with_transaction(manager=None)
@@ -562,7 +597,8 @@ class LoginService:
             refresh_token_jti=new_refresh_token_jti
         )
         
-        # Session'ı güncelle
+        # Session'ı güncelle (eski access token geçersiz olur)
+        AccessTokenCache.invalidate_after_commit(session, jti=auth_session.access_token_jti)
         cls._auth_session_repo._update(
             session,
             record_id=auth_session.id,
@@ -616,6 +652,7 @@ class LoginService:
         
         # Tüm aktif session'ları iptal et
         cls._auth_session_repo._revoke_sessions(session, user_id=user_id)
+        AccessTokenCache.invalidate_after_commit(session, user_id=user_id)
         
         return {
             "success": True,
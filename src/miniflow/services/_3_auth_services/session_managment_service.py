@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 from miniflow.database import RepositoryRegistry, with_transaction, with_readonly_session
 from miniflow.core.exceptions import ResourceNotFoundError
 from miniflow.core.logger import get_logger
+from miniflow.utils.helpers.access_token_cache import AccessTokenCache
 
 # Logger instance
 logger = get_logger(__name__)
@@ -160,6 +161,7 @@ class SessionManagementService:
             )
         
         logger.info(f"Session revoked successfully: session_id={session_id}, user_id={user_id}")
+        AccessTokenCache.invalidate_after_commit(session, jti=auth_session.access_token_jti)
         
         # Reason güncelle
         if reason:
@@ -192,6 +194,7 @@ class SessionManagementService:
             {"success": True, "sessions_revoked": int}
         """
         num_revoked = cls._auth_session_repo._revoke_sessions(session, user_id=user_id)
+        AccessTokenCache.invalidate_after_commit(session, user_id=user_id)
         
         return {
             "success": True,
@@ -220,4 +223,5 @@ class SessionManagementService:
         if not auth_session:
             return None
         
+        AccessTokenCache.invalidate_after_commit(session, jti=auth_session.access_token_jti)
         return auth_session.to_dict()
@@ -10,6 +10,7 @@ from miniflow.core.exceptions import (
     InvalidInputError,
 )
 from miniflow.core.logger import get_logger
+from miniflow.utils.helpers.access_token_cache import AccessTokenCache
 
 # Logger instance
 logger = get_logger(__name__)
@@ -335,6 +336,7 @@ class UserPasswordService:
         
         # Tüm session'ları iptal et (güvenlik için)
         cls._auth_session_repo._revoke_sessions(session, user_id=user.id)
+        AccessTokenCache.invalidate_after_commit(session, user_id=user.id)
         
         # Bildirim emaili gönder
         try:
@@ -10,6 +10,7 @@ from miniflow.core.exceptions import (
     InvalidInputError,
 )
 from miniflow.core.logger import get_logger
+from miniflow.utils.helpers.access_token_cache import AccessTokenCache
 from miniflow.utils import MailTrapClient
 
 # Logger instance
@@ -244,6 +245,7 @@ class UserProfileService:
         
         # Tüm aktif session'ları iptal et (güvenlik için)
         num_revoked = cls._auth_session_repo._revoke_sessions(session, user_id=user_id)
+        AccessTokenCache.invalidate_after_commit(session, user_id=user_id)
         
         # Yeni email'e doğrulama gönder
         try:
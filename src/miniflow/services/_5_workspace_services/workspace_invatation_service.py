@@ -7,6 +7,7 @@ from miniflow.core.exceptions import (ResourceNotFoundError,
     BusinessRuleViolationError,
 )
 from miniflow.core.logger import get_logger
+from miniflow.utils.helpers.workspace_access_cache import WorkspaceAccessCache
 
 
 class WorkspaceInvitationService:
@@ -356,6 +357,7 @@ class WorkspaceInvitationService:
         
         # Üye sayısını artır
         cls._workspace_repo._increment_member_count(session, workspace_id=invitation.workspace_id)
+        WorkspaceAccessCache.invalidate_after_commit(session, workspace_id=invitation.workspace_id, user_id=user_id)
         
         return {
             "invitation_id": invitation.id,
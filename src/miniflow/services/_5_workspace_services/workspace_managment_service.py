@@ -8,6 +8,7 @@ from miniflow.core.exceptions import (
     BusinessRuleViolationError,
 )
 from miniflow.core.logger import get_logger
+from miniflow.utils.helpers.workspace_access_cache import WorkspaceAccessCache
 from miniflow.utils.helpers.file_helper import (
     get_workspace_file_path,
     get_workspace_custom_script_path,
@@ -498,6 +499,7 @@ class WorkspaceManagementService:
         
         # Üyeleri sil
         deleted_members = cls._workspace_member_repo._delete_all_by_workspace_id(session, workspace_id=workspace_id)
+        WorkspaceAccessCache.invalidate_after_commit(session, workspace_id=workspace_id)
         
         # Davetleri sil
         deleted_invitations = cls._workspace_invitation_repo._delete_all_by_workspace_id(session, workspace_id=workspace_id)
@@ -578,6 +580,7 @@ class WorkspaceManagementService:
             )
         
         cls._workspace_repo._suspend_workspace(session, workspace_id=workspace_id, reason=reason)
+        WorkspaceAccessCache.invalidate_after_commit(session, workspace_id=workspace_id)
         
         return {
             "success": True,
@@ -616,6 +619,7 @@ class WorkspaceManagementService:
             )
         
         cls._workspace_repo._unsuspend_workspace(session, workspace_id=workspace_id)
+        WorkspaceAccessCache.invalidate_after_commit(session, workspace_id=workspace_id)
         
         return {"success": True}
 
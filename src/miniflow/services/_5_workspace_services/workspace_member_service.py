@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timezone
 
 from miniflow.database import RepositoryRegistry, with_transaction, with_readonly_session
@@ -6,6 +6,7 @@ from miniflow.core.exceptions import (ResourceNotFoundError,
     BusinessRuleViolationError,
 )
 from miniflow.core.logger import get_logger
+from miniflow.utils.helpers.workspace_access_cache import WorkspaceAccessCache
 
 
 class WorkspaceMemberService:
@@ -53,11 +54,101 @@ class WorkspaceMemberService:
         if not member:
             raise BusinessRuleViolationError(
                 rule_name="not_workspace_member",
+                rule_detail=f"User {user_id} is not a member of workspace {workspace_id}",
                 message="User is not a member of this workspace"
             )
         
         return True
 
+    @classmethod
+    def validate_workspace_access(
+        cls,
+        *,
+        workspace_id: str,
+        user_id: str,
+        check_suspended: bool = True,
+    ) -> bool:
+        """
+        Workspace'in var olduğunu, (check_suspended ise) askıya alınmadığını ve kullanıcının üye olduğunu doğrular.
+        
+        Sonuç WorkspaceAccessCache'te varsa veritabanına gidilmez; yoksa iki kontrol tek session'da yapılır
+        ve geçerli üyelik workspace'in askı durumuyla birlikte cache'lenir.
+        
+        Args:
+            workspace_id: Workspace ID'si
+            user_id: Kullanıcı ID'si
+            check_suspended: Askıya alınmış workspace'leri reddet (default: True)
+            
+        Returns:
+            True (erişim varsa)
+            
+        Raises:
+            ResourceNotFoundError: Workspace bulunamadı
+            BusinessRuleViolationError: Workspace askıya alınmış veya kullanıcı üye değil
+        """
+        access = WorkspaceAccessCache.get(workspace_id, user_id)
+        if access is None:
+            access = cls._load_workspace_access(
+                workspace_id=workspace_id,
+                user_id=user_id,
+                check_suspended=check_suspended
+            )
+            WorkspaceAccessCache.put(workspace_id, user_id, *access)
+        
+        is_suspended, suspension_reason = access
+        if check_suspended and is_suspended:
+            raise BusinessRuleViolationError(
+                rule_name="workspace_suspended",
+                rule_detail=f"Workspace {workspace_id} is suspended: {suspension_reason or 'No reason provided'}",
+                message=f"Workspace is suspended: {suspension_reason or 'No reason provided'}"
+            )
+        
+        return True
+
+    @classmethod
+    @with_readonly_session(manager=None)
+    def _load_workspace_access(
+        cls,
+        session,
+        *,
+        workspace_id: str,
+        user_id: str,
+        check_suspended: bool = True,
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        validate_workspace + validate_workspace_member kontrollerini aynı sırayla tek session'da yapar.
+        
+        Returns:
+            (is_suspended, suspension_reason)
+        """
+        workspace = cls._workspace_repo._get_by_id(session, record_id=workspace_id)
+        if not workspace:
+            raise ResourceNotFoundError(
+                resource_name="Workspace",
+                resource_id=workspace_id
+            )
+        
+        if check_suspended and workspace.is_suspended:
+            raise BusinessRuleViolationError(
+                rule_name="workspace_suspended",
+                rule_detail=f"Workspace {workspace_id} is suspended: {workspace.suspension_reason or 'No reason provided'}",
+                message=f"Workspace is suspended: {workspace.suspension_reason or 'No reason provided'}"
+            )
+        
+        member = cls._workspace_member_repo._get_by_workspace_id_and_user_id(
+            session, 
+            workspace_id=workspace_id, 
+            user_id=user_id
+        )
+        if not member:
+            raise BusinessRuleViolationError(
+                rule_name="not_workspace_member",
+                rule_detail=f"User {user_id} is not a member of workspace {workspace_id}",
+                message="User is not a member of this workspace"
+            )
+        
+        return bool(workspace.is_suspended), workspace.suspension_reason
+
     @classmethod
     @with_readonly_session(manager=None)
     def validate_member_role(
@@ -91,6 +182,7 @@ class WorkspaceMemberService:
         if member.role_name not in required_roles:
             raise BusinessRuleViolationError(
                 rule_name="insufficient_permissions",
+                rule_detail=f"Member {member_id} has role {member.role_name}, requires one of: {', '.join(required_roles)}",
                 message=f"Requires one of these roles: {', '.join(required_roles)}"
             )
         
@@ -263,6 +355,7 @@ class WorkspaceMemberService:
         if member.role_name.lower() == "owner":
             raise BusinessRuleViolationError(
                 rule_name="cannot_change_owner_role",
+                rule_detail=f"Member {member_id} is the workspace owner",
                 message="Cannot change owner role. Use transfer ownership instead."
             )
         
@@ -278,6 +371,7 @@ class WorkspaceMemberService:
         if new_role.name.lower() == "owner":
             raise BusinessRuleViolationError(
                 rule_name="cannot_assign_owner_role",
+                rule_detail=f"Role {new_role_id} is the owner role",
                 message="Cannot assign owner role directly. Use transfer ownership instead."
             )
         
@@ -331,6 +425,7 @@ class WorkspaceMemberService:
         if workspace.owner_id == user_id:
             raise BusinessRuleViolationError(
                 rule_name="cannot_remove_owner",
+                rule_detail=f"User {user_id} is the owner of workspace {workspace_id}",
                 message="Cannot remove workspace owner. Transfer ownership first or delete the workspace."
             )
         
@@ -343,11 +438,13 @@ class WorkspaceMemberService:
         if not member:
             raise BusinessRuleViolationError(
                 rule_name="not_workspace_member",
+                rule_detail=f"User {user_id} is not a member of workspace {workspace_id}",
                 message="User is not a member of this workspace"
             )
         
         # Üyeyi sil
         cls._workspace_member_repo._delete(session, record_id=member.id)
+        WorkspaceAccessCache.invalidate_after_commit(session, workspace_id=workspace_id, user_id=user_id)
         
         # Üye sayısını azalt
         cls._workspace_repo._decrement_member_count(session, workspace_id=workspace_id)
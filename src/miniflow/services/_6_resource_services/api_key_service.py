@@ -1,6 +1,7 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timezone
 import secrets
+import string
 
 from miniflow.database import RepositoryRegistry, with_transaction, with_readonly_session
 from miniflow.core.exceptions import (
@@ -10,7 +11,8 @@ from miniflow.core.exceptions import (
     InvalidInputError,
 )
 from miniflow.core.logger import get_logger
-from miniflow.utils.helpers.encryption_helper import hash_password
+from miniflow.utils import ConfigurationHandler
+from miniflow.utils.helpers.encryption_helper import hash_api_key, verify_api_key
 
 # Logger instance
 logger = get_logger(__name__)
@@ -57,6 +59,85 @@ class ApiKeyService:
     _api_key_repo = _registry.api_key_repository()
     _workspace_repo = _registry.workspace_repository()
 
+    # Key formatı: {key_prefix}{lookup_id}.{secret} - lookup_id gizli değildir, kaydı index'ten bulmak için kullanılır
+    LOOKUP_ID_LENGTH = 12
+    KEY_SEPARATOR = "."
+
+    # Konfigürasyon - Lookup ID'si olmayan eski (bcrypt hash'li) key'lerin doğrulanması (ilk kullanımda okunur)
+    # Taşınmamış key kalmadığında (migration log'u remaining=0 gösterir) kapatılabilir
+    _legacy_bcrypt_fallback = True
+    _initialized = False
+
+    @classmethod
+    def _load_config(cls):
+        if cls._initialized:
+            return
+        ConfigurationHandler.ensure_loaded()
+        cls._legacy_bcrypt_fallback = ConfigurationHandler.get_bool("API_KEY", "legacy_bcrypt_fallback", fallback=True)
+        cls._initialized = True
+
+    # ==================================================================================== KEY LOOKUP ==
+    @classmethod
+    def _parse_lookup_id(cls, full_api_key: str) -> Optional[str]:
+        """Key'den lookup ID'yi çıkarır; eski formattaki (ayraçsız) key'lerde None döner."""
+        head, separator, secret = full_api_key.rpartition(cls.KEY_SEPARATOR)
+        if not separator or not secret or len(head) < cls.LOOKUP_ID_LENGTH:
+            return None
+        
+        lookup_id = head[-cls.LOOKUP_ID_LENGTH:]
+        if not all(char in string.hexdigits for char in lookup_id):
+            return None
+        return lookup_id
+
+    @classmethod
+    def _find_api_key(cls, session, full_api_key: str):
+        """
+        Key'e ait kaydı bulur.
+        
+        - Yeni format: lookup ID ile tek satır okunur, HMAC hash sabit zamanlı karşılaştırılır
+        - Taşınmış eski key'ler: HMAC hash ile (unique index) aranır
+        - Taşınmamış eski key'ler: legacy_bcrypt_fallback açıksa bcrypt ile doğrulanır ve HMAC hash'e taşınır
+        """
+        lookup_id = cls._parse_lookup_id(full_api_key)
+        if lookup_id:
+            api_key = cls._api_key_repo._get_by_lookup_id(session, lookup_id=lookup_id)
+            if api_key and verify_api_key(full_api_key, api_key.key_hash):
+                return api_key
+            return None
+        
+        api_key = cls._api_key_repo._get_by_key_hash(session, key_hash=hash_api_key(full_api_key))
+        cls._load_config()
+        if api_key or not cls._legacy_bcrypt_fallback:
+            return api_key
+        
+        api_key = cls._api_key_repo._get_legacy_by_api_key(session, full_api_key=full_api_key)
+        if api_key:
+            try:
+                cls._migrate_legacy_api_key(api_key_id=api_key.id, full_api_key=full_api_key)
+            except Exception as e:
+                # Doğrulama başarılı; taşıma bir sonraki kullanımda tekrar denenir
+                logger.warning(f"Legacy API key migration failed: api_key_id={api_key.id}, error={e}")
+        return api_key
+
+    @classmethod
+    @with_transaction(manager=None)
+    def _migrate_legacy_api_key(
+        cls,
+        session,
+        *,
+        api_key_id: str,
+        full_api_key: str,
+    ) -> None:
+        """
+        Eski key'in bcrypt hash'ini HMAC hash ile değiştirir.
+        Key'in kendisi değişmez (kullanıcının elindeki key çalışmaya devam eder), sonraki doğrulamalar index'ten yapılır.
+        """
+        cls._api_key_repo._update(session, record_id=api_key_id, key_hash=hash_api_key(full_api_key))
+        remaining = cls._api_key_repo._count_legacy(session)
+        logger.info(f"Legacy API key migrated to HMAC hash: api_key_id={api_key_id}, remaining_legacy_keys={remaining}")
+        if remaining == 0:
+            logger.info("No bcrypt-hashed API keys remain; API_KEY.legacy_bcrypt_fallback can be disabled")
+
     # ==================================================================================== VALIDATE ==
     @classmethod
     @with_readonly_session(manager=None)
@@ -86,7 +167,7 @@ class ApiKeyService:
         Raises:
             BusinessRuleViolationError: Geçersiz, inactive veya expired API key
         """
-        api_key = cls._api_key_repo._get_by_api_key(session, full_api_key=full_api_key)
+        api_key = cls._find_api_key(session, full_api_key)
         
         if not api_key:
             raise BusinessRuleViolationError(
@@ -95,6 +176,8 @@ class ApiKeyService:
                 message="Invalid API key"
             )
         
+        api_key_id = api_key.id
+        
         # Aktif mi?
         if not api_key.is_active:
             raise BusinessRuleViolationError(
@@ -146,9 +229,7 @@ class ApiKeyService:
                 message="Workspace is suspended"
             )
         
-        # Kullanım güncelle
-        cls._api_key_repo._update_last_used(session, api_key_id=api_key.id)
-        
+        # Kullanım sayaçları burada yazılmaz; ApiKeyUsageHandler bellekte toplayıp toplu yazar
         return {
             "valid": True,
             "workspace_id": api_key.workspace_id,
@@ -157,6 +238,26 @@ class ApiKeyService:
             "workspace_plan_id": workspace.plan_id if hasattr(workspace, 'plan_id') else None
         }
 
+    # ==================================================================================== USAGE ==
+    @classmethod
+    @with_transaction(manager=None)
+    def apply_usage(
+        cls,
+        session,
+        *,
+        usage: Dict[str, Tuple[int, datetime]],
+    ) -> int:
+        """
+        Toplanan kullanım sayaçlarını tek UPDATE ile yazar (ApiKeyUsageHandler flush'ı).
+        
+        Args:
+            usage: {api_key_id: (kullanım sayısı, son kullanım zamanı)}
+            
+        Returns:
+            Güncellenen API key sayısı
+        """
+        return cls._api_key_repo._apply_usage(session, usage=usage)
+
     # ==================================================================================== CREATE ==
     @classmethod
     @with_transaction(manager=None)
@@ -233,18 +334,13 @@ class ApiKeyService:
                 message=f"API key with name '{name}' already exists in workspace {workspace_id}"
             )
         
-        # API key oluştur
-        api_key_secret = secrets.token_urlsafe(32)
-        full_api_key = f"{key_prefix}{api_key_secret}"
-        key_hash = hash_password(full_api_key)
-        
-        # Hash benzersizliği kontrolü (çok düşük ihtimal ama güvenlik için)
+        # API key oluştur: {key_prefix}{lookup_id}.{secret}
+        # Lookup ID benzersizliği kontrolü (çok düşük ihtimal ama güvenlik için)
         max_retries = 5
         retry_count = 0
-        while cls._api_key_repo._get_by_key_hash(session, key_hash=key_hash) and retry_count < max_retries:
-            api_key_secret = secrets.token_urlsafe(32)
-            full_api_key = f"{key_prefix}{api_key_secret}"
-            key_hash = hash_password(full_api_key)
+        lookup_id = secrets.token_hex(cls.LOOKUP_ID_LENGTH // 2)
+        while cls._api_key_repo._get_by_lookup_id(session, lookup_id=lookup_id, include_deleted=True) and retry_count < max_retries:
+            lookup_id = secrets.token_hex(cls.LOOKUP_ID_LENGTH // 2)
             retry_count += 1
         
         if retry_count >= max_retries:
@@ -254,6 +350,9 @@ class ApiKeyService:
                 message="Failed to generate unique API key"
             )
         
+        full_api_key = f"{key_prefix}{lookup_id}{cls.KEY_SEPARATOR}{secrets.token_urlsafe(32)}"
+        key_hash = hash_api_key(full_api_key)
+        
         # API key kaydet
         api_key = cls._api_key_repo._create(
             session,
@@ -261,6 +360,7 @@ class ApiKeyService:
             owner_id=owner_id,
             name=name,
             key_prefix=key_prefix,
+            key_lookup_id=lookup_id,
             key_hash=key_hash,
             description=description,
             permissions=permissions or DEFAULT_PERMISSIONS,
@@ -12,6 +12,7 @@ from miniflow.core.exceptions import (
 )
 from miniflow.core.logger import get_logger
 from miniflow.utils.helpers.encryption_helper import encrypt_data, decrypt_data
+from miniflow.utils.helpers.secret_cache import SecretCache
 
 # Logger instance
 logger = get_logger(__name__)
@@ -36,12 +37,16 @@ class CredentialService:
         return encrypt_data(json_str)
 
     @staticmethod
-    def _decrypt_credential_data(encrypted_data: str) -> Dict[str, Any]:
-        """Şifrelenmiş credential verisini çözer."""
+    def _decrypt_credential_data(encrypted_data: str, credential=None) -> Dict[str, Any]:
+        """Şifrelenmiş credential verisini çözer. credential verilirse çözülmüş değer SecretCache'ten gelir."""
         try:
             if isinstance(encrypted_data, dict):
                 return encrypted_data
-            decrypted = decrypt_data(encrypted_data)
+            if credential is not None:
+                decrypted = SecretCache.get_or_load(
+                    "credential", credential.id, credential.updated_at, lambda: decrypt_data(encrypted_data))
+            else:
+                decrypted = decrypt_data(encrypted_data)
             return json.loads(decrypted)
         except Exception:
             return {}
@@ -277,7 +282,7 @@ class CredentialService:
         
         # Gizli verileri dahil et (workflow execution için)
         if include_secret:
-            result["credential_data"] = cls._decrypt_credential_data(credential.credential_data)
+            result["credential_data"] = cls._decrypt_credential_data(credential.credential_data, credential)
         
         return result
 
@@ -395,6 +400,7 @@ class CredentialService:
         
         if update_data:
             cls._credential_repo._update(session, record_id=credential_id, **update_data)
+            SecretCache.invalidate("credential", credential_id)
         
         return cls.get_credential(credential_id=credential_id)
 
@@ -484,6 +490,7 @@ class CredentialService:
             )
         
         cls._credential_repo._delete(session, record_id=credential_id)
+        SecretCache.invalidate("credential", credential_id)
         
         return {
             "success": True,
@@ -8,6 +8,7 @@ from miniflow.core.exceptions import (
 )
 from miniflow.core.logger import get_logger
 from miniflow.utils.helpers.encryption_helper import encrypt_data, decrypt_data
+from miniflow.utils.helpers.secret_cache import SecretCache
 
 # Logger instance
 logger = get_logger(__name__)
@@ -119,7 +120,7 @@ class VariableService:
         # Değer
         if variable.is_secret:
             if decrypt_secret:
-                value = decrypt_data(variable.value)
+                value = SecretCache.get_or_load("variable", variable.id, variable.updated_at, lambda: decrypt_data(variable.value))
             else:
                 value = "********"
         else:
@@ -172,7 +173,7 @@ class VariableService:
         # Değer
         if variable.is_secret:
             if decrypt_secret:
-                value = decrypt_data(variable.value)
+                value = SecretCache.get_or_load("variable", variable.id, variable.updated_at, lambda: decrypt_data(variable.value))
             else:
                 value = "********"
         else:
@@ -300,6 +301,7 @@ class VariableService:
         
         if update_data:
             cls._variable_repo._update(session, record_id=variable_id, **update_data)
+            SecretCache.invalidate("variable", variable_id)
         
         return cls.get_variable(variable_id=variable_id)
 
@@ -324,6 +326,7 @@ class VariableService:
         variable = cls._variable_repo._get_by_id(session, record_id=variable_id, raise_not_found=True)
         
         cls._variable_repo._delete(session, record_id=variable_id)
+        SecretCache.invalidate("variable", variable_id)
         
         return {
             "success": True,
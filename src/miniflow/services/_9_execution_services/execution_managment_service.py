@@ -9,6 +9,8 @@ from miniflow.core.exceptions import (
     InvalidInputError,
 )
 from miniflow.core.logger import get_logger, log_function_call
+from miniflow.services._0_internal_services import ExecutionClassifier, ExecutionGraph, SchedulerForInputHandler
+from miniflow.utils.handlers.ready_input_notifier import ReadyInputNotifier
 
 # Logger instance
 logger = get_logger(__name__)
@@ -217,9 +219,7 @@ class ExecutionManagementService:
         # Execution inputs oluştur
         execution_inputs = cls._create_execution_inputs(
             session,
-            execution_id=execution.id,
-            workflow_id=workflow_id,
-            workspace_id=workspace_id,
+            execution=execution,
             triggered_by=triggered_by
         )
         
@@ -273,9 +273,7 @@ class ExecutionManagementService:
         # Execution inputs oluştur
         execution_inputs = cls._create_execution_inputs(
             session,
-            execution_id=execution.id,
-            workflow_id=workflow_id,
-            workspace_id=workspace_id,
+            execution=execution,
             triggered_by=triggered_by
         )
         
@@ -290,14 +288,15 @@ class ExecutionManagementService:
         cls,
         session,
         *,
-        execution_id: str,
-        workflow_id: str,
-        workspace_id: str,
+        execution,
         triggered_by: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
-        Workflow'un tüm node'ları için ExecutionInput oluşturur.
+        Workflow'un tüm node'ları için ExecutionInput oluşturur ve grafiğin snapshot'ını execution'a yazar.
         """
+        execution_id = execution.id
+        workflow_id = execution.workflow_id
+        workspace_id = execution.workspace_id
         nodes = cls._node_repo._get_all_by_workflow_id(session, workflow_id=workflow_id)
         edges = cls._edge_repo._get_all_by_workflow_id(session, workflow_id=workflow_id)
         
@@ -308,6 +307,9 @@ class ExecutionManagementService:
                 message="Workflow has no nodes"
             )
         
+        # Execution boyunca kullanılacak graf; sonraki workflow düzenlemelerinden etkilenmez
+        execution.dag_snapshot = ExecutionGraph.build_snapshot([n.id for n in nodes], edges).to_dict()
+        
         # Dependency map oluştur
         dependency_map = {}
         for edge in edges:
@@ -334,10 +336,9 @@ class ExecutionManagementService:
         workflow = cls._workflow_repo._get_by_id(session, record_id=workflow_id)
         workflow_priority = workflow.priority if workflow else 0
         
-        execution_inputs = []
+        # Tüm satırlar tek geçişte hazırlanır, tek bir çok satırlı INSERT ile yazılır
+        records = []
         for node in nodes:
-            dependency_count = len(dependency_map.get(node.id, []))
-            
             # Script bilgilerini al
             script = None
             if node.script_id:
@@ -354,30 +355,38 @@ class ExecutionManagementService:
             # Node parametrelerini çıkar
             parameters = cls._extract_node_parameters(node.input_params)
             
-            # ExecutionInput oluştur
-            execution_input = cls._execution_input_repo._create(
-                session,
-                execution_id=execution_id,
-                workflow_id=workflow_id,
-                workspace_id=workspace_id,
-                node_id=node.id,
-                dependency_count=dependency_count,
-                priority=workflow_priority,
-                max_retries=node.max_retries,
-                timeout_seconds=node.timeout_seconds,
-                node_name=node.name,
-                params=parameters,
-                script_name=script.name,
-                script_path=script.file_path,
-                created_by=triggered_by
-            )
-            
-            execution_inputs.append({
-                "id": execution_input.id,
-                "node_name": execution_input.node_name,
-                "dependency_count": execution_input.dependency_count
+            records.append({
+                "execution_id": execution_id,
+                "workflow_id": workflow_id,
+                "workspace_id": workspace_id,
+                "node_id": node.id,
+                "dependency_count": len(dependency_map.get(node.id, [])),
+                "priority": workflow_priority,
+                "max_retries": node.max_retries,
+                "timeout_seconds": node.timeout_seconds,
+                "node_name": node.name,
+                "params": parameters,
+                "reference_plan": SchedulerForInputHandler.compile_reference_plan(parameters),
+                "script_name": script.name,
+                "script_path": script.file_path,
+                "process_type": ExecutionClassifier.classify(script),
+                "created_by": triggered_by,
             })
         
+        execution_input_ids = cls._execution_input_repo._bulk_insert(session, records=records)
+        
+        execution_inputs = [
+            {
+                "id": execution_input_id,
+                "node_name": record["node_name"],
+                "dependency_count": record["dependency_count"]
+            }
+            for execution_input_id, record in zip(execution_input_ids, records)
+        ]
+        
+        # İlk node'lar için input handler polling'i beklemeden uyanır
+        ReadyInputNotifier.notify_after_commit(session)
+        
         return execution_inputs
 
     # ==================================================================================== END EXECUTION ==
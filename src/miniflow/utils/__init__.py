@@ -2,12 +2,14 @@ from .handlers import (
     EnvironmentHandler,
     ConfigurationHandler,
     RedisClient,
-    MailTrapClient
+    MailTrapClient,
+    ReadyInputNotifier
 )
 
 __all__ = [
     "EnvironmentHandler",
     "ConfigurationHandler",
     "RedisClient",
-    "MailTrapClient"
+    "MailTrapClient",
+    "ReadyInputNotifier"
 ]
\ No newline at end of file
@@ -2,11 +2,13 @@ from .environment_handler import EnvironmentHandler
 from .configuration_handler import ConfigurationHandler
 from .redis_handler import RedisClient
 from .mailtrap_handler import MailTrapClient
+from .ready_input_notifier import ReadyInputNotifier
 
 
 __all__ = [
     "EnvironmentHandler",
     "ConfigurationHandler",
     "RedisClient",
-    "MailTrapClient"
+    "MailTrapClient",
+    "ReadyInputNotifier"
 ]
\ No newline at end of file
@@ -0,0 +1,95 @@
+import threading
+from typing import Optional
+
+from miniflow.core.logger import get_logger
+from miniflow.database import run_after_commit
+from .configuration_handler import ConfigurationHandler
+# handlers/__init__ RedisClient'ı bu modülden önce yüklediği için cache_invalidation'ın
+# "from ..handlers import RedisClient" import'u döngüye girmez
+from ..helpers.cache_invalidation import CacheInvalidationChannel
+
+
+logger = get_logger(__name__)
+
+
+class ReadyInputNotifier:
+    """
+    Yeni execution input'lar hazır olduğunda input handler'ı beklemeden uyandırır.
+
+    - Execution başlatıldığında veya bir node'un tamamlanması sonraki node'ların bağımlılığını azalttığında
+      notify_after_commit(session) çağrılır; bildirim transaction commit edildikten sonra yapılır,
+      böylece uyanan handler yeni satırları görür. Rollback olursa bildirim yapılmaz.
+    - Aynı process'teki input handler threading.Event ile uyanır.
+    - backend = "redis" ise bildirim CacheInvalidationChannel ile Redis kanalına da yayınlanır; API worker'larında
+      oluşturulan execution'lar ayrı process'teki (standalone) engine'in input handler'ını uyandırır.
+      Kanal bağlantısı koptuğunda aradaki bildirimler bilinemeyeceği için handler uyandırılır.
+    - Bildirim kaybolsa bile input handler adaptive polling ile çalışmaya devam eder (fallback).
+    """
+
+    backend: str = "local"
+    channel: str = "miniflow:ready_inputs"
+
+    _initialized = False
+    _event = threading.Event()
+    _channel: Optional[CacheInvalidationChannel] = None
+
+    @classmethod
+    def _load_config(cls):
+        if cls._initialized:
+            return
+        ConfigurationHandler.ensure_loaded()
+        section = "INPUT_HANDLER"
+        cls.backend = (ConfigurationHandler.get(section, "input_handler_wakeup_backend", fallback="local") or "local").strip().lower()
+        cls.channel = ConfigurationHandler.get(section, "input_handler_wakeup_channel", fallback="miniflow:ready_inputs")
+        if cls.backend == "redis":
+            cls._channel = CacheInvalidationChannel("READY INPUT NOTIFIER", cls.channel, cls._handle_message, cls.wake)
+        cls._initialized = True
+
+    @classmethod
+    def wake(cls):
+        """Yalnızca bu process'teki input handler'ı uyandırır."""
+        cls._event.set()
+
+    @classmethod
+    def notify(cls):
+        """Bu process'teki input handler'ı uyandırır, redis backend'inde diğer process'lere de yayınlar."""
+        cls.wake()
+        cls._load_config()
+        if cls._channel is None:
+            return
+        # Yayınlanamazsa diğer process'ler polling ile input'u yine bulur
+        cls._channel.publish("1")
+
+    @classmethod
+    def notify_after_commit(cls, session):
+        """Session'ın en dıştaki transaction'ı commit edildiğinde notify() çağırır (run_after_commit)."""
+        run_after_commit(session, cls.notify)
+
+    @classmethod
+    def wait(cls, timeout: float) -> bool:
+        """
+        Bildirim gelene veya timeout dolana kadar bekler.
+
+        Returns:
+            bool: Bildirimle uyandıysa True, timeout dolduysa False
+        """
+        notified = cls._event.wait(timeout)
+        cls._event.clear()
+        return notified
+
+    @classmethod
+    def start(cls):
+        """Redis backend'inde diğer process'lerden gelen bildirimleri dinleyen thread'i başlatır."""
+        cls._load_config()
+        if cls._channel is not None:
+            cls._channel.start()
+
+    @classmethod
+    def _handle_message(cls, message: str):
+        cls.wake()
+
+    @classmethod
+    def stop(cls):
+        cls.wake()
+        if cls._channel is not None:
+            cls._channel.stop()
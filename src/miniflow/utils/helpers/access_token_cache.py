@@ -0,0 +1,206 @@
+import time
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Set, Tuple
+
+from miniflow.core.logger import get_logger
+from miniflow.database import run_after_commit
+from ..handlers import ConfigurationHandler
+from .cache_invalidation import CacheInvalidationChannel
+
+
+logger = get_logger(__name__)
+
+
+class AccessTokenCache:
+    """
+    Doğrulanmış access token'lar için process içi, boyutu sınırlı LRU cache: jti -> user_id.
+
+    İmzası doğrulanmış bir JWT'nin session'ı ve kullanıcısı her istekte veritabanından okunmaz;
+    cache'te olan jti için auth yolu SQL çalıştırmaz. Sadece geçerli sonuçlar (session aktif, kullanıcı
+    doğrulanmış ve kilitli değil) cache'lenir.
+
+    - TTL: Entry en fazla ttl_seconds (ve token'ın kendi süresi) kadar yaşar; kaçırılan bir invalidation'ın
+      etkisi de bu süreyle sınırlıdır
+    - Invalidation: Session iptal eden / kullanıcıyı kilitleyen yollar invalidate_after_commit() çağırır,
+      cache transaction commit edildikten sonra temizlenir (jti veya kullanıcının tüm jti'leri)
+    - backend = "redis" ise invalidation Redis kanalına da yayınlanır, diğer worker'lar start() ile
+      başlatılan dinleyici thread'inde kendi cache'lerini temizler. backend = "local" iken bir worker'da
+      iptal edilen token diğer worker'larda ttl_seconds boyunca geçerli kalabilir; birden fazla worker
+      ile local backend kullanılırsa start() uyarı loglar
+    - Cache'te sadece user_id tutulur: Hit durumunda session (is_revoked) ve kullanıcı bayrakları
+      (is_verified, is_locked) tekrar okunmaz. Bu alanları değiştiren her yol invalidate_after_commit()
+      çağırmalıdır; çağırmayan bir değişiklik en geç ttl_seconds sonra etkili olur
+    - Metrikler: stats() ile hit/miss/eviction/invalidation sayıları ve hit_rate
+    """
+
+    enabled: bool = True
+    max_entries: int = 10000
+    ttl_seconds: float = 30.0
+    backend: str = "local"
+    channel: str = "miniflow:access_token_invalidations"
+
+    _initialized = False
+    _lock = threading.Lock()
+    # jti -> (user_id, expires_at (monotonic))
+    _entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+    _user_index: Dict[str, Set[str]] = {}
+    _hits = 0
+    _misses = 0
+    _evictions = 0
+    _invalidations = 0
+    _channel: Optional[CacheInvalidationChannel] = None
+
+    @classmethod
+    def _load_config(cls):
+        if cls._initialized:
+            return
+        ConfigurationHandler.ensure_loaded()
+        section = "ACCESS_TOKEN_CACHE"
+        cls.enabled = ConfigurationHandler.get_bool(section, "access_token_cache_enabled", fallback=True)
+        cls.max_entries = ConfigurationHandler.get_int(section, "access_token_cache_max_entries", fallback=10000)
+        cls.ttl_seconds = ConfigurationHandler.get_float(section, "access_token_cache_ttl_seconds", fallback=30.0)
+        cls.backend = (ConfigurationHandler.get(section, "access_token_cache_backend", fallback="local") or "local").strip().lower()
+        cls.channel = ConfigurationHandler.get(section, "access_token_cache_channel", fallback="miniflow:access_token_invalidations")
+        if cls.backend == "redis":
+            cls._channel = CacheInvalidationChannel("ACCESS TOKEN CACHE", cls.channel, cls._handle_message, cls.clear)
+        cls._initialized = True
+
+    @classmethod
+    def get(cls, jti: str) -> Optional[str]:
+        """jti cache'te ve süresi dolmamışsa user_id, değilse None döner."""
+        cls._load_config()
+        if not cls.enabled:
+            return None
+
+        now = time.monotonic()
+        with cls._lock:
+            entry = cls._entries.get(jti)
+            if entry is not None:
+                user_id, expires_at = entry
+                if expires_at > now:
+                    cls._entries.move_to_end(jti)
+                    cls._hits += 1
+                    return user_id
+                cls._remove(jti)
+            cls._misses += 1
+        return None
+
+    @classmethod
+    def put(cls, jti: str, user_id: str, token_expires_at: datetime):
+        """Geçerli bulunan token'ı cache'ler; entry token'ın süresinden sonra yaşamaz."""
+        cls._load_config()
+        if not cls.enabled or cls.max_entries <= 0:
+            return
+
+        if token_expires_at.tzinfo is None:
+            token_expires_at = token_expires_at.replace(tzinfo=timezone.utc)
+        remaining = (token_expires_at - datetime.now(timezone.utc)).total_seconds()
+        lifetime = min(cls.ttl_seconds, remaining)
+        if lifetime <= 0:
+            return
+
+        with cls._lock:
+            cls._remove(jti)
+            cls._entries[jti] = (user_id, time.monotonic() + lifetime)
+            cls._user_index.setdefault(user_id, set()).add(jti)
+            while len(cls._entries) > cls.max_entries:
+                oldest_jti = next(iter(cls._entries))
+                cls._remove(oldest_jti)
+                cls._evictions += 1
+
+    @classmethod
+    def _remove(cls, jti: str):
+        """Entry'yi ve kullanıcı index'indeki kaydını siler. _lock altında çağrılır."""
+        entry = cls._entries.pop(jti, None)
+        if entry is None:
+            return
+        user_jtis = cls._user_index.get(entry[0])
+        if user_jtis is not None:
+            user_jtis.discard(jti)
+            if not user_jtis:
+                del cls._user_index[entry[0]]
+
+    @classmethod
+    def _invalidate_local(cls, *, jti: Optional[str] = None, user_id: Optional[str] = None):
+        with cls._lock:
+            if jti:
+                cls._remove(jti)
+            if user_id:
+                for user_jti in list(cls._user_index.get(user_id, ())):
+                    cls._remove(user_jti)
+            cls._invalidations += 1
+
+    @classmethod
+    def invalidate(cls, *, jti: Optional[str] = None, user_id: Optional[str] = None):
+        """
+        Bir token'ı (jti) veya kullanıcının tüm token'larını (user_id) bu process'te ve
+        redis backend'inde diğer worker'larda cache'ten çıkarır.
+        """
+        cls._invalidate_local(jti=jti, user_id=user_id)
+        cls._load_config()
+        if cls._channel is None:
+            return
+        if jti:
+            cls._channel.publish(f"jti:{jti}")
+        if user_id:
+            cls._channel.publish(f"user:{user_id}")
+
+    @classmethod
+    def invalidate_after_commit(cls, session, *, jti: Optional[str] = None, user_id: Optional[str] = None):
+        """
+        Session'ın en dıştaki transaction'ı commit edildiğinde invalidate() çağırır (run_after_commit).
+        Commit'ten önce temizlenen cache, eşzamanlı bir istekte eski (iptal edilmemiş) satırdan tekrar dolabilirdi.
+        """
+        run_after_commit(session, lambda: cls.invalidate(jti=jti, user_id=user_id))
+
+    @classmethod
+    def start(cls):
+        """Redis backend'inde diğer worker'lardan gelen invalidation'ları dinleyen thread'i başlatır."""
+        cls._load_config()
+        if cls._channel is not None:
+            cls._channel.start()
+            return
+
+        workers = ConfigurationHandler.get_int("Server", "workers", fallback=1)
+        if cls.enabled and workers > 1:
+            logger.warning(
+                f"[ACCESS TOKEN CACHE] backend=local with {workers} workers: a token revoked on one worker stays "
+                f"valid on the others for up to {cls.ttl_seconds}s. Set access_token_cache_backend = redis"
+            )
+
+    @classmethod
+    def _handle_message(cls, message: str):
+        kind, _, value = message.partition(":")
+        if kind == "jti" and value:
+            cls._invalidate_local(jti=value)
+        elif kind == "user" and value:
+            cls._invalidate_local(user_id=value)
+
+    @classmethod
+    def stop(cls):
+        if cls._channel is not None:
+            cls._channel.stop()
+
+    @classmethod
+    def clear(cls):
+        """Tüm entry'leri siler ve metrikleri sıfırlar."""
+        with cls._lock:
+            cls._entries.clear()
+            cls._user_index.clear()
+            cls._hits = cls._misses = cls._evictions = cls._invalidations = 0
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """Cache metrikleri: {"size", "hits", "misses", "evictions", "invalidations", "hit_rate"}"""
+        with cls._lock:
+            lookups = cls._hits + cls._misses
+            return {
+                "size": len(cls._entries),
+                "hits": cls._hits,
+                "misses": cls._misses,
+                "evictions": cls._evictions,
+                "invalidations": cls._invalidations,
+                "hit_rate": round(cls._hits / lookups, 4) if lookups else 0.0,
+            }
@@ -0,0 +1,89 @@
+import threading
+from typing import Any, Callable, Optional
+
+from miniflow.core.logger import get_logger
+from ..handlers import RedisClient
+
+
+logger = get_logger(__name__)
+
+
+class CacheInvalidationChannel:
+    """
+    Process içi cache'ler için Redis pub/sub üzerinden invalidation dağıtımı.
+
+    Cache kendi entry'lerini yerelde temizledikten sonra publish() ile mesajı diğer worker'lara yayınlar;
+    start() ile başlatılan dinleyici thread'i gelen her mesajı on_message'a verir. Bağlantı koptuğunda
+    aradaki mesajlar bilinemeyeceği için on_disconnect çağrılır (cache boşaltılır) ve yeniden bağlanılır.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        channel: str,
+        on_message: Callable[[str], None],
+        on_disconnect: Callable[[], None],
+    ):
+        self.name = name
+        self.channel = channel
+        self._on_message = on_message
+        self._on_disconnect = on_disconnect
+        self._stop_event = threading.Event()
+        self._listener_thread: Optional[threading.Thread] = None
+
+    def publish(self, message: str):
+        """Mesajı kanala yayınlar; yayınlanamazsa diğer worker'lar entry'leri TTL dolunca bırakır."""
+        try:
+            if not RedisClient._initialized:
+                RedisClient.initialize()
+            RedisClient._client.publish(self.channel, message)
+        except Exception as e:
+            logger.warning(f"[{self.name}] Failed to publish invalidation: {e}")
+
+    def start(self):
+        """Kanalı dinleyen thread'i başlatır."""
+        if self._listener_thread and self._listener_thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._listener_thread = threading.Thread(
+            target=self._listen_loop,
+            name=f"{self.name.title().replace(' ', '')}ListenerThread",
+            daemon=True
+        )
+        self._listener_thread.start()
+        logger.info(f"[{self.name}] Listening on redis channel {self.channel}")
+
+    def stop(self):
+        self._stop_event.set()
+        if self._listener_thread and self._listener_thread.is_alive():
+            self._listener_thread.join(timeout=5)
+        self._listener_thread = None
+
+    def _handle(self, data: Any):
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        self._on_message(str(data))
+
+    def _listen_loop(self):
+        while not self._stop_event.is_set():
+            pubsub = None
+            try:
+                if not RedisClient._initialized:
+                    RedisClient.initialize()
+                pubsub = RedisClient._client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                while not self._stop_event.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message:
+                        self._handle(message.get("data"))
+            except Exception as e:
+                logger.warning(f"[{self.name}] Redis listener error, clearing cache and retrying: {e}")
+                self._on_disconnect()
+                self._stop_event.wait(5.0)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
@@ -1,5 +1,6 @@
 import bcrypt
 import hashlib
+import hmac
 import base64
 from typing import Optional
 from cryptography.fernet import Fernet
@@ -11,6 +12,7 @@ from miniflow.core.exceptions import InvalidInputError, InternalError
 # Cache variables for lazy loading
 _encryption_key: Optional[bytes] = None
 _cipher: Optional[Fernet] = None
+_api_key_hmac_key: Optional[bytes] = None
 
 
 def _get_encryption_key() -> bytes:
@@ -66,6 +68,16 @@ def _get_cipher() -> Fernet:
     return _cipher
 
 
+def _get_api_key_hmac_key() -> bytes:
+    """API key hash'leri için HMAC anahtarı; ENCRYPTION_KEY'den türetilir (ENCRYPTION_KEY değişirse key'ler geçersiz olur)"""
+    global _api_key_hmac_key
+    
+    if _api_key_hmac_key is None:
+        _api_key_hmac_key = hashlib.sha256(b"miniflow:api-key:" + _get_encryption_key()).digest()
+    
+    return _api_key_hmac_key
+
+
 def encrypt_data(plain_text: str) -> str:
     if not plain_text:
         return ""
@@ -119,4 +131,28 @@ def hash_data(data: str) -> str:
     try:
         return hashlib.sha256(data.encode('utf-8')).hexdigest()
     except Exception:
-        raise InternalError(component_name="encryption_helper")
\ No newline at end of file
+        raise InternalError(component_name="encryption_helper")
+
+def hash_api_key(api_key: str) -> str:
+    """
+    API key'i HMAC-SHA256 ile hashler.
+    API key'ler yüksek entropili rastgele değerler olduğu için yavaş (bcrypt) hash gerekmez;
+    sonuç deterministiktir, index'li kolonda doğrudan aranabilir.
+    """
+    if not api_key:
+        raise InvalidInputError(field_name="api_key")
+    
+    try:
+        return hmac.new(_get_api_key_hmac_key(), api_key.encode('utf-8'), hashlib.sha256).hexdigest()
+    except Exception:
+        raise InternalError(component_name="encryption_helper")
+
+def verify_api_key(api_key: str, key_hash: str) -> bool:
+    if not api_key or not key_hash:
+        return False
+    
+    return hmac.compare_digest(hash_api_key(api_key), key_hash)
+
+def is_bcrypt_hash(hashed: Optional[str]) -> bool:
+    """Eski (bcrypt ile hashlenmiş) kayıtları ayırt etmek için"""
+    return bool(hashed) and hashed.startswith(("$2a$", "$2b$", "$2y$"))
@@ -0,0 +1,127 @@
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple
+
+from ..handlers import ConfigurationHandler
+
+
+class SecretCache:
+    """
+    Çözülmüş (decrypt edilmiş) secret değerleri için process içi, boyutu sınırlı LRU cache.
+
+    Aynı variable/credential birçok node ve execution'da referans edildiğinde her çözümlemede
+    Fernet decrypt çalıştırılmaz. Anahtar (kind, record_id), sürüm updated_at'tir: kayıt güncellendiğinde
+    updated_at değiştiği için başka process'lerdeki eski değerler de bir sonraki okumada kullanılmaz.
+
+    - TTL: Değer ttl_seconds sonunda tekrar çözülür, plaintext bellekte süresiz kalmaz
+    - Invalidation: Update/delete yolları invalidate() çağırır
+    - Zeroing: Değerler bytearray olarak tutulur, çıkarılan (evict/expire/invalidate) entry'nin byte'ları sıfırlanır
+    - Metrikler: stats() ile hit/miss/eviction sayıları ve hit_rate
+
+    NOT: Çağırana dönen str kopyaları Python tarafından yönetilir ve sıfırlanamaz.
+    """
+
+    enabled: bool = True
+    max_entries: int = 1024
+    ttl_seconds: float = 300.0
+
+    _initialized = False
+    _lock = threading.Lock()
+    # (kind, record_id) -> (version, expires_at, bytearray)
+    _entries: "OrderedDict[Tuple[str, str], Tuple[Any, float, bytearray]]" = OrderedDict()
+    _hits = 0
+    _misses = 0
+    _evictions = 0
+
+    @classmethod
+    def _load_config(cls):
+        if cls._initialized:
+            return
+        ConfigurationHandler.ensure_loaded()
+        section = "SECRET_CACHE"
+        cls.enabled = ConfigurationHandler.get_bool(section, "secret_cache_enabled", fallback=True)
+        cls.max_entries = ConfigurationHandler.get_int(section, "secret_cache_max_entries", fallback=1024)
+        cls.ttl_seconds = ConfigurationHandler.get_float(section, "secret_cache_ttl_seconds", fallback=300.0)
+        cls._initialized = True
+
+    @staticmethod
+    def _zero(buffer: bytearray):
+        buffer[:] = bytes(len(buffer))
+
+    @classmethod
+    def get_or_load(cls, kind: str, record_id: str, version: Any, loader: Callable[[], str]) -> str:
+        """
+        Cache'teki çözülmüş değeri döndürür; yoksa, süresi dolmuşsa veya sürüm değişmişse loader ile çözer.
+
+        Args:
+            kind (str): Kayıt tipi, örn. "variable", "credential".
+            record_id (str): Kayıt ID'si.
+            version (Any): Kaydın updated_at değeri.
+            loader (Callable[[], str]): Değeri çözen fonksiyon, örn. lambda: decrypt_data(variable.value).
+
+        Returns:
+            str: Çözülmüş değer
+        """
+        cls._load_config()
+        if not cls.enabled or cls.max_entries <= 0:
+            return loader()
+
+        key = (kind, record_id)
+        now = time.monotonic()
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is not None:
+                entry_version, expires_at, buffer = entry
+                if entry_version == version and expires_at > now:
+                    cls._entries.move_to_end(key)
+                    cls._hits += 1
+                    return buffer.decode("utf-8")
+                del cls._entries[key]
+                cls._zero(buffer)
+            cls._misses += 1
+
+        value = loader()
+        if not isinstance(value, str):
+            return value
+
+        with cls._lock:
+            previous = cls._entries.pop(key, None)
+            if previous is not None:
+                cls._zero(previous[2])
+            cls._entries[key] = (version, now + cls.ttl_seconds, bytearray(value.encode("utf-8")))
+            while len(cls._entries) > cls.max_entries:
+                _, (_, _, buffer) = cls._entries.popitem(last=False)
+                cls._zero(buffer)
+                cls._evictions += 1
+        return value
+
+    @classmethod
+    def invalidate(cls, kind: str, record_id: str):
+        """Kaydın cache'teki değerini siler ve byte'larını sıfırlar. Update/delete yollarından çağrılır."""
+        with cls._lock:
+            entry = cls._entries.pop((kind, record_id), None)
+            if entry is not None:
+                cls._zero(entry[2])
+
+    @classmethod
+    def clear(cls):
+        """Tüm entry'leri siler ve metrikleri sıfırlar."""
+        with cls._lock:
+            for _, _, buffer in cls._entries.values():
+                cls._zero(buffer)
+            cls._entries.clear()
+            cls._hits = cls._misses = cls._evictions = 0
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """Cache metrikleri: {"size", "hits", "misses", "evictions", "hit_rate"}"""
+        with cls._lock:
+            lookups = cls._hits + cls._misses
+            return {
+                "size": len(cls._entries),
+                "hits": cls._hits,
+                "misses": cls._misses,
+                "evictions": cls._evictions,
+                "hit_rate": round(cls._hits / lookups, 4) if lookups else 0.0,
+            }
@@ -0,0 +1,196 @@
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+
+from miniflow.core.logger import get_logger
+from miniflow.database import run_after_commit
+from ..handlers import ConfigurationHandler
+from .cache_invalidation import CacheInvalidationChannel
+
+
+logger = get_logger(__name__)
+
+
+class WorkspaceAccessCache:
+    """
+    Workspace erişim kontrolü için process içi, boyutu sınırlı LRU cache:
+    (workspace_id, user_id) -> (is_suspended, suspension_reason).
+
+    Entry varsa kullanıcı workspace'in üyesidir; workspace'in askı durumu da entry'de tutulur.
+    Sadece başarılı kontroller cache'lenir (workspace yok / üye değil sonuçları her seferinde veritabanından okunur).
+
+    - TTL: Entry en fazla ttl_seconds yaşar; kaçırılan bir invalidation'ın etkisi bu süreyle sınırlıdır
+    - Invalidation: Üyeyi çıkaran, üye ekleyen ve workspace'i askıya alan / silen yollar invalidate_after_commit()
+      çağırır (tek üye veya workspace'in tüm entry'leri)
+    - backend = "redis" ise invalidation diğer worker'lara da yayınlanır (CacheInvalidationChannel); local backend'de
+      çıkarılan üye diğer worker'larda ttl_seconds boyunca erişebilir, birden fazla worker varsa start() uyarı loglar
+    - Metrikler: stats() ile hit/miss/eviction/invalidation sayıları ve hit_rate
+    """
+
+    enabled: bool = True
+    max_entries: int = 10000
+    ttl_seconds: float = 30.0
+    backend: str = "local"
+    channel: str = "miniflow:workspace_access_invalidations"
+
+    _initialized = False
+    _lock = threading.Lock()
+    # (workspace_id, user_id) -> (is_suspended, suspension_reason, expires_at (monotonic))
+    _entries: "OrderedDict[Tuple[str, str], Tuple[bool, Optional[str], float]]" = OrderedDict()
+    _workspace_index: Dict[str, Set[str]] = {}
+    _hits = 0
+    _misses = 0
+    _evictions = 0
+    _invalidations = 0
+    _channel: Optional[CacheInvalidationChannel] = None
+
+    @classmethod
+    def _load_config(cls):
+        if cls._initialized:
+            return
+        ConfigurationHandler.ensure_loaded()
+        section = "WORKSPACE_ACCESS_CACHE"
+        cls.enabled = ConfigurationHandler.get_bool(section, "workspace_access_cache_enabled", fallback=True)
+        cls.max_entries = ConfigurationHandler.get_int(section, "workspace_access_cache_max_entries", fallback=10000)
+        cls.ttl_seconds = ConfigurationHandler.get_float(section, "workspace_access_cache_ttl_seconds", fallback=30.0)
+        cls.backend = (ConfigurationHandler.get(section, "workspace_access_cache_backend", fallback="local") or "local").strip().lower()
+        cls.channel = ConfigurationHandler.get(section, "workspace_access_cache_channel", fallback="miniflow:workspace_access_invalidations")
+        if cls.backend == "redis":
+            cls._channel = CacheInvalidationChannel("WORKSPACE ACCESS CACHE", cls.channel, cls._handle_message, cls.clear)
+        cls._initialized = True
+
+    @classmethod
+    def get(cls, workspace_id: str, user_id: str) -> Optional[Tuple[bool, Optional[str]]]:
+        """Üyelik cache'te ve süresi dolmamışsa (is_suspended, suspension_reason), değilse None döner."""
+        cls._load_config()
+        if not cls.enabled:
+            return None
+
+        key = (workspace_id, user_id)
+        now = time.monotonic()
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is not None:
+                is_suspended, suspension_reason, expires_at = entry
+                if expires_at > now:
+                    cls._entries.move_to_end(key)
+                    cls._hits += 1
+                    return is_suspended, suspension_reason
+                cls._remove(key)
+            cls._misses += 1
+        return None
+
+    @classmethod
+    def put(cls, workspace_id: str, user_id: str, is_suspended: bool, suspension_reason: Optional[str] = None):
+        """Doğrulanmış üyeliği workspace'in askı durumuyla birlikte cache'ler."""
+        cls._load_config()
+        if not cls.enabled or cls.max_entries <= 0 or cls.ttl_seconds <= 0:
+            return
+
+        key = (workspace_id, user_id)
+        with cls._lock:
+            cls._remove(key)
+            cls._entries[key] = (is_suspended, suspension_reason, time.monotonic() + cls.ttl_seconds)
+            cls._workspace_index.setdefault(workspace_id, set()).add(user_id)
+            while len(cls._entries) > cls.max_entries:
+                oldest_key = next(iter(cls._entries))
+                cls._remove(oldest_key)
+                cls._evictions += 1
+
+    @classmethod
+    def _remove(cls, key: Tuple[str, str]):
+        """Entry'yi ve workspace index'indeki kaydını siler. _lock altında çağrılır."""
+        if cls._entries.pop(key, None) is None:
+            return
+        workspace_id, user_id = key
+        user_ids = cls._workspace_index.get(workspace_id)
+        if user_ids is not None:
+            user_ids.discard(user_id)
+            if not user_ids:
+                del cls._workspace_index[workspace_id]
+
+    @classmethod
+    def _invalidate_local(cls, *, workspace_id: str, user_id: Optional[str] = None):
+        with cls._lock:
+            if user_id:
+                cls._remove((workspace_id, user_id))
+            else:
+                for member_id in list(cls._workspace_index.get(workspace_id, ())):
+                    cls._remove((workspace_id, member_id))
+            cls._invalidations += 1
+
+    @classmethod
+    def invalidate(cls, *, workspace_id: str, user_id: Optional[str] = None):
+        """
+        Bir üyenin (user_id verilirse) veya workspace'in tüm üyelerinin entry'lerini bu process'te ve
+        redis backend'inde diğer worker'larda cache'ten çıkarır.
+        """
+        cls._invalidate_local(workspace_id=workspace_id, user_id=user_id)
+        cls._load_config()
+        if cls._channel is None:
+            return
+        if user_id:
+            cls._channel.publish(f"member:{workspace_id}:{user_id}")
+        else:
+            cls._channel.publish(f"workspace:{workspace_id}")
+
+    @classmethod
+    def invalidate_after_commit(cls, session, *, workspace_id: str, user_id: Optional[str] = None):
+        """
+        Session'ın en dıştaki transaction'ı commit edildiğinde invalidate() çağırır (run_after_commit).
+        Commit'ten önce temizlenen cache, eşzamanlı bir istekte eski satırlardan tekrar dolabilirdi.
+        """
+        run_after_commit(session, lambda: cls.invalidate(workspace_id=workspace_id, user_id=user_id))
+
+    @classmethod
+    def start(cls):
+        """Redis backend'inde diğer worker'lardan gelen invalidation'ları dinleyen thread'i başlatır."""
+        cls._load_config()
+        if cls._channel is not None:
+            cls._channel.start()
+            return
+
+        workers = ConfigurationHandler.get_int("Server", "workers", fallback=1)
+        if cls.enabled and workers > 1:
+            logger.warning(
+                f"[WORKSPACE ACCESS CACHE] backend=local with {workers} workers: a removed member keeps access on "
+                f"the other workers for up to {cls.ttl_seconds}s. Set workspace_access_cache_backend = redis"
+            )
+
+    @classmethod
+    def _handle_message(cls, message: str):
+        kind, _, value = message.partition(":")
+        if kind == "workspace" and value:
+            cls._invalidate_local(workspace_id=value)
+        elif kind == "member" and value:
+            workspace_id, _, user_id = value.partition(":")
+            if workspace_id and user_id:
+                cls._invalidate_local(workspace_id=workspace_id, user_id=user_id)
+
+    @classmethod
+    def stop(cls):
+        if cls._channel is not None:
+            cls._channel.stop()
+
+    @classmethod
+    def clear(cls):
+        """Tüm entry'leri siler ve metrikleri sıfırlar."""
+        with cls._lock:
+            cls._entries.clear()
+            cls._workspace_index.clear()
+            cls._hits = cls._misses = cls._evictions = cls._invalidations = 0
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """Cache metrikleri: {"size", "hits", "misses", "evictions", "invalidations", "hit_rate"}"""
+        with cls._lock:
+            lookups = cls._hits + cls._misses
+            return {
+                "size": len(cls._entries),
+                "hits": cls._hits,
+                "misses": cls._misses,
+                "evictions": cls._evictions,
+                "invalidations": cls._invalidations,
+                "hit_rate": round(cls._hits / lookups, 4) if lookups else 0.0,
+            }
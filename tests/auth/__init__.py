@@ -0,0 +1 @@
+# Auth Tests
@@ -0,0 +1,110 @@
+"""
+TEST 1: API Key Lookup Testleri
+===============================
+
+Bu test, API key'lerin lookup ID ve HMAC hash ile doğrulanmasını doğrular:
+1. Yeni format key ({prefix}{lookup_id}.{secret}) lookup ID ile bulunur, secret HMAC ile doğrulanır
+2. Lookup ID'si doğru ama secret'ı yanlış key reddedilir, eski key taraması yapılmaz
+3. Eski (bcrypt hash'li) key bulunur ve HMAC hash'e taşınır
+4. Taşınmış eski key HMAC hash ile bulunur
+5. legacy_bcrypt_fallback varsayılan olarak açıktır (eski key'ler çalışmaya devam eder); kapatılınca bcrypt taraması yapılmaz
+6. Taşıma sonrası kalan eski key sayısı loglanır
+
+NOT: Bu testler api_keys tablosunu in-memory SQLite'ta oluşturur.
+"""
+
+import pytest
+
+from miniflow.models import ApiKey
+from miniflow.services import ApiKeyService
+from miniflow.services._6_resource_services import api_key_service
+from miniflow.utils.helpers import encryption_helper
+from miniflow.utils.helpers.encryption_helper import hash_api_key, hash_password
+
+LOOKUP_ID = "0123456789ab"
+NEW_KEY = f"sk_live_{LOOKUP_ID}.secret-value"
+LEGACY_KEY = "sk_live_legacy-secret-value"
+
+
+@pytest.fixture(autouse=True)
+def hmac_key(monkeypatch):
+    monkeypatch.setattr(encryption_helper, "_api_key_hmac_key", b"test-hmac-key")
+
+
+@pytest.fixture
+def legacy_fallback(monkeypatch):
+    monkeypatch.setattr(ApiKeyService, "_initialized", True)
+    monkeypatch.setattr(ApiKeyService, "_legacy_bcrypt_fallback", True)
+
+
+@pytest.fixture
+def migrated(monkeypatch):
+    migrated = []
+    monkeypatch.setattr(ApiKeyService, "_migrate_legacy_api_key",
+                        lambda **kwargs: migrated.append(kwargs["api_key_id"]))
+    return migrated
+
+
+@pytest.fixture
+def session(memory_session):
+    return memory_session(ApiKey, seed=_seed)
+
+
+def _seed(session):
+    session.add(ApiKey(id="API-NEW", workspace_id="WSP-1", owner_id="USR-1", name="new", key_prefix="sk_live_",
+                       key_lookup_id=LOOKUP_ID, key_hash=hash_api_key(NEW_KEY)))
+    session.add(ApiKey(id="API-LEGACY", workspace_id="WSP-1", owner_id="USR-1", name="legacy", key_prefix="sk_live_",
+                       key_hash=hash_password(LEGACY_KEY, rounds=4)))
+    session.flush()
+
+
+class TestApiKeyLookup:
+
+    def test_parse_lookup_id(self):
+        assert ApiKeyService._parse_lookup_id(NEW_KEY) == LOOKUP_ID
+        assert ApiKeyService._parse_lookup_id(LEGACY_KEY) is None
+        assert ApiKeyService._parse_lookup_id("sk_live_not-hex-here.secret") is None
+
+    def test_new_key_is_found_by_lookup_id(self, session, migrated):
+        assert ApiKeyService._find_api_key(session, NEW_KEY).id == "API-NEW"
+        assert migrated == []
+
+    def test_wrong_secret_is_rejected(self, session, migrated):
+        assert ApiKeyService._find_api_key(session, f"sk_live_{LOOKUP_ID}.wrong-secret") is None
+        assert ApiKeyService._find_api_key(session, "sk_live_ffffffffffff.secret-value") is None
+
+    def test_legacy_key_is_verified_and_migrated(self, session, migrated, legacy_fallback):
+        assert ApiKeyService._find_api_key(session, LEGACY_KEY).id == "API-LEGACY"
+        assert migrated == ["API-LEGACY"]
+
+    def test_migrated_legacy_key_is_found_by_hash(self, session, migrated, legacy_fallback):
+        session.get(ApiKey, "API-LEGACY").key_hash = hash_api_key(LEGACY_KEY)
+        session.flush()
+
+        assert ApiKeyService._find_api_key(session, LEGACY_KEY).id == "API-LEGACY"
+        assert migrated == []
+
+    def test_legacy_fallback_is_on_by_default(self, session, migrated, monkeypatch, test_config):
+        monkeypatch.setattr(ApiKeyService, "_initialized", False)
+        test_config._parser.remove_option("API_KEY", "legacy_bcrypt_fallback")
+
+        assert ApiKeyService._find_api_key(session, LEGACY_KEY).id == "API-LEGACY"
+        assert migrated == ["API-LEGACY"]
+
+    def test_legacy_fallback_can_be_disabled(self, session, migrated, monkeypatch):
+        monkeypatch.setattr(ApiKeyService, "_initialized", True)
+        monkeypatch.setattr(ApiKeyService, "_legacy_bcrypt_fallback", False)
+
+        assert ApiKeyService._find_api_key(session, LEGACY_KEY) is None
+        assert migrated == []
+
+    def test_migration_logs_remaining_legacy_keys(self, session, monkeypatch):
+        messages = []
+        monkeypatch.setattr(api_key_service.logger, "info", messages.append)
+
+        ApiKeyService._migrate_legacy_api_key.__wrapped__(
+            ApiKeyService, session, api_key_id="API-LEGACY", full_api_key=LEGACY_KEY)
+
+        assert session.get(ApiKey, "API-LEGACY").key_hash == hash_api_key(LEGACY_KEY)
+        assert "remaining_legacy_keys=0" in messages[0]
+        assert "can be disabled" in messages[1]
@@ -0,0 +1,106 @@
+"""
+TEST 2: API Key Usage Write-Behind Testleri
+===========================================
+
+Bu test, API key kullanım sayaçlarının toplu yazılmasını doğrular:
+1. Kullanımlar bellekte key başına birleştirilir, auth yolunda veritabanına yazılmaz
+2. Flush bekleyen sayaçları tek UPDATE ile yazar (usage_count eklenir, last_used_at güncellenir)
+3. Yazılamayan sayaçlar kaybolmaz, bir sonraki flush'ta tekrar denenir
+
+NOT: Bu testler api_keys tablosunu in-memory SQLite'ta oluşturur.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from miniflow.handlers import ApiKeyUsageHandler
+from miniflow.models import ApiKey
+from miniflow.services import ApiKeyService
+
+T0 = datetime(2026, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(autouse=True)
+def pending(monkeypatch):
+    monkeypatch.setattr(ApiKeyUsageHandler, "_pending", {})
+    monkeypatch.setattr(ApiKeyUsageHandler, "_running", False)
+
+
+@pytest.fixture
+def session(memory_session):
+    return memory_session(ApiKey, seed=_seed)
+
+
+def _seed(session):
+    for api_key_id in ("API-1", "API-2", "API-3"):
+        session.add(ApiKey(id=api_key_id, workspace_id="WSP-1", owner_id="USR-1", name=api_key_id,
+                           key_prefix="sk_live_", key_hash=f"hash-{api_key_id}", usage_count=5))
+    session.flush()
+
+
+class TestUsageRecording:
+
+    def test_usage_is_coalesced_per_key(self):
+        ApiKeyUsageHandler.record("API-1", T0)
+        ApiKeyUsageHandler.record("API-1", T0 + timedelta(seconds=5))
+        ApiKeyUsageHandler.record("API-1", T0 + timedelta(seconds=2))
+        ApiKeyUsageHandler.record("API-2", T0)
+
+        assert ApiKeyUsageHandler._pending == {
+            "API-1": (3, T0 + timedelta(seconds=5)),
+            "API-2": (1, T0),
+        }
+
+    def test_flush_writes_pending_usage(self, monkeypatch):
+        flushed = []
+        monkeypatch.setattr(ApiKeyService, "apply_usage", lambda usage: flushed.append(usage) or len(usage))
+        ApiKeyUsageHandler.record("API-1", T0)
+        ApiKeyUsageHandler.record("API-1", T0)
+
+        assert ApiKeyUsageHandler.flush() == 1
+        assert flushed == [{"API-1": (2, T0)}]
+        assert ApiKeyUsageHandler._pending == {}
+        assert ApiKeyUsageHandler.flush() == 0
+
+    def test_failed_flush_is_retried(self, monkeypatch):
+        def fail(usage):
+            raise RuntimeError("database is locked")
+
+        monkeypatch.setattr(ApiKeyService, "apply_usage", fail)
+        ApiKeyUsageHandler.record("API-1", T0)
+        ApiKeyUsageHandler.flush()
+        ApiKeyUsageHandler.record("API-1", T0 + timedelta(seconds=1))
+
+        assert ApiKeyUsageHandler._pending == {"API-1": (2, T0 + timedelta(seconds=1))}
+
+    def test_flushes_when_pending_limit_is_reached(self, monkeypatch):
+        flushed = []
+        monkeypatch.setattr(ApiKeyService, "apply_usage", lambda usage: flushed.append(usage) or len(usage))
+        monkeypatch.setattr(ApiKeyUsageHandler, "max_pending_keys", 2)
+
+        ApiKeyUsageHandler.record("API-1", T0)
+        assert flushed == []
+        ApiKeyUsageHandler.record("API-2", T0)
+        assert flushed == [{"API-1": (1, T0), "API-2": (1, T0)}]
+
+
+class TestApplyUsage:
+
+    def test_usage_is_written_with_single_update(self, session):
+        statements = []
+        event.listen(session.get_bind(), "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+
+        updated = ApiKeyService.apply_usage.__wrapped__(ApiKeyService, session, usage={
+            "API-1": (3, T0), "API-2": (1, T0 + timedelta(minutes=1))
+        })
+
+        assert updated == 2
+        assert len([s for s in statements if s.lstrip().upper().startswith("UPDATE")]) == 1
+        session.expire_all()
+        assert (session.get(ApiKey, "API-1").usage_count, session.get(ApiKey, "API-1").last_used_at) == (8, T0)
+        assert session.get(ApiKey, "API-2").usage_count == 6
+        assert session.get(ApiKey, "API-3").usage_count == 5
+        assert session.get(ApiKey, "API-3").last_used_at is None
@@ -0,0 +1,182 @@
+"""
+TEST 3: Access Token Cache Testleri
+===================================
+
+Bu test, doğrulanmış access token'ların cache'lenmesini doğrular:
+1. Cache'te olan jti için validate_access_token SQL çalıştırmaz
+2. Sadece geçerli sonuçlar cache'lenir, entry TTL ve token süresinden sonra düşer
+3. Session iptali / logout cache'i transaction commit edildikten sonra temizler (jti veya kullanıcı bazında)
+4. Boyut sınırı LRU ile korunur, diğer worker'lardan gelen Redis mesajları cache'i temizler
+5. Birden fazla worker ile local backend başlangıçta uyarı verir
+
+NOT: Bu testler tüm tabloları in-memory SQLite'ta oluşturur (User'ın eager yüklenen ilişkileri dahil).
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event
+
+from miniflow.models import User, AuthSession
+from miniflow.services import LoginService
+from miniflow.services._3_auth_services import login_service
+from miniflow.services._3_auth_services.session_managment_service import SessionManagementService
+from miniflow.utils.helpers import access_token_cache
+from miniflow.utils.helpers.access_token_cache import AccessTokenCache
+
+
+def _future(minutes: int = 15) -> datetime:
+    return datetime.now(timezone.utc) + timedelta(minutes=minutes)
+
+
+@pytest.fixture(autouse=True)
+def cache(monkeypatch):
+    monkeypatch.setattr(AccessTokenCache, "_initialized", True)
+    monkeypatch.setattr(AccessTokenCache, "enabled", True)
+    monkeypatch.setattr(AccessTokenCache, "backend", "local")
+    monkeypatch.setattr(AccessTokenCache, "_channel", None)
+    monkeypatch.setattr(AccessTokenCache, "max_entries", 100)
+    monkeypatch.setattr(AccessTokenCache, "ttl_seconds", 30.0)
+    AccessTokenCache.clear()
+    yield AccessTokenCache
+    AccessTokenCache.clear()
+
+
+@pytest.fixture
+def session(memory_session):
+    return memory_session(seed=_seed)
+
+
+def _seed(session):
+    session.add(User(id="USR-1", username="user", email="user@example.com", is_verified=True))
+    for jti in ("JTI-1", "JTI-2"):
+        session.add(AuthSession(
+            id=f"AUS-{jti}", user_id="USR-1",
+            access_token_jti=jti, access_token_expires_at=_future(),
+            refresh_token_jti=f"R{jti}", refresh_token_expires_at=_future(60 * 24),
+        ))
+    session.commit()
+
+
+@pytest.fixture
+def validate(monkeypatch, session):
+    """JWT imzası yerine token'ı jti olarak kabul eder, veritabanı kontrolünü test session'ında yapar."""
+    monkeypatch.setattr(login_service, "validate_access_token", lambda token: (True, {"jti": token}))
+    check_session = LoginService._validate_access_token_session.__wrapped__
+    monkeypatch.setattr(LoginService, "_validate_access_token_session",
+                        lambda access_token_jti: check_session(LoginService, session, access_token_jti=access_token_jti))
+    return lambda token: LoginService.validate_access_token(access_token=token)
+
+
+@pytest.fixture
+def statements(session):
+    executed = []
+    event.listen(session.get_bind(), "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: executed.append(statement))
+    return executed
+
+
+class TestValidateAccessToken:
+
+    def test_cached_token_runs_no_sql(self, validate, statements):
+        assert validate("JTI-1") == {"valid": True, "user_id": "USR-1"}
+        assert statements
+
+        statements.clear()
+        for _ in range(10):
+            assert validate("JTI-1") == {"valid": True, "user_id": "USR-1"}
+
+        assert statements == []
+        assert AccessTokenCache.stats()["hits"] == 10
+
+    def test_invalid_result_is_not_cached(self, validate, session):
+        session.get(User, "USR-1").is_locked = True
+        session.commit()
+
+        assert validate("JTI-1") == {"valid": False, "error": "Account locked"}
+        assert AccessTokenCache.get("JTI-1") is None
+
+    def test_entry_expires_with_token(self, monkeypatch):
+        AccessTokenCache.put("JTI-1", "USR-1", _future(minutes=0) - timedelta(seconds=1))
+        assert AccessTokenCache.get("JTI-1") is None
+
+        monkeypatch.setattr(AccessTokenCache, "ttl_seconds", 0.0)
+        AccessTokenCache.put("JTI-2", "USR-1", _future())
+        assert AccessTokenCache.get("JTI-2") is None
+
+
+class TestInvalidation:
+
+    def test_revoke_session_invalidates_after_commit(self, validate, session):
+        validate("JTI-1")
+        validate("JTI-2")
+
+        SessionManagementService.revoke_session.__wrapped__(
+            SessionManagementService, session, session_id="AUS-JTI-1", user_id="USR-1")
+        # Commit'ten önce cache değişmez
+        assert AccessTokenCache.get("JTI-1") == "USR-1"
+
+        session.commit()
+        assert AccessTokenCache.get("JTI-1") is None
+        assert AccessTokenCache.get("JTI-2") == "USR-1"
+        assert validate("JTI-1") == {"valid": False, "error": "Session revoked"}
+
+    def test_rollback_keeps_cache(self, validate, session):
+        validate("JTI-1")
+
+        SessionManagementService.revoke_session.__wrapped__(
+            SessionManagementService, session, session_id="AUS-JTI-1", user_id="USR-1")
+        session.rollback()
+
+        assert AccessTokenCache.get("JTI-1") == "USR-1"
+
+    def test_logout_all_invalidates_every_user_token(self, validate, session):
+        validate("JTI-1")
+        validate("JTI-2")
+
+        LoginService.logout_all.__wrapped__(LoginService, session, user_id="USR-1")
+        session.commit()
+
+        assert AccessTokenCache.get("JTI-1") is None
+        assert AccessTokenCache.get("JTI-2") is None
+        assert AccessTokenCache.stats()["size"] == 0
+
+    def test_redis_message_invalidates_local_cache(self):
+        AccessTokenCache.put("JTI-1", "USR-1", _future())
+        AccessTokenCache.put("JTI-2", "USR-1", _future())
+        AccessTokenCache.put("JTI-3", "USR-2", _future())
+
+        AccessTokenCache._handle_message("jti:JTI-3")
+        assert AccessTokenCache.get("JTI-3") is None
+
+        AccessTokenCache._handle_message("user:USR-1")
+        assert AccessTokenCache.get("JTI-1") is None
+        assert AccessTokenCache.get("JTI-2") is None
+
+
+class TestCacheBounds:
+
+    def test_least_recently_used_entry_is_evicted(self, monkeypatch):
+        monkeypatch.setattr(AccessTokenCache, "max_entries", 2)
+        AccessTokenCache.put("JTI-1", "USR-1", _future())
+        AccessTokenCache.put("JTI-2", "USR-1", _future())
+        AccessTokenCache.get("JTI-1")
+        AccessTokenCache.put("JTI-3", "USR-2", _future())
+
+        assert AccessTokenCache.get("JTI-2") is None
+        assert AccessTokenCache.get("JTI-1") == "USR-1"
+        assert AccessTokenCache.stats()["evictions"] == 1
+        assert AccessTokenCache._user_index == {"USR-1": {"JTI-1"}, "USR-2": {"JTI-3"}}
+
+
+class TestStartup:
+
+    @pytest.mark.parametrize("workers, warned", [(1, False), (4, True)])
+    def test_local_backend_warns_with_multiple_workers(self, monkeypatch, test_config, workers, warned):
+        warnings = []
+        monkeypatch.setattr(access_token_cache.logger, "warning", warnings.append)
+        test_config._parser.set("Server", "workers", str(workers))
+
+        AccessTokenCache.start()
+
+        assert bool(warnings) is warned
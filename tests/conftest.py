@@ -179,10 +179,62 @@ def mock_scripts():
     return MOCK_SCRIPTS
 
 
+@pytest.fixture(scope="function")
+def test_config(monkeypatch):
+    """ConfigurationHandler'ı .env dosyasına bakmadan configurations/test.ini ile yükler."""
+    import configparser
+    from pathlib import Path
+    from miniflow.utils.handlers.configuration_handler import ConfigurationHandler
+
+    parser = configparser.ConfigParser()
+    parser.read(os.path.join(PROJECT_ROOT, 'configurations', 'test.ini'))
+    monkeypatch.setattr(ConfigurationHandler, "_parser", parser)
+    monkeypatch.setattr(ConfigurationHandler, "_config_dir", Path(PROJECT_ROOT) / "configurations")
+    monkeypatch.setattr(ConfigurationHandler, "_initialized", True)
+    return ConfigurationHandler
+
+
 # ==============================================================================
 # DATABASE TEST FIXTURES
 # ==============================================================================
 
+@pytest.fixture(scope="function")
+def memory_session():
+    """In-memory SQLite session factory: memory_session(*models, seed=None) -> Session.
+
+    Her çağrı ayrı bir engine açar; verilen modellerin tablolarını (model verilmezse tüm tabloları) oluşturur
+    ve seed(session) ile doldurur (flush / commit seed'e bırakılır). Session'lar ve engine'ler test sonunda kapatılır.
+
+    Examples:
+        >>> @pytest.fixture
+        ... def session(memory_session):
+        ...     return memory_session(ApiKey, seed=_seed)
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+    from miniflow.models import Base
+
+    opened = []
+
+    def factory(*models, seed=None):
+        engine = create_engine("sqlite://")
+        if models:
+            for model in models:
+                model.__table__.create(engine)
+        else:
+            Base.metadata.create_all(engine)
+        session = Session(engine)
+        opened.append((engine, session))
+        if seed is not None:
+            seed(session)
+        return session
+
+    yield factory
+    for engine, session in opened:
+        session.close()
+        engine.dispose()
+
+
 @pytest.fixture(scope="function")
 def test_db_setup():
     """Setup test database and return session."""
@@ -0,0 +1,179 @@
+"""
+TEST 1: Request Session Testleri
+================================
+
+Bu test, istek boyunca paylaşılan session'ı (request_session_scope) doğrular:
+1. Scope içinde with_readonly_session / with_transaction servisleri aynı session'ı kullanır
+   (tek connection checkout, tek commit)
+2. Hata fırlatan with_transaction çağrısı sadece kendi değişikliklerini geri alır (SAVEPOINT)
+3. Scope hata ile kapanırsa tüm değişiklikler rollback edilir
+4. run_after_commit hook'ları SAVEPOINT release'inde değil scope commit'inde çalışır; rollback edilen
+   SAVEPOINT'in veya scope'un hook'ları düşer
+5. Scope dışında ve isolation_level verilen decorator'larda her çağrı kendi session'ını açar
+
+NOT: Bu testler DatabaseManager'ı get_sqlite_config ile geçici bir SQLite dosyasına kurar; uygulamanın
+SQLite engine'i (pysqlite transaction yönetimi dahil) olduğu gibi kullanılır.
+"""
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from miniflow.database import (
+    DatabaseManager, get_sqlite_config,
+    request_session_scope, get_request_session, run_after_commit, with_transaction, with_readonly_session
+)
+from miniflow.models import Workflow
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """Uygulamanın kullandığı DatabaseManager / DatabaseEngine kurulumu (dosya tabanlı SQLite)."""
+    manager = DatabaseManager()
+    manager.initialize(get_sqlite_config(str(tmp_path / "request_session")), auto_start=True,
+                       create_tables=True, force_reinitialize=True)
+    with manager.engine.session_context() as session:
+        session.add(Workflow(id="WFL-1", workspace_id="WSP-1", name="first"))
+        session.add(Workflow(id="WFL-2", workspace_id="WSP-1", name="second"))
+
+    # Açılan session sayısı
+    manager.sessions = 0
+    session_factory = manager.engine._session_factory
+
+    def counting_factory(**kwargs):
+        manager.sessions += 1
+        return session_factory(**kwargs)
+
+    monkeypatch.setattr(manager.engine, "_session_factory", counting_factory)
+    yield manager
+    manager.reset()
+
+
+@pytest.fixture
+def counters(manager):
+    counts = {"checkouts": 0, "commits": 0}
+    event.listen(manager.engine._engine.pool, "checkout", lambda *args: counts.__setitem__("checkouts", counts["checkouts"] + 1))
+    event.listen(manager.engine._engine, "commit", lambda conn: counts.__setitem__("commits", counts["commits"] + 1))
+    return counts
+
+
+@with_readonly_session(manager=None)
+def _get_name(session, *, workflow_id):
+    return session.get(Workflow, workflow_id).name, session
+
+
+@with_transaction(manager=None)
+def _rename(session, *, workflow_id, name, fail=False, on_commit=None):
+    session.get(Workflow, workflow_id).name = name
+    session.flush()
+    if on_commit is not None:
+        run_after_commit(session, on_commit)
+    if fail:
+        raise ValueError("rename failed")
+    return session
+
+
+@with_transaction(isolation_level="SERIALIZABLE", manager=None)
+def _rename_serializable(session, *, workflow_id, name):
+    session.get(Workflow, workflow_id).name = name
+    return session
+
+
+def _names(manager):
+    with Session(manager.engine._engine) as session:
+        return {w.id: w.name for w in session.query(Workflow)}
+
+
+class TestRequestScope:
+
+    def test_services_share_one_session_and_commit_once(self, manager, counters):
+        with request_session_scope(manager) as scope_session:
+            name, read_session = _get_name(workflow_id="WFL-1")
+            write_session = _rename(workflow_id="WFL-1", name="renamed")
+            _rename(workflow_id="WFL-2", name="renamed too")
+
+        assert name == "first"
+        assert read_session is scope_session and write_session is scope_session
+        assert manager.sessions == 1
+        assert counters == {"checkouts": 1, "commits": 1}
+        assert _names(manager) == {"WFL-1": "renamed", "WFL-2": "renamed too"}
+
+    def test_failed_transaction_rolls_back_only_its_changes(self, manager):
+        with request_session_scope(manager):
+            _rename(workflow_id="WFL-1", name="renamed")
+            with pytest.raises(ValueError):
+                _rename(workflow_id="WFL-2", name="lost", fail=True)
+
+        assert _names(manager) == {"WFL-1": "renamed", "WFL-2": "second"}
+
+    def test_failed_request_rolls_back_everything(self, manager):
+        committed = []
+        with pytest.raises(RuntimeError):
+            with request_session_scope(manager):
+                _rename(workflow_id="WFL-1", name="renamed")
+                raise RuntimeError("endpoint failed")
+
+        assert _names(manager) == {"WFL-1": "first", "WFL-2": "second"}
+
+    def test_after_commit_hooks_wait_for_request_commit(self, manager):
+        committed = []
+        with request_session_scope(manager):
+            _rename(workflow_id="WFL-1", name="renamed", on_commit=lambda: committed.append("WFL-1"))
+            _rename(workflow_id="WFL-2", name="renamed too", on_commit=lambda: committed.append("WFL-2"))
+            # SAVEPOINT'ler release edildi, request henüz commit edilmedi
+            assert committed == []
+
+        assert committed == ["WFL-1", "WFL-2"]
+
+    def test_failed_transaction_drops_its_hooks(self, manager):
+        committed = []
+        with request_session_scope(manager):
+            _rename(workflow_id="WFL-1", name="renamed", on_commit=lambda: committed.append("WFL-1"))
+            with pytest.raises(ValueError):
+                _rename(workflow_id="WFL-2", name="lost", fail=True, on_commit=lambda: committed.append("WFL-2"))
+
+        assert committed == ["WFL-1"]
+
+    def test_rollback_after_nested_write_runs_no_hooks(self, manager):
+        committed = []
+        with pytest.raises(RuntimeError):
+            with request_session_scope(manager):
+                _rename(workflow_id="WFL-1", name="renamed", on_commit=lambda: committed.append("WFL-1"))
+                raise RuntimeError("endpoint failed")
+
+        assert committed == []
+
+        # Düşen hook'lar aynı session'ın sonraki commit'lerinde de çalışmaz
+        with request_session_scope(manager):
+            _rename(workflow_id="WFL-2", name="renamed", on_commit=lambda: committed.append("WFL-2"))
+
+        assert committed == ["WFL-2"]
+
+    def test_nested_scope_reuses_session(self, manager, counters):
+        with request_session_scope(manager) as outer:
+            with request_session_scope(manager) as inner:
+                _rename(workflow_id="WFL-1", name="renamed")
+
+            assert inner is outer
+            assert counters["commits"] == 0
+
+        assert counters["commits"] == 1
+        assert get_request_session() is None
+
+
+class TestWithoutRequestScope:
+
+    def test_each_call_opens_its_own_session(self, manager):
+        _, read_session = _get_name(workflow_id="WFL-1")
+        write_session = _rename(workflow_id="WFL-1", name="renamed")
+
+        assert read_session is not write_session
+        assert manager.sessions == 2
+        assert _names(manager)["WFL-1"] == "renamed"
+
+    def test_isolation_level_opens_its_own_session(self, manager):
+        with request_session_scope(manager) as scope_session:
+            session = _rename_serializable(workflow_id="WFL-1", name="renamed")
+
+        assert session is not scope_session
+        assert manager.sessions == 2
@@ -0,0 +1,114 @@
+"""
+TEST 10: Engine Autoscaler Testleri
+===================================
+
+Bu test, IO-Bound lane'in worker process sayısını yük altında ayarlamasını doğrular:
+1. Lane doluyken backlog veya p95 kuyruk bekleme eşiği aşılınca process eklenir
+2. max_process_count'a ulaşıldığında büyüme durur
+3. Backlog yokken idle_retire_seconds boyunca boş kalan process kapatılır, minimumun altına inilmez
+4. Kuyruk bekleme süresi item'ın enqueued_at değerinden ölçülür
+
+NOT: Bu testler worker process başlatmaz, process kayıtları taklit edilir.
+"""
+
+import time
+from multiprocessing import Value
+
+from miniflow.engine.engine.type_controller import TypeController
+
+
+class FakePipe:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, data):
+        self.sent.append(data)
+
+
+def _fake_process(name, busy=False):
+    return {'name': name, 'pid': 0, 'process': None, 'cmd_pipe': FakePipe(), 'health_pipe': FakePipe(),
+            'slots': Value('i', 1 if busy else 0), 'module_cache': {}, 'idle_since': time.monotonic()}
+
+
+def _make_controller(monkeypatch, backlog=0, max_process_count=3, idle_retire_seconds=60.0):
+    controller = TypeController(output_queue=None, os=True, process_count=1, task_limit=1,
+                                controller_type="IO-Bound", max_process_count=max_process_count,
+                                scale_up_queue_wait=0.5, scale_up_backlog=10,
+                                idle_retire_seconds=idle_retire_seconds, backlog_provider=lambda: backlog)
+    controller.active_processes.append(_fake_process("IO-Bound-0", busy=True))
+
+    def new_process():
+        proc_dict = _fake_process(f"IO-Bound-{len(controller.active_processes)}")
+        controller.active_processes.append(proc_dict)
+        return proc_dict
+
+    def retire_process(proc_dict):
+        if proc_dict['slots'].value > 0:
+            return False
+        controller.active_processes.remove(proc_dict)
+        return True
+
+    monkeypatch.setattr(controller, "new_process", new_process)
+    monkeypatch.setattr(controller, "_retire_process", retire_process)
+    return controller
+
+
+class TestEngineAutoscaler:
+
+    def test_scales_up_on_backlog(self, monkeypatch):
+        controller = _make_controller(monkeypatch, backlog=25)
+
+        assert controller._autoscale_step() == "scale_up"
+        assert len(controller.active_processes) == 2
+
+    def test_scales_up_on_queue_wait(self, monkeypatch):
+        controller = _make_controller(monkeypatch, backlog=0)
+        for _ in range(20):
+            controller.record_queue_wait({"enqueued_at": time.time() - 2.0})
+
+        assert controller.queue_wait_p95() >= 1.9
+        assert controller._autoscale_step() == "scale_up"
+
+    def test_no_scale_up_with_free_slot(self, monkeypatch):
+        controller = _make_controller(monkeypatch, backlog=25)
+        controller.active_processes[0]['slots'].value = 0
+
+        assert controller._autoscale_step() is None
+        assert len(controller.active_processes) == 1
+
+    def test_scale_up_stops_at_max(self, monkeypatch):
+        controller = _make_controller(monkeypatch, backlog=25, max_process_count=2)
+        controller.active_processes.append(_fake_process("IO-Bound-1", busy=True))
+
+        assert controller._autoscale_step() is None
+        assert len(controller.active_processes) == 2
+
+    def test_idle_process_retired_down_to_minimum(self, monkeypatch):
+        controller = _make_controller(monkeypatch, backlog=0, idle_retire_seconds=0.05)
+        controller.active_processes[0]['slots'].value = 0
+        controller.active_processes.append(_fake_process("IO-Bound-1"))
+
+        # Henüz yeterince uzun süre boş kalmadı
+        controller.active_processes[1]['idle_since'] = time.monotonic()
+        assert controller._autoscale_step() is None
+
+        time.sleep(0.1)
+        assert controller._autoscale_step() == "retire"
+        assert [p['name'] for p in controller.active_processes] == ["IO-Bound-0"]
+
+        time.sleep(0.1)
+        assert controller._autoscale_step() is None
+        assert len(controller.active_processes) == 1
+
+    def test_busy_process_not_retired(self, monkeypatch):
+        controller = _make_controller(monkeypatch, backlog=0, idle_retire_seconds=0.0)
+        controller.active_processes.append(_fake_process("IO-Bound-1", busy=True))
+
+        assert controller._autoscale_step() is None
+        assert len(controller.active_processes) == 2
+
+    def test_item_without_enqueued_at_is_ignored(self, monkeypatch):
+        controller = _make_controller(monkeypatch)
+        controller.record_queue_wait({"execution_id": "EXE-1"})
+
+        assert controller.queue_wait_p95() == 0.0
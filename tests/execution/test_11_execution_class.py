@@ -0,0 +1,109 @@
+"""
+TEST 11: Execution Sınıfı (CPU-Bound / IO-Bound) Testleri
+=========================================================
+
+Bu test, node'ların engine lane'ine yönlendirilmesini doğrular:
+1. Script metadata'sında beyan edilen execution_class önceliklidir
+2. Beyan yoksa execution input "auto" olarak yazılır; lane context oluşturulurken ölçülen cpu_percent
+   geçmişinden öğrenilen sınıfa çevrilir (resolve)
+3. Çok kısa süren task'lar CPU-Bound sayılmaz
+4. Input handler payload'a context'teki process_type'ı koyar
+5. CPU-Bound lane çekirdek sayısına göre çok process'li kurulur
+
+NOT: Bu testler worker process başlatmaz.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from miniflow.core.logger import get_logger
+from miniflow.engine.engine.process_controller import ProcessController
+from miniflow.handlers.execution_input_handler import ExecutionInputHandler
+from miniflow.services._0_internal_services import ExecutionClassifier
+
+
+@pytest.fixture(autouse=True)
+def clean_usage():
+    # Eşikler sadece ExecutionClassifier.load_config() ile okunur; testler varsayılanlarla çalışır
+    ExecutionClassifier._usage.clear()
+    yield
+    ExecutionClassifier._usage.clear()
+
+
+def _script(path, metadata=None):
+    return SimpleNamespace(file_path=path, script_metadata=metadata)
+
+
+def _record(path, cpu_percent, cpu_time_seconds=1.0, times=1):
+    for _ in range(times):
+        ExecutionClassifier.record_usage({"script_path": path, "cpu_percent": cpu_percent,
+                                          "cpu_time_seconds": cpu_time_seconds})
+
+
+class TestExecutionClassifier:
+
+    def test_declared_class_wins(self):
+        _record("/scripts/a.py", 5.0, times=10)
+
+        assert ExecutionClassifier.classify(_script("/scripts/a.py", {"execution_class": "CPU"})) == "cb"
+        assert ExecutionClassifier.classify(_script("/scripts/b.py", {"execution_class": "io"})) == "iob"
+
+    def test_undeclared_class_defaults_to_io_bound(self):
+        assert ExecutionClassifier.classify(_script("/scripts/new.py")) == "auto"
+        # CustomScript'te script_metadata alanı yok
+        assert ExecutionClassifier.classify(SimpleNamespace(file_path="/scripts/custom.py")) == "auto"
+        assert ExecutionClassifier.resolve("auto", "/scripts/new.py") == "iob"
+        assert ExecutionClassifier.resolve(None, None) == "iob"
+
+    def test_learns_cpu_bound_after_min_samples(self):
+        path = "/scripts/heavy.py"
+        _record(path, 98.0, times=ExecutionClassifier.min_samples - 1)
+        assert ExecutionClassifier.resolve(ExecutionClassifier.classify(_script(path)), path) == "iob"
+
+        _record(path, 98.0)
+        assert ExecutionClassifier.resolve(ExecutionClassifier.classify(_script(path)), path) == "cb"
+
+    def test_declared_class_is_not_overridden_by_learning(self):
+        path = "/scripts/heavy.py"
+        _record(path, 98.0, times=ExecutionClassifier.min_samples)
+
+        assert ExecutionClassifier.resolve("iob", path) == "iob"
+        assert ExecutionClassifier.resolve("auto", path) == "cb"
+
+    def test_short_tasks_are_not_cpu_bound(self):
+        path = "/scripts/tiny.py"
+        _record(path, 100.0, cpu_time_seconds=0.001, times=5)
+
+        assert ExecutionClassifier.learned_class(path) == "iob"
+
+    def test_prepare_payloads_uses_context_process_type(self):
+        contexts = {
+            "EXI-1": {"script_path": "/scripts/heavy.py", "execution_id": "EXE-1", "node_id": "NOD-1",
+                      "params": {}, "process_type": "cb"},
+            "EXI-2": {"script_path": "/scripts/io.py", "execution_id": "EXE-1", "node_id": "NOD-2", "params": {}},
+        }
+
+        payloads, ids = ExecutionInputHandler._prepare_payloads(contexts)
+
+        assert ids == ["EXI-1", "EXI-2"]
+        assert [p["process_type"] for p in payloads] == ["cb", "iob"]
+
+
+class TestCpuBoundLane:
+
+    def test_cb_lane_sized_by_config(self):
+        controller = ProcessController(output_queue=None, input_queue=None, logger=get_logger(__name__),
+                                       iob_task_limit=4, cb_task_limit=1, os=True, cb_processes=3,
+                                       cb_cpu_affinity=True)
+
+        assert controller.cb_controller.process_count == 3
+        assert controller.cb_controller.cpu_affinity
+        assert controller.cb_controller.task_limit == 1
+
+    def test_pick_core_cycles_allowed_cores(self):
+        from miniflow.engine.engine.type_controller import TypeController
+
+        cores = {TypeController._pick_core(seq) for seq in range(64)}
+        assert cores
+        assert all(isinstance(core, int) and core >= 0 for core in cores)
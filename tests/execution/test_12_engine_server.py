@@ -0,0 +1,158 @@
+"""
+TEST 12: Standalone Engine Sunucusu Testleri
+============================================
+
+Bu test, host başına tek engine process'inin Unix socket IPC'sini doğrular:
+1. EngineClient ping/put_items/stats komutları engine'e ulaşır
+2. Aynı socket üzerinde ikinci bir engine başlatılamaz
+3. Önceki process'ten kalan socket dosyası temizlenip yeniden dinlenir
+4. Engine kapalıyken ping False döner
+5. Yanıtı geciken veya gönderildikten sonra kopan istek tekrar gönderilmez (put_items iki kez çalışmaz);
+   yalnızca engine'e ulaşmayan ping/stats isteği yeniden bağlanıp tekrar denenir
+
+NOT: Bu testler worker process başlatmaz, EngineManager taklit edilir.
+"""
+
+import socket
+import time
+
+import pytest
+
+from miniflow.engine.manager.engine_server import EngineServer, EngineClient
+from miniflow.handlers.execution_input_handler import ExecutionInputHandler
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets required")
+
+
+class FakeQueue:
+    def size(self):
+        return 0
+
+
+class FakeEngineManager:
+    def __init__(self, delay: float = 0.0):
+        self.started = True
+        self.process_controller = None
+        self.input_queue = FakeQueue()
+        self.items = []
+        self.delay = delay
+
+    def put_items_bulk(self, items):
+        time.sleep(self.delay)
+        self.items.extend(items)
+        return True
+
+
+class BrokenConnection:
+    """Engine yeniden başlatıldıktan sonra elde kalan, gönderimde kopan bağlantı."""
+
+    def send(self, request):
+        raise BrokenPipeError("engine restarted")
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    return str(tmp_path / "engine.sock")
+
+
+class TestEngineServer:
+
+    def test_client_round_trip(self, socket_path):
+        engine = FakeEngineManager()
+        server = EngineServer(engine, socket_path)
+        success, _ = server.start()
+        assert success
+
+        client = EngineClient(socket_path)
+        try:
+            assert client.ping()
+            assert client.put_items_bulk([{"execution_id": "EXE-1"}, {"execution_id": "EXE-2"}])
+            assert client.put_item({"execution_id": "EXE-3"})
+            assert [item["execution_id"] for item in engine.items] == ["EXE-1", "EXE-2", "EXE-3"]
+            assert client.get_stats()["input_queue_size"] == 0
+        finally:
+            client.close()
+            server.shutdown()
+
+    def test_second_engine_is_rejected(self, socket_path):
+        server = EngineServer(FakeEngineManager(), socket_path)
+        assert server.start()[0]
+        try:
+            success, message = EngineServer(FakeEngineManager(), socket_path).start()
+            assert not success
+            assert "already listening" in message
+        finally:
+            server.shutdown()
+
+    def test_stale_socket_is_replaced(self, socket_path):
+        stale = socket.socket(socket.AF_UNIX)
+        stale.bind(socket_path)
+        stale.close()
+
+        server = EngineServer(FakeEngineManager(), socket_path)
+        assert server.start()[0]
+        try:
+            assert EngineClient(socket_path).ping()
+        finally:
+            server.shutdown()
+
+    def test_ping_without_engine(self, socket_path):
+        assert not EngineClient(socket_path, timeout=0.5).ping()
+
+
+class TestEngineClientRetry:
+
+    def test_slow_reply_is_not_resent(self, socket_path):
+        engine = FakeEngineManager(delay=0.5)
+        server = EngineServer(engine, socket_path)
+        assert server.start()[0]
+
+        client = EngineClient(socket_path, timeout=0.1)
+        try:
+            with pytest.raises(TimeoutError):
+                client.put_items_bulk([{"execution_id": "EXE-1"}])
+            time.sleep(0.6)
+            assert [item["execution_id"] for item in engine.items] == ["EXE-1"]
+
+            # Geç gelen put_items yanıtı sonraki isteğe karışmaz
+            client.timeout = 1.0
+            assert client.get_stats()["input_queue_size"] == 0
+        finally:
+            client.close()
+            server.shutdown()
+
+    def test_undelivered_request_is_retried_except_put_items(self, socket_path):
+        engine = FakeEngineManager()
+        server = EngineServer(engine, socket_path)
+        assert server.start()[0]
+
+        client = EngineClient(socket_path)
+        try:
+            client.conn = BrokenConnection()
+            assert client.ping()
+
+            client.conn = BrokenConnection()
+            with pytest.raises(BrokenPipeError):
+                client.put_items_bulk([{"execution_id": "EXE-1"}])
+            assert engine.items == []
+        finally:
+            client.close()
+            server.shutdown()
+
+    def test_input_handler_does_not_resubmit_after_timeout(self, monkeypatch):
+        calls = []
+
+        class TimingOutEngine:
+            def put_items_bulk(self, payloads):
+                calls.append(payloads)
+                raise TimeoutError("Engine did not respond")
+
+        monkeypatch.setattr(ExecutionInputHandler, "_engine_manager", TimingOutEngine())
+        monkeypatch.setattr(ExecutionInputHandler, "retry_delay", 0.0)
+
+        with pytest.raises(TimeoutError):
+            ExecutionInputHandler._submit_to_engine([{"execution_id": "EXE-1"}])
+        assert len(calls) == 1
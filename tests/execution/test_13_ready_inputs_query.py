@@ -0,0 +1,115 @@
+"""
+TEST 13: Hazır Execution Input Sorgusu ve Claim Testleri
+========================================================
+
+Bu test, input handler'ın her poll'da çalıştırdığı seçim sorgusunu doğrular:
+1. Seçim SQL tarafında LIMIT ile yapılır
+2. Önce priority, aynı priority içinde en eski created_at (aging) gelir
+3. Bağımlılığı olan, retry hakkı biten ve silinmiş input'lar seçilmez
+4. Sorgu idx_execution_input_ready_sorted index'i ile sıralama adımı olmadan çalışır
+5. wait_factor kolon değil, created_at'ten hesaplanır
+6. Aynı anda poll eden handler'lar aynı input'u claim edemez, süresi dolan veya bırakılan claim tekrar alınır
+
+NOT: Bu testler yalnızca execution_inputs tablosunu in-memory SQLite'ta oluşturur.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from miniflow.database import RepositoryRegistry
+from miniflow.models import ExecutionInput
+
+
+@pytest.fixture
+def session(memory_session):
+    return memory_session(ExecutionInput)
+
+
+_base_time = datetime.now(timezone.utc) - timedelta(hours=1)
+
+
+def _add(session, input_id, *, priority=0, age_minutes=0, dependency_count=0, retry_count=0, is_deleted=False):
+    session.add(ExecutionInput(
+        id=input_id, execution_id="EXE-1", workflow_id="WFL-1", workspace_id="WSP-1", node_id=None,
+        node_name=input_id, script_name="script", script_path="/scripts/script.py",
+        priority=priority, dependency_count=dependency_count, retry_count=retry_count, max_retries=3,
+        is_deleted=is_deleted, created_at=_base_time - timedelta(minutes=age_minutes)
+    ))
+
+
+class TestReadyInputsQuery:
+
+    def test_priority_then_oldest_first_with_limit(self, session):
+        _add(session, "EXI-NEW", priority=0, age_minutes=1)
+        _add(session, "EXI-OLD", priority=0, age_minutes=30)
+        _add(session, "EXI-HIGH", priority=5, age_minutes=0)
+        _add(session, "EXI-MID", priority=0, age_minutes=10)
+        session.flush()
+
+        repo = RepositoryRegistry().execution_input_repository()
+        assert repo._get_ready_execution_input_ids(session, limit=3) == ["EXI-HIGH", "EXI-OLD", "EXI-MID"]
+        assert repo._get_ready_execution_input_ids(session, limit=10)[-1] == "EXI-NEW"
+
+    def test_not_ready_inputs_are_skipped(self, session):
+        _add(session, "EXI-READY")
+        _add(session, "EXI-WAITING", dependency_count=1)
+        _add(session, "EXI-EXHAUSTED", retry_count=3)
+        _add(session, "EXI-DELETED", is_deleted=True)
+        session.flush()
+
+        repo = RepositoryRegistry().execution_input_repository()
+        assert repo._get_ready_execution_input_ids(session, limit=10) == ["EXI-READY"]
+
+    def test_query_uses_sorted_index(self, session):
+        repo = RepositoryRegistry().execution_input_repository()
+        query = repo._ready_execution_inputs_query(5, datetime.now(timezone.utc))
+        compiled = str(query.compile(session.get_bind(), compile_kwargs={"literal_binds": True}))
+        plan = " ".join(str(row) for row in session.connection().exec_driver_sql("EXPLAIN QUERY PLAN " + compiled))
+
+        assert "idx_execution_input_ready_sorted" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_wait_factor_is_computed_from_created_at(self, session):
+        _add(session, "EXI-1", age_minutes=1)
+        session.flush()
+
+        execution_input = session.get(ExecutionInput, "EXI-1")
+        assert execution_input.wait_factor >= 60 * 61
+
+
+class TestExecutionInputClaim:
+
+    def test_concurrent_claims_are_disjoint(self, session):
+        for i in range(5):
+            _add(session, f"EXI-{i}", age_minutes=10 - i)
+        session.flush()
+
+        repo = RepositoryRegistry().execution_input_repository()
+        first = repo._claim_ready_execution_inputs(session, limit=3, claim_token="A", lease_seconds=60)
+        second = repo._claim_ready_execution_inputs(session, limit=3, claim_token="B", lease_seconds=60)
+
+        assert first == ["EXI-0", "EXI-1", "EXI-2"]
+        assert second == ["EXI-3", "EXI-4"]
+        assert repo._claim_ready_execution_inputs(session, limit=3, claim_token="C", lease_seconds=60) == []
+
+    def test_expired_claim_is_reclaimed(self, session):
+        _add(session, "EXI-1")
+        session.flush()
+
+        repo = RepositoryRegistry().execution_input_repository()
+        assert repo._claim_ready_execution_inputs(session, limit=1, claim_token="A", lease_seconds=-1) == ["EXI-1"]
+        # Claim eden process çöktü, lease doldu
+        assert repo._claim_ready_execution_inputs(session, limit=1, claim_token="B", lease_seconds=60) == ["EXI-1"]
+
+    def test_released_claim_is_available_again(self, session):
+        _add(session, "EXI-1")
+        session.flush()
+
+        repo = RepositoryRegistry().execution_input_repository()
+        repo._claim_ready_execution_inputs(session, limit=1, claim_token="A", lease_seconds=60)
+
+        # Başka bir token'ın claim'i bırakılamaz
+        assert repo._release_claims(session, execution_input_ids=["EXI-1"], claim_token="B") == 0
+        assert repo._release_claims(session, execution_input_ids=["EXI-1"], claim_token="A") == 1
+        assert repo._claim_ready_execution_inputs(session, limit=1, claim_token="C", lease_seconds=60) == ["EXI-1"]
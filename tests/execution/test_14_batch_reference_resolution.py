@@ -0,0 +1,109 @@
+"""
+TEST 14: Toplu Referans Çözümleme Testleri
+==========================================
+
+Bu test, input handler batch'inin context'lerinin tek session'da oluşturulmasını doğrular:
+1. Referanslar tipe göre toplanır ve her tip tek IN sorgusu ile getirilir
+2. Batch başına sorgu sayısı referans sayısından bağımsızdır
+3. Çözülemeyen input batch'in geri kalanını etkilemez
+4. Başka workspace'e ait kaynak reddedilir
+
+NOT: Bu testler ilgili tabloları in-memory SQLite'ta oluşturur, şifre çözme taklit edilir.
+"""
+
+import pytest
+from sqlalchemy import event
+
+from miniflow.models import ExecutionInput, Execution, ExecutionOutput, Variable, Credential
+from miniflow.models.enums import CredentialType
+from miniflow.services._0_internal_services import ExecutionOutputCache, SchedulerForInputHandler
+from miniflow.services._0_internal_services import scheduler_service
+from miniflow.utils.helpers.secret_cache import SecretCache
+
+
+@pytest.fixture
+def session(memory_session, monkeypatch):
+    monkeypatch.setattr(scheduler_service, "decrypt_data", lambda value: value)
+    # Tip gruplarının configuration dosyasından okunmaması için fallback'ler kullanılır
+    monkeypatch.setattr(scheduler_service.ConfigurationHandler, "ensure_loaded", lambda: None)
+    SecretCache.clear()
+    ExecutionOutputCache.clear()
+
+    return memory_session(ExecutionInput, Execution, ExecutionOutput, Variable, Credential)
+
+
+@pytest.fixture
+def statements(session):
+    executed = []
+    event.listen(session.get_bind(), "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: executed.append(statement))
+    return executed
+
+
+def _create_contexts(session, execution_input_ids):
+    return SchedulerForInputHandler.create_execution_contexts.__wrapped__(
+        SchedulerForInputHandler, session, execution_input_ids)
+
+
+def _seed(session, input_count):
+    session.add(Execution(id="EXE-1", workspace_id="WSP-1", workflow_id="WFL-1",
+                          trigger_data={"user": {"id": 42}}))
+    session.add(ExecutionOutput(id="EXO-1", execution_id="EXE-1", workflow_id="WFL-1", workspace_id="WSP-1",
+                                node_id="NOD-0", status="SUCCESS", result_data={"items": [{"name": "first"}]}))
+    session.add(Variable(id="ENV-1", workspace_id="WSP-1", owner_id="USR-1", key="region", value="eu"))
+    session.add(Variable(id="ENV-2", workspace_id="WSP-2", owner_id="USR-1", key="other", value="x"))
+    session.add(Credential(id="CRD-1", workspace_id="WSP-1", owner_id="USR-1", name="api",
+                           credential_type=CredentialType.API_KEY, credential_data={"api_key": "secret"}))
+
+    for i in range(input_count):
+        session.add(ExecutionInput(
+            id=f"EXI-{i}", execution_id="EXE-1", workflow_id="WFL-1", workspace_id="WSP-1", node_id=f"NOD-{i + 1}",
+            node_name=f"node-{i}", script_name="script", script_path="/scripts/script.py",
+            params={
+                "user_id": {"value": "${trigger:user.id}", "type": "integer"},
+                "first": {"value": "${node:NOD-0.items[0].name}", "type": "string"},
+                "region": {"value": "${value:ENV-1}", "type": "string"},
+                "api_key": {"value": "${credential:CRD-1.api_key}", "type": "string"},
+                "limit": {"value": "10", "type": "integer"},
+            }
+        ))
+    session.flush()
+
+
+class TestBatchReferenceResolution:
+
+    def test_batch_resolves_all_references(self, session):
+        _seed(session, 3)
+
+        contexts = _create_contexts(session, ["EXI-0", "EXI-1", "EXI-2"])
+
+        assert set(contexts) == {"EXI-0", "EXI-1", "EXI-2"}
+        assert contexts["EXI-1"]["params"] == {"user_id": 42, "first": "first", "region": "eu",
+                                               "api_key": "secret", "limit": 10}
+        assert contexts["EXI-1"]["node_id"] == "NOD-2"
+
+    def test_query_count_is_per_reference_kind(self, session, statements):
+        _seed(session, 10)
+
+        statements.clear()
+        contexts = _create_contexts(session, [f"EXI-{i}" for i in range(10)])
+
+        assert len(contexts) == 10
+        # execution_inputs + executions + execution_outputs + variables + credentials
+        assert len(statements) == 5
+
+    def test_failed_input_does_not_break_batch(self, session):
+        _seed(session, 2)
+        session.get(ExecutionInput, "EXI-1").params = {"missing": {"value": "${value:ENV-404}", "type": "string"}}
+        session.flush()
+
+        contexts = _create_contexts(session, ["EXI-0", "EXI-1", "EXI-404"])
+
+        assert list(contexts) == ["EXI-0"]
+
+    def test_foreign_workspace_resource_is_rejected(self, session):
+        _seed(session, 1)
+        session.get(ExecutionInput, "EXI-0").params = {"other": {"value": "${value:ENV-2}", "type": "string"}}
+        session.flush()
+
+        assert _create_contexts(session, ["EXI-0"]) == {}
@@ -0,0 +1,95 @@
+"""
+TEST 15: Çözülmüş Secret Cache Testleri
+=======================================
+
+Bu test, variable/credential decrypt sonuçlarının cache'lenmesini doğrular:
+1. Aynı kayıt ve updated_at için decrypt bir kez çalışır
+2. updated_at değişince veya TTL dolunca değer tekrar çözülür
+3. invalidate() ve LRU eviction tutulan byte'ları sıfırlar
+4. stats() hit/miss/eviction ve hit_rate döndürür
+
+NOT: Bu testler configuration dosyası okumaz, sınıf değerleri doğrudan ayarlanır.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from miniflow.utils.helpers.secret_cache import SecretCache
+
+
+@pytest.fixture(autouse=True)
+def cache(monkeypatch):
+    monkeypatch.setattr(SecretCache, "_initialized", True)
+    monkeypatch.setattr(SecretCache, "enabled", True)
+    monkeypatch.setattr(SecretCache, "max_entries", 2)
+    monkeypatch.setattr(SecretCache, "ttl_seconds", 60.0)
+    SecretCache.clear()
+    yield SecretCache
+    SecretCache.clear()
+
+
+class CountingLoader:
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+_version = datetime(2026, 1, 1)
+
+
+class TestSecretCache:
+
+    def test_decrypts_once_per_version(self):
+        loader = CountingLoader("secret")
+
+        assert SecretCache.get_or_load("variable", "ENV-1", _version, loader) == "secret"
+        assert SecretCache.get_or_load("variable", "ENV-1", _version, loader) == "secret"
+        assert loader.calls == 1
+
+        # Kayıt güncellendi (başka process'te olsa bile updated_at değişir)
+        assert SecretCache.get_or_load("variable", "ENV-1", _version + timedelta(seconds=1), loader) == "secret"
+        assert loader.calls == 2
+
+    def test_expired_entry_is_reloaded(self, monkeypatch):
+        loader = CountingLoader("secret")
+        monkeypatch.setattr(SecretCache, "ttl_seconds", -1.0)
+
+        SecretCache.get_or_load("credential", "CRD-1", _version, loader)
+        SecretCache.get_or_load("credential", "CRD-1", _version, loader)
+
+        assert loader.calls == 2
+
+    def test_invalidate_zeroes_buffer(self):
+        SecretCache.get_or_load("variable", "ENV-1", _version, CountingLoader("secret"))
+        buffer = SecretCache._entries[("variable", "ENV-1")][2]
+
+        SecretCache.invalidate("variable", "ENV-1")
+
+        assert ("variable", "ENV-1") not in SecretCache._entries
+        assert buffer == bytearray(len("secret"))
+
+    def test_lru_eviction_and_stats(self):
+        SecretCache.get_or_load("variable", "ENV-1", _version, CountingLoader("one"))
+        buffer = SecretCache._entries[("variable", "ENV-1")][2]
+        SecretCache.get_or_load("variable", "ENV-2", _version, CountingLoader("two"))
+        SecretCache.get_or_load("variable", "ENV-2", _version, CountingLoader("two"))
+        SecretCache.get_or_load("variable", "ENV-3", _version, CountingLoader("three"))
+
+        assert list(SecretCache._entries) == [("variable", "ENV-2"), ("variable", "ENV-3")]
+        assert buffer == bytearray(3)
+        assert SecretCache.stats() == {"size": 2, "hits": 1, "misses": 3, "evictions": 1, "hit_rate": 0.25}
+
+    def test_disabled_cache_always_loads(self, monkeypatch):
+        monkeypatch.setattr(SecretCache, "enabled", False)
+        loader = CountingLoader("secret")
+
+        SecretCache.get_or_load("variable", "ENV-1", _version, loader)
+        SecretCache.get_or_load("variable", "ENV-1", _version, loader)
+
+        assert loader.calls == 2
+        assert SecretCache.stats()["size"] == 0
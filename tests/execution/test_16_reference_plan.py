@@ -0,0 +1,94 @@
+"""
+TEST 16: Önceden Derlenmiş Referans Planı Testleri
+==================================================
+
+Bu test, ExecutionInput oluşturulurken çıkarılan reference_plan'ı doğrular:
+1. Plan her parametre için tip, id ve ayrılmış path parçalarını içerir
+2. Plan'lı input'larda context oluşturulurken referans string'leri parse edilmez
+3. Plan'sız (eski) input'lar params'tan parse edilerek aynı sonucu verir
+4. Parse edilemeyen referansta plan yazılmaz
+
+NOT: Bu testler ilgili tabloları in-memory SQLite'ta oluşturur.
+"""
+
+import pytest
+
+from miniflow.models import ExecutionInput, Execution, ExecutionOutput, Variable
+from miniflow.services._0_internal_services import SchedulerForInputHandler, RefrenceResolver
+from miniflow.services._0_internal_services import scheduler_service
+
+
+PARAMS = {
+    "user_id": {"value": "${trigger:user.id}", "type": "integer"},
+    "first": {"value": "${node:NOD-0.items[0].name}", "type": "string"},
+    "region": {"value": "${value:ENV-1}", "type": "string"},
+    "retries": {"value": "${static:3}", "type": "integer"},
+    "limit": {"value": "10", "type": "integer"},
+}
+
+
+@pytest.fixture
+def session(memory_session, monkeypatch):
+    monkeypatch.setattr(scheduler_service.ConfigurationHandler, "ensure_loaded", lambda: None)
+
+    return memory_session(ExecutionInput, Execution, ExecutionOutput, Variable, seed=_seed)
+
+
+def _seed(session):
+    session.add(Execution(id="EXE-1", workspace_id="WSP-1", workflow_id="WFL-1",
+                          trigger_data={"user": {"id": 42}}))
+    session.add(ExecutionOutput(id="EXO-1", execution_id="EXE-1", workflow_id="WFL-1", workspace_id="WSP-1",
+                                node_id="NOD-0", status="SUCCESS", result_data={"items": [{"name": "first"}]}))
+    session.add(Variable(id="ENV-1", workspace_id="WSP-1", owner_id="USR-1", key="region", value="eu"))
+
+
+def _add_input(session, input_id, reference_plan):
+    session.add(ExecutionInput(
+        id=input_id, execution_id="EXE-1", workflow_id="WFL-1", workspace_id="WSP-1", node_id="NOD-1",
+        node_name=input_id, script_name="script", script_path="/scripts/script.py",
+        params=PARAMS, reference_plan=reference_plan
+    ))
+    session.flush()
+
+
+def _create_contexts(session, execution_input_ids):
+    return SchedulerForInputHandler.create_execution_contexts.__wrapped__(
+        SchedulerForInputHandler, session, execution_input_ids)
+
+
+class TestReferencePlan:
+
+    def test_compile_reference_plan(self):
+        plan = SchedulerForInputHandler.compile_reference_plan(PARAMS)
+
+        assert plan == [
+            ["user_id", "trigger", None, ["user", "id"], "integer"],
+            ["first", "node", "NOD-0", ["items", "[0]", "name"], "string"],
+            ["region", "value", "ENV-1", [], "string"],
+            ["retries", "static", "3", None, "integer"],
+            ["limit", "static", "10", None, "integer"],
+        ]
+
+    def test_planned_input_is_not_parsed(self, session, monkeypatch):
+        _add_input(session, "EXI-PLAN", SchedulerForInputHandler.compile_reference_plan(PARAMS))
+
+        def fail(*args, **kwargs):
+            raise AssertionError("reference string parsed at context time")
+        monkeypatch.setattr(SchedulerForInputHandler, "_parse_refrence", staticmethod(fail))
+        monkeypatch.setattr(RefrenceResolver, "_resolve_nested_reference", staticmethod(fail))
+
+        contexts = _create_contexts(session, ["EXI-PLAN"])
+
+        assert contexts["EXI-PLAN"]["params"] == {"user_id": 42, "first": "first", "region": "eu",
+                                                  "retries": 3, "limit": 10}
+
+    def test_input_without_plan_gives_same_result(self, session):
+        _add_input(session, "EXI-PLAN", SchedulerForInputHandler.compile_reference_plan(PARAMS))
+        _add_input(session, "EXI-LEGACY", None)
+
+        contexts = _create_contexts(session, ["EXI-PLAN", "EXI-LEGACY"])
+
+        assert contexts["EXI-PLAN"]["params"] == contexts["EXI-LEGACY"]["params"]
+
+    def test_invalid_reference_is_not_compiled(self):
+        assert SchedulerForInputHandler.compile_reference_plan({"x": {"value": "${unknown:1}", "type": "string"}}) is None
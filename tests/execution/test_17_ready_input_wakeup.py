@@ -0,0 +1,142 @@
+"""
+TEST 17: Hazır Input Bildirimi (Wakeup) Testleri
+================================================
+
+Bu test, handler'ların boşta polling yerine bildirimle uyanmasını doğrular:
+1. notify_after_commit() yalnızca commit sonrası bildirir, rollback'te bildirmez
+2. wait() bildirimle True, timeout ile False döner
+3. Input handler boşta max polling aralığını beklemeden bildirimle uyanır
+4. get_execution_results() result gelince timeout'u beklemeden döner
+5. Redis backend'inde bildirim kanala yayınlanır; gelen mesaj ve kopan bağlantı handler'ı uyandırır
+
+NOT: Bu testler configuration dosyası okumaz, Redis bağlantısı açmaz (publish taklit edilir).
+"""
+
+import threading
+import time
+
+import pytest
+
+from miniflow.core.logger import get_logger
+from miniflow.engine.manager.engine_manager import EngineManager
+from miniflow.engine.queue_module import BaseQueue
+from miniflow.handlers.execution_input_handler import ExecutionInputHandler
+from miniflow.models import Variable
+from miniflow.utils.handlers import ConfigurationHandler
+from miniflow.utils.handlers.ready_input_notifier import ReadyInputNotifier
+from miniflow.utils.helpers.cache_invalidation import CacheInvalidationChannel
+
+
+@pytest.fixture(autouse=True)
+def notifier(monkeypatch):
+    monkeypatch.setattr(ReadyInputNotifier, "_initialized", True)
+    monkeypatch.setattr(ReadyInputNotifier, "backend", "local")
+    monkeypatch.setattr(ReadyInputNotifier, "_channel", None)
+    ReadyInputNotifier._event.clear()
+    yield ReadyInputNotifier
+    ReadyInputNotifier._event.clear()
+
+
+@pytest.fixture
+def session(memory_session):
+    return memory_session(Variable)
+
+
+class TestReadyInputWakeup:
+
+    def test_notifies_only_after_commit(self, session):
+        ReadyInputNotifier.notify_after_commit(session)
+        session.add(Variable(id="ENV-1", workspace_id="WSP-1", owner_id="USR-1", key="a", value="1"))
+        session.flush()
+        assert not ReadyInputNotifier._event.is_set()
+        session.rollback()
+        assert not ReadyInputNotifier._event.is_set()
+
+        ReadyInputNotifier.notify_after_commit(session)
+        session.add(Variable(id="ENV-2", workspace_id="WSP-1", owner_id="USR-1", key="b", value="2"))
+        session.commit()
+        assert ReadyInputNotifier._event.is_set()
+
+    def test_wait_returns_on_notify(self):
+        assert ReadyInputNotifier.wait(0.01) is False
+
+        ReadyInputNotifier.notify()
+        assert ReadyInputNotifier.wait(1.0) is True
+        # Bildirim tüketildi
+        assert ReadyInputNotifier.wait(0.01) is False
+
+    def test_idle_input_handler_wakes_on_notify(self, monkeypatch):
+        calls = []
+
+        def claim_ready_execution_inputs(**kwargs):
+            calls.append(time.monotonic())
+            return {"ids": [], "count": 0}
+
+        monkeypatch.setattr("miniflow.handlers.execution_input_handler.SchedulerForInputHandler.claim_ready_execution_inputs",
+                            claim_ready_execution_inputs)
+        monkeypatch.setattr(ExecutionInputHandler, "adaptive_polling", False)
+        monkeypatch.setattr(ExecutionInputHandler, "_current_polling_interval", 10.0)
+        monkeypatch.setattr(ExecutionInputHandler, "_shutdown_event", threading.Event())
+        monkeypatch.setattr(ExecutionInputHandler, "_running", True)
+
+        thread = threading.Thread(target=ExecutionInputHandler._main_loop, daemon=True)
+        thread.start()
+        try:
+            deadline = time.monotonic() + 2.0
+            while not calls and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert len(calls) == 1
+
+            notified_at = time.monotonic()
+            ReadyInputNotifier.notify()
+            deadline = notified_at + 2.0
+            while len(calls) < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert len(calls) >= 2
+            assert calls[1] - notified_at < 1.0
+        finally:
+            ExecutionInputHandler._shutdown_event.set()
+            ReadyInputNotifier.wake()
+            thread.join(timeout=2.0)
+
+    def test_get_execution_results_returns_when_result_arrives(self):
+        class FakeProcessController:
+            def is_late_result(self, item):
+                return item.get("node_id") == "NOD-LATE"
+
+        manager = object.__new__(EngineManager)
+        manager.started = True
+        manager.logger = get_logger("execution_engine")
+        manager.output_queue = BaseQueue(maxsize=10)
+        manager.process_controller = FakeProcessController()
+
+        threading.Timer(0.1, manager.output_queue.put, args=({"node_id": "NOD-LATE"},)).start()
+        threading.Timer(0.1, manager.output_queue.put, args=({"node_id": "NOD-1"},)).start()
+
+        started = time.monotonic()
+        results = []
+        while not results and time.monotonic() - started < 2.0:
+            results = manager.get_execution_results(max_items=10, timeout=5.0)
+        elapsed = time.monotonic() - started
+
+        assert [item["node_id"] for item in results] == ["NOD-1"]
+        assert elapsed < 2.0
+
+    def test_redis_backend_publishes_and_wakes_on_channel_events(self, monkeypatch):
+        published = []
+        monkeypatch.setattr(ReadyInputNotifier, "_initialized", False)
+        monkeypatch.setattr(ConfigurationHandler, "ensure_loaded", lambda: None)
+        monkeypatch.setattr(ConfigurationHandler, "get",
+                            lambda section, key, fallback=None: "redis" if key == "input_handler_wakeup_backend" else fallback)
+        monkeypatch.setattr(CacheInvalidationChannel, "publish", lambda self, message: published.append((self.channel, message)))
+
+        ReadyInputNotifier.notify()
+        assert published == [("miniflow:ready_inputs", "1")]
+        assert ReadyInputNotifier.wait(0.01) is True
+
+        channel = ReadyInputNotifier._channel
+        channel._handle(b"1")
+        assert ReadyInputNotifier.wait(0.01) is True
+        channel._on_disconnect()
+        assert ReadyInputNotifier.wait(0.01) is True
@@ -0,0 +1,143 @@
+"""
+TEST 18: Output Handler Group Commit Testleri
+=============================================
+
+Bu test, engine result batch'inin tek transaction'da işlenmesini doğrular:
+1. Aynı hedefe giden tamamlanan node'lar dependency'yi doğru sayıda azaltır, output'lar toplu eklenir
+2. Hatalı result'lar batch'in geri kalanını etkilemez
+3. FAILED result execution'ı sonlandırır, sonraki result'lar atlanır
+4. Son node execution'ı COMPLETED yapar ve output'ları sonuçlara taşır
+5. Batch transaction'ı başarısız olursa output handler result'ları tek tek işler
+6. Node çıktıları ExecutionOutputCache'e transaction commit edildikten sonra yazılır; rollback'te yazılmaz
+
+NOT: Bu testler ilgili tabloları in-memory SQLite'ta oluşturur.
+"""
+
+import pytest
+from sqlalchemy import select
+
+from miniflow.handlers.execution_output_handler import ExecutionOutputHandler
+from miniflow.models import ExecutionInput, Execution, ExecutionOutput, Edge
+from miniflow.models.enums import ExecutionStatus
+from miniflow.services._0_internal_services import ExecutionGraph, ExecutionOutputCache, SchedulerForOutputHandler
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    ExecutionGraph.clear()
+    ExecutionOutputCache.clear()
+    yield
+    ExecutionGraph.clear()
+    ExecutionOutputCache.clear()
+
+
+@pytest.fixture
+def session(memory_session):
+    return memory_session(ExecutionInput, Execution, ExecutionOutput, Edge, seed=_seed)
+
+
+def _seed(session):
+    # NOD-A -> NOD-B, NOD-A -> NOD-C, NOD-B -> NOD-D, NOD-C -> NOD-D
+    for edge_id, from_node, to_node in (("EDG-1", "NOD-A", "NOD-B"), ("EDG-2", "NOD-A", "NOD-C"),
+                                        ("EDG-3", "NOD-B", "NOD-D"), ("EDG-4", "NOD-C", "NOD-D")):
+        session.add(Edge(id=edge_id, workflow_id="WFL-1", from_node_id=from_node, to_node_id=to_node))
+    session.add(Execution(id="EXE-1", workspace_id="WSP-1", workflow_id="WFL-1"))
+    for node_id, dependency_count in (("NOD-B", 0), ("NOD-C", 0), ("NOD-D", 2)):
+        session.add(ExecutionInput(
+            id=f"EXI-{node_id[-1]}", execution_id="EXE-1", workflow_id="WFL-1", workspace_id="WSP-1",
+            node_id=node_id, node_name=node_id, script_name="script", script_path="/scripts/script.py",
+            params={}, dependency_count=dependency_count
+        ))
+    session.flush()
+
+
+def _result(node_id, status="SUCCESS", execution_id="EXE-1", **extra):
+    return {"execution_id": execution_id, "node_id": node_id, "status": status,
+            "result_data": {"node": node_id}, **extra}
+
+
+def _process(session, results):
+    return SchedulerForOutputHandler.process_execution_results.__wrapped__(
+        SchedulerForOutputHandler, session, results)
+
+
+class TestOutputGroupCommit:
+
+    def test_grouped_dependency_decrement(self, session):
+        outcomes = _process(session, [_result("NOD-B"), _result("NOD-C")])
+
+        assert [outcome["is_last_node"] for outcome in outcomes] == [False, False]
+        assert session.get(ExecutionInput, "EXI-D").dependency_count == 0
+        outputs = session.execute(select(ExecutionOutput)).scalars().all()
+        assert {output.node_id for output in outputs} == {"NOD-B", "NOD-C"}
+        assert {outcome["execution_output_id"] for outcome in outcomes} == {output.id for output in outputs}
+
+    def test_invalid_results_are_isolated(self, session):
+        outcomes = _process(session, [
+            _result("NOD-B", status="UNKNOWN"),
+            _result("NOD-B", execution_id="EXE-404"),
+            {"execution_id": "EXE-1", "status": "SUCCESS"},
+            _result("NOD-C"),
+        ])
+
+        assert [bool(outcome.get("error")) for outcome in outcomes] == [True, True, True, False]
+        assert session.get(ExecutionInput, "EXI-D").dependency_count == 1
+
+    def test_failed_result_finalizes_execution(self, session):
+        outcomes = _process(session, [_result("NOD-B"), _result("NOD-C", status="FAILED"), _result("NOD-D")])
+
+        execution = session.get(Execution, "EXE-1")
+        assert outcomes[1] == {"execution_id": "EXE-1", "status": "FAILED", "processed": True}
+        assert "error" in outcomes[2]
+        assert execution.status == ExecutionStatus.FAILED
+        assert execution.results["NOD-B"]["status"] == "SUCCESS"
+        assert execution.results["NOD-C"]["status"] == ExecutionStatus.CANCELLED.value
+        assert session.execute(select(ExecutionInput)).scalars().all() == []
+        assert session.execute(select(ExecutionOutput)).scalars().all() == []
+
+    def test_last_node_completes_execution(self, session):
+        outcomes = _process(session, [_result("NOD-D")])
+
+        execution = session.get(Execution, "EXE-1")
+        assert outcomes[0]["execution_completed"] is True
+        assert execution.status == ExecutionStatus.COMPLETED
+        assert execution.results["NOD-D"]["result_data"] == {"node": "NOD-D"}
+        assert session.execute(select(ExecutionOutput)).scalars().all() == []
+
+    def test_handler_falls_back_to_individual_processing(self, monkeypatch):
+        processed = []
+
+        def fail_batch(**kwargs):
+            raise RuntimeError("database is locked")
+
+        monkeypatch.setattr(ExecutionOutputHandler, "group_commit", True)
+        monkeypatch.setattr(ExecutionOutputHandler, "parallel_processing", False)
+        monkeypatch.setattr(SchedulerForOutputHandler, "process_execution_results", fail_batch)
+        monkeypatch.setattr(SchedulerForOutputHandler, "process_execution_result",
+                            lambda result: processed.append(result["node_id"]))
+
+        ExecutionOutputHandler._process_results_batch([_result("NOD-B"), _result("NOD-C")])
+
+        assert processed == ["NOD-B", "NOD-C"]
+
+
+class TestOutputCacheCommit:
+
+    def test_outputs_are_cached_after_commit(self, session, test_config):
+        pairs = [("EXE-1", "NOD-B"), ("EXE-1", "NOD-C")]
+        _process(session, [_result("NOD-B"), _result("NOD-C")])
+
+        assert ExecutionOutputCache.get_many(pairs) == {}
+        # Aynı transaction kendi çıktılarını görür
+        assert ExecutionOutputCache.get_many(pairs, session) == {pair: {"node": pair[1]} for pair in pairs}
+
+        session.commit()
+        assert ExecutionOutputCache.get_many(pairs) == {pair: {"node": pair[1]} for pair in pairs}
+
+    def test_rolled_back_outputs_are_not_cached(self, session):
+        pairs = [("EXE-1", "NOD-B")]
+        _process(session, [_result("NOD-B")])
+        session.rollback()
+
+        assert ExecutionOutputCache.get_many(pairs) == {}
+        assert ExecutionOutputCache.get_many(pairs, session) == {}
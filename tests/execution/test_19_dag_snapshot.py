@@ -0,0 +1,145 @@
+"""
+TEST 19: Execution DAG Snapshot Testleri
+========================================
+
+Bu test, execution başında alınan graf görüntüsünün kullanılmasını doğrular:
+1. Snapshot successor, in-degree ve terminal node'ları hesaplar, değiştirilemez
+2. Output handler execution sırasında yapılan edge değişikliklerinden etkilenmez
+3. Snapshot'lar execution başına LRU cache'te tutulur ve execution bitince çıkarılır;
+   cache boyutu handler başlangıcında yüklenir, snapshot okunurken config'e bakılmaz
+4. Snapshot'ı olmayan eski execution'lar güncel edge'lerden snapshot oluşturur
+
+NOT: Bu testler ilgili tabloları in-memory SQLite'ta oluşturur.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from miniflow.models import ExecutionInput, Execution, ExecutionOutput, Edge
+from miniflow.models.enums import ExecutionStatus
+from miniflow.services._0_internal_services import DagSnapshot, ExecutionGraph, SchedulerForOutputHandler
+from miniflow.utils.handlers.configuration_handler import ConfigurationHandler
+
+
+def _edge(from_node, to_node):
+    return SimpleNamespace(from_node_id=from_node, to_node_id=to_node)
+
+
+# NOD-A -> NOD-B, NOD-A -> NOD-C, NOD-B -> NOD-D, NOD-C -> NOD-D
+SNAPSHOT = ExecutionGraph.build_snapshot(
+    ["NOD-A", "NOD-B", "NOD-C", "NOD-D"],
+    [_edge("NOD-A", "NOD-B"), _edge("NOD-A", "NOD-C"), _edge("NOD-B", "NOD-D"), _edge("NOD-C", "NOD-D")]
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_graph_cache():
+    ExecutionGraph.clear()
+    yield
+    ExecutionGraph.clear()
+
+
+@pytest.fixture
+def session(memory_session):
+    return memory_session(ExecutionInput, Execution, ExecutionOutput, Edge, seed=_seed)
+
+
+def _seed(session):
+    session.add(Execution(id="EXE-1", workspace_id="WSP-1", workflow_id="WFL-1", dag_snapshot=SNAPSHOT.to_dict()))
+    for node_id, dependency_count in (("NOD-B", 1), ("NOD-C", 1), ("NOD-D", 2)):
+        session.add(ExecutionInput(
+            id=f"EXI-{node_id[-1]}", execution_id="EXE-1", workflow_id="WFL-1", workspace_id="WSP-1",
+            node_id=node_id, node_name=node_id, script_name="script", script_path="/scripts/script.py",
+            params={}, dependency_count=dependency_count
+        ))
+    session.flush()
+
+
+def _process(session, result):
+    return SchedulerForOutputHandler.process_execution_result.__wrapped__(SchedulerForOutputHandler, session, result)
+
+
+def _result(node_id):
+    return {"execution_id": "EXE-1", "node_id": node_id, "status": "SUCCESS", "result_data": {}}
+
+
+class TestDagSnapshot:
+
+    def test_adjacency(self):
+        assert SNAPSHOT.successors("NOD-A") == ("NOD-B", "NOD-C")
+        assert SNAPSHOT.successors("NOD-D") == ()
+        assert SNAPSHOT.in_degree("NOD-D") == 2
+        assert SNAPSHOT.in_degree("NOD-A") == 0
+        assert SNAPSHOT.terminal_nodes == frozenset({"NOD-D"})
+        assert DagSnapshot(SNAPSHOT.to_dict()["successors"]).successors("NOD-B") == ("NOD-D",)
+
+    def test_snapshot_is_immutable(self):
+        with pytest.raises(AttributeError):
+            SNAPSHOT.extra = True
+        with pytest.raises(TypeError):
+            SNAPSHOT._successors["NOD-X"] = ()
+
+
+class TestExecutionGraph:
+
+    def test_workflow_edits_do_not_affect_running_execution(self, session):
+        # Execution başladıktan sonra eklenen edge snapshot'ta yoktur
+        session.add(Edge(id="EDG-X", workflow_id="WFL-1", from_node_id="NOD-D", to_node_id="NOD-B"))
+        session.flush()
+
+        outcome = _process(session, _result("NOD-A"))
+
+        assert outcome["is_last_node"] is False
+        assert session.get(ExecutionInput, "EXI-B").dependency_count == 0
+        assert session.get(ExecutionInput, "EXI-C").dependency_count == 0
+
+    def test_last_node_completes_and_evicts(self, session):
+        execution = session.get(Execution, "EXE-1")
+        ExecutionGraph.get_snapshot(session, execution)
+        assert "EXE-1" in ExecutionGraph._snapshots
+
+        outcome = _process(session, _result("NOD-D"))
+
+        assert outcome["execution_completed"] is True
+        assert execution.status == ExecutionStatus.COMPLETED
+        assert "EXE-1" not in ExecutionGraph._snapshots
+
+    def test_lru_eviction(self, monkeypatch):
+        monkeypatch.setattr(ExecutionGraph, "max_entries", 2)
+        for execution_id in ("EXE-1", "EXE-2", "EXE-3"):
+            execution = SimpleNamespace(id=execution_id, dag_snapshot=SNAPSHOT.to_dict())
+            assert ExecutionGraph.get_snapshot(None, execution).successors("NOD-A") == ("NOD-B", "NOD-C")
+
+        assert list(ExecutionGraph._snapshots) == ["EXE-2", "EXE-3"]
+
+    def test_get_snapshot_does_not_read_configuration(self, monkeypatch):
+        # Config ExecutionOutputHandler.start sırasında load_config() ile bir kez yüklenir
+        def fail():
+            raise AssertionError("configuration read on the snapshot path")
+
+        monkeypatch.setattr(ConfigurationHandler, "ensure_loaded", fail)
+        execution = SimpleNamespace(id="EXE-1", dag_snapshot=SNAPSHOT.to_dict())
+        assert ExecutionGraph.get_snapshot(None, execution).successors("NOD-A") == ("NOD-B", "NOD-C")
+
+    def test_load_config_reads_max_entries(self, monkeypatch, test_config):
+        monkeypatch.setattr(ExecutionGraph, "max_entries", 2)
+        ExecutionGraph.load_config()
+
+        assert ExecutionGraph.max_entries == 1024
+
+    def test_cache_hit_does_not_reload(self):
+        execution = SimpleNamespace(id="EXE-1", dag_snapshot=SNAPSHOT.to_dict())
+        first = ExecutionGraph.get_snapshot(None, execution)
+        execution.dag_snapshot = None
+
+        assert ExecutionGraph.get_snapshot(None, execution) is first
+
+    def test_legacy_execution_builds_from_edges(self, session):
+        session.add(Edge(id="EDG-1", workflow_id="WFL-1", from_node_id="NOD-A", to_node_id="NOD-B"))
+        session.add(Execution(id="EXE-2", workspace_id="WSP-1", workflow_id="WFL-1"))
+        session.flush()
+
+        snapshot = ExecutionGraph.get_snapshot(session, session.get(Execution, "EXE-2"))
+
+        assert snapshot.successors("NOD-A") == ("NOD-B",)
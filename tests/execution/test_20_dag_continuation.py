@@ -0,0 +1,147 @@
+"""
+TEST 20: DAG Continuation Testleri
+==================================
+
+Bu test, output handler'ın hazır hale gelen sonraki node'ları doğrudan engine'e göndermesini doğrular:
+1. Result batch'i işlenirken hazır olan sonraki node'lar aynı transaction'da claim edilir ve context'leri oluşturulur
+2. ${node:...} referansları ExecutionOutput tablosu okunmadan bellekten çözülür
+3. Tüm bağımlılıkları tamamlanmayan node claim edilmez
+4. Context'i oluşturulamayan input'un claim'i input handler'a bırakılır
+5. Engine'e gönderilemeyen input'ların claim'i bırakılır
+6. Lane'i "auto" olan input'un lane'i context oluşturulurken öğrenilen execution sınıfından belirlenir
+
+NOT: Bu testler ilgili tabloları in-memory SQLite'ta oluşturur.
+"""
+
+import pytest
+from sqlalchemy import event
+
+from miniflow.handlers.execution_input_handler import ExecutionInputHandler
+from miniflow.handlers.execution_output_handler import ExecutionOutputHandler
+from miniflow.models import ExecutionInput, Execution, ExecutionOutput, Edge, Variable
+from miniflow.services._0_internal_services import (
+    ExecutionClassifier,
+    ExecutionGraph,
+    ExecutionOutputCache,
+    SchedulerForOutputHandler,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches(test_config):
+    ExecutionGraph.clear()
+    ExecutionOutputCache.clear()
+    yield
+    ExecutionGraph.clear()
+    ExecutionOutputCache.clear()
+
+
+@pytest.fixture
+def session(memory_session):
+    return memory_session(ExecutionInput, Execution, ExecutionOutput, Edge, Variable, seed=_seed)
+
+
+def _seed(session):
+    # NOD-A -> NOD-B, NOD-A -> NOD-C, NOD-B -> NOD-D, NOD-C -> NOD-D
+    session.add(Execution(id="EXE-1", workspace_id="WSP-1", workflow_id="WFL-1", dag_snapshot={"successors": {
+        "NOD-A": ["NOD-B", "NOD-C"], "NOD-B": ["NOD-D"], "NOD-C": ["NOD-D"], "NOD-D": []
+    }}))
+    params = {
+        "NOD-B": {"name": {"value": "${node:NOD-A.user.name}", "type": "string"}},
+        "NOD-C": {"missing": {"value": "${value:ENV-404}", "type": "string"}},
+        "NOD-D": {"left": {"value": "${node:NOD-B.side}", "type": "string"},
+                  "right": {"value": "${node:NOD-C.side}", "type": "string"}},
+    }
+    for node_id, dependency_count in (("NOD-B", 1), ("NOD-C", 1), ("NOD-D", 2)):
+        session.add(ExecutionInput(
+            id=f"EXI-{node_id[-1]}", execution_id="EXE-1", workflow_id="WFL-1", workspace_id="WSP-1",
+            node_id=node_id, node_name=node_id, script_name="script", script_path="/scripts/script.py",
+            params=params[node_id], dependency_count=dependency_count
+        ))
+    session.flush()
+
+
+def _result(node_id, result_data):
+    return {"execution_id": "EXE-1", "node_id": node_id, "status": "SUCCESS", "result_data": result_data}
+
+
+def _process(session, results):
+    return SchedulerForOutputHandler.process_and_continue_execution_results.__wrapped__(
+        SchedulerForOutputHandler, session, results, 60.0)
+
+
+class TestDagContinuation:
+
+    def test_ready_successors_are_claimed_with_contexts(self, session):
+        statements = []
+        event.listen(session.get_bind(), "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+
+        processed = _process(session, [_result("NOD-A", {"user": {"name": "ada"}})])
+
+        assert list(processed["contexts"]) == ["EXI-B"]
+        assert processed["contexts"]["EXI-B"]["params"] == {"name": "ada"}
+        assert session.get(ExecutionInput, "EXI-B").claimed_by == processed["claim_token"]
+        assert not [s for s in statements if s.lstrip().upper().startswith("SELECT") and "execution_outputs" in s]
+
+    def test_unresolved_context_is_left_to_input_handler(self, session):
+        processed = _process(session, [_result("NOD-A", {"user": {"name": "ada"}})])
+
+        assert "EXI-C" not in processed["contexts"]
+        session.expire_all()
+        execution_input = session.get(ExecutionInput, "EXI-C")
+        assert execution_input.dependency_count == 0
+        assert execution_input.claimed_by is None
+
+    def test_auto_lane_uses_learned_class(self, session, monkeypatch):
+        monkeypatch.setattr(ExecutionClassifier, "_usage", type(ExecutionClassifier._usage)())
+        for _ in range(ExecutionClassifier.min_samples):
+            ExecutionClassifier.record_usage({"script_path": "/scripts/script.py", "cpu_percent": 95.0,
+                                              "cpu_time_seconds": 1.0})
+        session.get(ExecutionInput, "EXI-B").process_type = "auto"
+
+        processed = _process(session, [_result("NOD-A", {"user": {"name": "ada"}})])
+
+        assert processed["contexts"]["EXI-B"]["process_type"] == "cb"
+
+    def test_join_node_waits_for_all_predecessors(self, session):
+        _process(session, [_result("NOD-A", {"user": {"name": "ada"}})])
+
+        processed = _process(session, [_result("NOD-B", {"side": "left"})])
+        assert "EXI-D" not in processed["contexts"]
+
+        processed = _process(session, [_result("NOD-C", {"side": "right"})])
+        assert processed["contexts"]["EXI-D"]["params"] == {"left": "left", "right": "right"}
+
+
+class TestContinuationDispatch:
+
+    def test_output_handler_dispatches_contexts(self, monkeypatch):
+        dispatched = []
+        processed = {"outcomes": [{"execution_id": "EXE-1"}], "contexts": {"EXI-B": {}}, "claim_token": "token"}
+
+        monkeypatch.setattr(ExecutionOutputHandler, "group_commit", True)
+        monkeypatch.setattr(ExecutionOutputHandler, "dag_continuation", True)
+        monkeypatch.setattr(ExecutionInputHandler, "_running", True)
+        monkeypatch.setattr(SchedulerForOutputHandler, "process_and_continue_execution_results",
+                            lambda **kwargs: processed)
+        monkeypatch.setattr(ExecutionInputHandler, "dispatch_contexts",
+                            lambda contexts, claim_token: dispatched.append((contexts, claim_token)))
+
+        ExecutionOutputHandler._process_results_batch([_result("NOD-A", {})])
+
+        assert dispatched == [({"EXI-B": {}}, "token")]
+
+    def test_failed_submission_releases_claims(self, monkeypatch):
+        released = []
+
+        def fail_submit(payloads):
+            raise RuntimeError("engine is down")
+
+        monkeypatch.setattr(ExecutionInputHandler, "_submit_to_engine", fail_submit)
+        monkeypatch.setattr(ExecutionInputHandler, "_release_claims",
+                            lambda ids, claim_token: released.append((ids, claim_token)))
+
+        contexts = {"EXI-B": {"script_path": "/scripts/script.py", "execution_id": "EXE-1", "node_id": "NOD-B"}}
+        assert ExecutionInputHandler.dispatch_contexts(contexts, "token") == 0
+        assert released == [(["EXI-B"], "token")]
@@ -0,0 +1,84 @@
+"""
+TEST 21: Toplu ExecutionInput Oluşturma Testleri
+================================================
+
+Bu test, execution başlatılırken input'ların toplu yazılmasını doğrular:
+1. Tüm node'ların input'ları tek bir INSERT ile yazılır
+2. Dependency sayısı, parametreler, referans planı ve script bilgileri node'lardan doğru kopyalanır
+3. Geçersiz bir node'da hiçbir input yazılmaz
+
+NOT: Bu testler ilgili tabloları in-memory SQLite'ta oluşturur.
+"""
+
+import pytest
+from sqlalchemy import event, select
+
+from miniflow.core.exceptions import InvalidInputError
+from miniflow.models import Workflow, Node, Edge, Script, Execution, ExecutionInput
+from miniflow.services._9_execution_services.execution_managment_service import ExecutionManagementService
+
+NODE_COUNT = 50
+
+
+@pytest.fixture
+def session(memory_session):
+    return memory_session(Workflow, Node, Edge, Script, Execution, ExecutionInput, seed=_seed)
+
+
+def _seed(session):
+    session.add(Workflow(id="WFL-1", workspace_id="WSP-1", name="workflow", priority=4))
+    session.add(Script(id="SCR-1", name="script", category="test", file_path="/scripts/script.py"))
+    # NOD-0 -> NOD-1 -> ... -> NOD-49
+    for i in range(NODE_COUNT):
+        session.add(Node(
+            id=f"NOD-{i}", workflow_id="WFL-1", name=f"node_{i}", script_id="SCR-1",
+            input_params={"message": {"value": f"${{node:NOD-{max(i - 1, 0)}.message}}", "type": "string"}}
+        ))
+        if i:
+            session.add(Edge(id=f"EDG-{i}", workflow_id="WFL-1", from_node_id=f"NOD-{i - 1}", to_node_id=f"NOD-{i}"))
+    session.flush()
+
+
+def _start(session):
+    # @log_function_call ve @with_transaction atlanır, servis test session'ında çalışır
+    return ExecutionManagementService.start_execution_by_workflow.__wrapped__.__wrapped__(
+        ExecutionManagementService, session, workspace_id="WSP-1", workflow_id="WFL-1")
+
+
+class TestBulkExecutionInputs:
+
+    def test_inputs_are_written_with_single_insert(self, session):
+        statements = []
+        event.listen(session.get_bind(), "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+
+        result = _start(session)
+
+        assert result["execution_inputs_count"] == NODE_COUNT
+        assert len([s for s in statements if s.lstrip().upper().startswith("INSERT INTO EXECUTION_INPUTS")]) == 1
+
+    def test_input_fields_are_copied_from_nodes(self, session):
+        result = _start(session)
+
+        inputs = {i.node_id: i for i in session.execute(
+            select(ExecutionInput).where(ExecutionInput.execution_id == result["id"])).scalars()}
+        assert len(inputs) == NODE_COUNT
+        assert len({i.id for i in inputs.values()}) == NODE_COUNT
+        assert all(i.id.startswith("EXI-") for i in inputs.values())
+
+        first, second = inputs["NOD-0"], inputs["NOD-1"]
+        assert first.dependency_count == 0 and second.dependency_count == 1
+        assert second.priority == 4
+        assert second.params == {"message": {"value": "${node:NOD-0.message}", "type": "string"}}
+        assert second.reference_plan
+        assert second.script_path == "/scripts/script.py"
+        assert second.retry_count == 0 and second.created_at is not None
+
+    def test_invalid_node_writes_nothing(self, session):
+        session.get(Node, "NOD-7").script_id = "SCR-404"
+        session.flush()
+
+        with pytest.raises(InvalidInputError):
+            _start(session)
+
+        assert session.execute(select(ExecutionInput)).first() is None
@@ -0,0 +1,196 @@
+"""
+TEST 5: Engine Dispatch Testleri
+================================
+
+Bu test, QueueController'ın batch ve slot-bazlı dağıtım davranışını doğrular:
+1. Input queue'daki item'lar batch olarak alınır
+2. Boş slot yoksa item requeue edilmez, slot boşalması beklenir
+3. Slot boşaldığında bekleyen dispatcher hemen uyanır
+4. Slot'lar worker ile paylaşılan sayaçtan atomik olarak ayrılır
+5. Meşgul worker nedeniyle requeue, task'ın retry hakkını harcamaz
+6. Dolu input queue'nun reddettiği requeue FAILED olarak raporlanır, item kaybolmaz
+7. Dispatch batch'i input queue kapasitesini aşmaz; shutdown'da kalan item'lar ProcessController üzerinden geri konur
+
+NOT: Bu testler worker process başlatmaz, ProcessController taklit edilir.
+"""
+
+import threading
+import time
+from multiprocessing import Value
+
+from miniflow.core.logger import get_logger
+from miniflow.engine.engine import ProcessController, QueueController
+from miniflow.engine.engine.type_controller import TypeController
+from miniflow.engine.queue_module import BaseQueue
+
+
+class FakeProcessController:
+    """Slot sayısı sınırlı, process başlatmayan ProcessController taklidi."""
+
+    def __init__(self, slots: int):
+        self.slots = slots
+        self.slot_condition = threading.Condition()
+        self.dispatched = []
+        self.requeued = []
+
+    def has_free_slot(self, process_type):
+        with self.slot_condition:
+            return self.slots > 0
+
+    def wait_for_slot(self, timeout: float):
+        with self.slot_condition:
+            return self.slot_condition.wait(timeout=timeout)
+
+    def create_thread(self, item):
+        with self.slot_condition:
+            self.slots -= 1
+            self.dispatched.append(item)
+        return True
+
+    def requeue(self, item, label):
+        self.requeued.append(item)
+        return True
+
+    def free_slot(self):
+        with self.slot_condition:
+            self.slots += 1
+            self.slot_condition.notify_all()
+
+
+class ListQueue:
+    def __init__(self, maxsize: int = None):
+        self.items = []
+        self.maxsize = maxsize
+
+    def put(self, item):
+        if self.maxsize is not None and len(self.items) >= self.maxsize:
+            return False
+        self.items.append(item)
+        return True
+
+    def put_with_retry(self, item, max_retries=3, retry_delay=0.1):
+        return self.put(item)
+
+
+def _wait_until(predicate, timeout: float = 5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestQueueControllerDispatch:
+
+    def test_get_batch_drains_available_items(self):
+        """get_batch hazır item'ları tek çağrıda max_items'a kadar toplar."""
+        queue = BaseQueue(maxsize=10)
+        for i in range(5):
+            queue.put({"node_id": f"NOD-{i}"})
+        assert _wait_until(lambda: queue.size() == 5)
+        # qsize feeder thread pipe'a yazmadan artar; get_nowait'in item'ları görmesi için bekle
+        time.sleep(0.1)
+
+        items = queue.get_batch(max_items=3, timeout=1.0)
+        assert [item["node_id"] for item in items] == ["NOD-0", "NOD-1", "NOD-2"]
+
+    def test_get_batch_empty_queue_returns_empty_list(self):
+        """Boş kuyrukta timeout sonrası boş liste döner."""
+        queue = BaseQueue(maxsize=10)
+        assert queue.get_batch(max_items=3, timeout=0.05) == []
+
+    def test_dispatch_waits_for_free_slot_instead_of_requeue(self):
+        """Slot yokken item bekletilir, slot boşalınca gecikmeden dağıtılır."""
+        input_queue = BaseQueue(maxsize=10)
+        process_controller = FakeProcessController(slots=1)
+        controller = QueueController(input_queue, process_controller, batch_size=10, slot_wait_timeout=5.0)
+        controller.start()
+
+        try:
+            input_queue.put({"node_id": "NOD-1", "process_type": "iob"})
+            input_queue.put({"node_id": "NOD-2", "process_type": "iob"})
+
+            assert _wait_until(lambda: len(process_controller.dispatched) == 1)
+            time.sleep(0.1)
+            assert len(process_controller.dispatched) == 1
+
+            freed_at = time.time()
+            process_controller.free_slot()
+            assert _wait_until(lambda: len(process_controller.dispatched) == 2)
+            # slot_wait_timeout (5s) dolmadan bildirimle uyanmalı
+            assert time.time() - freed_at < 1.0
+            assert [item["node_id"] for item in process_controller.dispatched] == ["NOD-1", "NOD-2"]
+        finally:
+            controller.shutdown()
+            controller.watcher_thread.join(timeout=2.0)
+
+    def test_batch_size_clamped_to_queue_capacity(self):
+        """Shutdown'da geri konan batch kuyruğa sığsın diye batch_size kapasiteyle sınırlanır."""
+        controller = QueueController(BaseQueue(maxsize=20), FakeProcessController(slots=1), batch_size=50)
+        assert controller.batch_size == 20
+
+    def test_shutdown_requeues_pending_items(self):
+        """Shutdown'da dağıtılamayan item'lar düşürülmez, ProcessController.requeue ile geri konur."""
+        process_controller = FakeProcessController(slots=0)
+        controller = QueueController(BaseQueue(maxsize=10), process_controller, batch_size=10)
+        controller.shutdown_event.set()
+        items = [{"node_id": f"NOD-{i}", "process_type": "iob"} for i in range(3)]
+
+        controller._dispatch_batch(items)
+
+        assert process_controller.requeued == items
+        assert process_controller.dispatched == []
+
+    def test_shared_slot_counter_reservation(self):
+        """Slot paylaşılan sayaçtan ayrılır; worker sayacı azaltınca tekrar kullanılabilir."""
+        controller = TypeController(output_queue=None, os=True, process_count=1, task_limit=1,
+                                    controller_type="IO-Bound")
+        sent = []
+        process = {'name': 'IO-Bound-0', 'pid': 0, 'process': None, 'slots': Value('i', 0),
+                   'cmd_pipe': type("Pipe", (), {"send": lambda self, data: sent.append(data)})()}
+        controller.active_processes.append(process)
+
+        item = {"node_id": "NOD-1"}
+        assert controller.create_thread(item)[0]
+        assert not controller.create_thread({"node_id": "NOD-2"})[0]
+        assert process['slots'].value == 1
+
+        # Worker task bitince sayacı kendisi azaltır ve status gönderir
+        with process['slots'].get_lock():
+            process['slots'].value -= 1
+        controller._apply_status(process, {"finished_tasks": [item["task_id"]]})
+
+        assert controller.has_free_slot()
+        assert item["task_id"] not in controller.running_tasks
+        assert sent[0]["task_id"] == item["task_id"]
+
+    def test_busy_requeue_does_not_consume_retry(self):
+        """Worker'lar doluyken requeue edilen item'ın retry hakkı azalmaz."""
+        input_queue = ListQueue()
+        process_controller = ProcessController(output_queue=ListQueue(), input_queue=input_queue, logger=get_logger(__name__),
+                                               iob_task_limit=1, cb_task_limit=1, os=True)
+        item = {"node_id": "NOD-1", "process_type": "iob", "max_retries": 1}
+
+        for _ in range(5):
+            assert not process_controller.create_thread(item)
+
+        assert item["retry"] == 0
+        assert len(input_queue.items) == 5
+
+    def test_rejected_requeue_is_reported_as_failed(self):
+        """Input queue requeue'yu kabul etmezse item output queue'ya FAILED olarak düşer."""
+        input_queue = ListQueue(maxsize=0)
+        output_queue = ListQueue()
+        process_controller = ProcessController(output_queue=output_queue, input_queue=input_queue, logger=get_logger(__name__),
+                                               iob_task_limit=1, cb_task_limit=1, os=True)
+        item = {"execution_id": "EXE-1", "node_id": "NOD-1", "process_type": "iob"}
+
+        assert not process_controller.create_thread(item)
+
+        assert input_queue.items == []
+        report = output_queue.items[0]
+        assert report["status"] == "FAILED"
+        assert report["reported_by_engine"] is True
+        assert report["error_details"]["exception_type"] == "QueueFull"
+        assert not process_controller.is_late_result(report)
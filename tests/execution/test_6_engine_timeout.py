@@ -0,0 +1,158 @@
+"""
+TEST 6: Engine Timeout Testleri
+===============================
+
+Bu test, node timeout_seconds değerinin engine tarafından uygulandığını doğrular:
+1. Deadline'ı geçen task FAILED/timed_out olarak raporlanır
+2. Worker'a cancel komutu gönderilir, geç gelen worker sonucu ayıklanır
+3. Cancel edilen thread sonuç üretmeden durur
+4. Takılı process geri dönüştürülürken kill / join / yeni process başlatma process_lock dışında yapılır
+
+NOT: Bu testler worker process başlatmaz, process kayıtları taklit edilir.
+"""
+
+import threading
+import time
+from multiprocessing import Value
+
+from miniflow.engine.engine.type_controller import TypeController
+from miniflow.engine.process.base_thread import BaseThread
+
+
+class ListQueue:
+    """output_queue yerine geçen basit kuyruk."""
+
+    def __init__(self):
+        self.items = []
+
+    def put(self, item):
+        self.items.append(item)
+        return True
+
+
+class FakePipe:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, data):
+        self.sent.append(data)
+
+
+def _make_controller(output_queue):
+    controller = TypeController(output_queue=output_queue, os=True, process_count=1, task_limit=1,
+                                controller_type="IO-Bound")
+    controller.active_processes.append({
+        'name': 'IO-Bound-0', 'pid': 0, 'process': None,
+        'cmd_pipe': FakePipe(), 'health_pipe': FakePipe(), 'slots': Value('i', 0)
+    })
+    return controller
+
+
+class FakeProcess:
+    """kill / join çağrıldığında process_lock'un boşta olup olmadığını kaydeder."""
+
+    def __init__(self, lock):
+        self.lock = lock
+        self.lock_free_on_join = None
+        self.process = self
+
+    def kill(self):
+        pass
+
+    def join(self, timeout=None):
+        self.lock_free_on_join = self.lock.acquire(blocking=False)
+        if self.lock_free_on_join:
+            self.lock.release()
+
+
+class TestEngineTimeout:
+
+    def test_expired_task_reported_and_cancelled(self):
+        """Deadline geçince FAILED raporu üretilir ve cancel gönderilir; slotu worker cancel'da bırakır."""
+        output_queue = ListQueue()
+        controller = _make_controller(output_queue)
+        item = {"execution_id": "EXE-1", "node_id": "NOD-1", "timeout_seconds": 0.05}
+
+        success, _ = controller.create_thread(item)
+        assert success
+        assert not controller.has_free_slot()
+
+        time.sleep(0.1)
+        controller._check_deadlines()
+
+        # Slot controller tarafında bırakılmaz, aksi halde task kendiliğinden biterse iki kez azalırdı
+        assert not controller.has_free_slot()
+        report = output_queue.items[0]
+        assert report["status"] == "FAILED"
+        assert report["timed_out"] is True
+        assert report["error_details"]["exception_type"] == "TimeoutError"
+
+        cmd_pipe = controller.active_processes[0]['cmd_pipe']
+        assert cmd_pipe.sent[-1] == {"command": "cancel_task", "task_id": item["task_id"]}
+
+        # Worker'dan sonradan gelen sonuç bir kez ayıklanır
+        assert controller.is_late_result(item["task_id"])
+        assert not controller.is_late_result(item["task_id"])
+
+    def test_task_without_timeout_is_not_expired(self):
+        """timeout_seconds verilmeyen task deadline takibine girmez."""
+        output_queue = ListQueue()
+        controller = _make_controller(output_queue)
+
+        controller.create_thread({"execution_id": "EXE-1", "node_id": "NOD-1"})
+        controller._check_deadlines()
+
+        assert output_queue.items == []
+        assert not controller.has_free_slot()
+
+    def test_cancelled_thread_stops_without_result(self):
+        """Cancel edilen thread TaskCancelled ile durur ve output üretmez."""
+        output_queue = ListQueue()
+        finished = threading.Event()
+
+        def busy_runner(item, queue):
+            while True:
+                pass
+            queue.put(item)
+
+        thread = BaseThread(target=busy_runner, args=({},), output_queue=output_queue,
+                            task_id="TASK-1", on_finish=lambda t: finished.set())
+        thread.start()
+        time.sleep(0.05)
+
+        assert thread.cancel()
+        assert finished.wait(timeout=5.0)
+        assert not thread.is_alive()
+        assert output_queue.items == []
+
+    def test_recycle_runs_outside_process_lock(self, monkeypatch):
+        """Process listeden lock altında çıkarılır; kill, join ve yeni process başlatma lock dışında yapılır."""
+        output_queue = ListQueue()
+        controller = _make_controller(output_queue)
+        old = controller.active_processes[0]
+        old['process'] = FakeProcess(controller.process_lock)
+        item = {"execution_id": "EXE-1", "node_id": "NOD-1"}
+        assert controller.create_thread(item)[0]
+
+        spawned = []
+
+        def spawn(name, core):
+            lock_free = controller.process_lock.acquire(blocking=False)
+            if lock_free:
+                controller.process_lock.release()
+            spawned.append(lock_free)
+            return {'name': name, 'pid': 1, 'process': None, 'cmd_pipe': FakePipe(),
+                    'health_pipe': FakePipe(), 'slots': Value('i', 0)}
+
+        monkeypatch.setattr(controller, "_spawn_process", spawn)
+        controller._recycle_process(old)
+
+        assert old['process'].lock_free_on_join is True
+        assert spawned == [True]
+        assert [p['pid'] for p in controller.active_processes] == [1]
+        assert controller.active_processes[0] is not old
+        assert output_queue.items[0]["error_details"]["exception_type"] == "WorkerRecycled"
+
+        # Zaten geri dönüştürülmüş process ikinci kez işlenmez
+        controller._recycle_process(old)
+        assert spawned == [True]
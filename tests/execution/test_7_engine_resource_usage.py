@@ -0,0 +1,85 @@
+"""
+TEST 7: Task Kaynak Kullanımı Testleri
+======================================
+
+Bu test, worker'daki task bazlı kaynak ölçümünü doğrular:
+1. CPU yoğun task için cpu_percent ve cpu_time_seconds hesaplanır
+2. Task süresince görülen en yüksek RSS artışı memory_mb olarak raporlanır
+3. Ölçümler sonuç item'ına kuyruğa konmadan önce eklenir
+
+NOT: Bu testler worker process başlatmaz, BaseThread doğrudan çalıştırılır.
+"""
+
+import time
+
+from miniflow.engine.process.base_thread import BaseThread
+from miniflow.engine.process.resource_monitor import ResourceMonitor
+
+
+class ListQueue:
+    """output_queue yerine geçen basit kuyruk."""
+
+    def __init__(self):
+        self.items = []
+
+    def put(self, item):
+        self.items.append(item)
+        return True
+
+
+def _run_task(target, monitor):
+    output_queue = ListQueue()
+    thread = BaseThread(target=target, args=({"node_id": "NOD-1"},), output_queue=output_queue, monitor=monitor)
+    thread.start()
+    thread.thread.join(timeout=10)
+    return output_queue.items
+
+
+class TestTaskResourceUsage:
+
+    def test_cpu_bound_task_reports_cpu_usage(self):
+        """Meşgul döngü yüksek cpu_percent üretir."""
+        monitor = ResourceMonitor(sample_interval=0.01)
+        monitor.start()
+
+        def cpu_task(item, queue):
+            end = time.perf_counter() + 0.2
+            while time.perf_counter() < end:
+                pass
+            queue.put(item)
+
+        try:
+            items = _run_task(cpu_task, monitor)
+        finally:
+            monitor.stop()
+
+        assert items[0]["cpu_time_seconds"] > 0.1
+        assert items[0]["cpu_percent"] > 50
+
+    def test_peak_memory_delta_reported(self):
+        """Task içinde ayrılıp bırakılan bellek peak olarak yakalanır."""
+        monitor = ResourceMonitor(sample_interval=0.01)
+        monitor.start()
+
+        def memory_task(item, queue):
+            block = bytearray(64 * 1024 * 1024)
+            time.sleep(0.1)
+            del block
+            queue.put(item)
+
+        try:
+            items = _run_task(memory_task, monitor)
+        finally:
+            monitor.stop()
+
+        assert items[0]["memory_mb"] >= 32
+
+    def test_disabled_monitor_leaves_item_untouched(self):
+        """sample_interval=0 ölçümü kapatır."""
+        monitor = ResourceMonitor(sample_interval=0)
+        monitor.start()
+
+        items = _run_task(lambda item, queue: queue.put(item), monitor)
+
+        assert "memory_mb" not in items[0]
+        assert "cpu_percent" not in items[0]
@@ -0,0 +1,101 @@
+"""
+TEST 8: Script Modül Cache Testleri
+===================================
+
+Bu test, python_runner'ın process içi script modül cache'ini doğrular:
+1. Aynı script ikinci kez diskten yüklenmez (hit)
+2. Script dosyası güncellendiğinde cache geçersiz olur ve yeni kod çalışır
+3. Cache boyutu aşıldığında en eski modül çıkarılır (LRU)
+"""
+
+import importlib
+import os
+
+import pytest
+
+# modules paketi python_runner fonksiyonunu aynı isimle export ettiği için modül importlib ile alınır
+runner = importlib.import_module("miniflow.engine.process.modules.python_runner")
+
+
+SCRIPT_TEMPLATE = '''
+class Module:
+    def run(self, params):
+        return {"value": %d}
+
+
+def module():
+    return Module()
+'''
+
+
+class ListQueue:
+    def __init__(self):
+        self.items = []
+
+    def put(self, item):
+        self.items.append(item)
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    runner._module_cache.clear()
+    runner._module_cache_stats.update({"hits": 0, "misses": 0, "evictions": 0})
+    yield
+    runner._module_cache.clear()
+
+
+def _write_script(path, value):
+    path.write_text(SCRIPT_TEMPLATE % value)
+
+
+def _run(script_path):
+    queue = ListQueue()
+    runner.python_runner({"script_path": str(script_path), "params": {}}, queue)
+    return queue.items[0]
+
+
+class TestScriptModuleCache:
+
+    def test_second_run_hits_cache(self, tmp_path):
+        script = tmp_path / "calc.py"
+        _write_script(script, 1)
+
+        assert _run(script)["result_data"] == {"value": 1}
+        assert _run(script)["result_data"] == {"value": 1}
+
+        stats = runner.get_module_cache_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+        assert stats["size"] == 1
+
+    def test_updated_script_is_reloaded(self, tmp_path):
+        script = tmp_path / "calc.py"
+        _write_script(script, 1)
+        assert _run(script)["result_data"] == {"value": 1}
+
+        _write_script(script, 22)
+        stat = os.stat(script)
+        # Aynı mtime tick'ine düşmesin
+        os.utime(script, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert _run(script)["result_data"] == {"value": 22}
+        assert runner.get_module_cache_stats()["misses"] == 2
+
+    def test_lru_eviction(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(runner, "MODULE_CACHE_SIZE", 2)
+        scripts = []
+        for i in range(3):
+            script = tmp_path / f"calc_{i}.py"
+            _write_script(script, i)
+            scripts.append(script)
+            _run(script)
+
+        stats = runner.get_module_cache_stats()
+        assert stats["size"] == 2
+        assert stats["evictions"] == 1
+        assert str(scripts[0]) not in runner._module_cache
+
+    def test_missing_script_fails(self, tmp_path):
+        item = _run(tmp_path / "missing.py")
+        assert item["status"] == "FAILED"
+        assert item["error_message"] == "Script file not found"
@@ -0,0 +1,128 @@
+"""
+TEST 9: Worker Task Havuzu Testleri
+===================================
+
+Bu test, worker process içindeki kalıcı task thread havuzunu doğrular:
+1. Task'lar sabit sayıda thread üzerinde çalışır (task başına thread açılmaz)
+2. in_flight sayacı kuyruktaki ve çalışan task'ları tam olarak sayar
+3. Çalışırken cancel edilen task'ın yerine yeni thread açılır, cancel sonraki task'a sızmaz
+4. Kuyrukta beklerken cancel edilen task hiç çalışmaz
+
+NOT: Bu testler worker process başlatmaz, TaskPool doğrudan kullanılır.
+"""
+
+import threading
+import time
+
+from miniflow.engine.process.base_thread import BaseThread
+from miniflow.engine.process.task_pool import TaskPool
+
+
+class ListQueue:
+    def __init__(self):
+        self.items = []
+
+    def put(self, item):
+        self.items.append(item)
+        return True
+
+
+def _wait_until(predicate, timeout: float = 5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def _make_task(pool, target, output_queue, item=None):
+    return BaseThread(target=target, args=(item if item is not None else {},), output_queue=output_queue,
+                      on_finish=lambda t: pool.task_finished())
+
+
+class TestTaskPool:
+
+    def test_tasks_reuse_pool_threads(self):
+        pool = TaskPool(size=2)
+        pool.start()
+        output_queue = ListQueue()
+        idents = set()
+
+        def record(item, queue):
+            idents.add(threading.get_ident())
+            queue.put(item)
+
+        try:
+            for _ in range(20):
+                pool.submit(_make_task(pool, record, output_queue))
+            assert _wait_until(lambda: len(output_queue.items) == 20)
+            assert _wait_until(lambda: pool.in_flight == 0)
+            assert len(idents) <= 2
+        finally:
+            pool.shutdown()
+
+    def test_in_flight_counts_queued_and_running(self):
+        pool = TaskPool(size=1)
+        pool.start()
+        release = threading.Event()
+        output_queue = ListQueue()
+
+        def blocking(item, queue):
+            release.wait(timeout=5)
+            queue.put(item)
+
+        try:
+            for _ in range(3):
+                pool.submit(_make_task(pool, blocking, output_queue))
+            assert pool.in_flight == 3
+
+            release.set()
+            assert _wait_until(lambda: pool.in_flight == 0)
+            assert len(output_queue.items) == 3
+        finally:
+            pool.shutdown()
+
+    def test_cancelled_running_task_is_replaced(self):
+        pool = TaskPool(size=1)
+        pool.start()
+        output_queue = ListQueue()
+
+        def busy(item, queue):
+            while True:
+                pass
+
+        try:
+            stuck = _make_task(pool, busy, output_queue)
+            pool.submit(stuck)
+            assert _wait_until(lambda: stuck.state == BaseThread.RUNNING)
+
+            assert pool.cancel(stuck)
+            assert _wait_until(lambda: not stuck.is_alive())
+
+            # Sonraki task cancel'dan etkilenmeden çalışır
+            pool.submit(_make_task(pool, lambda item, queue: queue.put(item), output_queue, {"node_id": "NOD-2"}))
+            assert _wait_until(lambda: len(output_queue.items) == 1)
+            assert output_queue.items[0]["node_id"] == "NOD-2"
+            assert _wait_until(lambda: pool.worker_count == 1)
+        finally:
+            pool.shutdown()
+
+    def test_cancelled_queued_task_never_runs(self):
+        pool = TaskPool(size=1)
+        pool.start()
+        release = threading.Event()
+        output_queue = ListQueue()
+
+        try:
+            pool.submit(_make_task(pool, lambda item, queue: release.wait(timeout=5), output_queue))
+            queued = _make_task(pool, lambda item, queue: queue.put(item), output_queue)
+            pool.submit(queued)
+
+            assert pool.cancel(queued)
+            release.set()
+
+            assert _wait_until(lambda: pool.in_flight == 0)
+            assert output_queue.items == []
+        finally:
+            pool.shutdown()
@@ -0,0 +1 @@
+# Workspace Tests
@@ -0,0 +1,172 @@
+"""
+TEST 1: Workspace Access Cache Testleri
+=======================================
+
+Bu test, require_workspace_access'in kullandığı üyelik / askı durumu cache'ini doğrular:
+1. Cache'te olan (workspace_id, user_id) için validate_workspace_access SQL çalıştırmaz
+2. Sadece geçerli üyelik cache'lenir; askı durumu entry'de tutulur (allow_suspended yolu da aynı entry'yi kullanır)
+3. Üye çıkarma ve workspace askıya alma cache'i transaction commit edildikten sonra temizler
+4. Boyut sınırı LRU ile korunur, diğer worker'lardan gelen Redis mesajları cache'i temizler
+
+NOT: Bu testler workspaces ve workspace_members tablolarını in-memory SQLite'ta oluşturur.
+"""
+
+import pytest
+from sqlalchemy import event
+
+from miniflow.core.exceptions import BusinessRuleViolationError, ResourceNotFoundError
+from miniflow.models import Workspace, WorkspaceMember
+from miniflow.services import WorkspaceManagementService, WorkspaceMemberService
+from miniflow.utils.helpers.workspace_access_cache import WorkspaceAccessCache
+
+
+@pytest.fixture(autouse=True)
+def cache(monkeypatch):
+    monkeypatch.setattr(WorkspaceAccessCache, "_initialized", True)
+    monkeypatch.setattr(WorkspaceAccessCache, "enabled", True)
+    monkeypatch.setattr(WorkspaceAccessCache, "backend", "local")
+    monkeypatch.setattr(WorkspaceAccessCache, "_channel", None)
+    monkeypatch.setattr(WorkspaceAccessCache, "max_entries", 100)
+    monkeypatch.setattr(WorkspaceAccessCache, "ttl_seconds", 30.0)
+    WorkspaceAccessCache.clear()
+    yield WorkspaceAccessCache
+    WorkspaceAccessCache.clear()
+
+
+@pytest.fixture
+def session(memory_session):
+    return memory_session(Workspace, WorkspaceMember, seed=_seed)
+
+
+def _seed(session):
+    session.add(Workspace(
+        id="WSP-1", name="workspace", slug="workspace", owner_id="USR-1", plan_id="PLN-1",
+        member_limit=10, current_member_count=2, workflow_limit=10, custom_script_limit=10,
+        max_file_size_mb_per_workspace=10, storage_limit_mb=100, api_key_limit=10,
+        monthly_execution_limit=100, monthly_concurrent_executions=10,
+    ))
+    for user_id in ("USR-1", "USR-2"):
+        session.add(WorkspaceMember(
+            id=f"WSM-{user_id}", workspace_id="WSP-1", user_id=user_id, role_id="ROL-1", role_name="member"
+        ))
+    session.commit()
+
+
+@pytest.fixture
+def validate(monkeypatch, session):
+    """Veritabanı kontrolünü test session'ında yapar."""
+    load = WorkspaceMemberService._load_workspace_access.__wrapped__
+    monkeypatch.setattr(WorkspaceMemberService, "_load_workspace_access",
+                        lambda **kwargs: load(WorkspaceMemberService, session, **kwargs))
+    return lambda user_id, check_suspended=True: WorkspaceMemberService.validate_workspace_access(
+        workspace_id="WSP-1", user_id=user_id, check_suspended=check_suspended)
+
+
+@pytest.fixture
+def statements(session):
+    executed = []
+    event.listen(session.get_bind(), "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: executed.append(statement))
+    return executed
+
+
+class TestValidateWorkspaceAccess:
+
+    def test_cached_access_runs_no_sql(self, validate, statements):
+        assert validate("USR-2") is True
+        assert statements
+
+        statements.clear()
+        for _ in range(10):
+            assert validate("USR-2") is True
+
+        assert statements == []
+        assert WorkspaceAccessCache.stats()["hits"] == 10
+
+    def test_denied_access_is_not_cached(self, validate):
+        with pytest.raises(BusinessRuleViolationError):
+            validate("USR-3")
+        with pytest.raises(ResourceNotFoundError):
+            WorkspaceMemberService.validate_workspace_access(workspace_id="WSP-404", user_id="USR-1")
+
+        assert WorkspaceAccessCache.stats()["size"] == 0
+
+    def test_suspended_entry_serves_allow_suspended_only(self, validate, session):
+        session.get(Workspace, "WSP-1").is_suspended = True
+        session.commit()
+
+        with pytest.raises(BusinessRuleViolationError):
+            validate("USR-2")
+        assert validate("USR-2", check_suspended=False) is True
+
+        # Entry'de askı durumu var, normal kontrol cache'ten reddedilir
+        with pytest.raises(BusinessRuleViolationError):
+            validate("USR-2")
+        assert WorkspaceAccessCache.stats()["hits"] == 1
+
+
+class TestInvalidation:
+
+    def test_remove_member_invalidates_after_commit(self, validate, session):
+        validate("USR-1")
+        validate("USR-2")
+
+        WorkspaceMemberService.remove_member.__wrapped__(
+            WorkspaceMemberService, session, workspace_id="WSP-1", user_id="USR-2")
+        # Commit'ten önce cache değişmez
+        assert WorkspaceAccessCache.get("WSP-1", "USR-2") == (False, None)
+
+        session.commit()
+        assert WorkspaceAccessCache.get("WSP-1", "USR-2") is None
+        assert WorkspaceAccessCache.get("WSP-1", "USR-1") == (False, None)
+        with pytest.raises(BusinessRuleViolationError):
+            validate("USR-2")
+
+    def test_suspend_invalidates_every_member(self, validate, session):
+        validate("USR-1")
+        validate("USR-2")
+
+        WorkspaceManagementService.suspend_workspace.__wrapped__(
+            WorkspaceManagementService, session, workspace_id="WSP-1", reason="billing")
+        session.commit()
+
+        assert WorkspaceAccessCache.stats()["size"] == 0
+        with pytest.raises(BusinessRuleViolationError):
+            validate("USR-1")
+
+    def test_rollback_keeps_cache(self, validate, session):
+        validate("USR-2")
+
+        WorkspaceManagementService.suspend_workspace.__wrapped__(
+            WorkspaceManagementService, session, workspace_id="WSP-1", reason="billing")
+        session.rollback()
+
+        assert WorkspaceAccessCache.get("WSP-1", "USR-2") == (False, None)
+
+    def test_redis_message_invalidates_local_cache(self):
+        WorkspaceAccessCache.put("WSP-1", "USR-1", False)
+        WorkspaceAccessCache.put("WSP-1", "USR-2", False)
+        WorkspaceAccessCache.put("WSP-2", "USR-1", False)
+
+        WorkspaceAccessCache._handle_message("member:WSP-2:USR-1")
+        assert WorkspaceAccessCache.get("WSP-2", "USR-1") is None
+
+        WorkspaceAccessCache._handle_message("workspace:WSP-1")
+        assert WorkspaceAccessCache.get("WSP-1", "USR-1") is None
+        assert WorkspaceAccessCache.get("WSP-1", "USR-2") is None
+
+
+class TestCacheBounds:
+
+    def test_least_recently_used_entry_is_evicted(self, monkeypatch):
+        monkeypatch.setattr(WorkspaceAccessCache, "max_entries", 2)
+        WorkspaceAccessCache.put("WSP-1", "USR-1", False)
+        WorkspaceAccessCache.put("WSP-1", "USR-2", False)
+        WorkspaceAccessCache.get("WSP-1", "USR-1")
+        WorkspaceAccessCache.put("WSP-2", "USR-1", False)
+
+        assert WorkspaceAccessCache.get("WSP-1", "USR-2") is None
+        assert WorkspaceAccessCache.get("WSP-1", "USR-1") == (False, None)
+        assert WorkspaceAccessCache.stats()["evictions"] == 1
+        assert WorkspaceAccessCache.stats()["hit_rate"] == 0.6667
+        assert WorkspaceAccessCache._workspace_index == {"WSP-1": {"USR-1"}, "WSP-2": {"USR-1"}}